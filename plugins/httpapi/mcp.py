@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, NTT Ltd.
+#
+# Author: Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+author:
+    - Ken Sinfield (@kensinfield)
+name: mcp
+short_description: HttpApi plugin for the NTT Ltd. Cloud Control API
+description:
+    - Keeps a single authenticated HTTPS connection to the Cloud Control API open for the duration of a play using
+      the ansible.netcommon.httpapi persistent connection
+    - The nttmcp.mcp modules send their API requests over this connection when C(connection=ansible.netcommon.httpapi)
+      and C(ansible_network_os=nttmcp.mcp.mcp) are set, so later tasks reuse the warm connection and the cached org
+      context of the API user instead of rebuilding them
+    - The API user and password are taken from C(ansible_user) and C(ansible_httpapi_pass) and C(ansible_host) must be
+      the API end-point for the region e.g. api-na.mcp-services.net. The module region, auth and credential sources
+      are not used for the connection
+    - Only requests to the connection host are sent over the connection. A request for another API host, e.g. a home
+      geo in another region, fails
+version_added: "2.10.0"
+'''
+
+import base64
+import json
+from ansible.module_utils.six.moves.urllib.parse import urlencode, urlparse
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.plugins.httpapi import HttpApiBase
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import HTTP_HEADERS
+
+
+class HttpApi(HttpApiBase):
+
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self.org_contexts = {}
+
+    def login(self, username, password):
+        """
+        Cloud Control uses HTTP basic authentication on every request so the header is set once for the connection
+        """
+        token = base64.b64encode(to_bytes('{0}:{1}'.format(username, password), errors='surrogate_or_strict'))
+        self.connection._auth = {'Authorization': 'Basic {0}'.format(to_text(token))}
+
+    def logout(self):
+        self.connection._auth = None
+
+    def handle_httperror(self, exc):
+        """
+        Authentication failures are raised. Any other HTTP error is returned as the response so the module can report
+        the Cloud Control error (e.g. RESOURCE_NOT_FOUND) in the same way as when it connects directly
+        """
+        if exc.code == 401:
+            return False
+        return exc
+
+    def send_request(self, method, url, params=None):
+        """
+        Send an API request over the persistent connection
+
+        :arg method: The HTTP method (GET or POST)
+        :arg url: The API url or path. A url for any host other than the connection host is refused
+        :kw params: The query parameters (GET) or JSON body (POST)
+        :returns: A tuple of (HTTP status code, response body text)
+        """
+        parts = urlparse(url)
+        host = self.connection.get_option('host')
+        if parts.hostname and host and parts.hostname.lower() != host.lower():
+            raise AnsibleConnectionFailure('The API url {0} is not on the connection host {1}. Requests to other API '
+                                           'hosts cannot be sent over the persistent connection'.format(url, host))
+        path = parts.path
+        data = None
+        if method == 'GET':
+            if params:
+                path = '{0}?{1}'.format(path, urlencode(params, doseq=True))
+        else:
+            data = json.dumps(params)
+        response, response_data = self.connection.send(path, data, method=method, headers=HTTP_HEADERS)
+        return response.getcode(), to_text(response_data.getvalue(), errors='surrogate_then_replace')
+
+    def get_org_context(self, api_version):
+        """
+        Return the org ID and home geo of the API user and the connection host. The myUser lookup is made once per
+        connection
+
+        :arg api_version: The Cloud Control API version
+        :returns: dict containing org_id, home_geo and host
+        """
+        if api_version not in self.org_contexts:
+            status, body = self.send_request('GET', '/caas/{0}/user/myUser'.format(api_version))
+            if status != 200:
+                raise ValueError('Could not get the user org ID and home geo: {0}'.format(body))
+            organization = json.loads(body)['organization']
+            self.org_contexts[api_version] = {'org_id': organization['id'], 'home_geo': organization['homeGeoApiHost'],
+                                              'host': self.connection.get_option('host')}
+        return self.org_contexts[api_version]
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, NTT Ltd.
+#
+# Author: Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+name: mcp
+plugin_type: inventory
+short_description: NTT Ltd. MCP server inventory source
+description:
+    - Get the servers from one or more NTT Ltd. MCP regions and datacenters
+    - Servers are grouped by datacenter, Cloud Network Domain, VLAN, OS family and tag
+    - The primary NIC IPv4 address of each server is used as ansible_host
+    - Uses a YAML configuration file that ends with mcp.(yml|yaml)
+version_added: "2.10.0"
+author:
+    - Ken Sinfield (@kensinfield)
+extends_documentation_fragment:
+    - inventory_cache
+    - constructed
+options:
+    plugin:
+        description:
+            - The name of this plugin, it should always be set to C(nttmcp.mcp.mcp) for this plugin to recognize it as its own
+        required: true
+        type: str
+        choices:
+            - nttmcp.mcp.mcp
+    auth:
+        description:
+            - Optional dictionary containing the authentication and API information for Cloud Control
+            - If not supplied the credentials are read from the environment or the ~/.nttmcp file as per the modules
+        required: false
+        type: dict
+    regions:
+        description:
+            - The geographical regions to query
+            - With more than one region the API end-point of each region is used (any auth api or NTTMCP_API
+              end-point is ignored)
+        required: false
+        type: list
+        default:
+            - na
+    datacenters:
+        description:
+            - The datacenters to query. All datacenters in each region are queried if not supplied
+            - With more than one region each datacenter is only queried in the region it belongs to
+        required: false
+        type: list
+        default: []
+    hostnames:
+        description:
+            - The server attribute used as the inventory hostname
+        required: false
+        type: str
+        default: name
+        choices:
+            - name
+            - id
+    max_workers:
+        description:
+            - The maximum number of regions and datacenters queried at the same time
+        required: false
+        type: int
+        default: 4
+notes:
+    - Requires NTT Ltd. MCP account/credentials
+requirements:
+    - requests
+    - configparser
+    - pyOpenSSL
+'''
+
+EXAMPLES = '''
+# mcp.yml
+plugin: nttmcp.mcp.mcp
+regions:
+  - na
+  - eu
+datacenters:
+  - NA9
+  - NA12
+  - EU6
+cache: true
+cache_plugin: jsonfile
+cache_connection: ~/.ansible/nttmcp/inventory
+cache_timeout: 600
+keyed_groups:
+  - key: mcp_server.virtualHardware.version
+    prefix: hw
+'''
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+from ansible.errors import AnsibleError
+from ansible.inventory.group import to_safe_group_name
+from ansible.plugins.inventory import BaseInventoryPlugin, Constructable, Cacheable
+try:
+    from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+    from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+    HAS_PROVIDER = True
+    PROVIDER_IMPORT_ERROR = None
+except ImportError as e:
+    HAS_PROVIDER = False
+    PROVIDER_IMPORT_ERROR = e
+
+
+class CredentialSource():
+    """
+    Present the inventory auth option to get_credentials in the same way as a module
+    """
+    def __init__(self, auth):
+        self.params = {'auth': auth}
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(msg)
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'nttmcp.mcp.mcp'
+
+    def verify_file(self, path):
+        """
+        Return true/false if this is possibly a valid file for this plugin to consume
+        """
+        if super(InventoryModule, self).verify_file(path):
+            return path.endswith(('mcp.yml', 'mcp.yaml'))
+        return False
+
+    def get_datacenter_servers(self, client, region, datacenter):
+        """
+        Return the servers and Cloud Network Domain names for a single datacenter
+
+        :arg client: The CC API client instance for the region
+        :arg region: The region of the datacenter
+        :arg datacenter: The MCP ID
+        :returns: A tuple of (list of servers, dict of Cloud Network Domain names keyed on UUID)
+        """
+        try:
+            servers = client.list_servers(datacenter=datacenter)
+            network_domains = dict((x.get('id'), x.get('name')) for x in client.list_network_domains(datacenter=datacenter))
+        except NTTMCPAPIException as e:
+            raise AnsibleError('Could not get the servers in {0} - {1}'.format(datacenter, e))
+        for server in servers:
+            server['region'] = region
+        return servers, network_domains
+
+    def fetch_servers(self):
+        """
+        Get all servers across the configured regions and datacenters. Each region and datacenter is queried in
+        parallel up to max_workers
+
+        :returns: A dict of servers and Cloud Network Domain names that is safe to cache
+        """
+        credentials = get_credentials(CredentialSource(self.get_option('auth')))
+        if credentials is False:
+            raise AnsibleError('Could not load the user credentials')
+        regions = self.get_option('regions')
+        invalid_regions = [x for x in regions if x not in get_regions()]
+        if invalid_regions:
+            raise AnsibleError('Invalid region(s) {0}. Regions must be one of {1}'.format(invalid_regions, get_regions()))
+        max_workers = max(self.get_option('max_workers'), 1)
+        datacenters = self.get_option('datacenters')
+        if len(regions) > 1:
+            # Each region must be queried on its own API end-point rather than a single configured one
+            credentials = dict(credentials, api_endpoint=None)
+
+        def get_region(region):
+            try:
+                client = NTTMCPClient(credentials, region)
+                if datacenters and len(regions) == 1:
+                    return client, datacenters
+                return client, [x.get('id') for x in client.get_dc().get('datacenter', [])]
+            except NTTMCPAPIException as e:
+                raise AnsibleError('Could not get the datacenters in region {0} - {1}'.format(region, e))
+
+        def get_datacenter(args):
+            return self.get_datacenter_servers(*args)
+
+        executor = None
+        if HAS_FUTURES and max_workers > 1:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            region_datacenters = list(executor.map(get_region, regions) if executor else map(get_region, regions))
+
+            # Query each configured datacenter only in the (first) region it belongs to
+            targets = []
+            found = set()
+            for region, (client, region_dcs) in zip(regions, region_datacenters):
+                for datacenter in region_dcs:
+                    if datacenter in found or (datacenters and datacenter not in datacenters):
+                        continue
+                    found.add(datacenter)
+                    targets.append((client, region, datacenter))
+            missing = [x for x in datacenters if x not in found]
+            if missing:
+                raise AnsibleError('Could not find the datacenter(s) {0} in the region(s) {1}'.format(
+                    ', '.join(missing), ', '.join(regions)))
+
+            results = list(executor.map(get_datacenter, targets) if executor else map(get_datacenter, targets))
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+        data = {'servers': [], 'network_domains': {}}
+        for servers, network_domains in results:
+            data['servers'].extend(servers)
+            data['network_domains'].update(network_domains)
+        return data
+
+    def add_server(self, server, network_domains):
+        """
+        Add a server to the inventory, its groups and set its host variables
+
+        :arg server: The server dict
+        :arg network_domains: dict of Cloud Network Domain names keyed on UUID
+        """
+        hostname = server.get(self.get_option('hostnames'))
+        if not hostname:
+            return
+        network_info = server.get('networkInfo') or {}
+        primary_nic = network_info.get('primaryNic') or {}
+        network_domain = network_domains.get(network_info.get('networkDomainId'))
+        os_family = ((server.get('guest') or {}).get('operatingSystem') or {}).get('family')
+        tags = dict((x.get('tagKeyName'), x.get('value')) for x in server.get('tag') or [])
+
+        self.inventory.add_host(hostname)
+        host_vars = {
+            'ansible_host': primary_nic.get('privateIpv4'),
+            'mcp_id': server.get('id'),
+            'mcp_region': server.get('region'),
+            'mcp_datacenter': server.get('datacenterId'),
+            'mcp_network_domain': network_domain,
+            'mcp_vlan': primary_nic.get('vlanName'),
+            'mcp_os_family': os_family,
+            'mcp_tags': tags,
+            'mcp_server': server
+        }
+        for key, value in host_vars.items():
+            self.inventory.set_variable(hostname, key, value)
+
+        groups = ['datacenter_{0}'.format(server.get('datacenterId'))]
+        if network_domain:
+            groups.append('network_domain_{0}'.format(network_domain))
+        if primary_nic.get('vlanName'):
+            groups.append('vlan_{0}'.format(primary_nic.get('vlanName')))
+        if os_family:
+            groups.append('os_{0}'.format(os_family))
+        for key, value in tags.items():
+            groups.append('tag_{0}_{1}'.format(key, value) if value else 'tag_{0}'.format(key))
+        for group in groups:
+            group = self.inventory.add_group(to_safe_group_name(group.lower()))
+            self.inventory.add_child(group, hostname)
+
+        strict = self.get_option('strict')
+        self._set_composite_vars(self.get_option('compose'), host_vars, hostname, strict=strict)
+        self._add_host_to_composed_groups(self.get_option('groups'), host_vars, hostname, strict=strict)
+        self._add_host_to_keyed_groups(self.get_option('keyed_groups'), host_vars, hostname, strict=strict)
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path)
+
+        if not HAS_PROVIDER:
+            raise AnsibleError('The nttmcp.mcp.mcp inventory plugin could not load its dependencies: {0}'.format(PROVIDER_IMPORT_ERROR))
+
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+
+        data = None
+        if use_cache:
+            try:
+                data = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if data is None:
+            data = self.fetch_servers()
+        if update_cache:
+            self._cache[cache_key] = data
+
+        for server in data.get('servers', []):
+            self.add_server(server, data.get('network_domains', {}))
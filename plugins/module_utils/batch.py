@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Run a batch of API calls concurrently within a rate limit
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import random
+from threading import Lock
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import (POLL_MIN_INTERVAL, POLL_BACKOFF_FACTOR, API_BUSY_CODES,
+                                                                        API_BUSY_RETRIES, API_BUSY_MAX_DELAY)
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+def is_busy(exc):
+    """
+    Check if an API exception was caused by the resource being busy with another operation
+
+    :arg exc: The exception
+    :returns: True or False
+    """
+    message = '{0}'.format(exc)
+    return any(code in message for code in API_BUSY_CODES)
+
+
+class RateLimiter():
+    """
+    Space the start of calls made from any number of threads so no more than rate calls start per second
+    """
+    def __init__(self, rate=None):
+        """
+        :kw rate: The maximum number of calls per second (None or 0 for no limit)
+        """
+        self.interval = 1.0 / rate if rate else 0
+        self.next_call = 0
+        self.lock = Lock()
+
+    def wait(self):
+        """
+        Block until the next call is allowed to start
+        """
+        if not self.interval:
+            return
+        with self.lock:
+            now = monotonic()
+            start = max(now, self.next_call)
+            self.next_call = start + self.interval
+        if start > now:
+            sleep(start - now)
+
+
+def run_batch(func, items, concurrency=1, rate=None, retries=API_BUSY_RETRIES):
+    """
+    Call func once for each item using up to concurrency threads and no more than rate calls per second. A call that
+    fails because the resource is busy is retried with an exponential backoff (with jitter). Any other API error, or a
+    KeyError, IndexError or AttributeError from parsing the response, is returned straight away
+
+    :arg func: A callable taking a single item
+    :arg items: The list of items
+    :kw concurrency: The maximum number of calls in flight
+    :kw rate: The maximum number of calls started per second (None or 0 for no limit)
+    :kw retries: The maximum number of retries for each item when the API reports the resource is busy
+    :returns: A list of tuples of (item, result, exception) in the same order as items. Either result or exception
+              is None
+    """
+    limiter = RateLimiter(rate)
+
+    def call(item):
+        delay = POLL_MIN_INTERVAL
+        attempt = 0
+        while True:
+            limiter.wait()
+            try:
+                return item, func(item), None
+            except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
+                if not is_busy(exc) or attempt >= retries:
+                    return item, None, exc
+            sleep(delay / 2.0 + random.uniform(0, delay / 2.0))
+            delay = min(delay * POLL_BACKOFF_FACTOR, API_BUSY_MAX_DELAY)
+            attempt += 1
+
+    workers = min(max(concurrency or 1, 1), len(items))
+    if not HAS_FUTURES or workers <= 1:
+        return [call(item) for item in items]
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        return list(executor.map(call, items))
+    finally:
+        executor.shutdown(wait=True)
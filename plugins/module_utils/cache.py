@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Local file cache used to share API lookups between module invocations
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import hashlib
+import tempfile
+from time import time
+from contextlib import contextmanager
+from os import environ, makedirs, rename, remove, fdopen
+from os.path import expanduser, join, isdir
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import CACHE_DIR
+
+
+def cache_key(*args):
+    """
+    Return a stable hash of the supplied values for use as a cache key. This ensures secrets such as passwords
+    that form part of a key are never written to disk
+
+    :arg args: The values that make up the key
+    :returns: A hex digest string
+    """
+    return hashlib.sha256(u'\0'.join(u'{0}'.format(arg) for arg in args).encode('utf-8')).hexdigest()
+
+
+class NTTMCPFileCache():
+    """
+    A JSON file backed key/value store with a TTL per entry. Reads take a shared lock and writes take an exclusive
+    lock on a separate lock file, and the cache file is replaced atomically, so Ansible forks running at the same
+    time never see a partially written cache. Any error accessing the cache is treated as a cache miss
+    """
+    def __init__(self, name, cache_dir=None):
+        self.cache_dir = expanduser(cache_dir or environ.get('NTTMCP_CACHE_DIR') or CACHE_DIR)
+        self.path = join(self.cache_dir, '{0}.json'.format(name))
+        self.lock_path = '{0}.lock'.format(self.path)
+
+    @contextmanager
+    def lock(self, exclusive=False):
+        """
+        Hold a shared or exclusive lock on the cache for the duration of the context
+
+        :kw exclusive: Take an exclusive (write) lock instead of a shared (read) lock
+        """
+        if not isdir(self.cache_dir):
+            makedirs(self.cache_dir, 0o700)
+        with open(self.lock_path, 'a') as lock_file:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def read(self):
+        """
+        Read the cache file. Must be called while holding a lock
+
+        :returns: dict of cache entries
+        """
+        try:
+            with open(self.path, 'r') as cache_file:
+                data = json.load(cache_file)
+            return data if isinstance(data, dict) else dict()
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def write(self, data):
+        """
+        Atomically replace the cache file. Must be called while holding an exclusive lock
+
+        :arg data: dict of cache entries
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp')
+        try:
+            with fdopen(fd, 'w') as tmp_file:
+                json.dump(data, tmp_file)
+            rename(tmp_path, self.path)
+        except (IOError, OSError):
+            try:
+                remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, key):
+        """
+        Return a cached value
+
+        :arg key: The cache key
+        :returns: The cached value or None if it does not exist or has expired
+        """
+        try:
+            with self.lock():
+                entry = self.read().get(key)
+        except (IOError, OSError):
+            return None
+        if entry and entry.get('expires', 0) > time():
+            return entry.get('value')
+        return None
+
+    def set(self, key, value, ttl):
+        """
+        Store a value in the cache and prune any expired entries
+
+        :arg key: The cache key
+        :arg value: A JSON serializable value
+        :arg ttl: The number of seconds the value is valid for
+        """
+        now = time()
+        try:
+            with self.lock(exclusive=True):
+                data = dict((k, v) for k, v in self.read().items() if v.get('expires', 0) > now)
+                data[key] = {'expires': now + ttl, 'value': value}
+                self.write(data)
+        except (IOError, OSError):
+            pass
+
+    def delete(self, key):
+        """
+        Remove a value from the cache
+
+        :arg key: The cache key
+        """
+        try:
+            with self.lock(exclusive=True):
+                data = self.read()
+                if data.pop(key, None) is not None:
+                    self.write(data)
+        except (IOError, OSError):
+            pass
+
+    def delete_value(self, value):
+        """
+        Remove every entry holding a value
+
+        :arg value: The cached value
+        """
+        try:
+            with self.lock(exclusive=True):
+                data = self.read()
+                keep = dict((k, v) for k, v in data.items() if v.get('value') != value)
+                if len(keep) != len(data):
+                    self.write(keep)
+        except (IOError, OSError):
+            pass
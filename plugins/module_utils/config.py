@@ -18,6 +18,71 @@ HTTP_HEADERS = {'Content-Type': 'application/json',
 # API Versions
 API_VERSION = '2.11'
 
+# HTTP connection pool settings for the API client session
+# The number of keep-alive connections kept open per API host
+HTTP_POOL_SIZE = 10
+# The number of times a failed connection attempt is retried before giving up
+HTTP_MAX_RETRIES = 3
+# Block when the pool is exhausted instead of opening a throwaway connection
+HTTP_POOL_BLOCK = False
+
+# The default number of objects requested per page for paged API listings
+API_PAGE_SIZE = 250
+# The default number of pages fetched concurrently for paged API listings
+API_PAGE_WORKERS = 4
+
+# Directory for the local cache shared between module invocations. Can be overridden with NTTMCP_CACHE_DIR
+CACHE_DIR = '~/.ansible/nttmcp'
+
+# The number of seconds the user's org ID and home geo are cached for. Set to 0 to disable the cache
+ORG_CACHE_TTL = 3600
+
+# The number of seconds the UUIDs of named objects (Cloud Network Domains, VLANs, IP address lists, port lists and
+# VIP nodes) are cached for on disk. Set to 0 to disable the resolver cache
+RESOLVER_CACHE_TTL = 600
+
+# The number of seconds the server_changes module keeps the snapshot of the previous server listing for (30 days). A
+# feed that is not run within this time starts again with every server reported as added
+SERVER_CHANGES_TTL = 2592000
+
+# The number of seconds a GET response is cached for by the API client. Set to 0 to disable the request cache
+API_CACHE_TTL = 60
+# The maximum number of GET responses cached by the API client
+API_CACHE_SIZE = 256
+# A POST to a resource family also invalidates the cached GETs of these families
+API_CACHE_RELATED = {
+    'server': ['network'],
+    'networkDomainVip': ['network'],
+    'snapshot': ['server'],
+}
+
+# Polling of asynchronous operations. The first check is made immediately and the delay between checks then grows by
+# POLL_BACKOFF_FACTOR (with jitter) from POLL_MIN_INTERVAL up to the user supplied wait_poll_interval
+POLL_MIN_INTERVAL = 1
+POLL_BACKOFF_FACTOR = 2
+# The typical number of seconds an operation on each resource type takes. Polling starts slower for long operations
+POLL_EXPECTED_DURATION = {
+    'server': 120,
+    'server_clone': 600,
+    'network_domain': 60,
+    'vlan': 60,
+    'image_import': 900,
+    'image_export': 900,
+    'snapshot': 300,
+}
+# The fraction of the expected duration used as the first backoff delay
+POLL_HINT_FRACTION = 0.1
+
+# Batches of API changes (e.g. VIP pool members). A call that fails because the resource is locked by another
+# operation is retried up to API_BUSY_RETRIES times, backing off from POLL_MIN_INTERVAL up to API_BUSY_MAX_DELAY
+API_BUSY_CODES = ['RESOURCE_BUSY']
+API_BUSY_RETRIES = 5
+API_BUSY_MAX_DELAY = 10
+
+# The maximum number of datacenters queried at the same time when an info module is given several datacenters or
+# regions
+API_FANOUT_WORKERS = 8
+
 # API end-points
 API_ENDPOINTS = {
     'na': {
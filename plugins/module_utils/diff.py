@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Non-mutating comparison of JSON objects
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from collections import Counter
+
+# Markers so the canonical form of a dict can never be equal to the canonical form of a list
+_DICT = 'dict'
+_LIST = 'list'
+
+
+def canonical(value):
+    """
+    Return a hashable canonical form of a JSON value. Dicts are compared by their keys and values and lists are
+    compared as multisets, so two lists holding the same elements in a different order have the same canonical form
+
+    :arg value: Any JSON value
+    :returns: A hashable canonical form of the value
+    """
+    if isinstance(value, dict):
+        return (_DICT, frozenset((k, canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (_LIST, frozenset(Counter(canonical(x) for x in value).items()))
+    return value
+
+
+def diff_list(new, existing):
+    """
+    Compare two lists as multisets without sorting or modifying either list
+
+    :arg new: The new list
+    :arg existing: The existing list
+    :returns: A tuple of (the elements only in new, the elements only in existing)
+    """
+    new_keys = [canonical(x) for x in new]
+    existing_keys = [canonical(x) for x in existing]
+    new_counts = Counter(new_keys)
+    existing_counts = Counter(existing_keys)
+    if new_counts == existing_counts:
+        return [], []
+
+    def only_in(values, keys, counts):
+        items = []
+        for value, key in zip(values, keys):
+            if counts[key] > 0:
+                counts[key] -= 1
+                items.append(value)
+        return items
+
+    return (only_in(new, new_keys, new_counts - existing_counts),
+            only_in(existing, existing_keys, existing_counts - new_counts))
+
+
+def _diff_dict(new, existing, path, differences):
+    """
+    Compare one level of two dicts, recursing into child dicts
+
+    :arg new: The new dict
+    :arg existing: The existing dict
+    :arg path: The list of keys leading to this level
+    :arg differences: The list the typed differences are appended to
+    :returns: dict containing the differences at this level in the compare_json format
+    """
+    result = {
+        'changes': False,
+        'updated': {},
+        'removed': {},
+        'added': {}
+    }
+    for key, value in new.items():
+        key_path = path + [key]
+        if key not in existing:
+            result['changes'] = True
+            result['added'][str(key)] = str(value)
+            differences.append({'type': 'added', 'path': key_path, 'new': value})
+            continue
+        old = existing[key]
+        if isinstance(value, dict) and isinstance(old, dict):
+            child = _diff_dict(value, old, key_path, differences)
+            for change_type in ('updated', 'removed', 'added'):
+                if child[change_type]:
+                    result[change_type][str(key)] = child[change_type]
+            result['changes'] = result['changes'] or child['changes']
+            continue
+        if isinstance(value, list) and isinstance(old, list):
+            added_items, removed_items = diff_list(value, old)
+            if not added_items and not removed_items:
+                continue
+            difference = {'type': 'updated', 'path': key_path, 'old': old, 'new': value,
+                          'added_items': added_items, 'removed_items': removed_items}
+        elif value != old:
+            difference = {'type': 'updated', 'path': key_path, 'old': old, 'new': value}
+        else:
+            continue
+        result['changes'] = True
+        result['updated'][str(key)] = {
+            'old_value': str(old),
+            'new_value': str(value)
+        }
+        differences.append(difference)
+    for key, old in existing.items():
+        if key not in new:
+            result['changes'] = True
+            result['removed'][str(key)] = str(old)
+            differences.append({'type': 'removed', 'path': path + [key], 'old': old})
+    return result
+
+
+def diff_json(new, existing):
+    """
+    Compare two JSON objects and return if they are different and any differences between them. Lists are compared
+    as multisets (the order of the elements is ignored) and neither object is modified
+
+    :arg new: The new/desired JSON object (dict)
+    :arg existing: The existing JSON object (dict)
+    :returns: dict containing changes (bool), the updated, removed and added values keyed the same as the objects and
+              differences, a list of typed differences each containing the type (added, removed or updated), path
+              (list of keys), old and/or new value and for lists the added_items and removed_items
+    """
+    differences = []
+    result = _diff_dict(new, existing, [], differences)
+    result['differences'] = differences
+    return result
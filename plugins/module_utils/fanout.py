@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Run an info query across several datacenters and regions
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_FANOUT_WORKERS
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient
+from ansible_collections.nttmcp.mcp.plugins.module_utils.batch import run_batch
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_listing
+
+
+def unique(values):
+    """
+    Return the values without duplicates in their original order
+    """
+    result = []
+    for value in values or []:
+        if value not in result:
+            result.append(value)
+    return result
+
+
+def get_region_clients(module, credentials, regions):
+    """
+    Create one API client per region. With a single region the supplied credentials are used as they are (so a
+    custom API end-point is honoured). With several regions each client connects to the region host in API_ENDPOINTS.
+    The clients are created concurrently and all of them report to the debug_timing recorder
+
+    :arg module: The Ansible module instance
+    :arg credentials: The API credentials from get_credentials
+    :arg regions: The list of region names
+    :returns: dict of clients keyed on region
+    """
+    if len(regions) > 1:
+        if credentials.get('socket_path'):
+            module.fail_json(msg='Only one region can be queried over a persistent connection')
+        credentials = dict(credentials, api_endpoint=None)
+
+    hooks = debug_timing(module)
+    results = run_batch(lambda region: NTTMCPClient(credentials, region, hooks=hooks), regions, len(regions))
+    errors = ['{0}: {1}'.format(region, exc) for region, client, exc in results if exc]
+    if errors:
+        module.fail_json(msg='Could not connect to the API - {0}'.format(', '.join(errors)))
+    return dict((region, client) for region, client, exc in results)
+
+
+def get_datacenter_regions(module, clients, regions, datacenters):
+    """
+    Return the region of each datacenter. The datacenters of each region are listed when there is more than one
+    region, otherwise every datacenter is in the only region
+
+    :arg module: The Ansible module instance
+    :arg clients: dict of clients keyed on region
+    :arg regions: The list of region names
+    :arg datacenters: The list of datacenter IDs
+    :returns: A list of tuples of (region, datacenter)
+    """
+    if len(regions) == 1:
+        return [(regions[0], datacenter) for datacenter in datacenters]
+
+    def list_datacenters(region):
+        return [x.get('id') for x in clients[region].get_dc().get('datacenter', [])]
+
+    locations = {}
+    for region, region_datacenters, exc in run_batch(list_datacenters, regions, len(regions)):
+        if exc:
+            module.fail_json(msg='Could not get the datacenters in {0} - {1}'.format(region, exc))
+        for datacenter in region_datacenters:
+            locations.setdefault(datacenter, region)
+    missing = [x for x in datacenters if x not in locations]
+    if missing:
+        module.fail_json(msg='Could not find the datacenter(s) {0} in the region(s) {1}'.format(
+            ', '.join(missing), ', '.join(regions)))
+    return [(locations[datacenter], datacenter) for datacenter in datacenters]
+
+
+def fan_out(module, credentials, query, concurrency=API_FANOUT_WORKERS, entity=None):
+    """
+    Call query once for each datacenter in the module datacenter argument, using a client for the region the
+    datacenter is in, and run the calls concurrently. The module region and datacenter arguments are lists. When the
+    module has no datacenter the query is called once per region with a datacenter of None. Any failure fails the
+    module
+
+    :arg module: The Ansible module instance
+    :arg credentials: The API credentials from get_credentials
+    :arg query: A callable taking a client and a datacenter ID and returning a result. It must raise
+                NTTMCPAPIException (and not call fail_json) on an error
+    :kw concurrency: The maximum number of datacenters queried at the same time
+    :kw entity: The name of the object list the query lists (e.g. server). The module fields argument is applied to
+                these objects as they are listed
+    :returns: A list of tuples of (region, datacenter, result) in the order of the datacenter argument
+    """
+    regions = unique(module.params.get('region'))
+    datacenters = unique(module.params.get('datacenter'))
+    valid_regions = get_regions()
+    if not regions or [x for x in regions if x not in valid_regions]:
+        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(valid_regions))
+
+    clients = get_region_clients(module, credentials, regions)
+    if entity is not None:
+        for client in clients.values():
+            project_listing(module, client, entity)
+    if datacenters:
+        locations = get_datacenter_regions(module, clients, regions, datacenters)
+    else:
+        locations = [(region, None) for region in regions]
+
+    results = run_batch(lambda location: query(clients[location[0]], location[1]), locations, concurrency)
+    errors = ['{0}/{1}: {2}'.format(location[0], location[1], exc) for location, result, exc in results if exc]
+    if errors:
+        module.fail_json(msg='; '.join(errors))
+    return [(location[0], location[1], result) for location, result, exc in results]
+
+
+def merge_results(results):
+    """
+    Merge the lists of objects returned for each datacenter into one list. Each object is tagged with the region it
+    came from and the datacenterId it was queried in (if the object does not already have one). An object returned
+    for more than one datacenter of the same region (e.g. looked up by UUID) is only included once
+
+    :arg results: A list of tuples of (region, datacenter, list of objects or None)
+    :returns: The merged list of objects
+    """
+    merged = []
+    seen = set()
+    for region, datacenter, objects in results:
+        for obj in objects or []:
+            key = (region, obj.get('id'))
+            if obj.get('id') and key in seen:
+                continue
+            seen.add(key)
+            obj['region'] = region
+            if datacenter and not obj.get('datacenterId'):
+                obj['datacenterId'] = datacenter
+            merged.append(obj)
+    return merged
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Recording and reporting of the Cloud Control API calls made by the client
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import re
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+UUID_PATTERN = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+def url_template(url):
+    """
+    Return the path of an API URL with any UUIDs (including the org ID) replaced so calls to the same end-point can
+    be grouped together
+
+    :arg url: The API URL
+    :returns: The URL path template e.g. /caas/2.11/{id}/server/server/{id}
+    """
+    return UUID_PATTERN.sub('{id}', urlparse(url).path)
+
+
+def percentile(values, percent):
+    """
+    Return the nearest-rank percentile of a list of values
+
+    :arg values: A list of numbers
+    :arg percent: The percentile (0-100)
+    :returns: The percentile value or None if there are no values
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(int(-(-len(values) * percent // 100)), 1)
+    return values[rank - 1]
+
+
+class APICallRecorder():
+    """
+    A client hook that keeps every API call record and summarises them. Each record is a dict containing the method,
+    url (template), status, bytes, latency (seconds) and page (None for unpaged calls)
+    """
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, call):
+        self.calls.append(call)
+
+    def summary(self):
+        """
+        Summarise the recorded API calls
+
+        :returns: dict containing the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        """
+        calls = list(self.calls)
+        latencies = [x.get('latency') for x in calls]
+        endpoints = {}
+        for call in calls:
+            endpoint = endpoints.setdefault('{0} {1}'.format(call.get('method'), call.get('url')),
+                                            {'count': 0, 'latency': 0, 'bytes': 0})
+            endpoint['count'] += 1
+            endpoint['latency'] = round(endpoint['latency'] + call.get('latency'), 3)
+            endpoint['bytes'] += call.get('bytes') or 0
+        return {
+            'count': len(calls),
+            'latency_p50': round(percentile(latencies, 50) or 0, 3),
+            'latency_p95': round(percentile(latencies, 95) or 0, 3),
+            'latency_total': round(sum(latencies), 3),
+            'bytes_total': sum(x.get('bytes') or 0 for x in calls),
+            'endpoints': endpoints
+        }
+
+
+def debug_timing(module):
+    """
+    If the module debug_timing option is set, return a hook that records every API call and add a summary of the
+    calls to the module result as api_timing. Pass the hooks to the client constructor
+    (NTTMCPClient(credentials, region, hooks=debug_timing(module))) so the calls made while the client is created
+    (e.g. the org ID lookup) are recorded too
+
+    :arg module: The Ansible module instance
+    :returns: A list holding the APICallRecorder or an empty list if debug_timing is not set
+    """
+    if not module.params.get('debug_timing'):
+        return []
+    recorder = APICallRecorder()
+
+    def with_summary(func):
+        def wrapper(**kwargs):
+            kwargs['api_timing'] = recorder.summary()
+            return func(**kwargs)
+        return wrapper
+
+    module.exit_json = with_summary(module.exit_json)
+    module.fail_json = with_summary(module.fail_json)
+    return [recorder]
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Sorted interval index for looking up public IPv4 blocks by address
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from bisect import bisect_left, bisect_right
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import IP_TO_INT
+
+
+def block_range(block):
+    """
+    Return the integer start and end addresses of a public IPv4 block
+
+    :arg block: A public IPv4 block dict (baseIp and size)
+    :returns: A tuple of (start, end)
+    """
+    start = IP_TO_INT(block.get('baseIp'))
+    return start, start + max(block.get('size') or 1, 1) - 1
+
+
+class IPv4BlockIndex():
+    """
+    An index of public IPv4 blocks as integer start/end ranges sorted by the start address. Looking up the block for
+    an address is a binary search instead of a scan of every address in every block
+    """
+    def __init__(self, blocks):
+        """
+        :arg blocks: A list of public IPv4 block dicts (baseIp and size)
+        """
+        entries = sorted(((block_range(block), block) for block in blocks), key=lambda x: x[0])
+        self.starts = [start for (start, end), block in entries]
+        self.ends = [end for (start, end), block in entries]
+        self.blocks = [block for (start, end), block in entries]
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def find(self, ip_address):
+        """
+        Return the block containing an IPv4 address
+
+        :arg ip_address: An IPv4 address string
+        :returns: The public IPv4 block dict or None
+        """
+        ip_int = IP_TO_INT(ip_address)
+        i = bisect_right(self.starts, ip_int) - 1
+        if i >= 0 and ip_int <= self.ends[i]:
+            return self.blocks[i]
+        return None
+
+
+def any_in_range(sorted_ips, start, end):
+    """
+    Check if any address in a sorted list of integer IPv4 addresses falls within an inclusive range
+
+    :arg sorted_ips: A sorted list of integer IPv4 addresses
+    :arg start: The integer start address
+    :arg end: The integer end address
+    :returns: True or False
+    """
+    i = bisect_left(sorted_ips, start)
+    return i < len(sorted_ips) and sorted_ips[i] <= end
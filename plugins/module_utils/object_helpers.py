@@ -9,7 +9,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 
 
 def fw_update_dict(fw_rule):
@@ -29,30 +29,55 @@ def fw_update_dict(fw_rule):
 def compare_fw_rule(new_fw_rule, existing_fw_rule):
     """
     Compare two firewall rules and return any differences. This uses the generic
-    compare_json but first the schemas of the firewall rules must be matched
+    diff_json but first the schemas of the firewall rules must be matched. Neither rule is modified
 
     :arg new_fw_rule: The new firewall rule to check
     :arg existing_fw_rule: The existing firewall rule to check against
     :returns: dict containing any differences
     """
-    existing_dst = existing_fw_rule['destination']
-    existing_src = existing_fw_rule['source']
-    existing_fw_rule['destination'] = {}
-    existing_fw_rule['source'] = {}
-
-    # Handle schema differences between create/update schema and the returned get/list schema
-    if 'ipAddressList' in existing_dst:
-        existing_fw_rule['destination']['ipAddressListId'] = existing_dst['ipAddressList']['id']
-    if 'portList' in existing_dst:
-        existing_fw_rule['destination']['portListId'] = existing_dst['portList']['id']
-    if 'ipAddressList' in existing_src:
-        existing_fw_rule['source']['ipAddressListId'] = existing_src['ipAddressList']['id']
-    if 'portList' in existing_src:
-        existing_fw_rule['source']['portListId'] = existing_src['portList']['id']
-
-    existing_fw_rule.pop('ruleType', None)
-    existing_fw_rule.pop('datacenterId', None)
-    existing_fw_rule.pop('state', None)
-    new_fw_rule.pop('placement', None)
-
-    return compare_json(new_fw_rule, existing_fw_rule, None)
+    # Handle schema differences between the create/update schema and the returned get/list schema. The nested
+    # source/destination dicts are replaced rather than changed so a shallow copy leaves the caller's rule untouched
+    existing_fw_rule = dict(existing_fw_rule)
+    if existing_fw_rule.get('ruleType') != 'DEFAULT_RULE':
+        existing_dst = existing_fw_rule['destination']
+        existing_src = existing_fw_rule['source']
+        existing_fw_rule['destination'] = {}
+        existing_fw_rule['source'] = {}
+
+        if 'ipAddressList' in existing_dst:
+            existing_fw_rule['destination']['ipAddressListId'] = existing_dst['ipAddressList']['id']
+        elif 'ip' in existing_dst:
+            existing_fw_rule['destination']['ip'] = {}
+            existing_fw_rule['destination']['ip']['address'] = existing_dst['ip']['address']
+            if 'prefixSize' in existing_dst['ip']:
+                existing_fw_rule['destination']['ip']['prefixSize'] = str(existing_dst['ip']['prefixSize'])
+        if 'portList' in existing_dst:
+            existing_fw_rule['destination']['portListId'] = existing_dst['portList']['id']
+        elif 'port' in existing_dst:
+            existing_fw_rule['destination']['port'] = {}
+            existing_fw_rule['destination']['port']['begin'] = str(existing_dst['port']['begin'])
+            if 'end' in existing_dst['port']:
+                existing_fw_rule['destination']['port']['end'] = str(existing_dst['port']['end'])
+        if 'ipAddressList' in existing_src:
+            existing_fw_rule['source']['ipAddressListId'] = existing_src['ipAddressList']['id']
+        elif 'ip' in existing_src:
+            existing_fw_rule['source']['ip'] = {}
+            existing_fw_rule['source']['ip']['address'] = existing_src['ip']['address']
+            if 'prefixSize' in existing_src['ip']:
+                existing_fw_rule['source']['ip']['prefixSize'] = str(existing_src['ip']['prefixSize'])
+        if 'portList' in existing_src:
+            existing_fw_rule['source']['portListId'] = existing_src['portList']['id']
+        elif 'port' in existing_src:
+            existing_fw_rule['source']['port'] = {}
+            existing_fw_rule['source']['port']['begin'] = str(existing_src['port']['begin'])
+            if 'end' in existing_src['port']:
+                existing_fw_rule['source']['port']['end'] = str(existing_src['port']['end'])
+
+        existing_fw_rule.pop('ruleType', None)
+        existing_fw_rule.pop('datacenterId', None)
+        existing_fw_rule.pop('state', None)
+        existing_fw_rule.pop('ipVersion', None)
+        existing_fw_rule.pop('name', None)
+        existing_fw_rule.pop('networkDomainId', None)
+
+    return diff_json(new_fw_rule, existing_fw_rule)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Reduce API objects to a set of dotted path fields
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+# The fields kept on listed objects (in addition to the requested fields) so a module can still match and merge them.
+# They are removed again from the module result if they were not requested
+LISTING_FIELDS = ['id', 'name']
+
+
+def parse_fields(fields):
+    """
+    Parse a list of dotted path fields into a tree of dicts. A field that selects a whole value is None in the tree
+    e.g. ['name', 'networkInfo.primaryNic.privateIpv4'] is {'name': None, 'networkInfo': {'primaryNic':
+    {'privateIpv4': None}}}. A field that is a prefix of another (e.g. networkInfo and networkInfo.primaryNic) selects
+    the whole value
+
+    :arg fields: A list of dotted path strings
+    :returns: The field tree or None if no fields were supplied
+    """
+    tree = {}
+    for field in fields or []:
+        path = [x for x in str(field).split('.') if x]
+        if not path:
+            continue
+        node = tree
+        for name in path[:-1]:
+            if name in node and node[name] is None:
+                break
+            node = node.setdefault(name, {})
+        else:
+            node[path[-1]] = None
+    return tree or None
+
+
+def project(value, tree):
+    """
+    Return a copy of an object (or a list of objects) holding only the fields in the field tree. A path through a list
+    is applied to every element of the list and paths that do not exist in the object are left out
+
+    :arg value: The object, list of objects or any other value
+    :arg tree: The field tree from parse_fields (None returns the value as it is)
+    :returns: The projected value
+    """
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [project(x, tree) for x in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for name, subtree in tree.items():
+        if name not in value:
+            continue
+        if subtree is not None and not isinstance(value[name], (dict, list)):
+            continue
+        result[name] = project(value[name], subtree)
+    return result
+
+
+def project_listing(module, client, entity):
+    """
+    If the module fields argument is set, reduce each object of the entity type listed by the client to the fields
+    (plus LISTING_FIELDS) as each page arrives, so the full objects are never held or returned
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg entity: The name of the object list in the API response (e.g. server)
+    """
+    if module.params.get('fields'):
+        client.project(entity, list(module.params.get('fields')) + LISTING_FIELDS)
+
+
+def project_output(module, keys, always=None):
+    """
+    If the module fields argument is set, reduce the objects the module returns in data[key] for each key (or data
+    itself if it is not a return_object) to exactly the fields when the module exits
+
+    :arg module: The Ansible module instance
+    :arg keys: The return_object key or list of keys holding the objects
+    :kw always: Optional list of fields that are returned even if they were not requested
+    :returns: N/A
+    """
+    if not module.params.get('fields'):
+        return
+    tree = parse_fields(list(module.params.get('fields')) + list(always or []))
+    if not isinstance(keys, (list, tuple)):
+        keys = [keys]
+
+    def with_projection(func):
+        def wrapper(**kwargs):
+            data = kwargs.get('data')
+            if isinstance(data, dict) and [key for key in keys if key in data]:
+                kwargs['data'] = dict(data)
+                for key in [key for key in keys if key in data]:
+                    kwargs['data'][key] = project(data[key], tree)
+            elif data is not None:
+                kwargs['data'] = project(data, tree)
+            return func(**kwargs)
+        return wrapper
+
+    module.exit_json = with_projection(module.exit_json)
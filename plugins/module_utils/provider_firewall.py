@@ -0,0 +1,772 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - Firewall API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+class NTTMCPFirewallAPI():
+    """
+    NTTMCPClient methods for port lists, IP address lists and firewall rules. Loaded by NTTMCPClient the first time
+    one of the methods is used
+    """
+    def list_port_list_old(self, network_domain_id):
+        """
+        Return an array of port lists for a specified Cloud Network Domains
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :returns: Array of Port Lists
+        """
+        url = self.base_url + 'network/portList'
+
+        params = {'networkDomainId': network_domain_id}
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()['portList']
+        except KeyError:
+            return []
+
+    def list_port_list(self, network_domain_id=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of port lists for a specified Cloud Network Domains
+
+        :kw network_domain_id: Cloud Network Domain UUID
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: Array of Port Lists
+        """
+        params = {}
+
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/portList'
+
+        return list(self.iter_entities(url=url, entity='portList', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_port_list(self, network_domain_id, port_list_id):
+        """
+        Return a port list based on UUIDs
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg port_list_id: The UUID of a Port List
+        :returns: Port List
+        """
+        url = self.base_url + 'network/portList/%s' % port_list_id
+
+        response = self.api_get_call(url)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_port_list_by_name(self, network_domain_id, name):
+        """
+        Return a port list based on a specified name
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a Port List
+        :returns: Port List or None
+        """
+        url = self.base_url + 'network/portList'
+
+        params = {'networkDomainId': network_domain_id}
+        port_list = self.get_entity_by_name(url=url, entity='portList', name=name, params=params)
+        self.resolver.set('portList', network_domain_id, name, (port_list or {}).get('id'))
+        return port_list
+
+    def resolve_port_list_id(self, network_domain_id, name):
+        """
+        Return the UUID of a port list from the resolver cache, looking it up by name on a cache miss
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a Port List
+        :returns: The UUID of the Port List
+        """
+        port_list_id = self.resolver.get('portList', network_domain_id, name)
+        if not port_list_id:
+            port_list_id = (self.get_port_list_by_name(network_domain_id, name) or {}).get('id')
+        if not port_list_id:
+            raise NTTMCPAPIException('Could not find the Port List {0}'.format(name))
+        return port_list_id
+
+    def create_port_list(self, network_domain_id, name, description, ports, child_port_lists):
+        """
+        Create a port list
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a Port List
+        :arg description: The description of the port list
+        :arg ports: An array of beginning and end ports
+        :arg child_port_list: An array of port list UUIDs
+        :returns: Port List UUID
+        """
+        if network_domain_id is None or name is None or (ports is None and child_port_lists is None):
+            raise NTTMCPAPIException('A valid Network Domain, Name and Beginning Port is required')
+
+        params = self.port_list_args_to_dict(True,
+                                             network_domain_id,
+                                             None,
+                                             name,
+                                             description,
+                                             ports,
+                                             None,
+                                             child_port_lists,
+                                             None)
+        url = self.base_url + 'network/createPortList'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['info'][0]['value']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create Port List request was accepted')
+
+    def update_port_list(self, network_domain_id, port_list_id, description, ports, ports_nil, child_port_lists, child_port_lists_nil):
+        """
+        Update an existing port list
+
+        :arg network_domain_id: The UUID of the Cloud Network Domain
+        :arg port_list_id: The UUID of a Port List
+        :arg description: The description of the port list
+        :arg ports: An array of beginning and end ports
+        :arg ports_nil: Boolean to denote whether to delete all ports
+        :arg child_port_lists: An array of port list UUIDs
+        :arg child_port_lists_nil: Boolean to denote whether to delete all child Port Lists
+        :returns: Port List UUID
+        """
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain ID is required')
+        if port_list_id is None:
+            raise NTTMCPAPIException('A valid Port List ID is required')
+
+        params = self.port_list_args_to_dict(False,
+                                             network_domain_id,
+                                             port_list_id,
+                                             None,
+                                             description,
+                                             ports,
+                                             ports_nil,
+                                             child_port_lists,
+                                             child_port_lists_nil)
+        params.pop('name')
+        url = self.base_url + 'network/editPortList'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['responseCode']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update Port List request was accepted')
+
+    def port_list_args_to_dict(self, create, network_domain_id, port_list_id, name, description,
+                               ports, ports_nil, child_port_list, child_port_list_nil):
+        """
+        Convert a list of port list args to a dict
+        """
+        child_port_list_id = []
+        params = {}
+        params['port'] = []
+        params['name'] = name
+
+        if not create:
+            params['id'] = port_list_id
+        else:
+            params['networkDomainId'] = network_domain_id
+
+        if child_port_list_nil:
+            child_port_list_id.append({'nil': True})
+        elif child_port_list:
+            if network_domain_id is None:
+                raise NTTMCPAPIException('A valid Network Domain is required')
+            for port_list_name in child_port_list:
+                try:
+                    child_port_list_id.append(self.resolve_port_list_id(network_domain_id, port_list_name))
+                except (KeyError, IndexError, NTTMCPAPIException):
+                    raise NTTMCPAPIException('Could not find child port lists')
+
+        if ports_nil:
+            params['port'].append({'nil': True})
+        else:
+            for port in ports:
+                new_port_group = {}
+                try:
+                    new_port_group['begin'] = port['port_begin']
+                    if 'port_end' in port:
+                        if port['port_end'] > port['port_begin']:
+                            new_port_group['end'] = port['port_end']
+                        else:
+                            raise NTTMCPAPIException('End port must be greater than the beginning port')
+                    params['port'].append(new_port_group)
+                except KeyError:
+                    raise NTTMCPAPIException('Port groups must have a beginning port')
+
+        if description:
+            params['description'] = description
+
+        if child_port_list_id:
+            params['childPortListId'] = child_port_list_id
+
+        return params
+
+    def remove_port_list(self, port_list_id):
+        """
+        Remove a port list - Note port list must not be currently used in a firewall rule
+
+        :arg port_list_id: Port List UUID
+        :returns: string (API message)
+        """
+        params = {'id': port_list_id}
+
+        url = self.base_url + 'network/deletePortList'
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove Port List request was accepted')
+
+    def list_ip_list_old(self, network_domain_id, version):
+        """
+        Return an array of IP address lists
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg version: IP version
+        :returns: Array of IP Address Lists
+        """
+        url = self.base_url + 'network/ipAddressList'
+
+        params = {'networkDomainId': network_domain_id}
+        if version:
+            params['ipVersion'] = version
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()['ipAddressList']
+        except KeyError:
+            return []
+
+    def list_ip_list(self, network_domain_id=None, version=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of IP address lists
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg version: IP version
+        :arg page_size: The number of objects per page
+        :arg max_workers: The maximum number of pages to fetch concurrently
+        :returns: Array of IP Address Lists
+        """
+        params = {}
+
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if version:
+            params['ipVersion'] = version
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/ipAddressList'
+
+        return list(self.iter_entities(url=url, entity='ipAddressList', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_ip_list(self, network_domain_id, ip_address_list_id):
+        """
+        Return a specific IP address list based on a UUID
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg port_list_id: The UUID of a IP Address List
+        :returns: IP Address List
+        """
+        url = self.base_url + 'network/ipAddressList/%s' % ip_address_list_id
+
+        response = self.api_get_call(url)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_ip_list_by_name(self, network_domain_id, name, version):
+        """
+        Return a specific IP address list for the specified name
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a IP Address List
+        :returns: IP Address List
+        """
+        url = self.base_url + 'network/ipAddressList'
+
+        params = {'networkDomainId': network_domain_id}
+        if version:
+            params['ipVersion'] = version
+        ip_list = self.get_entity_by_name(url=url, entity='ipAddressList', name=name, params=params)
+        self.resolver.set('ipAddressList', (network_domain_id, version), name, (ip_list or {}).get('id'))
+        return ip_list
+
+    def resolve_ip_list_id(self, network_domain_id, name, version):
+        """
+        Return the UUID of an IP address list from the resolver cache, looking it up by name on a cache miss
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a IP Address List
+        :arg version: The IP version
+        :returns: The UUID of the IP Address List
+        """
+        ip_list_id = self.resolver.get('ipAddressList', (network_domain_id, version), name)
+        if not ip_list_id:
+            ip_list_id = (self.get_ip_list_by_name(network_domain_id, name, version) or {}).get('id')
+        if not ip_list_id:
+            raise NTTMCPAPIException('Could not find the IP Address List {0}'.format(name))
+        return ip_list_id
+
+    def create_ip_list(self, network_domain_id, name, description, ip_addresses, child_ip_lists, version):
+        """
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a IP Address List
+        :arg description: The description of the IP Address list
+        :arg ip_addresses: An array of beginning and end ports
+        :arg child_ip_lists: An array of IP Address list UUIDs
+        :arg version: IP version
+        :returns: IP Address List UUID
+        """
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain ID is required')
+        if name is None:
+            raise NTTMCPAPIException('A valid IP address list name is required')
+
+        params = self.ip_list_args_to_dict(True,
+                                           network_domain_id,
+                                           None,
+                                           name,
+                                           description,
+                                           ip_addresses,
+                                           False,
+                                           child_ip_lists,
+                                           False,
+                                           version)
+
+        url = self.base_url + 'network/createIpAddressList'
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['info'][0]['value']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create IP Address List request was accepted')
+
+    def update_ip_list(self, network_domain_id, ip_address_list_id, description, ip_addresses, ip_addresses_nil,
+                       child_ip_lists, child_ip_lists_nil):
+        """
+        Update an existing IP address list
+
+        :arg network_domain_id: The UUID of the Cloud Network Domain
+        :arg ip_address_list_id: The UUID of a IP Address List
+        :arg description: The description of the IP Address list
+        :arg ip_addresses: An array of beginning and end ip addresses
+        :arg ip_addresses_nil: Boolean to denote whether to delete all ip addresses
+        :arg child_ip_lists: An array of IP Address list UUIDs
+        :arg child_ip_lists_nil: Boolean to denote whether to delete all child IP Address Lists
+        :returns: Port List UUID
+        """
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain ID is required')
+        if ip_address_list_id is None:
+            raise NTTMCPAPIException('A valid IP Address List ID is required')
+
+        params = self.ip_list_args_to_dict(False,
+                                           network_domain_id,
+                                           ip_address_list_id,
+                                           None,
+                                           description,
+                                           ip_addresses,
+                                           ip_addresses_nil,
+                                           child_ip_lists,
+                                           child_ip_lists_nil,
+                                           None)
+        params.pop('name')
+        params.pop('ipVersion')
+
+        url = self.base_url + 'network/editIpAddressList'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['responseCode']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update IP Address List request was accepted')
+
+    def ip_list_args_to_dict(self, create, network_domain_id, ip_address_list_id, name, description, ip_addresses,
+                             ip_addresses_nil, child_ip_lists, child_ip_lists_nil, version):
+        """
+        Convert a list of IP address list arguments to a dict
+        :arg network_domain_id: The UUID of the Cloud Network Domain
+        :arg ip_address_list_id: The UUID of a IP Address List
+        :arg description: The description of the IP Address list
+        :arg ip_addresses: An array of beginning and end ip addresses
+        :arg ip_addresses_nil: Boolean to denote whether to delete all ip addresses
+        :arg child_ip_lists: An array of IP Address list UUIDs
+        :arg child_ip_lists_nil: Boolean to denote whether to delete all child IP Address Lists
+        :returns: Port List UUID
+        """
+        child_ip_list_id = []
+        params = {}
+        params['ipAddress'] = []
+        params['name'] = name
+        params['ipVersion'] = version
+
+        if not create:
+            params['id'] = ip_address_list_id
+        else:
+            params['networkDomainId'] = network_domain_id
+
+        if child_ip_lists_nil:
+            child_ip_list_id.append({'nil': True})
+        elif child_ip_lists:
+            if network_domain_id is None:
+                raise NTTMCPAPIException('A valid Network Domain is required')
+            for child_ip_list in child_ip_lists:
+                try:
+                    child_ip_list_id.append(self.resolve_ip_list_id(network_domain_id, child_ip_list, version))
+                except Exception:
+                    raise NTTMCPAPIException('Could not find child IP Address lists')
+
+        if ip_addresses_nil:
+            params['ipAddress'].append({'nil': True})
+        else:
+            for ip_address in ip_addresses:
+                new_ip_group = {}
+                try:
+                    new_ip_group['begin'] = ip_address.get('begin')
+                    if 'end' in ip_address:
+                        new_ip_group['end'] = ip_address.get('end')
+                    elif 'prefix' in ip_address:
+                        new_ip_group['prefixSize'] = int(ip_address.get('prefix'))
+                    params['ipAddress'].append(new_ip_group)
+                except KeyError:
+                    raise NTTMCPAPIException('IP Addresses must have a beginning IP Address')
+
+        if description:
+            params['description'] = description
+
+        if child_ip_list_id:
+            params['childIpAddressListId'] = child_ip_list_id
+
+        return params
+
+    def remove_ip_list(self, ip_address_list_id):
+        """
+        Remove an IP address list
+
+        :arg ip_address_list_id: IP Address List UUID
+        :returns: string (API message)
+        """
+        params = {'id': ip_address_list_id}
+
+        url = self.base_url + 'network/deleteIpAddressList'
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove IP Address List request was accepted')
+
+    def list_fw_rules_old(self, network_domain_id,):
+        """
+        Return an array of firewall rules for the specified Cloud Network Domain
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :returns: Array of firewall rules
+        """
+        url = self.base_url + 'network/firewallRule'
+
+        params = {'networkDomainId': network_domain_id}
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()['firewallRule']
+        except KeyError:
+            return []
+
+    def list_fw_rules(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of firewall rules and utilize paging functionality for more than 250 servers
+
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        """
+        params = {}
+
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        else:
+            raise NTTMCPAPIException('A valid network domain ID is required')
+        if name is not None:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/firewallRule'
+
+        return list(self.iter_entities(url=url, entity='firewallRule', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def list_fw_rule_stats_old(self, network_domain_id=None, name=None):
+        """
+        Return an array of firewall rules with statistics for the specified Cloud Network Domain
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :returns: Array of firewall rules
+        """
+        url = self.base_url + 'network/firewallRuleStatistics'
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid network domain ID is required')
+
+        params = {'networkDomainId': network_domain_id}
+        if name is not None:
+            params['name'] = name
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()['firewallRuleStatistics']
+        except KeyError:
+            return []
+
+    def list_fw_rule_stats(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of firewall rules with statistics and utilize paging functionality for more than 250 fw rules
+
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        """
+        params = {}
+
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        else:
+            raise NTTMCPAPIException('A valid network domain ID is required')
+        if name is not None:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/firewallRuleStatistics'
+
+        return list(self.iter_entities(url=url, entity='firewallRuleStatistics', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_fw_rule(self, network_domain_id, fw_rule_id):
+        """
+        Return a specific firewall rule based on a UUID
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg fw_rule_id: The UUID of an ACL rule
+        :returns: firewall rule
+        """
+        url = self.base_url + 'network/firewallRule/{0}'.format(fw_rule_id)
+
+        response = self.api_get_call(url)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_fw_rule_by_name(self, network_domain_id, name):
+        """
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg name: The name of a firewall rule
+        :arg version: the IP version ([IPV4, IPv6])
+        :returns: firewall rule
+        """
+        url = self.base_url + 'network/firewallRule'
+
+        params = {'networkDomainId': network_domain_id}
+        return self.get_entity_by_name(url=url, entity='firewallRule', name=name, params=params)
+
+    def create_fw_rule(self, fw_rule):
+        """
+        Create a firewall rule from the specified dict of arguments
+
+        :arg fw_rule: The new Firewall rule dict
+        :returns: message
+        """
+        url = self.base_url + 'network/createFirewallRule'
+        fw_src = fw_rule['source']
+        fw_dst = fw_rule['destination']
+
+        if fw_rule['networkDomainId'] is None:
+            raise NTTMCPAPIException('Network Domain UUID is required')
+        if fw_rule['name'] is None:
+            raise NTTMCPAPIException('Name is required')
+        if 'ip' not in fw_src and 'ipAddressListId' not in fw_src:
+            raise NTTMCPAPIException('Source IP or IP Address list is required')
+        if 'ip' not in fw_dst and 'ipAddressListId' not in fw_dst:
+            raise NTTMCPAPIException('Destination IP or IP Address list is required')
+        if 'port' in fw_src:
+            if 'begin' not in fw_src['port']:
+                raise NTTMCPAPIException('Source Port or Port list is required')
+        if 'port' in fw_dst:
+            if 'begin' not in fw_dst['port']:
+                raise NTTMCPAPIException('Destination Port or Port list is required')
+
+        response = self.api_post_call(url, fw_rule)
+        try:
+            return response.json()['info'][0]['value']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create firewall rule request was accepted')
+
+    def fw_args_to_dict(self, create, fw_rule_id, network_domain_id, name, action, version,
+                        protocol, src_ip, src_ip_prefix, src_ip_list_id,
+                        dst_ip, dst_ip_prefix, dst_ip_list_id, src_port_begin,
+                        src_port_end, src_port_list_id, dst_port_begin,
+                        dst_port_end, dst_port_list_id, enabled, position,
+                        position_to):
+        """
+        Convert a list of firewall rule arguments to a dict
+
+        :arg create: Boolean as to whether or not to create an ACL
+        :arg fw_rule_id: UUID of the firewall rule
+        :arg network_domain_id: The UUID of the CND
+        :arg action: [ACCEPT_DECISIVELY, DROP]
+        :arg protocol: [IP, ICMP, TCP, UDP]
+        :arg src_ip: (string) IPv4 or IPv6 address
+        :arg src_ip_prefix: (string) IP prefix
+        :arg src_ip_list_id: (string) UUID of an IP Address List
+        :arg dst_ip: (string) IPv4 or IPv6 address
+        :arg dst_ip_prefix: (string) IP prefix
+        :arg dst_ip_list_id: (string) UUID of an IP Address List
+        :arg src_port_begin: (string) beginning port number for
+        :arg src_port_end: (string) end port number for a port range
+        :arg src_port_list: (string) UUID of a port list
+        :arg dst_port_begin: (string) beginning port number
+        :arg dst_port_end: (string) end port number for a port range
+        :arg dst_port_list: (string) UUID of a port list
+        :arg enabled: (boolean) whether to enable the firewall rule
+        :arg position: [FIRST, LAST, BEFORE, AFTER]
+        :arg position_to: (string) name of an existing firewall rule
+        :returns: Firewall Rule Dictionary
+        """
+        params = {}
+        if create:
+            params['placement'] = {}
+        if src_ip is not None or src_ip_list_id is not None or src_port_begin is not None or src_port_list_id:
+            params['source'] = {}
+        if dst_ip is not None or dst_ip_list_id is not None or dst_port_begin is not None or dst_port_list_id:
+            params['destination'] = {}
+
+        if not create:
+            if fw_rule_id:
+                params['id'] = fw_rule_id
+        else:
+            if network_domain_id:
+                params['networkDomainId'] = network_domain_id
+            if name:
+                params['name'] = name
+        try:
+            if src_ip_list_id:
+                params['source']['ipAddressListId'] = src_ip_list_id
+            elif 'source' in params:
+                params['source']['ip'] = {}
+                if src_ip == '0.0.0.0' and src_ip_prefix == '0':
+                    params['source']['ip']['address'] = 'ANY'
+                else:
+                    params['source']['ip']['address'] = src_ip
+                    if src_ip_prefix:
+                        params['source']['ip']['prefixSize'] = src_ip_prefix
+            if dst_ip_list_id:
+                params['destination']['ipAddressListId'] = dst_ip_list_id
+            elif 'source' in params:
+                params['destination']['ip'] = {}
+                if dst_ip == '0.0.0.0' and dst_ip_prefix == '0':
+                    params['destination']['ip']['address'] = 'ANY'
+                else:
+                    params['destination']['ip']['address'] = dst_ip
+                    if dst_ip_prefix:
+                        params['destination']['ip']['prefixSize'] = dst_ip_prefix
+            if src_port_list_id:
+                params['source']['portListId'] = src_port_list_id
+            else:
+                if src_port_begin != 'ANY' and src_port_begin:
+                    params['source']['port'] = {}
+                    params['source']['port']['begin'] = src_port_begin
+                    if src_port_end:
+                        params['source']['port']['end'] = src_port_end
+            if dst_port_list_id:
+                params['destination']['portListId'] = dst_port_list_id
+            else:
+                if dst_port_begin != 'ANY' and dst_port_begin:
+                    params['destination']['port'] = {}
+                    params['destination']['port']['begin'] = dst_port_begin
+                    if dst_port_end:
+                        params['destination']['port']['end'] = dst_port_end
+
+            # Configure the defaults
+            if create:
+                if position is None:
+                    position = 'LAST'
+                if position_to:
+                    params['placement']['relativeToRule'] = position_to
+                params['ipVersion'] = version
+                params['placement']['position'] = position
+
+            if action is None:
+                action = 'ACCEPT_DECISIVELY'
+            if version is None:
+                version = 'IPV4'
+            if protocol is None:
+                protocol = 'TCP'
+            if enabled is None:
+                enabled = True
+            params['enabled'] = enabled
+            params['protocol'] = protocol
+
+            params['action'] = action
+
+        except (KeyError, AttributeError, IndexError) as e:
+            raise NTTMCPAPIException("Could not create the firewall arguments: {0}".format(e))
+
+        return params
+
+    def update_fw_rule(self, fw_rule):
+        """
+        Update an existing firewall rule
+
+        :arg fw_rule: a Firewall rule dictionary
+        :returns: message
+        """
+        url = self.base_url + 'network/editFirewallRule'
+
+        if fw_rule['id'] is None:
+            raise NTTMCPAPIException('Id is required')
+
+        response = self.api_post_call(url, fw_rule)
+        try:
+            return response.json().get('responseCode')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update firewall rule request was accepted')
+
+    def remove_fw_rule(self, firewall_rule_id):
+        """
+        Remove a firewall rule
+
+        :arg fw_rule_id: UUID of the firewall rule
+        :returns: string (API message)
+        """
+        params = {'id': firewall_rule_id}
+
+        url = self.base_url + 'network/deleteFirewallRule'
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove firewall rule request was accepted')
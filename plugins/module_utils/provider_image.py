@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - Image API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+class NTTMCPImageAPI():
+    """
+    NTTMCPClient methods for OS and customer images, image import/export and server cloning. Loaded by NTTMCPClient
+    the first time one of the methods is used
+    """
+    def get_os(self, os_id=None, os_name=None, os_family=None):
+        """
+        Return an OS object for a given UUID, name or family
+        """
+        params = {}
+        if os_id:
+            if '*' in os_id:
+                params['id.LIKE'] = os_id
+            else:
+                params['id'] = os_id
+        if os_name:
+            if '*' in os_name:
+                params['name.LIKE'] = os_name
+            else:
+                params['name'] = os_name
+        if os_family:
+            params['family'] = os_family
+
+        url = self.base_url + 'infrastructure/operatingSystem'
+
+        response = self.api_get_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_image(self, datacenter_id=None, image_id=None, image_name=None, os_family=None, page_size=API_PAGE_SIZE,
+                   max_workers=None):
+        """
+        Return the images based on a datacenter, UUID, name or family and utilize paging
+
+        :kw datacenter_id: The MCP ID
+        :kw image_id: The UUID of an image
+        :kw image_name: The name of an image
+        :kw os_family: The operating system family type
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: dict containing the list of images as osImage and the image count as totalCount
+        """
+        params = {}
+        if image_id:
+            if '*' in image_id:
+                params['id.LIKE'] = image_id
+            else:
+                params['id'] = image_id
+        if image_name:
+            if '*' in image_name:
+                params['name.LIKE'] = image_name
+            else:
+                params['name'] = image_name
+        if os_family:
+            params['family'] = os_family
+        if datacenter_id:
+            params['datacenterId'] = datacenter_id
+
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'image/osImage'
+
+        images = list(self.iter_entities(url=url, entity='osImage', params=params, page_size=page_size,
+                                         max_workers=max_workers))
+        return {'osImage': images, 'totalCount': len(images)}
+
+    def get_customer_image(self, image_id):
+        """
+        Return a customer imported image
+
+        :arg image_id: The UUID of the image
+        :returns: the customer image object
+        """
+        url = self.base_url + 'image/customerImage/%s' % image_id
+
+        response = self.api_get_call(url)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_customer_image(self, datacenter_id=None, image_id=None, image_name=None, os_family=None,
+                            page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List customer images based on the supplied filter criteria and utilize paging
+
+        arg: datacenter_id: The UUID of the MCP
+        arg: image_id: The UUID of an existing customer image
+        arg: image_name: The name of an existing customer image
+        arg: os_family: The operating system family type
+        kw: page_size: The number of objects per page
+        kw: max_workers: The maximum number of pages to fetch concurrently
+        returns: dict containing the list of customer images as customerImage and the image count as totalCount
+        """
+        params = {}
+        if image_id is not None:
+            if '*' in image_id:
+                params['id.LIKE'] = image_id
+            else:
+                params['id'] = image_id
+        if image_name is not None:
+            if '*' in image_name:
+                params['name.LIKE'] = image_name
+            else:
+                params['name'] = image_name
+        if os_family is not None:
+            params['family'] = os_family
+        if datacenter_id is not None:
+            params['datacenterId'] = datacenter_id
+
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'image/customerImage'
+
+        images = list(self.iter_entities(url=url, entity='customerImage', params=params, page_size=page_size,
+                                         max_workers=max_workers))
+        return {'customerImage': images, 'totalCount': len(images)}
+
+    def import_customer_image(self, datacenter_id, ovf_package, image_name, description, guest_customization):
+        """
+        Import a customer image
+
+        :arg datacenter: The datacenter ID e.g. NA9
+        :arg ovf_package: The filename of the OVF manifest file on the FTPS server
+        :arg image_name: The name to be assigned to the imported image
+        :arg description: The image description in Cloud Control
+        :arg guest_customization: Boolean to enable/disable Guest OS Customization
+        :returns: the customer image object
+        """
+        url = self.base_url + 'image/importImage'
+        params = {}
+
+        if datacenter_id is None:
+            raise NTTMCPAPIException('datacenter_id cannot be None')
+        else:
+            params['datacenterId'] = datacenter_id
+        if ovf_package is None:
+            raise NTTMCPAPIException('ovf_package cannot be None')
+        else:
+            params['ovfPackage'] = ovf_package
+        if image_name is None:
+            raise NTTMCPAPIException('image_name cannot be None')
+        else:
+            params['name'] = image_name
+        if description:
+            params['description'] = description
+        if guest_customization is None:
+            raise NTTMCPAPIException('guest_customization cannot be None')
+        else:
+            params['guestOsCustomization'] = guest_customization
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_customer_image(self, image_id):
+        """
+        Delete a customer image
+
+        :arg image_id: The GUID to be assigned to the customer image
+        :returns: the customer image object
+        """
+        url = self.base_url + 'image/deleteCustomerImage'
+        params = {}
+
+        if image_id is None:
+            raise NTTMCPAPIException('image_id cannot be None')
+        else:
+            params['id'] = image_id
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_image_export_history(self, image_id):
+        """
+        Return the export history for a given image export ID
+
+        :arg image_id: The ID of the image export
+        :returns: The API response
+        """
+        params = dict()
+        if image_id is None:
+            raise NTTMCPAPIException('A valid Image ID is required to find the export history')
+
+        params['imageExportId'] = image_id
+
+        url = self.base_url + 'image/exportInProgress'
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()
+        except Exception:
+            return dict()
+
+    def export_image(self, image_id=None, ovf_name=None):
+        """
+        Export a customer image
+
+        :arg image_id: The ID of the image to export
+        :arg ovf_name: The name of the OVF package
+        :returns: The UUID of the image export
+        """
+        params = dict()
+        if image_id is None:
+            raise NTTMCPAPIException('A valid Image ID is required to export an image')
+        if ovf_name is None:
+            raise NTTMCPAPIException('A valid OVF Name is required to export an image')
+
+        params['imageId'] = image_id
+        params['ovfPackagePrefix'] = ovf_name
+
+        url = self.base_url + 'image/exportImage'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'IN_PROGRESS':
+                return next((item for item in result.get('info') if item.get("name") == "imageExportId"), dict()).get('value')
+            else:
+                raise NTTMCPAPIException('Could not confirm that the image export started successfully: {0}'.format(response.content))
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def clone_server_to_image(self, server_id=None, image_name=None, description=None, cluster_id=None, goc=True):
+        """
+        Clone an existing server to a customer image
+
+        :kw server_id: The UUID of the server to clone
+        :kw image_name: The name of the new image
+        :kw description: The image description
+        :kw cluster_id: The cluster ID when in a multi-cluster environment
+        :kw goc: Guest OS customization on this image
+        :returns: The UUID of the new image
+        """
+        params = dict()
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server ID is required')
+        if image_name is None:
+            raise NTTMCPAPIException('A valid image name is required')
+
+        params['id'] = server_id
+        params['imageName'] = image_name
+        params['guestOsCustomization'] = goc
+        if description:
+            params['description'] = description
+        if cluster_id:
+            params['clusterId'] = cluster_id
+
+        url = self.base_url + 'server/cloneServer'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'IN_PROGRESS':
+                return next((item for item in result.get('info') if item.get("name") == "imageId"), dict()).get('value')
+            else:
+                raise NTTMCPAPIException('Could not confirm that the image export started successfully: {0}'.format(response.content))
+        else:
+            raise NTTMCPAPIException('No response from the API')
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - IPAM API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+try:
+    from ipaddress import (ip_address as ip_addr)
+except ImportError:
+    pass
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.ip_index import IPv4BlockIndex, block_range, any_in_range
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import IP_TO_INT, INT_TO_IP
+
+# Python3 workaround for unicode function so the same code can be used with ipaddress later
+try:
+    unicode('')
+except NameError:
+    unicode = str
+
+
+class NTTMCPIPAMAPI():
+    """
+    NTTMCPClient methods for public IPv4 blocks, reserved private IP addresses and NAT rules. Loaded by NTTMCPClient
+    the first time one of the methods is used
+    """
+    def list_public_ipv4(self, network_domain_id, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list all public IPv4 addresses for the given Cloud Network Domain and utilize paging
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: Array of UUIDs of found public IPv4 block or empty array
+        """
+        url = self.base_url + 'network/publicIpBlock'
+
+        params = {'networkDomainId': network_domain_id, 'pageSize': page_size}
+        return list(self.iter_entities(url=url, entity='publicIpBlock', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_public_ipv4(self, public_ipv4_block_id):
+        """
+        Return a specific public IPv4 block object
+
+        :arg public_ipv4_block_id: Public IPv4 block UUID
+        :returns: UUID of the public IPv4 block
+        """
+        url = self.base_url + 'network/publicIpBlock/%s' % (public_ipv4_block_id)
+
+        response = self.api_get_call(url)
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'RESOURCE_NOT_FOUND':
+                return []
+            return result
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_public_ipv4_index(self, network_domain_id):
+        """
+        Return the public IPv4 block index for a Cloud Network Domain. The index is built once per client and rebuilt
+        after a public IPv4 block is added or removed
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :returns: An IPv4BlockIndex
+        """
+        index = self.public_ipv4_indexes.get(network_domain_id)
+        if index is None:
+            index = IPv4BlockIndex(self.list_public_ipv4(network_domain_id))
+            self.public_ipv4_indexes[network_domain_id] = index
+        return index
+
+    def invalidate_public_ipv4_index(self, network_domain_id=None):
+        """
+        Discard the cached public IPv4 block index for a Cloud Network Domain, or for all Cloud Network Domains
+
+        :kw network_domain_id: Cloud Network Domain UUID
+        """
+        if network_domain_id is None:
+            self.public_ipv4_indexes.clear()
+        else:
+            self.public_ipv4_indexes.pop(network_domain_id, None)
+
+    def get_public_ipv4_by_ip(self, network_domain_id, public_ipv4):
+        """
+        Return a specific public IPv4 block object
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg public_ipv4: A public IPv4 address
+        :returns: The public IPv4 block dict
+        """
+        try:
+            return self.get_public_ipv4_index(network_domain_id).find(public_ipv4)
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def get_next_public_ipv4(self, network_domain_id):
+        """
+        Return the next available public IPv4 address
+        If no more IPv4 addresses are available in the current allocated /30
+        blocks, allocate a new /30 block
+        """
+        result = self.get_free_public_ipv4s(network_domain_id, 1)
+        return {'changed': result.get('changed'), 'ipAddress': result.get('ipAddresses')[0]}
+
+    def get_free_public_ipv4s(self, network_domain_id, count=1):
+        """
+        Return a number of free public IPv4 addresses in a single pass. Every address in the existing public IPv4
+        blocks is checked against the set of NAT external IPs and only as many new blocks as are needed to make up
+        the count are added
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :kw count: The number of free public IPv4 addresses required
+        :returns: dict with the list of addresses (ipAddresses) and whether any new blocks were added (changed)
+        """
+        return_data = {'changed': False, 'ipAddresses': []}
+        if count < 1:
+            return return_data
+        try:
+            nat_public_ips = set(nat.get('externalIp') for nat in self.list_nat_rule(network_domain_id))
+            for public_block in self.get_public_ipv4_index(network_domain_id).blocks:
+                start, end = block_range(public_block)
+                for ip_int in range(start, end + 1):
+                    ip_address = INT_TO_IP(ip_int)
+                    if ip_address not in nat_public_ips:
+                        return_data['ipAddresses'].append(ip_address)
+                        if len(return_data['ipAddresses']) == count:
+                            return return_data
+
+            # If you're here that means there are not enough free addresses and new blocks need to be allocated
+            while len(return_data['ipAddresses']) < count:
+                block_id = self.add_public_ipv4(network_domain_id)
+                return_data['changed'] = True
+                start, end = block_range(self.get_public_ipv4(block_id))
+                for ip_int in range(start, end + 1):
+                    if len(return_data['ipAddresses']) < count:
+                        return_data['ipAddresses'].append(INT_TO_IP(ip_int))
+            return return_data
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def add_public_ipv4(self, network_domain_id):
+        """
+        Add a new /30 public IPv4 block to a Cloud Network Domain
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :returns: UUID of the new public IPv4 block
+        """
+        params = {'networkDomainId': network_domain_id}
+
+        url = self.base_url + 'network/addPublicIpBlock'
+        response = self.api_post_call(url, params)
+        self.invalidate_public_ipv4_index(network_domain_id)
+        try:
+            return response.json()['info'][0]['value']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the add public ipv4 block request was accepted')
+
+    def remove_public_ipv4(self, public_ipv4_block_id):
+        """
+        Remove a public IPv4 block
+
+        :arg public_ipv4_block_id: Public IPv4 block UUID
+        :returns: string (API message)
+        """
+        params = {'id': public_ipv4_block_id}
+
+        url = self.base_url + 'network/removePublicIpBlock'
+        response = self.api_post_call(url, params)
+        self.invalidate_public_ipv4_index()
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove public ipv4 block request was accepted')
+
+    def check_public_block_in_use(self, network_domain_id, base_public_ipv4):
+        """
+        Check if a public ipv4 block is in use
+
+        :arg network_domain_id: The UUID of the CND
+        :arg base_public_ipv4: The base IPv4 address of the public block
+        :returns: True or False
+        """
+        try:
+            block = self.get_public_ipv4_index(network_domain_id).find(base_public_ipv4)
+            start, end = block_range(block or {'baseIp': base_public_ipv4, 'size': 2})
+            nat_public_ips = sorted(IP_TO_INT(nat.get('externalIp')) for nat in self.list_nat_rule(network_domain_id)
+                                    if nat.get('externalIp'))
+            return any_in_range(nat_public_ips, start, end)
+        except (KeyError, IndexError, NTTMCPAPIException) as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def list_reserved_ip(self, vlan_id=None, datacenter_id=None, version=4, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of reserved IPv4 or IPv6 addresses and utilize paging
+
+        :kw vlan_id: VLAN UUID
+        :kw datacenter_id: datacenter ID (e.g. NA9)
+        :kw version: IP version (deafult = 4)
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: Array of private IPv4 reservations or empty array
+        """
+        params = {}
+        if vlan_id is None and datacenter_id is None:
+            raise NTTMCPAPIException('A vlan or datacenter must be provided')
+        if version != 4 and version != 6:
+            raise NTTMCPAPIException('Invalid IP version - %d' % version)
+        # Prefer VLAN ID over datacenter ID
+        if vlan_id:
+            params['vlanId'] = vlan_id
+        elif datacenter_id:
+            params['datacenterId'] = datacenter_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/reservedPrivateIpv4Address'
+        entity = 'ipv4'
+        if version == 6:
+            url = self.base_url + 'network/reservedIpv6Address'
+            entity = 'reservedIpv6Address'
+
+        return list(self.iter_entities(url=url, entity=entity, params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def reserve_ip(self, vlan_id=None, ip_address=None, description=None, version=4):
+        """
+        Reserve an IPv4 or IPv6 address - prevents Cloud Control from auto allocating
+
+        :kw vlan_id: VLAN UUID
+        :kw ip_address: The IP address to reserve
+        :kw description: The description of the reserve IPv4 address
+        :kw version: IP version (deafult = 4)
+        :returns: the returned confirmed IPv4 address
+        """
+        params = {}
+        if vlan_id is None or ip_address is None:
+            raise NTTMCPAPIException('A vlan and IPv4 address must be provided')
+        if version != 4 and version != 6:
+            raise NTTMCPAPIException('Invalid IP version - {0}'.format(version))
+        params['vlanId'] = vlan_id
+        params['ipAddress'] = ip_address
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'network/reservePrivateIpv4Address'
+        if version == 6:
+            url = self.base_url + 'network/reserveIpv6Address'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if ip_addr(unicode(result.get('info')[0].get('value'))) == ip_addr(unicode(ip_address)):
+                return result.get('info')[0].get('value')
+            else:
+                raise NTTMCPAPIException('Could not reserve the private IPv{0} address: {1}'.format(version, response))
+        except (KeyError, IndexError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the reserve private ipv{0} address request was accepted'.format(version))
+
+    def unreserve_ip(self, vlan_id=None, ip_address=None, version=4):
+        """
+        Unreserve an IPv4 or IPv6 address
+
+        :arg vlan_id: VLAN UUID
+        :arg ipv_address: The IP address to reserve
+        :returns: string (API message)
+        """
+        params = {}
+        if vlan_id is None or ip_address is None:
+            raise NTTMCPAPIException('A vlan and IPv4 address must be '
+                                     'provided')
+        if version != 4 and version != 6:
+            raise NTTMCPAPIException('Invalid IP version - {0}'.format(version))
+        params['vlanId'] = vlan_id
+        params['ipAddress'] = ip_address
+
+        url = self.base_url + 'network/unreservePrivateIpv4Address'
+        if version == 6:
+            url = self.base_url + 'network/unreserveIpv6Address'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the unreserving of the private ipv{0} address request was accepted'.format(version))
+
+    def list_nat_rule(self, network_domain_id, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of NAT rules for a Cloud Network Domain and utilize paging
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: Array of NATs
+        """
+        url = self.base_url + 'network/natRule'
+
+        params = {'networkDomainId': network_domain_id, 'pageSize': page_size}
+        return list(self.iter_entities(url=url, entity='natRule', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def create_nat_rule(self, network_domain_id=None, internal_ip=None, external_ip=None):
+        """
+        Create a new NAT rule
+
+        :arg network_domain_id: Cloud Network Domain UUID
+        :arg ip_address: The IP address to reserve
+        :arg description: The description of the reserve IPv4 address
+        :arg version: IP version (deafult = 4)
+        :returns: the returned confirmed IPv4 address
+        """
+        params = {}
+        if internal_ip is None or external_ip is None:
+            raise NTTMCPAPIException('A valid internal and external IP address must be provided')
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain is required')
+        params['networkDomainId'] = network_domain_id
+        params['internalIp'] = internal_ip
+        params['externalIp'] = external_ip
+
+        url = self.base_url + 'network/createNatRule'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['info'][0]['value']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the create NAT rule request was accepted')
+        except IndexError:
+            raise NTTMCPAPIException('Could not confirm that the create NAT rule request was accepted')
+
+    def get_nat_rule(self, nat_rule_id):
+        """
+        Return a specific NAT rule by UUID
+
+        :arg nat_rule_id: NAT rule UUID
+        :returns: The NAT rule object
+        """
+        url = self.base_url + 'network/natRule/{0}'.format(nat_rule_id)
+
+        response = self.api_get_call(url)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def get_nat_by_private_ip(self, network_domain_id, private_ip):
+        """
+        Return a specific NAT rule based on the private IPv4 address
+
+        :arg network_domain_id: The UUID of the CND:
+        :arg private_ip: The private IPv4 address to search by
+        :returns: The NAT rule object
+        """
+        try:
+            nat_rules = self.list_nat_rule(network_domain_id)
+            for nat_rule in nat_rules:
+                if nat_rule['internalIp'] == private_ip:
+                    return nat_rule
+            return None
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def get_nat_by_public_ip(self, network_domain_id, public_ip):
+        """
+        Return a specific NAT rule based on the public IPv4 address
+
+        :arg network_domain_id: The UUID of the CND:
+        :arg public_ip: The public IPv4 address to search by
+        :returns: The NAT rule object
+        """
+        try:
+            nat_rules = self.list_nat_rule(network_domain_id)
+            for nat_rule in nat_rules:
+                if nat_rule['externalIp'] == public_ip:
+                    return nat_rule
+            return None
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def remove_nat_rule(self, nat_rule_id):
+        """
+        Remove a NAT rules
+
+        :arg nat_rule_id: NAT rule UUID
+        :returns: string (API message)
+        """
+        params = {'id': nat_rule_id}
+
+        url = self.base_url + 'network/deleteNatRule'
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove NAT rule request was accepted')
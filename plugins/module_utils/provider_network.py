@@ -0,0 +1,860 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - Network API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+class NTTMCPNetworkAPI():
+    """
+    NTTMCPClient methods for Cloud Network Domains, VLANs, Security Groups, SNAT exclusions and static routes.
+    Loaded by NTTMCPClient the first time one of the methods is used
+    """
+    def list_network_domains(self, network_domain_id=None, datacenter=None, name=None, network_type=None, state=None,
+                             page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of Cloud Network domains and utilize paging
+
+        :arg self: self
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw datacenter: The MCP name
+        :kw name: The name of a Cloud Network Domain
+        :kw network_type: The type of Cloud Network Domain(s)
+        :kw state: The state of the Cloud Network Domain(s)
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: An array of Cloud Network Domain dicts
+        """
+        params = {}
+        if network_domain_id:
+            params['id'] = network_domain_id
+        if datacenter:
+            params['datacenterId'] = datacenter
+        if name:
+            params['name'] = name
+        if network_type:
+            params['type'] = network_type
+        if state:
+            params['state'] = state
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/networkDomain'
+
+        return list(self.iter_entities(url=url, entity='networkDomain', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_network_domain_by_name(self, name=None, datacenter=None):
+        """
+        Return a Cloud Network domain for the specified name
+
+        :arg self: self
+        :kw datacenter: The MCP name
+        :kw name: The name of a Cloud Network Domain
+        :returns: A Cloud Network Domain dict
+        """
+        if name is None:
+            raise NTTMCPAPIException('A Cloud Network Domain is required.')
+        if datacenter is None:
+            raise NTTMCPAPIException('A Datacenter is required.')
+
+        url = self.base_url + 'network/networkDomain'
+
+        network_domain = self.get_entity_by_name(url=url, entity='networkDomain', name=name, params={'datacenterId': datacenter})
+        self.resolver.set('networkDomain', datacenter, name, (network_domain or {}).get('id'))
+        return network_domain
+
+    def resolve_network_domain_id(self, name=None, datacenter=None):
+        """
+        Return the UUID of a Cloud Network Domain from the resolver cache, looking it up by name on a cache miss
+
+        :kw name: The name of a Cloud Network Domain
+        :kw datacenter: The MCP name
+        :returns: The UUID of the Cloud Network Domain
+        """
+        network_domain_id = self.resolver.get('networkDomain', datacenter, name)
+        if not network_domain_id:
+            network_domain_id = (self.get_network_domain_by_name(name=name, datacenter=datacenter) or {}).get('id')
+        if not network_domain_id:
+            raise NTTMCPAPIException('Could not find the Cloud Network Domain {0}'.format(name))
+        return network_domain_id
+
+    def create_network_domain(self, datacenter=None, name=None, network_type=None, description=None):
+        """
+        Create a Cloud Network domain
+
+        :arg self: self
+        :kw datacenter: The MCP name
+        :kw name: The name of a Cloud Network Domain
+        :kw network_type: The type of Cloud Network Domain
+        :kw description: The description of the Cloud Network Domain
+        :returns: The API response
+        """
+        params = {}
+        if datacenter:
+            params['datacenterId'] = datacenter
+        if name:
+            params['name'] = name
+        if network_type:
+            params['type'] = network_type
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'network/deployNetworkDomain'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the create Cloud Network Domain request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def update_network_domain(self, network_domain_id=None, name=None, network_type=None, description=None):
+        """
+        Update an existing Cloud Network domains
+
+        :arg self: self
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw name: The name of a Cloud Network Domain
+        :kw network_type: The type of Cloud Network Domain
+        :kw description: The description of the Cloud Network Domain
+        :returns: The API response
+        """
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Cloud Network Domain is required')
+
+        params['id'] = network_domain_id
+        if name:
+            params['name'] = name
+        if network_type:
+            params['type'] = network_type
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'network/editNetworkDomain'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the update Cloud Network Domain request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_network_domain(self, network_domain_id=None):
+        """
+        Delete a Cloud Network domains
+
+        :arg self: self
+        :arg network_domain_id: The UUID of the Cloud Network Domain
+        :returns: The API response
+        """
+        params = {}
+        if network_domain_id:
+            params['id'] = network_domain_id
+        else:
+            raise NTTMCPAPIException('No Cloud Network Domain ID supplied')
+
+        url = self.base_url + 'network/deleteNetworkDomain'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the delete '
+                                         'Cloud Network Domain request was '
+                                         'accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_vlans_old(self, datacenter=None, network_domain_id=None, name=None, ipv4_network_address=None,
+                       ipv6_network_address=None, state=None, attached=None):
+        """
+        Return a list of VLANs
+
+        :arg self: self
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw datacenter: The MCP name
+        :kw name: The name of a VLAN
+        :kw ipv4_network_address: The IPv4 subnet address of the VLAN
+        :kw ipv6_network_address: The IPv6 subnet address of the VLAN
+        :kw state: The state of the VLAN
+        :kw attached: Is the VLAN attached
+        :returns: An array of VLAN dicts
+        """
+        params = {}
+        if datacenter:
+            params['datacenterId'] = datacenter
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        if ipv4_network_address:
+            params['privateIpv4Address'] = ipv4_network_address
+        if ipv6_network_address:
+            params['ipv6Address'] = ipv6_network_address
+        if state:
+            params['state'] = state
+        if attached:
+            params['attached'] = attached
+
+        url = self.base_url + 'network/vlan'
+        response = self.api_get_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'vlan' in result:
+                return result['vlan']
+            else:
+                return []
+        else:
+            raise NTTMCPAPIException('Could not get a list of VLANs')
+
+    def list_vlans(self, datacenter=None, network_domain_id=None, name=None, ipv4_network_address=None,
+                   ipv6_network_address=None, state=None, attached=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of VLANs and utilize paging
+
+        :arg self: self
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw datacenter: The MCP name
+        :kw name: The name of a VLAN
+        :kw ipv4_network_address: The IPv4 subnet address of the VLAN
+        :kw ipv6_network_address: The IPv6 subnet address of the VLAN
+        :kw state: The state of the VLAN
+        :kw attached: Is the VLAN attached
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: An array of VLAN dicts
+        """
+        params = {}
+
+        if datacenter:
+            params['datacenterId'] = datacenter
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        if ipv4_network_address:
+            params['privateIpv4Address'] = ipv4_network_address
+        if ipv6_network_address:
+            params['ipv6Address'] = ipv6_network_address
+        if state:
+            params['state'] = state
+        if attached:
+            params['attached'] = attached
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/vlan'
+
+        return list(self.iter_entities(url=url, entity='vlan', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_vlan_by_name(self, name=None, datacenter=None, network_domain_id=None):
+        """
+        Return a VLAN for the specified name
+
+        :kw self: self
+        :kw datacenter: The MCP name
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :returns: A VLAN dict
+        """
+        if name is None:
+            raise NTTMCPAPIException('A VLAN is required.')
+        params = {}
+        if datacenter:
+            params['datacenterId'] = datacenter
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+
+        url = self.base_url + 'network/vlan'
+
+        try:
+            vlan = self.get_entity_by_name(url=url, entity='vlan', name=name, params=params)
+        except Exception as e:
+            raise NTTMCPAPIException('Failed to get a list of VLANs - {0}'.format(e))
+        self.resolver.set('vlan', (datacenter, network_domain_id), name, (vlan or {}).get('id'))
+        return vlan
+
+    def resolve_vlan_id(self, name=None, datacenter=None, network_domain_id=None):
+        """
+        Return the UUID of a VLAN from the resolver cache, looking it up by name on a cache miss
+
+        :kw name: The name of a VLAN
+        :kw datacenter: The MCP name
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :returns: The UUID of the VLAN
+        """
+        vlan_id = self.resolver.get('vlan', (datacenter, network_domain_id), name)
+        if not vlan_id:
+            vlan_id = (self.get_vlan_by_name(name=name, datacenter=datacenter, network_domain_id=network_domain_id) or {}).get('id')
+        if not vlan_id:
+            raise NTTMCPAPIException('Could not find the VLAN {0}'.format(name))
+        return vlan_id
+
+    def create_vlan(self,
+                    networkDomainId=None,
+                    name=None,
+                    description=None,
+                    privateIpv4NetworkAddress=None,
+                    privateIpv4PrefixSize=None,
+                    attachedVlan=False,
+                    detachedVlan=False,
+                    attachedVlan_gatewayAddressing=None,
+                    detachedVlan_ipv4GatewayAddress=None):
+        """
+        Create a VLAN
+        """
+        params = {}
+        if name:
+            params['name'] = name
+        if description:
+            params['description'] = description
+        if networkDomainId:
+            params['networkDomainId'] = networkDomainId
+        if privateIpv4NetworkAddress:
+            params['privateIpv4NetworkAddress'] = privateIpv4NetworkAddress
+        if privateIpv4PrefixSize:
+            params['privateIpv4PrefixSize'] = privateIpv4PrefixSize
+        if attachedVlan:
+            params['attachedVlan'] = {}
+            params['attachedVlan']['gatewayAddressing'] = (
+                attachedVlan_gatewayAddressing)
+        elif detachedVlan:
+            params['detachedVlan'] = {}
+            params['detachedVlan']['ipv4GatewayAddress'] = (
+                detachedVlan_ipv4GatewayAddress)
+
+        url = self.base_url + 'network/deployVlan'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the create VLAN request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def update_vlan(self,
+                    vlan_id=None,
+                    name=None,
+                    description=None,
+                    detached_vlan_gw=None,
+                    detached_vlan_gw_ipv6=None):
+        """
+        Update an existing VLAN
+        """
+        params = {}
+
+        if vlan_id:
+            params['id'] = vlan_id
+        else:
+            raise NTTMCPAPIException('A valid VLAN id is required')
+        if name:
+            params['name'] = name
+        if description:
+            params['description'] = description
+        if detached_vlan_gw:
+            params['ipv4GatewayAddress'] = detached_vlan_gw
+        if detached_vlan_gw_ipv6:
+            params['ipv6GatewayAddress'] = detached_vlan_gw_ipv6
+
+        url = self.base_url + 'network/editVlan'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the update VLAN request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_vlan(self, vlan_id=None):
+        """
+        Delete a VLAN
+
+        :kw vlan_id: The UUID of the VLAN
+        :returns: API response
+        """
+        params = {}
+        if vlan_id:
+            params['id'] = vlan_id
+        else:
+            raise NTTMCPAPIException('No VLAN ID supplied')
+
+        url = self.base_url + 'network/deleteVlan'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the delete VLAN request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_security_groups(self, network_domain_id=None, name=None, group_type=None, server_id=None, vlan_id=None,
+                             page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of security groups and utilize paging
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw name: The name of the security group
+        :kw group_type: The type of security group (SERVER or VLAN)
+        :kw server_id: The UUID of a server in the security group
+        :kw vlan_id: The UUID of a VLAN
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of security groups
+        """
+        params = dict()
+        if vlan_id:
+            params['vlanId'] = vlan_id
+            params['type'] = 'VLAN'
+        elif network_domain_id:
+            params['networkDomainId'] = network_domain_id
+            params['type'] = 'SERVER'
+        if group_type:
+            params['type'] = group_type
+        if server_id:
+            params['serverId'] = server_id
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'securityGroup/securityGroup'
+
+        return list(self.iter_entities(url=url, entity='securityGroup', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_security_group_by_id(self, group_id=None):
+        """
+        Return a security groups
+
+        :kw group_id: The UUID of the Security Group
+        :returns: The Security Group
+        """
+        if group_id is None:
+            raise NTTMCPAPIException('A valid ID for a Security Group is required')
+
+        url = self.base_url + 'securityGroup/securityGroup/{0}'.format(group_id)
+
+        response = self.api_get_call(url, None)
+
+        try:
+            return response.json()
+        except Exception:
+            return dict()
+
+    def create_security_group(self, network_domain_id=None, vlan_id=None, name=None, description=None):
+        """
+        Create a security group
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain.
+        :kw vlan_id: The UUID of the VLAN
+        :kw name: The name of the Security Group
+        :kw description: The description for the Security Group
+        :returns: The new Security Group UUID
+        """
+        params = dict()
+        if network_domain_id is None and vlan_id is None:
+            raise NTTMCPAPIException('A valid Network Domain or VLAN is required')
+        if name is None:
+            raise NTTMCPAPIException('A valid value for name is required')
+
+        if vlan_id:
+            params['vlanId'] = vlan_id
+        elif network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'securityGroup/createSecurityGroup'
+
+        response = self.api_post_call(url, params)
+
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'OK':
+                return next((item for item in result.get('info') if item["name"] == "securityGroupId"), dict()).get('value')
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Security Group was successfully created')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def update_security_group(self, group_id=None, name=None, description=None):
+        """
+        Update a security group
+
+        :kw group_id: The UUID of the Security Group
+        :kw name: The name of the Security Group
+        :kw description: The description for the Security Group
+        :returns: API response
+        """
+        params = dict()
+        if group_id is None:
+            raise NTTMCPAPIException('A valid Security Group ID is required')
+
+        params['id'] = group_id
+        if name:
+            params['name'] = name
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'securityGroup/editSecurityGroup'
+
+        response = self.api_post_call(url, params)
+
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'OK':
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Security Group was successfully updated')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_security_group(self, group_id=None):
+        """
+        Delete a security group
+
+        :kw group_id: The UUID of the Security Group
+        :returns: API response
+        """
+        params = dict()
+        if group_id is None:
+            raise NTTMCPAPIException('A valid Security Group ID is required')
+
+        params['id'] = group_id
+
+        url = self.base_url + 'securityGroup/deleteSecurityGroup'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def add_security_group_member(self, group_id=None, group_type=None, member_id=None):
+        """
+        Add a new member server or NIC to an existing Security Group
+
+        :kw group_id: The UUID of the Security Group
+        :kw group_type: The type of the Security Group (vlan or server)
+        :kw member_id: The UUID of the member entity (server or NIC)
+        :returns: API response
+        """
+        params = dict()
+        if group_id is None and member_id is None:
+            raise NTTMCPAPIException('A valid Security Group ID and Server/NIC ID is required')
+        if group_type not in ['vlan', 'server']:
+            raise NTTMCPAPIException('The group type must be either one of [server, vlan]')
+
+        params['securityGroupId'] = group_id
+        if group_type == 'vlan':
+            params['nicId'] = member_id
+            url = url = self.base_url + 'securityGroup/addNicToSecurityGroup'
+        elif group_type == 'server':
+            params['serverId'] = member_id
+            url = self.base_url + 'securityGroup/addServerToSecurityGroup'
+
+        response = self.api_post_call(url, params)
+
+        if response is not None:
+            result = response.json()
+            if result.get('responseCode') == 'OK':
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Security Group was successfully updated')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_security_group_member(self, group_id=None, member_id=None, group_type=None):
+        """
+        Delete a security group member
+
+        :kw group_id: The UUID of the Security Group
+        :kw member_id: The UUID of the member object
+        :kw group_type: The type of Security Group
+        :returns: API response
+        """
+        params = dict()
+        if group_type not in ['vlan', 'server']:
+            raise NTTMCPAPIException('The group type must be either one of [server, vlan]')
+        if group_id is None:
+            raise NTTMCPAPIException('A valid Security Group ID is required')
+        if member_id is None:
+            raise NTTMCPAPIException('A valid Security Group member ID is required')
+
+        params['securityGroupId'] = group_id
+        if group_type == 'server':
+            params['serverId'] = member_id
+            url = self.base_url + 'securityGroup/removeServerFromSecurityGroup'
+        else:
+            params['nicId'] = member_id
+            url = self.base_url + 'securityGroup/removeNicFromSecurityGroup'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def list_snat_exclusion(self, network_domain_id=None, snat_id=None, network=None, prefix=None, page_size=API_PAGE_SIZE,
+                            max_workers=None):
+        """
+        Return a list of SNAT exclusions
+
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        """
+        params = {}
+        return_data = snats = []
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid value Network Domain ID is required')
+        params['networkDomainId'] = network_domain_id
+        if snat_id:
+            params['id'] = snat_id
+        if network:
+            params['destinationIpv4NetworkAddress'] = network
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/snatExclusion'
+
+        snats = list(self.iter_entities(url=url, entity='snatExclusion', params=params, page_size=page_size,
+                                        max_workers=max_workers))
+        try:
+            if network:
+                for snat in snats:
+                    if snat.get('id') == snat_id:
+                        return_data.append(snat)
+                    elif all([network, prefix]):
+                        if snat.get('destinationIpv4NetworkAddress') == network and snat.get('destinationIpv4PrefixSize') == prefix:
+                            return_data.append(snat)
+                    else:
+                        if snat.get('destinationIpv4NetworkAddress') == network:
+                            return_data.append(snat)
+                return return_data
+            return snats
+        except Exception as e:
+            raise NTTMCPAPIException('Could not decode the response - {0}'.format(e))
+
+    def get_snat_exclusion(self, snat_id):
+        """
+        Get a specific SNAT exclusion
+
+        :arg snat_id: The UUID of the SNAT Exclusion
+        :returns: List of SNAT Exclusions
+        """
+        params = {}
+        if snat_id is None:
+            raise NTTMCPAPIException('The SNAT Exclusion ID is required')
+
+        url = self.base_url + 'network/snatExclusion/{0}'.format(snat_id)
+
+        response = self.api_get_call(url, params)
+        try:
+            result = response.json()
+            if result.get('responseCode') == 'RESOURCE_NOT_FOUND':
+                return []
+            return result
+        except KeyError:
+            return {}
+
+    def create_snat_exclusion(self, network_domain_id=None, description=None, network=None, prefix=None):
+        """
+        Create a SNAT exclusion
+
+        :kw network_domain_id: The UUID of the Network Domain
+        :kw description: The description of the SNAT exclusion
+        :kw network: The destination network for the SNAT exclusion
+        :kw prefix: The prefix for the destination network
+        :returns: Key/Value pair {'name': 'snatExclusionId', 'value': 'some_uuid'}
+        """
+        params = {}
+        if network_domain_id is None or network is None or prefix is None:
+            raise NTTMCPAPIException('A valid value is required for network_domain, network and prefix')
+
+        params['networkDomainId'] = network_domain_id
+        if description:
+            params['description'] = description
+        params['destinationIpv4NetworkAddress'] = network
+        params['destinationIpv4PrefixSize'] = prefix
+
+        url = self.base_url + 'network/addSnatExclusion'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()['info'][0]['value']
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create firewall rule request was accepted')
+
+    def remove_snat_exclusion(self, snat_id):
+        """
+        Remove a SNAT exclusion
+
+        :arg snat_id: The UUID of the SNAT Exclusion
+        :returns: {'operation': 'some_operation', responseCode': 'OK', 'message': 'some_message'}
+        """
+        params = {}
+        if snat_id is None:
+            raise NTTMCPAPIException('A SNAT exclusion ID is required')
+        params['id'] = snat_id
+
+        url = self.base_url + 'network/removeSnatExclusion'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def restore_snat_exclusion(self, network_domain_id):
+        """
+        Restore SNAT exclusions to the defaultPersistenceProfile
+
+        :arg network_domain_id: The UUID of the Cloud Network Domain
+        :returns: {'operation': 'some_operation', responseCode': 'OK', 'message': 'some_message'}
+        """
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+
+        url = self.base_url + 'network/restoreSnatExclusions'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_static_routes(self, network_domain_id=None, name=None, version=None, network=None, prefix=None, next_hop=None,
+                           page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List static routes
+
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        """
+        params = {}
+        return_data = routes = []
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid value Network Domain ID is required')
+
+        params['networkDomainId'] = network_domain_id
+        if version:
+            params['ipVersion'] = version
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'network/staticRoute'
+
+        routes = list(self.iter_entities(url=url, entity='staticRoute', params=params, page_size=page_size,
+                                         max_workers=max_workers))
+        if network is not None or next_hop:
+            for route in routes:
+                if route.get('name') == name:
+                    return_data.append(route)
+                elif all([network, prefix, next_hop]):
+                    if (route.get('destinationNetworkAddress') == network and route.get('destinationPrefixSize') == prefix and
+                            route.get('nextHopAddress') == next_hop):
+                        return_data.append(route)
+                elif all([network, prefix]):
+                    if route.get('destinationNetworkAddress') == network and route.get('destinationPrefixSize') == prefix:
+                        return_data.append(route)
+                elif all([network, next_hop]):
+                    if route.get('destinationNetworkAddress') == network and route.get('nextHopAddress') == next_hop:
+                        return_data.append(route)
+                elif network:
+                    if route.get('destinationNetworkAddress') == network:
+                        return_data.append(route)
+                elif next_hop:
+                    if route.get('nextHopAddress') == next_hop:
+                        return_data.append(route)
+        else:
+            return_data = routes
+        return return_data
+
+    def create_static_route(self, network_domain_id=None, name=None, description=None,
+                            version=None, network=None, prefix=None, next_hop=None):
+        """
+        Create a static route
+        """
+        params = {}
+        if not all([network_domain_id, name, version, network, prefix, next_hop]):
+            raise NTTMCPAPIException('A valid value is required for network_domain, name, version, network, prefix and next_hop')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['ipVersion'] = version
+        params['destinationNetworkAddress'] = network
+        params['destinationPrefixSize'] = prefix
+        params['nextHopAddress'] = next_hop
+
+        url = self.base_url + 'network/createStaticRoute'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def remove_static_route(self, static_route_id):
+        """
+        Remove a static route
+        """
+        params = {}
+        if static_route_id is None:
+            raise NTTMCPAPIException('A Static Route ID is required')
+        params['id'] = static_route_id
+
+        url = self.base_url + 'network/deleteStaticRoute'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def restore_static_routes(self, network_domain_id):
+        """
+        Restore static routes to defaults
+        """
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('A valid Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+
+        url = self.base_url + 'network/restoreStaticRoutes'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
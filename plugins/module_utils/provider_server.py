@@ -0,0 +1,821 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - Server API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+class NTTMCPServerAPI():
+    """
+    NTTMCPClient methods for servers, disks, NICs, anti-affinity groups, vApp properties and server monitoring.
+    Loaded by NTTMCPClient the first time one of the methods is used
+    """
+    def list_servers_old(self, datacenter=None, network_domain_id=None, vlan_id=None, name=None):
+        """
+        Return a list of servers/VMs
+        """
+        params = {}
+        if datacenter is None:
+            raise NTTMCPAPIException('A valid value for datacenter is required')
+        else:
+            params['datacenterId'] = datacenter
+        # if network_domain_id is None:
+        #    raise NTTMCPAPIException('A valid value for network_domain is required')
+        # else:
+        #    params['networkDomainId'] = network_domain_id
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if vlan_id:
+            params['vlanId'] = vlan_id
+        if name:
+            params['name'] = name
+
+        url = self.base_url + 'server/server'
+
+        response = self.api_get_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'server' in result:
+                return result['server']
+            else:
+                return []
+        else:
+            raise NTTMCPAPIException('Could not get a list of servers')
+
+    def list_servers(self, datacenter=None, network_domain_id=None, vlan_id=None, name=None, page_size=API_PAGE_SIZE,
+                     max_workers=None):
+        """
+        Return a list of servers/VMs and utilize paging functionality for more than 250 servers
+
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        """
+        params = {}
+        if datacenter is None:
+            raise NTTMCPAPIException('A valid value for datacenter is required')
+        else:
+            params['datacenterId'] = datacenter
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if vlan_id:
+            params['vlanId'] = vlan_id
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'server/server'
+
+        return list(self.iter_entities(url=url, entity='server', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_server_by_name(self, datacenter=None, network_domain_id=None, vlan_id=None, name=None):
+        """
+        Get a server/VM by name
+        """
+        if datacenter is None:
+            raise NTTMCPAPIException('A valid value for datacenter is required')
+        if name is None:
+            raise NTTMCPAPIException('A valid value for name is required')
+
+        params = {'datacenterId': datacenter, 'name': name}
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if vlan_id:
+            params['vlanId'] = vlan_id
+
+        url = self.base_url + 'server/server'
+
+        for server in self.iter_entities(url=url, entity='server', params=params):
+            if server.get('name') == name:
+                try:
+                    return self.get_server_by_id(server.get('id'))
+                except (KeyError, IndexError):
+                    raise NTTMCPAPIException('Could not return the server object. Possible API error')
+        return None
+
+    def get_server_by_id(self, server_id=None):
+        """
+        Get a server/VM by id
+        """
+        if server_id is None:
+            raise NTTMCPAPIException('A valid value for server_id is required')
+
+        url = self.base_url + 'server/server/{0}'.format(server_id)
+
+        response = self.api_get_call(url, None)
+        try:
+            return response.json()
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not find the server with id - {0}'.format(server_id))
+
+    def create_server(self, ngoc, params):
+        """
+        Create a VM
+        """
+        if ngoc:
+            url = self.base_url + 'server/deployUncustomizedServer'
+        else:
+            url = self.base_url + 'server/deployServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the create server request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def reconfigure_server(self, params):
+        """
+        Change a VM specifications
+
+        :arg params: dict of valid parameters
+        :returns: An API message
+        """
+        url = self.base_url + 'server/reconfigureServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the update '
+                                         'server request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_server(self, server_id=None):
+        """
+        Delete a VM
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+
+        url = self.base_url + 'server/deleteServer'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the delete Server request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def shutdown_server(self, server_id=None):
+        """
+        Shutdown a VM
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+
+        url = self.base_url + 'server/shutdownServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'requestId' in result:
+                return result
+            elif 'responseCode' in result:
+                if result['responseCode'] == 'SERVER_STOPPED':
+                    return {}
+                else:
+                    raise NTTMCPAPIException('Could not confirm that the '
+                                             'shutdown server request was '
+                                             'accepted')
+            else:
+                raise NTTMCPAPIException('Could not confirm that the '
+                                         'shutdown server request was '
+                                         'accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def poweroff_server(self, server_id=None):
+        """
+        Hard power off a VM
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+
+        url = self.base_url + 'server/powerOffServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'requestId' in result:
+                return result
+            elif 'responseCode' in result:
+                if result['responseCode'] == 'SERVER_STOPPED':
+                    return {}
+                else:
+                    raise NTTMCPAPIException('Could not confirm that the '
+                                             'poweroff server request was '
+                                             'accepted')
+            else:
+                raise NTTMCPAPIException('Could not confirm that the '
+                                         'poweroff server request was '
+                                         'accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def start_server(self, server_id=None):
+        """
+        Power on a VM
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+
+        url = self.base_url + 'server/startServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'requestId' in result:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the start server request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def reboot_server(self, server_id=None):
+        """
+        Reboot a VM
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+
+        url = self.base_url + 'server/rebootServer'
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if 'requestId' in result:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the reboot server request was accepted')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def add_disk(self, controller_id=None, controller_name=None,
+                 device_number=None, size=None, speed=None, iops=None):
+        """
+        Add a disk to an existing server
+        """
+        params = {}
+
+        device_num_attribute_name = controller_name.replace('Controller', 'Id')
+
+        if controller_id is not None and controller_name:
+            params[controller_name] = {}
+            params[controller_name]['controllerId'] = controller_id
+        else:
+            raise NTTMCPAPIException('Invalid storage controller')
+        if device_number is not None and type(device_number) is int:
+            params[controller_name][device_num_attribute_name] = device_number
+        if size:
+            params['sizeGb'] = size
+        else:
+            raise NTTMCPAPIException('size cannot be None')
+        if speed:
+            params['speed'] = speed
+        else:
+            raise NTTMCPAPIException('speed cannot be None')
+        if speed == 'PROVISIONEDIOPS' and iops:
+            params['iops'] = iops
+
+        url = self.base_url + 'server/addDisk'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def change_iops(self, disk_id=None, disk_iops=None):
+        """
+        Change the IOPS count for a disk
+        """
+        params = {}
+        if not disk_id:
+            raise NTTMCPAPIException('No disk ID supplied')
+        if not disk_iops:
+            raise NTTMCPAPIException('No disk IOPS count supplied')
+
+        params['id'] = disk_id
+        params['iops'] = disk_iops
+
+        url = self.base_url + 'server/changeDiskIops'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def expand_disk(self, server_id=None, disk_id=None, disk_size=None):
+        """
+        Expand an existing disk size
+        """
+        params = {}
+        if server_id:
+            params['id'] = server_id
+        else:
+            raise NTTMCPAPIException('No server ID supplied')
+        if disk_id:
+            params['id'] = disk_id
+        else:
+            raise NTTMCPAPIException('No disk ID supplied')
+        if disk_size:
+            params['newSizeGb'] = disk_size
+        else:
+            raise NTTMCPAPIException('No disk size supplied')
+
+        url = self.base_url + 'server/expandDisk'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def update_disk_speed(self, disk_id=None, speed=None, iops=None):
+        """
+        Modify the speed of an existing disk
+        """
+        params = {}
+        if disk_id is None:
+            raise NTTMCPAPIException('disk_id cannot be None')
+        if speed is None:
+            raise NTTMCPAPIException('speed cannot be None')
+
+        params['id'] = disk_id
+        params['speed'] = speed
+        if iops is not None and type(iops) is int:
+            params['iops'] = iops
+
+        url = self.base_url + 'server/changeDiskSpeed'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def update_disk_iops(self, disk_id=None, iops=None):
+        """
+        For disks of type PROVISIONEDIOPS, update and IOPS allocated to the disk
+        """
+        params = {}
+        if disk_id is None:
+            raise NTTMCPAPIException('disk_id cannot be None')
+        if iops is None or type(iops) is not int:
+            raise NTTMCPAPIException('iops cannot be None and must be an integer')
+
+        params['id'] = disk_id
+        params['iops'] = iops
+
+        url = self.base_url + 'server/changeDiskIops'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def remove_disk(self, disk_id=None):
+        """
+        Remove a disk from a VM
+        """
+        params = {}
+        if disk_id is None:
+            raise NTTMCPAPIException('disk_id cannot be None')
+
+        params['id'] = disk_id
+
+        url = self.base_url + 'server/removeDisk'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def add_controller(self, server_id=None, controller_type=None, adapter_type=None, controller_number=None):
+        """
+        Add a new disk controller to an existing VM
+        """
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('The server ID cannot be None')
+        if controller_type is None:
+            raise NTTMCPAPIException('The controller type cannot be None')
+        if adapter_type is None:
+            raise NTTMCPAPIException('The controller adapter type cannot be None')
+        if controller_number is not None and type(controller_number) is int:
+            params['busNumber'] = controller_number
+
+        params['serverId'] = server_id
+        params['adapterType'] = adapter_type
+
+        url = self.base_url + 'server/addScsiController'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def remove_controller(self, controller_id=None):
+        """
+        Remove a disk controller from an existing VM
+        """
+        params = {}
+        if controller_id is None:
+            raise NTTMCPAPIException('The controller ID cannot be None')
+
+        params['id'] = controller_id
+
+        url = self.base_url + 'server/removeScsiController'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def add_nic(self, server_id=None, vlan_id=None, ipv4_address=None, nic_type='VMXNET3', connected=True):
+        """
+        Add a new NIC to an existing VM - Note the new NIC must be in a new VLAN
+        """
+        params = {}
+        params['nic'] = {}
+        if server_id is None:
+            raise NTTMCPAPIException('The server ID cannot be None')
+        if vlan_id is None and ipv4_address is None:
+            raise NTTMCPAPIException('A valid VLAN ID or IPv4 address is required')
+
+        params['serverId'] = server_id
+        if ipv4_address:
+            params['nic']['privateIpv4'] = ipv4_address
+        else:
+            params['nic']['vlanId'] = vlan_id
+        params['nic']['networkAdapter'] = nic_type
+        params['nic']['connected'] = connected
+
+        url = self.base_url + 'server/addNic'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def remove_nic(self, nic_id=None):
+        """
+        Remove a NIC from an existing VM
+        """
+        params = {}
+        if nic_id is None:
+            raise NTTMCPAPIException('The NIC ID cannot be None')
+
+        params['id'] = nic_id
+
+        url = self.base_url + 'server/removeNic'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def change_nic_type(self, nic_id=None, nic_type=None):
+        """
+        Change the device type of a NIC
+        """
+        params = {}
+        if nic_id is None or nic_type is None:
+            raise NTTMCPAPIException('The NIC ID and type cannot be None')
+
+        params['nicId'] = nic_id
+        params['networkAdapter'] = nic_type
+
+        url = self.base_url + 'server/changeNetworkAdapter'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def exchange_nic(self, nic_1_id=None, nic_2_id=None):
+        """
+        Swap VLANs between two existing NICs on a VM
+        """
+        params = {}
+        if nic_1_id is None or nic_2_id is None:
+            raise NTTMCPAPIException('The NIC IDs cannot be None')
+
+        params['nicId1'] = nic_1_id
+        params['nicId2'] = nic_2_id
+
+        url = self.base_url + 'server/exchangeNicVlans'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def change_nic_state(self, nic_id=None, nic_state=True):
+        """
+        Change the NIC connection state
+        """
+        params = dict()
+        if nic_id is None:
+            raise NTTMCPAPIException('The NIC ID cannot be None')
+
+        params['nic'] = list()
+        params['nic'].append({'id': nic_id, 'connected': nic_state})
+
+        url = self.base_url + 'server/setNicConnectivity'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def list_server_anti_affinity_groups(self, network_domain_id=None, server_id=None, page_size=API_PAGE_SIZE,
+                                         max_workers=None):
+        """
+        List all anti affinity groups for the supplied parameters and utilize paging
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw server_id: The UUID of a server in the anti affinity group
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of anti affinity groups
+        """
+        params = dict()
+        if network_domain_id is None and server_id is None:
+            raise NTTMCPAPIException('A Network Domain or Server ID is required')
+
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        if server_id:
+            params['serverId'] = server_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'server/antiAffinityRule'
+
+        return list(self.iter_entities(url=url, entity='antiAffinityRule', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_anti_affinity_group_by_servers(self, server_1_id=None, server_2_id=None):
+        """
+        Get an anti affinity groups with the supplied server IDs
+        Currently a server can belong to only a single aa group but this is future proofing into case this is changed
+        in the future
+        """
+        if server_1_id is None or server_2_id is None:
+            raise NTTMCPAPIException('Two valid server IDs are required')
+
+        # List all the anti affinity groups for one of the servers
+        try:
+            aa_groups = self.list_server_anti_affinity_groups(server_id=server_1_id)
+            if not aa_groups:
+                return None
+
+            for aa_group in aa_groups:
+                s1_id = aa_group.get('server', list())[0].get('id')
+                s2_id = aa_group.get('server', list())[1].get('id')
+                if server_2_id in [s1_id, s2_id]:
+                    return aa_group
+        except (AttributeError, IndexError, KeyError, NTTMCPAPIException) as e:
+            raise NTTMCPAPIException('Could not search the existing Anti-Affinity Groups - {0}'.format(e))
+        return None
+
+    def create_anti_affinity_group(self, server_1_id=None, server_2_id=None):
+        """
+        Create an anti affinity groups with the supplied server IDs
+        """
+        params = dict()
+        if server_1_id is None or server_2_id is None:
+            raise NTTMCPAPIException('Two valid server IDs are required')
+
+        params['serverId'] = list()
+        params['serverId'] += [server_1_id, server_2_id]
+
+        url = self.base_url + 'server/createAntiAffinityRule'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def delete_anti_affinity_group(self, anti_affinity_group_id=None):
+        """
+        Delete the anti affinity group
+        """
+        params = dict()
+        if anti_affinity_group_id is None:
+            raise NTTMCPAPIException('A valid Anti Affinity group ID is required')
+
+        params['id'] = anti_affinity_group_id
+
+        url = self.base_url + 'server/deleteAntiAffinityRule'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def set_vapp(self, server_id=None, iso=False, vmtools=True, vapp=None):
+        """
+        Enable and set vApp properties on a server
+        """
+        params = dict()
+
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server_id is required')
+        params['serverId'] = server_id
+        params['isoTransport'] = iso
+        params['vmwareTransport'] = vmtools
+        if vapp is not None:
+            params['vAppProperty'] = list()
+        for prop in vapp:
+            temp_prop = dict()
+            if prop.get('key') is None:
+                raise NTTMCPAPIException('A valid key is required for all supplied vApp properties')
+            temp_prop['key'] = prop.get('key')
+            temp_prop['set'] = dict()
+            temp_prop['set']['schema'] = dict()
+            if prop.get('value') is not None:
+                temp_prop['set']['value'] = prop.get('value')
+            if prop.get('id') is None:
+                raise NTTMCPAPIException('A valid id is required for all supplied vApp properties')
+            temp_prop['set']['schema']['id'] = prop.get('id')
+            if prop.get('type') is None:
+                raise NTTMCPAPIException('A valid type is required for all supplied vApp properties')
+            temp_prop['set']['schema']['type'] = prop.get('type')
+            if prop.get('class_id') is not None:
+                temp_prop['set']['schema']['classId'] = prop.get('class_id')
+            if prop.get('instance_id') is not None:
+                temp_prop['set']['schema']['instanceId'] = prop.get('instance_id')
+            if prop.get('category') is not None:
+                temp_prop['set']['schema']['category'] = prop.get('category')
+            if prop.get('label') is not None:
+                temp_prop['set']['schema']['label'] = prop.get('label')
+            if prop.get('description') is not None:
+                temp_prop['set']['schema']['description'] = prop.get('description')
+            if prop.get('configurable') is not None:
+                temp_prop['set']['schema']['userConfigurable'] = prop.get('configurable')
+            if prop.get('default_value') is not None:
+                temp_prop['set']['schema']['defaultValue'] = prop.get('default_value')
+            else:
+                if 'string' in prop.get('type'):
+                    temp_prop['set']['schema']['defaultValue'] = ""
+            params['vAppProperty'].append(temp_prop)
+
+        url = self.base_url + 'server/setVAppProperties'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def remove_vapp_property(self, server_id=None, iso=False, vmtools=True, vapp_keys=None):
+        """
+        Remove vApp properties from a server
+        """
+        params = dict()
+
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server_id is required')
+        if len(vapp_keys) == 0 or vapp_keys is None:
+            raise NTTMCPAPIException('A least 1 vApp property key must be provided')
+
+        params['serverId'] = server_id
+        params['isoTransport'] = iso
+        params['vmwareTransport'] = vmtools
+        params['vAppProperty'] = list()
+        for vapp_key in vapp_keys:
+            temp_key = dict()
+            temp_key['key'] = vapp_key
+            temp_key['delete'] = dict()
+            params['vAppProperty'].append(temp_key)
+
+        url = self.base_url + 'server/setVAppProperties'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def disable_vapp(self, server_id=None):
+        """
+        Remove vApp properties from a server
+
+        :kw server_id: The UUID of the server
+        :returns: API response
+        """
+
+        params = dict()
+
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server_id is required')
+
+        params['serverId'] = server_id
+
+        url = self.base_url + 'server/disableVAppProperties'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            return response.json()
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def enable_server_monitoring(self, update=False, server_id=None, service_plan=None):
+        """
+        Enable/Update server monitoring configuration
+
+        :kw update: Is this an update for an existing configuration
+        :kw server_id: The UUID of the server being enabled for Monitoring
+        :kw service_plan: The Service Plan name (e.g. ADVANCED)
+        :returns: API response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+        if service_plan is None:
+            raise NTTMCPAPIException('A Service Plan is required, service_plan cannot be None')
+
+        params['id'] = server_id
+        params['servicePlan'] = service_plan
+
+        if update:
+            url = self.base_url + 'server/changeServerMonitoringPlan'
+        else:
+            url = self.base_url + 'server/enableServerMonitoring'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Service was successfully enabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def disable_server_monitoring(self, server_id=None):
+        """
+        Disable server monitoring configuration
+
+        :kw server_id: The UUID of the server being enabled for Monitoring
+        :returns: API response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+
+        params['id'] = server_id
+
+        url = self.base_url + 'server/disableServerMonitoring'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Service was successfully disabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
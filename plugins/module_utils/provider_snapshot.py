@@ -0,0 +1,552 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - Snapshot API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+
+
+class NTTMCPSnapshotAPI():
+    """
+    NTTMCPClient methods for the snapshot service, snapshots, snapshot scripts and snapshot previews. Loaded by
+    NTTMCPClient the first time one of the methods is used
+    """
+    def list_snapshot_windows(self, datacenter=None, service_plan=None, start_hour=None, slots_available=None,
+                              page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List Snapshot Windows and utilize paging
+
+        :kw datacenter: The datacenter ID (e.g. NA9)
+        :kw service_plan: The Service Plan name (e.g. ONE_MONTH)
+        :kw start_hour: Filter results by a specific start hour (e.g. 06)
+        :kw slots_available: Boolean to filter results based on if slots are available or not
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of Snapshot Windows
+        """
+
+        params = {}
+        if datacenter is None:
+            raise NTTMCPAPIException('datacenter is required')
+        if service_plan is None:
+            raise NTTMCPAPIException('service_plan is required')
+
+        params['datacenterId'] = datacenter
+        params['servicePlan'] = service_plan
+        if start_hour:
+            params['startHour'] = start_hour
+        if slots_available:
+            params['slotsAvailable'] = slots_available
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'infrastructure/snapshotWindow'
+
+        return list(self.iter_entities(url=url, entity='snapshotWindow', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def list_snapshot_service_plans(self, service_plan=None, available=True):
+        """
+        List Snapshot Service Plans
+
+        :kw service_plan: The Service Plan name (e.g. ONE_MONTH)
+        :kw available: Boolean to filter results based on if slots are available or not
+        :returns: A list of Snapshot Service Plans
+        """
+
+        params = {}
+
+        if service_plan:
+            params['id'] = service_plan
+        if available:
+            params['available'] = available
+
+        url = self.base_url + 'snapshot/servicePlan'
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json().get('snapshotServicePlan')
+        except Exception:
+            return []
+
+    def list_snapshot(self, server_id=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List server Snapshots and utilize paging
+
+        :kw server_id: The UUID of the server
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of Snapshots for a server
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server is required')
+
+        params['serverId'] = server_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'snapshot/snapshot'
+
+        return list(self.iter_entities(url=url, entity='snapshot', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_snapshot_by_id(self, snapshot_id=None):
+        """
+        Get a server snapshot
+
+        :kw snapshot_id: The UUID of the snapshot
+        :returns: A snapshot
+        """
+
+        if snapshot_id is None:
+            raise NTTMCPAPIException('A valid snapshot ID is required')
+
+        url = self.base_url + 'snapshot/snapshot/{0}'.format(snapshot_id)
+
+        response = self.api_get_call(url, None)
+        try:
+            return response.json()
+        except Exception:
+            return {}
+
+    def snapshot_restore(self, snapshot_id=None, src_path=None, dst_path=None, username=None, password=None):
+        """
+        Get a server snapshot
+
+        :kw snapshot_id: The UUID of the snapshot
+        :kw src_path: The path to the source file/directory
+        :kw dst_path: The path to the destination file/directory
+        :kw username: The OS username
+        :kw password: The OS password
+        :returns: The server ID
+        """
+        params = {}
+        if None in [snapshot_id, src_path, dst_path, username, password]:
+            raise NTTMCPAPIException('A valid snapshot ID, source path, destination path, username and password are required')
+
+        params['snapshotId'] = snapshot_id
+        params['pathOnSourceSnapshot'] = src_path
+        params['pathOnTargetServer'] = dst_path
+        params['targetServerUsername'] = username
+        params['targetServerPassword'] = password
+
+        url = self.base_url + 'snapshot/restoreFromSnapshot'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()
+        except Exception:
+            return {}
+
+    def manual_snapshot(self, server_id=None, description=None):
+        """
+        Initiate a manual snapshot on a server
+
+        :kw server_id: The UUID of the server
+        :returns: UUID of the new snapshot
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server is required')
+
+        params['serverId'] = server_id
+        if description:
+            params['description'] = description
+
+        url = self.base_url + 'snapshot/initiateManualSnapshot'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except Exception:
+            return None
+
+    def update_snapshot(self, snapshot_id=None, description=None):
+        """
+        Initiate a manual snapshot on a server
+
+        :kw snapshot_id: The UUID of the snapshot
+        :returns: UUID of the new snapshot
+        """
+
+        params = {}
+        if snapshot_id is None or description is None:
+            raise NTTMCPAPIException('A valid snapshot ID and description is required')
+
+        params['id'] = snapshot_id
+        params['description'] = description
+
+        url = self.base_url + 'snapshot/editSnapshotMetadata'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('responseCode') == 'OK'
+        except Exception:
+            return None
+
+    def delete_snapshot(self, snapshot_id=None):
+        """
+        Initiate a manual snapshot on a server
+
+        :kw snapshot_id: The UUID of the snapshot
+        :returns: True/False
+        """
+
+        params = {}
+        if snapshot_id is None:
+            raise NTTMCPAPIException('A valid snapshot ID is required')
+
+        params['id'] = snapshot_id
+
+        url = self.base_url + 'snapshot/deleteManualSnapshot'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('responseCode') == 'OK'
+        except Exception:
+            return None
+
+    def update_snapshot_scripts(self, server_id=None, pre_path=None, pre_description=None, pre_timeout=None,
+                                on_failure=None, post_path=None, post_description=None, username=None, password=None):
+        """
+        Initiate a manual snapshot on a server
+
+        :kw snapshot_id: The UUID of the snapshot
+        :returns: UUID of the new snapshot
+        """
+
+        params = {}
+        if not server_id:
+            raise NTTMCPAPIException('A valid server ID is required')
+        if not pre_path:
+            raise NTTMCPAPIException('A Pre script path must be present')
+        if not post_path:
+            raise NTTMCPAPIException('A Post script path must be present')
+        if None in [username, password] and (pre_path or post_path):
+            raise NTTMCPAPIException('A valid username and password for the server are required')
+
+        params['serverId'] = server_id
+        if pre_path or post_path:
+            params['serverCredentials'] = {}
+            params['serverCredentials']['username'] = username
+            params['serverCredentials']['password'] = password
+
+        if pre_path:
+            params['preSnapshot'] = {}
+            if not pre_timeout:
+                raise NTTMCPAPIException('The pre script timeout cannot be None/Null')
+            if not on_failure:
+                raise NTTMCPAPIException('The pre script on failure option cannot be None/Null')
+            params['preSnapshot']['script'] = {}
+            params['preSnapshot']['script']['path'] = pre_path
+            params['preSnapshot']['script']['timeoutSeconds'] = pre_timeout
+            params['preSnapshot']['script']['onFailure'] = on_failure
+            if pre_description:
+                params['preSnapshot']['script']['description'] = pre_description
+
+        if post_path:
+            params['postSnapshot'] = {}
+            params['postSnapshot']['script'] = {}
+            params['postSnapshot']['script']['path'] = post_path
+            if post_description:
+                params['postSnapshot']['script']['description'] = post_description
+
+        url = self.base_url + 'snapshot/editSnapshotServiceScripts'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('responseCode') == 'OK'
+        except Exception:
+            return None
+
+    def delete_snapshot_script(self, server_id=None, delete_pre=False, delete_post=False):
+        """
+        Initiate a manual snapshot on a server
+
+        :kw snapshot_id: The UUID of the snapshot
+        :returns: True/False
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A valid server ID is required')
+        if not delete_pre and not delete_post:
+            return True
+
+        params['serverId'] = server_id
+        if delete_pre:
+            params['preSnapshot'] = {}
+            params['preSnapshot']['noScript'] = {}
+        if delete_post:
+            params['postSnapshot'] = {}
+            params['postSnapshot']['noScript'] = {}
+
+        url = self.base_url + 'snapshot/editSnapshotServiceScripts'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('responseCode') == 'OK'
+        except Exception:
+            return None
+
+    def enable_snapshot_service(self, update=False, server_id=None, service_plan=None, window_id=None,
+                                replication_mcp=None, take_snapshot=False):
+        """
+        Enable/Update Snapshot Service configuration
+
+        :kw update: Is this an update for an existing configuration
+        :kw server_id: The UUID of the server being enabled for Snapshots
+        :kw service_plan: The Service Plan name (e.g. ONE_MONTH)
+        :kw window_id: Filter results by a specific start hour (e.g. 06)
+        :kw replication_mcp: The ID of the replication MCP
+        :kw take_snapshot: Whether to initiate a manual snapshot
+        :returns: API response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+        if service_plan is None:
+            raise NTTMCPAPIException('A Service Plan is required, service_plan cannot be None')
+        if window_id is None:
+            raise NTTMCPAPIException('A Snapshot Window is required, window_id cannot be None')
+
+        if replication_mcp is not None:
+            params['replicationTargetDatacenterId'] = replication_mcp
+        if take_snapshot:
+            params['initiateManualSnapshot'] = True
+
+        params['serverId'] = server_id
+        params['servicePlan'] = service_plan
+        params['windowId'] = window_id
+
+        if update:
+            url = self.base_url + 'snapshot/changeSnapshotServicePlan'
+        else:
+            url = self.base_url + 'snapshot/enableSnapshotService'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Service was successfully enabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def disable_snapshot_service(self, server_id=None):
+        """
+        Disable the snapshot service on a server
+
+        :kw server_id: The UUID of the server being disabled for Snapshots
+        :returns: API Response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+
+        params['serverId'] = server_id
+
+        url = self.base_url + 'snapshot/disableSnapshotService'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Service was successfully disabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def enable_snapshot_replication(self, server_id=None, replication_target=None):
+        """
+        Enable snapshot replication on a server
+
+        :kw server_id: The UUID of the server being enabled for Snapshot replication
+        :kw replication_target: The datacenter ID for the replication target
+        :returns: API Response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+        if replication_target is None:
+            raise NTTMCPAPIException('A replication datacenter is required, replication_target cannot be None')
+
+        params['serverId'] = server_id
+        params['targetDatacenterId'] = replication_target
+
+        url = self.base_url + 'snapshot/enableReplication'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot replication was successfully enabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def disable_snapshot_replication(self, server_id=None):
+        """
+        Disable snapshot replication on a server
+
+        :kw server_id: The UUID of the server being enabled for Snapshot replication
+        :returns: API Response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A Server is required, server_id cannot be None')
+
+        params['serverId'] = server_id
+
+        url = self.base_url + 'snapshot/disableReplication'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot replication was successfully disabled')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def create_snapshot_preview(self, snapshot_id=None, server_name=None, server_description=None, cluster_id=None,
+                                start_server=False, connect_nics=False, preserve_mac=False):
+        """
+        Create a local Snapshot Preview Server
+
+        :kw snapshot_id: The UUID of the snapshot to be used as the base for the preview server
+        :kw server_name: The name of the new preview server
+        :kw server_description: The description of the new preview server
+        :kw cluster_id: The vCenter cluster ID for the new preview server
+        :kw start_server: Should the preview server be started
+        :kw connect_nics: Should the preview server be created with NICs connected
+        :kw preserve_mac: Should the preview server's MAC address be preserved from the original base server's
+
+        :returns: API Response
+        """
+
+        params = {}
+        if snapshot_id is None:
+            raise NTTMCPAPIException('A Snapshot ID is required, snapshot_id cannot be None')
+        if server_name is None:
+            raise NTTMCPAPIException('A Server Name is required, server_name cannot be None')
+
+        params['snapshotId'] = snapshot_id
+        params['serverName'] = server_name
+        params['serverStarted'] = start_server
+        params['nicsConnected'] = connect_nics
+        params['preserveMacAddresses'] = preserve_mac
+        if server_description:
+            params['serverDescription'] = server_description
+        if cluster_id:
+            params['targetClusterId'] = cluster_id
+
+        url = self.base_url + 'snapshot/createSnapshotPreviewServer'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Preview Server was successfully created')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def create_replicated_snapshot_preview(self, snapshot_id=None, server_name=None, server_description=None,
+                                           cluster_id=None, start_server=False, connect_nics=False, networks=None,
+                                           preserve_mac=False):
+        """
+        Create a local Snapshot Preview Server
+
+        :kw snapshot_id: The UUID of the snapshot to be used as the base for the preview server
+        :kw server_name: The name of the new preview server
+        :kw server_description: The description of the new preview server
+        :kw cluster_id: The vCenter cluster ID for the new preview server
+        :kw start_server: Should the preview server be started
+        :kw connect_nics: Should the preview server be created with NICs connected
+        :kw networks: List of network dicts containing the source NIC ID, destination VLAN ID and any IPv4 address
+        :kw preserve_mac: Should the preview server's MAC address be preserved from the original base server's
+
+        :returns: API Response
+        """
+
+        params = {}
+        if snapshot_id is None:
+            raise NTTMCPAPIException('A Snapshot ID is required, snapshot_id cannot be None')
+        if server_name is None:
+            raise NTTMCPAPIException('A Server Name is required, server_name cannot be None')
+        if networks is None or type(networks) != list:
+            raise NTTMCPAPIException('A valid list of NICs and associated networks is required')
+
+        params['replicatedSnapshotId'] = snapshot_id
+        params['serverName'] = server_name
+        params['serverStarted'] = start_server
+        params['nicsConnected'] = connect_nics
+        params['nic'] = list()
+        for nic in networks:
+            tmp_nic = dict()
+            tmp_nic['sourceNicId'] = nic.get('nic_id')
+            tmp_nic['vlanId'] = nic.get('vlan_id')
+            if nic.get('ipv4_address'):
+                tmp_nic['privateIpv4'] = nic.get('ipv4_address')
+            params['nic'].append(tmp_nic)
+        params['preserveMacAddresses'] = preserve_mac
+        if server_description:
+            params['serverDescription'] = server_description
+        if cluster_id:
+            params['targetClusterId'] = cluster_id
+
+        url = self.base_url + 'snapshot/createReplicatedSnapshotPreviewServer'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Preview Server was successfully created')
+        else:
+            raise NTTMCPAPIException('No response from the API')
+
+    def migrate_snapshot_preview(self, server_id=None):
+        """
+        Migrate Snapshot Preview Server
+
+        :kw servert_id: The UUID of the preview server
+        :returns: API Response
+        """
+
+        params = {}
+        if server_id is None:
+            raise NTTMCPAPIException('A server ID is required, server_id cannot be None')
+
+        params['serverId'] = server_id
+
+        url = self.base_url + 'snapshot/migrateSnapshotPreviewServer'
+
+        response = self.api_post_call(url, params)
+        if response is not None:
+            result = response.json()
+            if result['requestId']:
+                return result
+            else:
+                raise NTTMCPAPIException('Could not confirm that the Snapshot Preview Server was successfully migrated')
+        else:
+            raise NTTMCPAPIException('No response from the API')
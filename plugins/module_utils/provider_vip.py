@@ -0,0 +1,931 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# NTT LTD MCP Cloud API Provider (MCP 2.0) - VIP API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_SIZE
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_ip_version
+
+
+class NTTMCPVIPAPI():
+    """
+    NTTMCPClient methods for VIP nodes, pools, listeners, SSL offload profiles and VIP support objects. Loaded by
+    NTTMCPClient the first time one of the methods is used
+    """
+    def list_vip_function(self, network_domain_id=None, function_type='health_monitor', page_size=API_PAGE_SIZE,
+                          max_workers=None):
+        """
+        Return information on available VIP support functions and utilize paging
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw function_type: The type of VIP support function to search on
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :return: List of VIP support functions for the supplied function type
+        """
+        params = dict()
+        api_entity = None
+
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        if function_type == 'health_monitor':
+            api_entity = 'defaultHealthMonitor'
+        elif function_type == 'persistence_profile':
+            api_entity = 'defaultPersistenceProfile'
+        elif function_type == 'irule':
+            api_entity = 'defaultIrule'
+
+        url = self.base_url + 'networkDomainVip/' + api_entity
+
+        params['networkDomainId'] = network_domain_id
+        params['pageSize'] = page_size
+        return list(self.iter_entities(url=url, entity=api_entity, params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def list_vip_node(self, network_domain_id=None, name=None, ip_address=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return a list of Virtual IP nodes
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The node name
+        :kw ip_address: the IPv4 or IPv6 address for the node
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: List of Nodes
+        """
+        params = {}
+        version = None
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        if ip_address:
+            version = get_ip_version(ip_address)
+
+        # Any supplied name trumps a supplied version and ip_address
+        if name:
+            params['name'] = name
+        elif version is not None and ip_address:
+            params['ipv{0}Address'.format(version)] = ip_address
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/node'
+
+        return list(self.iter_entities(url=url, entity='node', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def resolve_vip_node_ids(self, network_domain_id, names):
+        """
+        Return the UUIDs of VIP nodes from the resolver cache. If any name is not cached the nodes in the Cloud Network
+        Domain are listed once and all of them are cached
+
+        :arg network_domain_id: The UUID of a Cloud Network Domain
+        :arg names: A list of VIP node names
+        :returns: dict of node UUIDs keyed on name. Names that do not exist are not included
+        """
+        node_ids = {}
+        for name in names:
+            node_id = self.resolver.get('node', network_domain_id, name)
+            if node_id:
+                node_ids[name] = node_id
+        missing = set(names) - set(node_ids)
+        if missing:
+            for node in self.list_vip_node(network_domain_id=network_domain_id):
+                if node.get('name') in missing and node.get('name') not in node_ids:
+                    node_ids[node.get('name')] = node.get('id')
+                    self.resolver.set('node', network_domain_id, node.get('name'), node.get('id'))
+            for name in missing - set(node_ids):
+                self.resolver.set('node', network_domain_id, name, None)
+        return node_ids
+
+    def get_vip_node(self, node_id):
+        """
+        Return a specific Virtual IP node
+
+        :arg node_id: The UUID of a VIP Node
+        :return: List of Nodes
+        """
+        params = {}
+        if node_id is None:
+            raise NTTMCPAPIException('The Node ID is required')
+
+        url = self.base_url + 'networkDomainVip/node/{0}'.format(node_id)
+
+        response = self.api_get_call(url, params)
+        try:
+            if response is not None:
+                result = response.json()
+                if result.get('responseCode') == 'RESOURCE_NOT_FOUND':
+                    return []
+                return result
+        except (KeyError, AttributeError, NTTMCPAPIException):
+            return {}
+
+    def create_vip_node(self, network_domain_id=None, name=None, description=None, ip_address=None, status=None,
+                        health_monitor=None, connection_limit=None, connection_rate_limit=None):
+        """
+        Create a Virtual IP node
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The node name
+        :kw description: the node descrition
+        :kw ip_address: The IPv4 or IPv6 address of the Node
+        :kw status: The status for the node. Valid values are stored in VIP_NODE_STATES in ansible.module_utils.config
+        :kw health_monitor: The UUID for a node compatible health monitoring profile
+        :kw connection_limit: The maximum number of simultaneous connections permitted on the Node. Should be an integer between 1 and 100,000
+        :kw connection_rate_limit: The amount of new connections permitted every second. Should be an integer between 1 and 4,000.
+        :returns: The UUID of the newly created node
+        """
+        params = {}
+        if not all([network_domain_id, name, ip_address, status, connection_limit, connection_rate_limit]):
+            raise NTTMCPAPIException('Valid values for Network Domain ID, Name, IP Address, status, connection limit '
+                                     'and connection rate limit values are required')
+
+        version = get_ip_version(ip_address)
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['ipv{0}Address'.format(version)] = ip_address
+        params['status'] = status
+        params['healthMonitorId'] = health_monitor
+        params['connectionLimit'] = connection_limit
+        params['connectionRateLimit'] = connection_rate_limit
+
+        url = self.base_url + 'networkDomainVip/createNode'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create VIP Node request was accepted')
+
+    def update_vip_node(self, node_id=None, description=None, status=None, health_monitor=None, no_health_monitor=False,
+                        connection_limit=None, connection_rate_limit=None):
+        """
+        :kw node_id: The UUID of the node to be updated
+        :kw description: the node description
+        :kw status: The status for the node. Valid values are stored in VIP_NODE_STATES in ansible.module_utils.config
+        :kw health_monitor: The UUID for a node compatible health monitoring profile
+        :kw no_health_monitor: If True this will remove any configured health monitoring profiles on the node
+        :kw connection_limit: The maximum number of simultaneous connections permitted on the Node. Should be an integer between 1 and 100,000
+        :kw connection_rate_limit: The amount of new connections permitted every second. Should be an integer between 1 and 4,000.
+        :returns: The UUID of the newly created node
+        """
+        params = {}
+        if not node_id:
+            raise NTTMCPAPIException('Valid values for Network Domain ID and node ID are required ')
+
+        params['id'] = node_id
+        if description:
+            params['description'] = description
+        if status:
+            params['status'] = status
+        if no_health_monitor:
+            params['healthMonitorId'] = {'nil': True}
+        elif health_monitor:
+            params['healthMonitorId'] = health_monitor
+        if connection_limit:
+            params['connectionLimit'] = connection_limit
+        if connection_rate_limit:
+            params['connectionRateLimit'] = connection_rate_limit
+
+        url = self.base_url + 'networkDomainVip/editNode'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update VIP Node request was accepted')
+
+    def remove_vip_node(self, node_id):
+        """
+        Remove a Virtual IP node
+
+        :arg node_id: UUID of the VIP Node
+        :returns: string (API message)
+        """
+        if node_id is None:
+            raise NTTMCPAPIException('A valid value for the VIP Node ID is required')
+        params = {'id': node_id}
+
+        url = self.base_url + 'networkDomainVip/deleteNode'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove VIP Node request was accepted')
+
+    def list_vip_health_monitor(self, network_domain_id=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of Virtual IP health monitor profiles and utilize paging
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: List of VIP Node Health Monitor profiles
+        """
+        params = {}
+        if not network_domain_id:
+            raise NTTMCPAPIException('The Network Domain ID provided is invalid')
+        params['networkDomainId'] = network_domain_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/defaultHealthMonitor'
+
+        return list(self.iter_entities(url=url, entity='defaultHealthMonitor', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def list_vip_pool(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        Return an array of Virtual IP pools
+
+        :arg network_domain_id: The UUID of a Cloud Network Domain
+        :arg name: The pool name
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: List of Nodes
+        """
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/pool'
+
+        return list(self.iter_entities(url=url, entity='pool', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_vip_pool(self, pool_id):
+        """
+        Return a specific Virtual IP pool based on the specified UUID
+
+        :arg pool_id: The UUID of a VIP pool
+        :returns: List of Pools
+        """
+        params = {}
+        if pool_id is None:
+            raise NTTMCPAPIException('The VIP Pool ID is required')
+
+        url = self.base_url + 'networkDomainVip/pool/{0}'.format(pool_id)
+
+        response = self.api_get_call(url, params)
+        try:
+            return response.json()
+        except Exception:
+            return {}
+
+    def create_vip_pool(self, network_domain_id=None, name=None, description=None, load_balancing=None,
+                        service_down_action=None, health_monitor=None, slow_ramp_time=None):
+        """
+        Create a new Virtual IP pool
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The node name
+        :kw description: The pool description
+        :kw ip_address: The IPv4 or IPv6 address of the Node
+        :kw load_balancing: The load balancing method for the node. Valid values are stored in LOAD_BALANCING_METHODS
+                            in ansible.module_utils.config
+        :kw health_monitor: List of UUID for a pool compatible health monitoring profiles
+                            (maximum of 2 IDs in the list)
+        :kw service_down_action: When a Pool Member fails to respond to a Health Monitor, the system marks that Pool
+                                 Member down and removes any persistence entries associated with the Pool Member.
+        :kw slow_ramp_time: The Slow Ramp Time setting controls the percentage of connections that are sent to a new
+                            Pool Member by specifying the duration (in seconds)
+        :returns: The UUID of the newly created pool
+        """
+        params = {}
+        if not all([network_domain_id, name, load_balancing, service_down_action, slow_ramp_time]):
+            raise NTTMCPAPIException('Valid values for Network Domain ID, Name, load balancing method and '
+                                     'slow ramp time values are required')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['loadBalanceMethod'] = load_balancing
+        params['serviceDownAction'] = service_down_action
+        params['healthMonitorId'] = health_monitor
+        params['slowRampTime'] = slow_ramp_time
+
+        url = self.base_url + 'networkDomainVip/createPool'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create VIP Pool request was accepted')
+
+    def update_vip_pool(self, vip_pool_id, description=None, load_balancing=None, health_monitor=None,
+                        no_health_monitor=None, service_down_action=None, slow_ramp_time=None):
+        """
+        Update an existing IP Pool
+        :kw vip_pool_id: The UUID of the VIP Pool
+        :kw description: The description of the VIP Pool
+        :kw load_balancing: The load balancing method for the node. Valid values are stored in LOAD_BALANCING_METHODS
+                            in ansible.module_utils.config
+        :kw health_monitor: List of UUID for a pool compatible health monitoring profiles
+                            (maximum of 2 IDs in the list)
+        :kw no_health_monitor: If this is True all health monitoring profiles will be removed from the VIP Pool
+        :kw service_down_action: When a Pool Member fails to respond to a Health Monitor, the system marks that Pool
+                                 Member down and removes any persistence entries associated with the Pool Member.
+        :kw slow_ramp_time: The Slow Ramp Time setting controls the percentage of connections that are sent to a new
+                            Pool Member by specifying the duration (in seconds)
+        # Return: The UUID of the updated pool
+        """
+        params = {}
+        if not vip_pool_id:
+            raise NTTMCPAPIException('A valid VIP Pool ID is required')
+
+        params['id'] = vip_pool_id
+        if description:
+            params['description'] = description
+        if load_balancing:
+            params['loadBalanceMethod'] = load_balancing
+        if service_down_action:
+            params['serviceDownAction'] = service_down_action
+        if slow_ramp_time:
+            params['slowRampTime'] = slow_ramp_time
+        if no_health_monitor:
+            params['healthMonitorId'] = {'nil': True}
+        elif health_monitor:
+            params['healthMonitorId'] = health_monitor
+
+        url = self.base_url + 'networkDomainVip/editPool'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update VIP Pool request was accepted')
+
+    def remove_vip_pool(self, vip_pool_id=None):
+        """
+        Remove a VIP Pool
+        :kw vip_pool_id: The UUID of the VIP Pool
+        """
+        params = {}
+        if not vip_pool_id:
+            raise NTTMCPAPIException('A valid VIP Pool ID is required')
+
+        params['id'] = vip_pool_id
+
+        url = self.base_url + 'networkDomainVip/deletePool'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result['responseCode'] == "OK":
+                return result['message']
+            else:
+                return result['error']
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove VIP Pool request was accepted')
+
+    def list_vip_pool_members(self, vip_pool_id=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List all the members for the given VIP Pool ID and utilize paging
+
+        :kw vip_pool_id: The UUID of the VIP Pool
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of members
+        """
+        params = {}
+        if not vip_pool_id:
+            raise NTTMCPAPIException('A valid VIP Pool ID is required')
+
+        params['poolId'] = vip_pool_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/poolMember'
+
+        return list(self.iter_entities(url=url, entity='poolMember', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def add_vip_pool_member(self, vip_pool_id=None, vip_node_id=None, port=None, status=None):
+        """
+        Add a member to an existing VIP Pool
+
+        :kw vip_pool_id: The UUID of the VIP Pool
+        :kw vip_node_id: The UUID of the Node to be added
+        :kw port: The TCP/UDP port to be used
+        :kw status: The status for the node. Valid values are stored in VIP_NODE_STATES in ansible.module_utils.config
+        :returns: The UUID of the new VIP Pool Member
+        """
+        params = {}
+        if not all([vip_pool_id, vip_node_id, port, status]):
+            raise NTTMCPAPIException('Valid values for VIP Pool ID, VIP Node ID, port and status are required')
+
+        params['poolId'] = vip_pool_id
+        params['nodeId'] = vip_node_id
+        params['port'] = port
+        params['status'] = status
+
+        url = self.base_url + 'networkDomainVip/addPoolMember'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the add VIP Pool Member request was accepted')
+
+    def remove_vip_pool_member(self, vip_pool_member_id):
+        """
+        Remove a member to an existing VIP Pool
+
+        :kw vip_pool_member_id: The UUID of the Node to be removed
+        :returns: string API message
+        """
+        if vip_pool_member_id is None:
+            raise NTTMCPAPIException('A valid value for the VIP Node ID is required')
+        params = {'id': vip_pool_member_id}
+
+        url = self.base_url + 'networkDomainVip/removePoolMember'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result.get('responseCode') == "OK":
+                return result.get('message')
+            else:
+                return result.get('error')
+        except (KeyError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the remove VIP Pool Member request was accepted')
+
+    def list_vip_ssl(self, network_domain_id=None, ssl_type=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List the VIP SSL object and utilize paging
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw ssl_type: The type of SSL object to list
+        :kw name: The name of the SSL object
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of SSL objects
+        """
+        params = {}
+
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain and the SSL object type cannot be None')
+        elif ssl_type not in ['sslDomainCertificate', 'sslCertificateChain', 'sslOffloadProfile']:
+            raise NTTMCPAPIException('Invalid object type')
+
+        if name:
+            params['name'] = name
+        if network_domain_id:
+            params['networkDomainId'] = network_domain_id
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/{0}'.format(ssl_type)
+
+        return list(self.iter_entities(url=url, entity=ssl_type, params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_vip_ssl(self, ssl_type=None, ssl_id=None):
+        """
+        Get a VIP SSL object
+
+        :kw ssl_type: The type of SSL object to get
+        :kw ssl_id: The UUID of the SSL object
+        """
+        if ssl_id is None:
+            raise NTTMCPAPIException('SSL object ID cannot be None')
+        elif ssl_type not in ['sslDomainCertificate', 'sslCertificateChain', 'sslOffloadProfile']:
+            raise NTTMCPAPIException('Invalid object type')
+
+        if ssl_type == 'certificate':
+            ssl_type = 'sslDomainCertificate'
+        elif ssl_type == 'chain':
+            ssl_type = 'sslCertificateChain'
+        elif ssl_type == 'profile':
+            ssl_type = 'sslOffloadProfile'
+
+        url = self.base_url + 'networkDomainVip/{0}/{1}'.format(ssl_type, ssl_id)
+
+        response = self.api_get_call(url, None)
+        try:
+            result = response.json()
+            if result.get('responseCode') == 'RESOURCE_NOT_FOUND':
+                return []
+            return result
+        except (KeyError, IndexError, AttributeError):
+            return {}
+
+    def import_ssl_cert(self, network_domain_id=None, name=None, description=None, cert=None, cert_key=None):
+        """
+        Import a SSL certificate
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw name: The name of the SSL certificate
+        :kw description: The description of the SSL certificate
+        :kw cert: The SSL certificate
+        :kw cert_key: The SSL certificate key
+        """
+        params = {}
+        if not all([network_domain_id, name, cert, cert_key]):
+            raise NTTMCPAPIException('A valid Network Domain, certificate name, certificate and key are required')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['certificate'] = cert
+        params['key'] = cert_key
+
+        url = self.base_url + 'networkDomainVip/importSslDomainCertificate'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the import SSL certificate request was accepted')
+
+    def import_ssl_cert_chain(self, network_domain_id=None, name=None, description=None, cert_chain=None):
+        """
+        Import a SSL certificate chain
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw name: The name of the SSL certificate chain
+        :kw description: The description of the SSL certificate chain
+        :kw cert_chain: The SSL certificate chain
+        """
+        params = {}
+        if not all([network_domain_id, name, cert_chain]):
+            raise NTTMCPAPIException('A valid Network Domain, certificate chain name, certificate chain are required')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['certificateChain'] = cert_chain
+
+        url = self.base_url + 'networkDomainVip/importSslCertificateChain'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the import SSL certificate chain request was accepted')
+
+    def create_ssl_offload_profile(self, network_domain_id=None, name=None, description=None, ciphers=None, cert_id=None, cert_chain_id=None):
+        """
+        Import a SSL certificate chain
+
+        :kw network_domain_id: The UUID of the Cloud Network Domain
+        :kw name: The name of the SSL certificate chain
+        :kw description: The description of the SSL certificate chain
+        :kw ciphers: A valid F5 cipher string
+        :kw cert_id: The UUID of a previously imported SSL certificate
+        :kw cerT_chain_id: the UUID of the previously imported SSL certificate chain
+        """
+        params = {}
+        if not all([network_domain_id, name, ciphers, cert_id, cert_chain_id]):
+            raise NTTMCPAPIException('A valid Network Domain, profile name, cipher string, certificate ID and certificate chain ID are required')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['ciphers'] = ciphers
+        params['sslDomainCertificateId'] = cert_id
+        params['sslCertificateChainId'] = cert_chain_id
+
+        url = self.base_url + 'networkDomainVip/createSslOffloadProfile'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the create SSL Offload Profile request was accepted')
+
+    def update_ssl_offload_profile(self, profile_id=None, name=None, description=None, ciphers=None, cert_id=None, cert_chain_id=None):
+        """
+        Import a SSL certificate chain
+
+        :kw profile_id: The UUID of the SSL Offload Profile
+        :kw name: The name of the SSL certificate chain
+        :kw description: The description of the SSL certificate chain
+        :kw ciphers: A valid F5 cipher string
+        :kw cert_id: The UUID of a previously imported SSL certificate
+        :kw cerT_chain_id: the UUID of the previously imported SSL certificate chain
+        """
+        params = {}
+        if not all([profile_id, name]):
+            raise NTTMCPAPIException('A valid profile ID and profile name are required')
+
+        params['id'] = profile_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        if ciphers:
+            params['ciphers'] = ciphers
+        if cert_id:
+            params['sslDomainCertificateId'] = cert_id
+        if cert_chain_id:
+            params['sslCertificateChainId'] = cert_chain_id
+
+        url = self.base_url + 'networkDomainVip/editSslOffloadProfile'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('responseCode')
+        except (KeyError, IndexError, AttributeError):
+            raise NTTMCPAPIException('Could not confirm that the update SSL Offload Profile request was accepted')
+
+    def remove_ssl(self, ssl_type=None, ssl_id=None):
+        """
+        Remove a VIP SSL object
+
+        :kw ssl_type: The type of SSL object to remove
+        :kw ssl_id: The UUID of the SSL object
+        """
+        if ssl_id is None:
+            raise NTTMCPAPIException('SSL object ID cannot be None')
+        elif ssl_type not in ['certificate', 'chain', 'profile']:
+            raise NTTMCPAPIException('Invalid object type')
+
+        if ssl_type == 'certificate':
+            ssl_type = 'deleteSslDomainCertificate'
+        elif ssl_type == 'chain':
+            ssl_type = 'deleteSslCertificateChain'
+        elif ssl_type == 'profile':
+            ssl_type = 'deleteSslOffloadProfile'
+
+        params = {}
+        params['id'] = ssl_id
+
+        url = self.base_url + 'networkDomainVip/{0}'.format(ssl_type)
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json()
+        except Exception as e:
+            raise NTTMCPAPIException('{0}'.format(e))
+
+    def list_vip_listener(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List VIP Virtual Listeners and utilize paging
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The name to search for
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of Virtual Listeners
+        """
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/virtualListener'
+
+        return list(self.iter_entities(url=url, entity='virtualListener', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def get_vip_listener(self, listener_id):
+        """
+        List VIP Virtual Listeners
+
+        :kw listener_id: The UUID of a Virtual Listener
+        :returns: A Virtual Listeners
+        """
+        params = {}
+        if listener_id is None:
+            raise NTTMCPAPIException('The VIP Virtual Listener ID is required')
+
+        url = self.base_url + 'networkDomainVip/virtualListener/{0}'.format(listener_id)
+
+        response = self.api_get_call(url, params)
+        try:
+            result = response.json()
+            if result.get('responseCode') == 'RESOURCE_NOT_FOUND':
+                return {}
+            return result
+        except Exception:
+            return {}
+
+    def list_irule(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List VIP iRules and utilize paging
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The name to search for
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of iRules
+        """
+
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/defaultIrule'
+
+        return list(self.iter_entities(url=url, entity='defaultIrule', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def list_persistence_profile(self, network_domain_id=None, name=None, page_size=API_PAGE_SIZE, max_workers=None):
+        """
+        List VIP Persistence Profiles and utilize paging
+
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The name to search for
+        :kw page_size: The number of objects per page
+        :kw max_workers: The maximum number of pages to fetch concurrently
+        :returns: A list of Persistence Profiles
+        """
+
+        params = {}
+        if network_domain_id is None:
+            raise NTTMCPAPIException('Network Domain is required')
+
+        params['networkDomainId'] = network_domain_id
+        if name:
+            params['name'] = name
+        params['pageSize'] = page_size
+
+        url = self.base_url + 'networkDomainVip/defaultPersistenceProfile'
+
+        return list(self.iter_entities(url=url, entity='defaultPersistenceProfile', params=params, page_size=page_size,
+                                       max_workers=max_workers))
+
+    def create_vip_listener(self, network_domain_id=None, name=None, description=None, listener_type='STANDARD',
+                            protocol='ANY', ip_address=None, port=None, enabled=True, connection_limit=100000,
+                            connection_rate_limit=4000, preservation=None, pool_id_1=None, pool_id_2=None,
+                            persistence_id_1=None, persistence_id_2=None, optimization_profile=None,
+                            ssl_profile_id=None, irules=None):
+        """
+        Create a VIP Virtual Listener
+
+        :arg self: this
+        :kw network_domain_id: The UUID of a Cloud Network Domain
+        :kw name: The name of the Virtual Listener
+        :kw description: The description for the Virtual Listener (max 255 characters)
+        :kw type: The type of Virtual Listener
+        :kw protocol: The protocol for this Virtual Listener
+        :kw ip_address: The IP address to listen on
+        :kw port: The port(s) to listen on
+        :kw enabled: The state for this Virtual Listener
+        :kw connection_limit: The maximum number of simultaneous connections permitted on the Node. Should be an integer between 1 and 100,000
+        :kw connection_rate_limit: The amount of new connections permitted every second. Should be an integer between 1 and 4,000.
+        :kw preservation: Identifies how the port of the source traffic will be treated when sending connections to the pool member.
+        :kw pool_id_1: The primary VIP Pool
+        :kw pool_id_2: The client VIP Pool (gets a duplicate copy of all VIP traffic)
+        :kw persistence_id_1: The UUID of the primary persistence profile
+        :kw persistence_id_2: The UUID of the secondary persistence profile
+        :kw optimization_profile: The optimization profile
+        :kw ssl_profile_id: The UUID of the SSL Offload Profile
+        :kw irules: A list of UUIDs of iRules
+        """
+        params = {}
+
+        if not all([network_domain_id, name, ip_address, pool_id_1]):
+            raise NTTMCPAPIException('A valid Network Domain ID, name, IP Address and VIP Pool are required.')
+
+        params['networkDomainId'] = network_domain_id
+        params['name'] = name
+        if description:
+            params['description'] = description
+        params['type'] = listener_type
+        params['protocol'] = protocol
+        params['listenerIpAddress'] = ip_address
+        if port:
+            params['port'] = port
+        params['enabled'] = enabled
+        params['connectionLimit'] = connection_limit
+        params['connectionRateLimit'] = connection_rate_limit
+        params['sourcePortPreservation'] = preservation
+        params['poolId'] = pool_id_1
+        if pool_id_2:
+            params['clientClonePoolId'] = pool_id_2
+        if persistence_id_1:
+            params['persistenceProfileId'] = persistence_id_1
+        if persistence_id_2:
+            params['fallbackPersistenceProfileId'] = persistence_id_2
+        if optimization_profile:
+            params['optimizationProfile'] = optimization_profile
+        if ssl_profile_id:
+            params['sslOffloadProfileId'] = ssl_profile_id
+        if type(irules) is list:
+            if irules:
+                params['iruleId'] = irules
+
+        url = self.base_url + 'networkDomainVip/createVirtualListener'
+
+        response = self.api_post_call(url, params)
+        try:
+            return response.json().get('info')[0].get('value')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the create VIP Virtual Listener request was accepted')
+
+    def update_vip_listener(self, listener_id=None, description=None, listener_type='STANDARD',
+                            protocol='ANY', enabled=True, connection_limit=100000,
+                            connection_rate_limit=4000, preservation=None, pool_id_1=None, pool_id_2=None,
+                            persistence_id_1=None, persistence_id_2=None, optimization_profile=None,
+                            ssl_profile_id=None, irules=None):
+        """
+        Create a VIP Virtual Listener
+
+        :arg self: this
+        :kw listener_id: The UUID of the Virtual Listener
+        :kw description: The description for the Virtual Listener (max 255 characters)
+        :kw type: The type of Virtual Listener
+        :kw protocol: The protocol for this Virtual Listener
+        :kw enabled: The state for this Virtual Listener
+        :kw connection_limit: The maximum number of simultaneous connections permitted on the Node. Should be an integer between 1 and 100,000
+        :kw connection_rate_limit: The amount of new connections permitted every second. Should be an integer between 1 and 4,000.
+        :kw preservation: Identifies how the port of the source traffic will be treated when sending connections to the pool member.
+        :kw pool_id_1: The primary VIP Pool
+        :kw pool_id_2: The client VIP Pool (gets a duplicate copy of all VIP traffic)
+        :kw persistence_id_1: The UUID of the primary persistence profile
+        :kw persistence_id_2: The UUID of the secondary persistence profile
+        :kw optimization_profile: The optimization profile
+        :kw ssl_profile_id: The UUID of the SSL Offload Profile
+        :kw irules: A list of UUIDs of iRules
+        """
+        params = {}
+
+        if not listener_id:
+            raise NTTMCPAPIException('A valid VIP Listener ID is required.')
+
+        params['id'] = listener_id
+        params['description'] = description
+        params['type'] = listener_type
+        params['protocol'] = protocol
+        params['enabled'] = enabled
+        params['connectionLimit'] = connection_limit
+        params['connectionRateLimit'] = connection_rate_limit
+        params['sourcePortPreservation'] = preservation
+        params['poolId'] = pool_id_1
+        params['clientClonePoolId'] = pool_id_2
+        params['persistenceProfileId'] = persistence_id_1
+        params['fallbackPersistenceProfileId'] = persistence_id_2
+        params['optimizationProfile'] = optimization_profile
+        params['sslOffloadProfileId'] = ssl_profile_id
+        if type(irules) is list:
+            params['iruleId'] = irules
+
+        url = self.base_url + 'networkDomainVip/editVirtualListener'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result.get('responseCode') == "OK":
+                return listener_id
+            else:
+                return result.get('error')
+        except (KeyError, IndexError):
+            raise NTTMCPAPIException('Could not confirm that the update VIP Virtual Listener request was accepted')
+
+    def remove_vip_listener(self, listener_id=None):
+        """
+        Remove a VIP Pool
+        :kw listener_id: The UUID of the VIP Virtual Listener
+        """
+        params = {}
+        if not listener_id:
+            raise NTTMCPAPIException('A valid VIP Virtual Listener ID is required')
+
+        params['id'] = listener_id
+
+        url = self.base_url + 'networkDomainVip/deleteVirtualListener'
+
+        response = self.api_post_call(url, params)
+        try:
+            result = response.json()
+            if result.get('responseCode') == "OK":
+                return result.get('message')
+            else:
+                return result.get('error')
+        except KeyError:
+            raise NTTMCPAPIException('Could not confirm that the remove VIP Virtual Listener request was accepted')
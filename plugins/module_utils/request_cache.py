@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# In memory cache of GET responses for the lifetime of a single API client
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from collections import OrderedDict
+from threading import Lock
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+
+def resource_family(url):
+    """
+    Return the resource family of an API URL. This is the first path element after the org ID
+    e.g. /caas/2.11/{org_id}/network/vlan is in the network family
+
+    :arg url: The API URL
+    :returns: The resource family string or None
+    """
+    path = [x for x in urlparse(url).path.split('/') if x]
+    if len(path) > 3 and path[0] == 'caas':
+        return path[3]
+    return None
+
+
+def request_key(url, params=None):
+    """
+    Return a hashable key for a GET request. Parameters are normalized so the same query with the parameters in a
+    different order (or with values of a different type e.g. 1 and '1') has the same key
+
+    :arg url: The API URL
+    :kw params: dict of query parameters
+    :returns: A tuple of the URL and sorted parameters
+    """
+    normalized = []
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = tuple(str(x) for x in value)
+        else:
+            value = str(value)
+        normalized.append((str(key), value))
+    return url, tuple(sorted(normalized))
+
+
+class RequestCache():
+    """
+    A size bounded, least recently used cache of GET responses with a TTL per entry. A POST to a resource family
+    removes the cached GETs for that family (and any related families) and stops further GETs on those families from
+    being cached, as the resources are likely to be changing state until the client is finished with them
+    """
+    def __init__(self, ttl, max_size, related=None):
+        """
+        :arg ttl: The number of seconds a response is cached for
+        :arg max_size: The maximum number of responses held
+        :kw related: dict of resource family to a list of other families a POST also invalidates
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.related = related or {}
+        self.entries = OrderedDict()
+        self.dirty = set()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, url, params=None):
+        """
+        Return a cached response
+
+        :arg url: The API URL
+        :kw params: dict of query parameters
+        :returns: The cached response or None
+        """
+        key = request_key(url, params)
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None or entry[0] <= monotonic():
+                self.misses += 1
+                return None
+            # Re-insert to mark the entry as the most recently used
+            self.entries[key] = entry
+            self.hits += 1
+            return entry[1]
+
+    def set(self, url, params, response):
+        """
+        Cache a response unless its resource family has been modified by this client
+
+        :arg url: The API URL
+        :arg params: dict of query parameters
+        :arg response: The response object
+        """
+        if resource_family(url) in self.dirty:
+            return
+        key = request_key(url, params)
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = (monotonic() + self.ttl, response)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, url):
+        """
+        Remove the cached responses in the resource family of a URL (and any related families) and stop caching
+        responses for those families
+
+        :arg url: The API URL that was modified e.g. by a POST
+        """
+        family = resource_family(url)
+        families = set([family] + list(self.related.get(family, [])))
+        with self.lock:
+            self.dirty.update(families)
+            for key in [k for k in self.entries if resource_family(k[0]) in families]:
+                del self.entries[key]
+
+    def clear(self):
+        """
+        Remove all cached responses
+        """
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Persistent cache of object name to UUID lookups shared between module invocations
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.cache import NTTMCPFileCache, cache_key
+
+# API actions that delete or rename a resolvable object. The cached entries for the object id are removed
+RESOLVER_FORGET_ACTIONS = ['deleteNetworkDomain', 'editNetworkDomain', 'deleteVlan', 'editVlan', 'deleteIpAddressList',
+                           'editIpAddressList', 'deletePortList', 'editPortList', 'deleteNode', 'editNode']
+
+
+class NTTMCPResolver():
+    """
+    Resolve object names to UUIDs using the local file cache. Entries are keyed on a hash of the org ID, scope (e.g.
+    datacenter or Cloud Network Domain), object kind and name. A lookup that finds nothing removes the entry and any
+    UUID that later turns out not to exist can be forgotten so the next lookup goes back to the API. The file cache
+    locking makes it safe to share between Ansible forks
+    """
+    def __init__(self, org_id, ttl, cache_dir=None):
+        """
+        :arg org_id: The UUID of the user's org
+        :arg ttl: The number of seconds a UUID is cached for (0 disables the cache)
+        :kw cache_dir: Optional cache directory
+        """
+        self.org_id = org_id
+        self.ttl = ttl
+        self.cache = NTTMCPFileCache('resolver', cache_dir)
+        self.resolved = {}
+
+    def key(self, kind, scope, name):
+        """
+        Return the cache key for an object
+
+        :arg kind: The object kind e.g. vlan
+        :arg scope: The datacenter, Cloud Network Domain UUID or tuple of values the name is unique within
+        :arg name: The name of the object
+        :returns: The cache key
+        """
+        return cache_key(self.org_id, scope, kind, name)
+
+    def get(self, kind, scope, name):
+        """
+        Return a cached UUID
+
+        :arg kind: The object kind
+        :arg scope: The scope of the name
+        :arg name: The name of the object
+        :returns: The UUID or None
+        """
+        if not self.ttl:
+            return None
+        key = self.key(kind, scope, name)
+        uuid = self.cache.get(key)
+        if uuid:
+            self.resolved[uuid] = key
+        return uuid
+
+    def set(self, kind, scope, name, uuid):
+        """
+        Cache the UUID for an object name or remove the entry if the object was not found
+
+        :arg kind: The object kind
+        :arg scope: The scope of the name
+        :arg name: The name of the object
+        :arg uuid: The UUID of the object or None
+        """
+        if not self.ttl:
+            return
+        key = self.key(kind, scope, name)
+        if uuid:
+            self.cache.set(key, uuid, self.ttl)
+            self.resolved[uuid] = key
+        else:
+            self.cache.delete(key)
+
+    def forget(self, text):
+        """
+        Remove the cached entries for any UUID resolved by this instance that appears in text e.g. the URL of an API
+        call that returned RESOURCE_NOT_FOUND
+
+        :arg text: The string to search for resolved UUIDs
+        """
+        for uuid in [x for x in self.resolved if x in text]:
+            self.cache.delete(self.resolved.pop(uuid))
+
+    def forget_uuid(self, uuid):
+        """
+        Remove any cached entries for a UUID e.g. after the object is deleted or renamed
+
+        :arg uuid: The UUID of the object
+        """
+        self.resolved.pop(uuid, None)
+        if self.ttl:
+            self.cache.delete_value(uuid)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# API response wrapper that parses the JSON body at most once
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_NOT_PARSED = object()
+
+
+def json_loads(data):
+    """
+    Parse a JSON document using orjson when it is installed and the standard library json module otherwise
+
+    :arg data: The JSON document as bytes or text
+    :returns: The parsed object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+class NTTMCPResponse():
+    """
+    Wrap a requests Response (or an httpapi connection response) so the JSON body is parsed the first time json() is
+    called and the same object is returned on every later call. The raw bytes are parsed directly which avoids the
+    character set detection requests does when the response text is built
+    """
+    def __init__(self, response):
+        """
+        :arg response: The response object. It must provide status_code, content and text
+        """
+        self.response = response
+        self.status_code = response.status_code
+        self._json = _NOT_PARSED
+
+    @property
+    def content(self):
+        return self.response.content
+
+    @property
+    def text(self):
+        return self.response.text
+
+    def json(self):
+        """
+        Return the parsed JSON body. The returned object is shared between callers of this response
+
+        :returns: The parsed JSON body
+        """
+        if self._json is _NOT_PARSED:
+            self._json = json_loads(self.response.content)
+        return self._json
+
+    def copy(self):
+        """
+        Return a new wrapper of the same response that has not been parsed yet. Used when the same response is
+        returned more than once (e.g. from the request cache) so a caller that modifies the parsed body does not
+        change the body seen by another caller
+
+        :returns: NTTMCPResponse
+        """
+        return NTTMCPResponse(self.response)
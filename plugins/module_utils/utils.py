@@ -30,6 +30,7 @@ try:
 except ImportError:
     HAS_IPADDRESS = False
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_ENDPOINTS
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -79,6 +80,14 @@ def get_credentials(module):
         'api_version': None
     }
 
+    # The httpapi persistent connection holds the credentials when the module is run with connection=httpapi
+    if getattr(module, '_socket_path', None):
+        return_data['socket_path'] = module._socket_path
+        if module.params.get('auth') is not None:
+            return_data['api_version'] = module.params.get('auth').get('api_version')
+        return_data['api_version'] = return_data.get('api_version') or environ.get('NTTMCP_API_VERSION')
+        return return_data
+
     # Check Imports
     try:
         utils_check_imports()
@@ -208,66 +217,14 @@ def is_ip_private(ip_address):
 def compare_json(a, b, parent):
     """
     Compare two JSON objects and return a dict of if they are different and
-    any differences between the two objects
+    any differences between the two objects. Kept for backwards compatibility,
+    new code should use diff.diff_json which this wraps
     :arg a: JSON object 1
     :arg b: JSON object 2
-    :arg parent: The parent object - used when recursing through child objects
+    :arg parent: Unused, kept for backwards compatibility
     :returns: dict containing any differences
     """
-    modified = {
-        'changes': False,
-        'updated': {},
-        'removed': {},
-        'added': {}
-    }
     try:
-        for tag in a:
-            if type(a[tag]) is dict:
-                if tag in b:
-                    r_modified = compare_json(a[tag], b[tag], tag)
-                    if r_modified['updated']:
-                        modified['updated'][str(tag)] = r_modified['updated']
-                        modified['changes'] = r_modified['changes']
-                    if r_modified['removed']:
-                        modified['removed'][str(tag)] = r_modified['removed']
-                        modified['changes'] = r_modified['changes']
-                    if r_modified['added']:
-                        modified['added'][str(tag)] = r_modified['added']
-                        modified['changes'] = r_modified['changes']
-                else:
-                    modified['added'][str(tag)] = str(a[tag])
-            if tag not in b:
-                modified['added'][str(tag)] = str(a[tag])
-                modified['changes'] = True
-            else:
-                if type(a[tag]) is list:
-                    if len(a.get(tag)) > 0:
-                        if type(a.get(tag)[0]) is dict or type(a.get(tag)[0]) is list:
-                            a[tag].sort(key=lambda x: sorted(x.items()))
-                        else:
-                            a[tag].sort()
-                if type(b[tag]) is list:
-                    if len(b.get(tag)) > 0:
-                        if type(b.get(tag)[0]) is dict or type(b.get(tag)[0]) is list:
-                            b[tag].sort(key=lambda x: sorted(x.items()))
-                        else:
-                            b[tag].sort()
-                if a[tag] != b[tag] and not type(a[tag]) is dict:
-                    modified['changes'] = True
-                    if parent != "":
-                        modified['updated'][str(tag)] = {
-                            'old_value': str(b[tag]),
-                            'new_value': str(a[tag])
-                        }
-                    else:
-                        modified['updated'][str(tag)] = {
-                            'old_value': str(b[tag]),
-                            'new_value': str(a[tag])
-                        }
-        for tag in b:
-            if tag not in a:
-                modified['changes'] = True
-                modified['removed'][str(tag)] = str(b[str(tag)])
+        return diff_json(a, b)
     except (KeyError, IndexError, AttributeError, TypeError) as e:
         return e
-    return modified
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Shared functions for waiting on asynchronous Cloud Control operations
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import traceback
+import random
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import (POLL_MIN_INTERVAL, POLL_BACKOFF_FACTOR,
+                                                                        POLL_EXPECTED_DURATION, POLL_HINT_FRACTION)
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_server  # noqa: F401
+
+
+def poll_delays(wait_poll_interval, resource_type=None):
+    """
+    Generate the delays between polls. The delay starts small (scaled by the expected duration of an operation on the
+    resource type) and grows exponentially with jitter up to wait_poll_interval so that short operations are detected
+    quickly without flooding the API during long ones
+
+    :arg wait_poll_interval: The maximum time between polls
+    :kw resource_type: The resource type key in POLL_EXPECTED_DURATION
+    :returns: A generator of delays in seconds
+    """
+    cap = max(wait_poll_interval or POLL_MIN_INTERVAL, POLL_MIN_INTERVAL)
+    expected = POLL_EXPECTED_DURATION.get(resource_type, 0)
+    delay = min(max(expected * POLL_HINT_FRACTION, POLL_MIN_INTERVAL), cap)
+    while True:
+        # Equal jitter: spread concurrent pollers (e.g. Ansible forks) while keeping at least half the delay
+        yield min(delay / 2.0 + random.uniform(0, delay / 2.0), cap)
+        delay = min(delay * POLL_BACKOFF_FACTOR, cap)
+
+
+def poll(check, wait_time, wait_poll_interval, resource_type=None, client=None):
+    """
+    Call check until it reports completion or wait_time seconds (measured on a monotonic clock) have elapsed. The
+    first check is made immediately and subsequent checks back off up to wait_poll_interval
+
+    :arg check: A callable returning a tuple of (done, result)
+    :arg wait_time: The maximum time to wait in seconds
+    :arg wait_poll_interval: The maximum time between polls
+    :kw resource_type: The resource type key in POLL_EXPECTED_DURATION
+    :kw client: The CC API client used by check. Each check bypasses its request cache so it sees the current state
+    :returns: A tuple of (done, result) from the last check
+    """
+    deadline = monotonic() + (wait_time or 0)
+    delays = poll_delays(wait_poll_interval, resource_type)
+    while True:
+        if client is not None:
+            with client.uncached():
+                done, result = check()
+        else:
+            done, result = check()
+        if done:
+            return True, result
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return False, result
+        sleep(min(next(delays), remaining))
+
+
+def get_server_state(client, server_id=None, name=None, datacenter=None, network_domain_id=None):
+    """
+    Return the current server object using a single small API request. The server is looked up by UUID when one is
+    supplied, otherwise by a name filtered server listing. The request cache is bypassed as the state is being polled
+
+    :arg client: The CC API client instance
+    :kw server_id: The UUID of the server
+    :kw name: The name of the server
+    :kw datacenter: The MCP ID (required when looking up by name)
+    :kw network_domain_id: The UUID of the Cloud Network Domain
+    :returns: The server dict or None if the server does not exist
+    """
+    with client.uncached():
+        if server_id:
+            server = client.get_server_by_id(server_id=server_id)
+            if server and server.get('id'):
+                return server
+            return None
+        servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id, name=name)
+    return next((x for x in servers if x.get('name') == name), None)
+
+
+def server_state_reached(server, state='NORMAL', check_for_start=False, check_for_stop=False, wait_for_vmtools=False):
+    """
+    Check if a server has reached the desired state
+
+    :arg server: The server dict
+    :kw state: The desired server state
+    :kw check_for_start: Check if the server is started
+    :kw check_for_stop: Check if the server is stopped
+    :kw wait_for_vmtools: Check if VMWare Tools is running
+    :returns: boolean
+    """
+    if server.get('state') != state:
+        return False
+    if check_for_start and not server.get('started'):
+        return False
+    if check_for_stop and server.get('started'):
+        return False
+    if wait_for_vmtools and (server.get('guest') or {}).get('vmTools', {}).get('runningStatus') != 'RUNNING':
+        return False
+    return True
+
+
+def wait_for_server_state(module, client, server_id=None, name=None, datacenter=None, network_domain_id=None,
+                          state='NORMAL', check_for_start=False, check_for_stop=False, wait_for_vmtools=False,
+                          wait_poll_interval=None, fail_if_missing=True):
+    """
+    Wait for an operation on a server. Polls with backoff up to the module wait_time and wait_poll_interval values with
+    each poll fetching only the server in question (by UUID or a name filtered listing)
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :kw server_id: The UUID of the server (preferred over name)
+    :kw name: The name of the server
+    :kw datacenter: The MCP ID (required when looking up by name)
+    :kw network_domain_id: The UUID of the Cloud Network Domain
+    :kw state: The desired state to wait for
+    :kw check_for_start: Check if the server is started
+    :kw check_for_stop: Check if the server is stopped
+    :kw wait_for_vmtools: Check if VMWare Tools is running
+    :kw wait_poll_interval: The time between polls
+    :kw fail_if_missing: Fail the module at once if the server cannot be found, otherwise keep polling until it exists
+    :returns: The server dict or None on timeout
+    """
+    if wait_poll_interval is None:
+        wait_poll_interval = module.params.get('wait_poll_interval')
+
+    def check():
+        try:
+            server = get_server_state(client, server_id, name, datacenter, network_domain_id)
+        except NTTMCPAPIException as e:
+            module.fail_json(msg='Failed to get the server - {0}'.format(e), exception=traceback.format_exc())
+        if server is None and fail_if_missing:
+            module.fail_json(msg='Failed to find the server - {0}'.format(name or server_id))
+        return bool(server and server_state_reached(server, state, check_for_start, check_for_stop, wait_for_vmtools)), server
+
+    done, server = poll(check, module.params.get('wait_time'), wait_poll_interval, 'server', client=client)
+    return server if done else None
+
+
+def wait_for_server_removal(module, client, server_id, wait_poll_interval=None):
+    """
+    Wait for a server to be deleted. Polls the server by UUID with backoff up to the module wait_time and
+    wait_poll_interval values
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg server_id: The UUID of the server
+    :kw wait_poll_interval: The time between polls
+    :returns: True if the server was removed or False on timeout
+    """
+    if wait_poll_interval is None:
+        wait_poll_interval = module.params.get('wait_poll_interval')
+
+    def check():
+        try:
+            return get_server_state(client, server_id=server_id) is None, None
+        except NTTMCPAPIException as e:
+            module.fail_json(msg='Failed to get the server - {0}'.format(e), exception=traceback.format_exc())
+
+    return poll(check, module.params.get('wait_time'), wait_poll_interval, 'server', client=client)[0]
+
+
+def wait_for_servers_state(module, client, server_ids, datacenter=None, network_domain_id=None, state='NORMAL',
+                           check_for_start=False, wait_for_vmtools=False, wait_poll_interval=None):
+    """
+    Wait for a set of servers to reach a state using a single shared poll loop. Each poll is one (paged) listing of the
+    servers in the Cloud Network Domain, so the number of API calls does not grow with the number of servers. Servers
+    that enter a FAILED_* or REQUIRES_SUPPORT state are no longer waited on. A failed poll is retried once at the next
+    poll interval. The module is not failed if the retry also fails so the caller can still report the servers
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg server_ids: A list of server UUIDs
+    :kw datacenter: The MCP ID
+    :kw network_domain_id: The UUID of the Cloud Network Domain
+    :kw state: The desired state to wait for
+    :kw check_for_start: Check if the servers are started
+    :kw wait_for_vmtools: Check if VMWare Tools is running
+    :kw wait_poll_interval: The time between polls
+    :returns: A tuple of (dict of servers that reached the state, dict of failed servers, list of UUIDs still
+              pending on timeout or error, error message or None). The dicts are keyed on the server UUID
+    """
+    if wait_poll_interval is None:
+        wait_poll_interval = module.params.get('wait_poll_interval')
+    pending = set(server_ids)
+    reached = {}
+    failed = {}
+    errors = []
+
+    def check():
+        try:
+            with client.uncached():
+                servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
+        except NTTMCPAPIException as e:
+            errors.append('Failed to get the servers - {0}'.format(e))
+            return len(errors) > 1, None
+        del errors[:]
+        for server in servers:
+            server_id = server.get('id')
+            if server_id not in pending:
+                continue
+            if server_state_reached(server, state, check_for_start, False, wait_for_vmtools):
+                reached[server_id] = server
+                pending.discard(server_id)
+            elif server.get('state', '').startswith('FAILED') or server.get('state') == 'REQUIRES_SUPPORT':
+                failed[server_id] = server
+                pending.discard(server_id)
+        return not pending, None
+
+    poll(check, module.params.get('wait_time'), wait_poll_interval, 'server', client=client)
+    return reached, failed, sorted(pending), errors[-1] if len(errors) > 1 else None
@@ -137,6 +137,13 @@ options:
             - present
             - absent
 
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
     - Must have sshpass installed for playbooks to use this module
@@ -398,6 +405,10 @@ from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, generate_password
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import (provider_firewall, provider_image, provider_ipam,  # noqa: F401
+                                                                 provider_network, provider_server)
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_server_state, wait_for_server_removal
 
 ACL_RULE_NAME = 'Ipv4.Internet.to.Ansible.SSH'
 
@@ -439,11 +450,13 @@ def create_server(module, client, network_domain_id, vlan_id):
         module.fail_json(msg='Failed to find the  Image {0} - {1}'.format(image_name, e))
 
     try:
-        client.create_server(ngoc, params)
+        result = client.create_server(ngoc, params)
+        new_server_id = result['info'][0]['value']
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
         module.fail_json(msg='Could not create the server - {0}'.format(exc), exception=traceback.format_exc())
 
-    wait_result = wait_for_server(module, client, params.get('name'), datacenter, network_domain_id, 'NORMAL', True, False, None)
+    wait_result = wait_for_server(module, client, params.get('name'), datacenter, network_domain_id, 'NORMAL', True, False, None,
+                                  server_id=new_server_id)
     if wait_result is None:
         module.fail_json(msg='Could not verify the server creation. Password: {0}'.format(params.get('administratorPassword')))
 
@@ -582,12 +595,9 @@ def delete_server(module, client, server):
     :arg network_domain: The server dict
     :returns: A message
     """
-    server_exists = True
     name = server.get('name')
     datacenter = server.get('datacenterId')
     network_domain_id = server.get('networkInfo').get('networkDomainId')
-    time = 0
-    wait_time = module.params.get('wait_time')
     wait_poll_interval = module.params.get('wait_poll_interval')
     wait = module.params.get('wait')
 
@@ -604,13 +614,7 @@ def delete_server(module, client, server):
     except NTTMCPAPIException as e:
         module.fail_json(msg='Could not delete the server - {0}'.format(e), exception=traceback.format_exc())
     if wait:
-        while server_exists and time < wait_time:
-            servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
-            server_exists = [x for x in servers if x['id'] == server['id']]
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-
-        if server_exists and time >= wait_time:
+        if not wait_for_server_removal(module, client, server.get('id'), wait_poll_interval):
             module.fail_json(msg='Timeout waiting for the server to be deleted')
 
     return True
@@ -682,7 +686,7 @@ def delete_public_ipv4(module, client, public_ipv4_block_id):
 
 
 def wait_for_server(module, client, name, datacenter, network_domain_id, state, check_for_start=False,
-                    check_for_stop=False, wait_poll_interval=None):
+                    check_for_stop=False, wait_poll_interval=None, server_id=None):
     """
     Wait for the server deployment to complete.
 
@@ -694,32 +698,12 @@ def wait_for_server(module, client, name, datacenter, network_domain_id, state,
     :arg check_for_start: Should we check if the server is started
     :arg check_for_stop: Should we check if the server is stooped
     :arg wait_poll_internal: Optional custom wait polling interval value in seconds
+    :kw server_id: The UUID of the server, polled by UUID instead of name when supplied
     """
-    set_state = False
-    actual_state = ''
-    start_state = ''
-    time = 0
-    wait_time = module.params.get('wait_time')
-    if wait_poll_interval is None:
-        wait_poll_interval = module.params.get('wait_poll_interval')
-    server = []
-    while not set_state and time < wait_time:
-        sleep(wait_poll_interval)
-        try:
-            server = client.get_server_by_name(datacenter=datacenter, network_domain_id=network_domain_id, name=name)
-        except NTTMCPAPIException as exc:
-            module.fail_json(msg='Failed to get a list of servers - {0}'.format(exc), exception=traceback.format_exc())
-        try:
-            actual_state = server.get('state')
-            start_state = server.get('started')
-        except (KeyError, IndexError, AttributeError):
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-        if actual_state != state or (check_for_start and not start_state) or (check_for_stop and start_state):
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
+    server = wait_for_server_state(module, client, server_id=server_id, name=name, datacenter=datacenter,
+                                   network_domain_id=network_domain_id, state=state, check_for_start=check_for_start,
+                                   check_for_stop=check_for_stop, wait_poll_interval=wait_poll_interval)
+    if server is None:
         module.fail_json(msg='Timeout waiting for the server to be created')
 
     return server
@@ -734,6 +718,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             vlan=dict(required=True, type='str'),
@@ -771,19 +756,17 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params['region'])
+    client = NTTMCPClient(credentials, module.params['region'], hooks=debug_timing(module))
 
     # Get the CND object based on the supplied name
     try:
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
         module.fail_json(msg='Failed to find the Cloud Network Domain - {0}'.format(exc))
 
     # Get the VLAN object based on the supplied name
     try:
-        vlan = client.get_vlan_by_name(datacenter=datacenter, network_domain_id=network_domain_id, name=vlan_name)
-        vlan_id = vlan.get('id')
+        vlan_id = client.resolve_vlan_id(datacenter=datacenter, network_domain_id=network_domain_id, name=vlan_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
         module.fail_json(msg='Failed to get a list of VLANs - {0}'.format(exc), exception=traceback.format_exc())
 
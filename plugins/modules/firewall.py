@@ -189,6 +189,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -405,8 +412,11 @@ except ImportError:
     HAS_IPADDRESS = False
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.object_helpers import compare_fw_rule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_firewall, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -429,13 +439,13 @@ def create_fw_rule(module, client, network_domain_id, src_cidr, dst_cidr):
 
     try:
         if args['src_ip_list']:
-            args['src_ip_list'] = client.get_ip_list_by_name(network_domain_id, args.get('src_ip_list'), args.get('version')).get('id')
+            args['src_ip_list'] = client.resolve_ip_list_id(network_domain_id, args.get('src_ip_list'), args.get('version'))
         if args['dst_ip_list']:
-            args['dst_ip_list'] = client.get_ip_list_by_name(network_domain_id, args.get('dst_ip_list'), args.get('version')).get('id')
+            args['dst_ip_list'] = client.resolve_ip_list_id(network_domain_id, args.get('dst_ip_list'), args.get('version'))
         if args['src_port_list']:
-            args['src_port_list'] = client.get_port_list_by_name(network_domain_id, args.get('src_port_list')).get('id')
+            args['src_port_list'] = client.resolve_port_list_id(network_domain_id, args.get('src_port_list'))
         if args['dst_port_list']:
-            args['dst_port_list'] = client.get_port_list_by_name(network_domain_id, args.get('dst_port_list')).get('id')
+            args['dst_port_list'] = client.resolve_port_list_id(network_domain_id, args.get('dst_port_list'))
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
         module.fail_json(msg='create_fw_rule: Could not determine IP address and/or child port lists - {0}'.format(e),
                          exception=traceback.format_exc())
@@ -486,13 +496,13 @@ def update_fw_rule(module, client, network_domain_id, existing_fw_rule, src_cidr
     if existing_fw_rule.get('ruleType') != 'DEFAULT_RULE':
         try:
             if args['src_ip_list']:
-                args['src_ip_list'] = client.get_ip_list_by_name(network_domain_id, args.get('src_ip_list'), args.get('version')).get('id')
+                args['src_ip_list'] = client.resolve_ip_list_id(network_domain_id, args.get('src_ip_list'), args.get('version'))
             if args['dst_ip_list']:
-                args['dst_ip_list'] = client.get_ip_list_by_name(network_domain_id, args.get('dst_ip_list'), args.get('version')).get('id')
+                args['dst_ip_list'] = client.resolve_ip_list_id(network_domain_id, args.get('dst_ip_list'), args.get('version'))
             if args['src_port_list']:
-                args['src_port_list'] = client.get_port_list_by_name(network_domain_id, args.get('src_port_list')).get('id')
+                args['src_port_list'] = client.resolve_port_list_id(network_domain_id, args.get('src_port_list'))
             if args['dst_port_list']:
-                args['dst_port_list'] = client.get_port_list_by_name(network_domain_id, args.get('dst_port_list')).get('id')
+                args['dst_port_list'] = client.resolve_port_list_id(network_domain_id, args.get('dst_port_list'))
         except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
             module.fail_json(msg='update_fw_rule: Could not determine IP address and/or child port lists - {0}'.format(e),
                              exception=traceback.format_exc())
@@ -514,7 +524,7 @@ def update_fw_rule(module, client, network_domain_id, existing_fw_rule, src_cidr
                                          args.get('dst_port_list'), args.get('enabled'),
                                          args.get('position'), args.get('position_to'))
         # Check for any state changes in the fw rule and update if required
-        compare_result = compare_fw_rule(fw_rule, deepcopy(existing_fw_rule))
+        compare_result = compare_fw_rule(fw_rule, existing_fw_rule)
     else:
         fw_rule = dict()
         fw_rule['id'] = fw_rule_id
@@ -522,7 +532,7 @@ def update_fw_rule(module, client, network_domain_id, existing_fw_rule, src_cidr
         tmp_fw_rule = deepcopy(existing_fw_rule)
         tmp_fw_rule['enabled'] = args.get('enabled')
         # Check for any state changes in the fw rule and update if required
-        compare_result = compare_fw_rule(tmp_fw_rule, deepcopy(existing_fw_rule))
+        compare_result = compare_fw_rule(tmp_fw_rule, existing_fw_rule)
     # Implement check_mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -564,60 +574,6 @@ def delete_fw_rule(module, client, network_domain_id, name):
     module.exit_json(changed=True, msg='Firewall rule successfully removed')
 
 
-def compare_fw_rule(new_fw_rule, existing_fw_rule):
-    """
-    Compare two firewall rules
-
-    :arg new_fw_rule: The dict containing the specification for the new rule based on the supplied parameters
-    :arg existing_fw_rule: The dict containing the speification for the existing firewall rule
-    :returns: Any differences between the two firewall rules
-    """
-    # Handle schema differences between the create/update schema and the returned get/list schema
-    if existing_fw_rule.get('ruleType') != 'DEFAULT_RULE':
-        existing_dst = existing_fw_rule['destination']
-        existing_src = existing_fw_rule['source']
-        existing_fw_rule['destination'] = {}
-        existing_fw_rule['source'] = {}
-
-        if 'ipAddressList' in existing_dst:
-            existing_fw_rule['destination']['ipAddressListId'] = existing_dst['ipAddressList']['id']
-        elif 'ip' in existing_dst:
-            existing_fw_rule['destination']['ip'] = {}
-            existing_fw_rule['destination']['ip']['address'] = existing_dst['ip']['address']
-            if 'prefixSize' in existing_dst['ip']:
-                existing_fw_rule['destination']['ip']['prefixSize'] = str(existing_dst['ip']['prefixSize'])
-        if 'portList' in existing_dst:
-            existing_fw_rule['destination']['portListId'] = existing_dst['portList']['id']
-        elif 'port' in existing_dst:
-            existing_fw_rule['destination']['port'] = {}
-            existing_fw_rule['destination']['port']['begin'] = str(existing_dst['port']['begin'])
-            if 'end' in existing_dst['port']:
-                existing_fw_rule['destination']['port']['end'] = str(existing_dst['port']['end'])
-        if 'ipAddressList' in existing_src:
-            existing_fw_rule['source']['ipAddressListId'] = existing_src['ipAddressList']['id']
-        elif 'ip' in existing_src:
-            existing_fw_rule['source']['ip'] = {}
-            existing_fw_rule['source']['ip']['address'] = existing_src['ip']['address']
-            if 'prefixSize' in existing_src['ip']:
-                existing_fw_rule['source']['ip']['prefixSize'] = str(existing_src['ip']['prefixSize'])
-        if 'portList' in existing_src:
-            existing_fw_rule['source']['portListId'] = existing_src['portList']['id']
-        elif 'port' in existing_src:
-            existing_fw_rule['source']['port'] = {}
-            existing_fw_rule['source']['port']['begin'] = str(existing_src['port']['begin'])
-            if 'end' in existing_src['port']:
-                existing_fw_rule['source']['port']['end'] = str(existing_src['port']['end'])
-
-        existing_fw_rule.pop('ruleType', None)
-        existing_fw_rule.pop('datacenterId', None)
-        existing_fw_rule.pop('state', None)
-        existing_fw_rule.pop('ipVersion', None)
-        existing_fw_rule.pop('name', None)
-        existing_fw_rule.pop('networkDomainId', None)
-
-    return compare_json(new_fw_rule, existing_fw_rule, None)
-
-
 def main():
     """
     Main function
@@ -628,6 +584,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=False, type='str'),
             network_domain=dict(required=True, type='str'),
@@ -675,7 +632,7 @@ def main():
         module.fail_json(msg='Error: Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -693,8 +650,7 @@ def main():
 
     # Get the CND object based on the supplied name
     try:
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
         module.fail_json(msg='Failed to find the Cloud Network Domains - {0}'.format(e), exception=traceback.format_exc())
 
@@ -0,0 +1,669 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, NTT Ltd.
+#
+# Author: Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'NTT Ltd.'
+}
+
+DOCUMENTATION = '''
+---
+module: firewall_batch
+short_description: Create, Modify and Delete many Firewall rules in a single task
+description:
+    - Create, Modify and Delete a list of Firewall rules in a Cloud Network Domain
+    - The existing firewall rules, IP address lists and port lists are fetched once and compared to the supplied rules
+    - Only the rules that need to be created, updated or removed result in API calls
+version_added: "2.10.0"
+author:
+    - Ken Sinfield (@kensinfield)
+options:
+    auth:
+        description:
+            - Optional dictionary containing the authentication and API information for Cloud Control
+        required: false
+        type: dict
+        suboptions:
+            username:
+                  description:
+                      - The Cloud Control API username
+                  required: false
+                  type: str
+            password:
+                  description:
+                      - The Cloud Control API user password
+                  required: false
+                  type: str
+            api:
+                  description:
+                      - The Cloud Control API endpoint e.g. api-na.mcp-services.net
+                  required: false
+                  type: str
+            api_version:
+                  description:
+                      - The Cloud Control API version e.g. 2.11
+                  required: false
+                  type: str
+    region:
+        description:
+            - The geographical region
+        required: false
+        type: str
+        default: na
+    datacenter:
+        description:
+            - The datacenter name
+        required: true
+        type: str
+    network_domain:
+        description:
+            - The name of a Cloud Network Domain
+        required: true
+        type: str
+    rules:
+        description:
+            - The list of firewall rules
+            - Each rule supports the same options as the firewall module
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                    - The name of the firewall rule
+                required: true
+                type: str
+            action:
+                description:
+                    - The firewall rule action
+                required: false
+                type: str
+                default: ACCEPT_DECISIVELY
+                choices:
+                    - ACCEPT_DECISIVELY
+                    - DROP
+            version:
+                description:
+                    - The IP version
+                required: false
+                type: str
+                default: IPV4
+                choices:
+                    - IPV4
+                    - IPV6
+            protocol:
+                description:
+                    - The protocol
+                required: false
+                type: str
+                default: TCP
+                choices:
+                    - TCP
+                    - UDP
+                    - IP
+                    - ICMP
+            src_cidr:
+                description:
+                    - The source IP address in CIDR notation
+                    - ANY is represented by 0.0.0.0/0
+                required: false
+                type: str
+            src_ip_list:
+                description:
+                    - The name of an existing IP address list
+                required: false
+                type: str
+            dst_cidr:
+                description:
+                    - The destination IP address in CIDR notation
+                    - ANY is represented by 0.0.0.0/0
+                required: false
+                type: str
+            dst_ip_list:
+                description:
+                    - The name of an existing IP address list
+                required: false
+                type: str
+            src_port_start:
+                description:
+                    - The starting source port
+                    - omit all src port details for ANY
+                required: false
+                type: str
+            src_port_end:
+                description:
+                    - The end of the port range
+                required: false
+                type: str
+            src_port_list:
+                description:
+                    - The name of an existing port list
+                required: false
+                type: str
+            dst_port_start:
+                description:
+                    - The starting destination port
+                    - omit all dst port details for ANY
+                required: false
+                type: str
+            dst_port_end:
+                description:
+                    - The end of the port range
+                required: false
+                type: str
+            dst_port_list:
+                description:
+                    - The name of an existing port list
+                required: false
+                type: str
+            enabled:
+                description:
+                    - Whether to enable the firewall rule
+                required: false
+                type: bool
+                default: true
+            position:
+                description:
+                    - Position of the firewall rule
+                    - If BEFORE or AFTER are used a position_to value is required
+                required: false
+                type: str
+                default: LAST
+                choices:
+                    - FIRST
+                    - LAST
+                    - BEFORE
+                    - AFTER
+            position_to:
+                description:
+                    - The name of an existing firewall rule, or a rule earlier in this list, to position the new rule
+                    - relative to
+                required: false
+                type: str
+            state:
+                description:
+                    - The action to be performed
+                required: false
+                type: str
+                default: present
+                choices:
+                    - present
+                    - absent
+    concurrency:
+        description:
+            - The maximum number of firewall rules created at the same time
+            - The resulting rule order is the same as creating every rule one at a time in list order
+            - Rules whose placement does not depend on each other are created at the same time. A group of new rules
+              with the same placement (FIRST, LAST or the same position relative to the same rule) is created in
+              about log2(n) + 1 rounds by placing the rules relative to each other
+            - A group that another new rule is positioned relative to is created one rule at a time
+        required: false
+        type: int
+        default: 4
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+notes:
+    - Requires NTT Ltd. MCP account/credentials
+requirements:
+    - requests
+    - configparser
+    - pyOpenSSL
+    - netaddr
+'''
+
+EXAMPLES = '''
+- hosts: 127.0.0.1
+  connection: local
+  collections:
+    - nttmcp.mcp
+  tasks:
+
+  - name: Converge a set of firewall rules
+    firewall_batch:
+      region: na
+      datacenter: NA12
+      network_domain: myCND
+      rules:
+        - name: Ipv4.ACL_01
+          protocol: UDP
+          src_cidr: "172.16.0.0/24"
+          src_port_start: ANY
+          dst_cidr: "10.1.77.0/24"
+          dst_port_start: "80"
+          dst_port_end: "81"
+        - name: Ipv4.ACL_02
+          protocol: TCP
+          src_ip_list: myIpAddressList2
+          dst_ip_list: myIpAddressList
+          dst_port_list: myPortList
+          position: AFTER
+          position_to: Ipv4.ACL_01
+        - name: Ipv4.ACL_OLD
+          state: absent
+'''
+
+RETURN = '''
+data:
+    description: The names of the firewall rules grouped by the action taken
+    returned: always
+    type: complex
+    contains:
+        created:
+            description: The firewall rules that were created
+            type: list
+            sample: ["Ipv4.ACL_01"]
+        updated:
+            description: The firewall rules that were updated
+            type: list
+            sample: ["Ipv4.ACL_02"]
+        removed:
+            description: The firewall rules that were removed
+            type: list
+            sample: ["Ipv4.ACL_OLD"]
+        unchanged:
+            description: The firewall rules that did not require any change
+            type: list
+            sample: ["Ipv4.ACL_03"]
+'''
+
+import traceback
+try:
+    from ipaddress import (ip_network as ip_net, AddressValueError)
+    HAS_IPADDRESS = True
+except ImportError:
+    HAS_IPADDRESS = False
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+from copy import deepcopy
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.object_helpers import compare_fw_rule
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_firewall, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+
+# Python3 workaround for unicode function so the same code can be used with ipaddress later
+try:
+    unicode('')
+except NameError:
+    unicode = str
+
+RULE_SPEC = dict(
+    name=dict(required=True, type='str'),
+    action=dict(default='ACCEPT_DECISIVELY', choices=['ACCEPT_DECISIVELY', 'DROP']),
+    version=dict(required=False, default='IPV4', choices=['IPV4', 'IPV6']),
+    protocol=dict(default='TCP', choices=['TCP', 'UDP', 'IP', 'ICMP']),
+    src_cidr=dict(required=False, type='str'),
+    src_ip_list=dict(required=False, type='str'),
+    dst_cidr=dict(required=False, type='str'),
+    dst_ip_list=dict(required=False, type='str'),
+    src_port_start=dict(required=False, default=None, type='str'),
+    src_port_end=dict(required=False, default=None, type='str'),
+    src_port_list=dict(required=False, default=None, type='str'),
+    dst_port_start=dict(required=False, default=None, type='str'),
+    dst_port_end=dict(required=False, default=None, type='str'),
+    dst_port_list=dict(required=False, default=None, type='str'),
+    enabled=dict(default=True, type='bool'),
+    position=dict(default='LAST', choices=['FIRST', 'LAST', 'BEFORE', 'AFTER']),
+    position_to=dict(required=False, default=None, type='str'),
+    state=dict(default='present', choices=['present', 'absent'])
+)
+
+
+def get_cidr(module, rule, key):
+    """
+    Convert a CIDR string from a rule to an ip_network object
+
+    :arg module: The Ansible module instance
+    :arg rule: The firewall rule arguments
+    :arg key: The argument holding the CIDR (src_cidr or dst_cidr)
+    :returns: An ip_network object or None
+    """
+    if not rule.get(key):
+        return None
+    try:
+        return ip_net(unicode(rule.get(key)))
+    except (AddressValueError, ValueError) as e:
+        module.fail_json(msg='Invalid CIDR format {0} in firewall rule {1}: {2}'.format(rule.get(key), rule.get('name'), e))
+
+
+def resolve_lists(module, rule, ip_lists, port_lists):
+    """
+    Replace the IP address list and port list names in a rule with their UUIDs
+
+    :arg module: The Ansible module instance
+    :arg rule: The firewall rule arguments
+    :arg ip_lists: dict of IP address list UUIDs keyed on (name, version)
+    :arg port_lists: dict of port list UUIDs keyed on name
+    :returns: The updated firewall rule arguments
+    """
+    for key in ['src_ip_list', 'dst_ip_list']:
+        if rule.get(key):
+            try:
+                rule[key] = ip_lists[(rule.get(key), rule.get('version'))]
+            except KeyError:
+                module.fail_json(msg='Could not find the IP address list {0} for firewall rule {1}'.format(rule.get(key), rule.get('name')))
+    for key in ['src_port_list', 'dst_port_list']:
+        if rule.get(key):
+            try:
+                rule[key] = port_lists[rule.get(key)]
+            except KeyError:
+                module.fail_json(msg='Could not find the port list {0} for firewall rule {1}'.format(rule.get(key), rule.get('name')))
+    return rule
+
+
+def rule_to_dict(client, create, fw_rule_id, network_domain_id, rule, src_cidr, dst_cidr):
+    """
+    Convert the firewall rule arguments to the API schema
+
+    :arg client: The CC API client instance
+    :arg create: Boolean as to whether the dict is for a create or update
+    :arg fw_rule_id: The UUID of the existing firewall rule
+    :arg network_domain_id: The UUID of the network domain
+    :arg rule: The firewall rule arguments with resolved list UUIDs
+    :arg src_cidr: The source ip_network object
+    :arg dst_cidr: The destination ip_network object
+    :returns: The firewall rule dict
+    """
+    return client.fw_args_to_dict(create, fw_rule_id, network_domain_id, rule.get('name'),
+                                  rule.get('action'), rule.get('version'),
+                                  rule.get('protocol'),
+                                  str(src_cidr.network_address) if hasattr(src_cidr, 'network_address') else None,
+                                  str(src_cidr.prefixlen) if hasattr(src_cidr, 'prefixlen') else None,
+                                  rule.get('src_ip_list'),
+                                  str(dst_cidr.network_address) if hasattr(dst_cidr, 'network_address') else None,
+                                  str(dst_cidr.prefixlen) if hasattr(dst_cidr, 'prefixlen') else None,
+                                  rule.get('dst_ip_list'),
+                                  rule.get('src_port_start'),
+                                  rule.get('src_port_end'),
+                                  rule.get('src_port_list'),
+                                  rule.get('dst_port_start'),
+                                  rule.get('dst_port_end'),
+                                  rule.get('dst_port_list'), rule.get('enabled'),
+                                  rule.get('position'), rule.get('position_to'))
+
+
+def plan_fw_rules(module, client, network_domain_id, rules, existing_rules, ip_lists, port_lists):
+    """
+    Compare the supplied firewall rules against the existing rules in memory
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg network_domain_id: The UUID of the network domain
+    :arg rules: The list of firewall rule arguments
+    :arg existing_rules: dict of the existing firewall rules keyed on name
+    :arg ip_lists: dict of IP address list UUIDs keyed on (name, version)
+    :arg port_lists: dict of port list UUIDs keyed on name
+    :returns: A tuple of lists of (create, update, remove, unchanged) firewall rules. Updates are (name, dict) tuples
+    """
+    create = []
+    update = []
+    remove = []
+    unchanged = []
+    for rule in rules:
+        name = rule.get('name')
+        existing_fw_rule = existing_rules.get(name)
+        if rule.get('state') == 'absent':
+            if existing_fw_rule:
+                remove.append(existing_fw_rule)
+            else:
+                unchanged.append(name)
+            continue
+
+        rule = deepcopy(rule)
+        if existing_fw_rule and existing_fw_rule.get('ruleType') == 'DEFAULT_RULE':
+            fw_rule = {'id': existing_fw_rule.get('id'), 'enabled': rule.get('enabled')}
+            tmp_fw_rule = deepcopy(existing_fw_rule)
+            tmp_fw_rule['enabled'] = rule.get('enabled')
+            compare_result = compare_fw_rule(tmp_fw_rule, existing_fw_rule)
+        else:
+            src_cidr = get_cidr(module, rule, 'src_cidr')
+            dst_cidr = get_cidr(module, rule, 'dst_cidr')
+            rule = resolve_lists(module, rule, ip_lists, port_lists)
+            try:
+                fw_rule = rule_to_dict(client, existing_fw_rule is None, (existing_fw_rule or {}).get('id'),
+                                       network_domain_id, rule, src_cidr, dst_cidr)
+            except NTTMCPAPIException as e:
+                module.fail_json(msg='Invalid firewall rule {0} - {1}'.format(name, e))
+            if existing_fw_rule is None:
+                create.append(fw_rule)
+                continue
+            compare_result = compare_fw_rule(fw_rule, existing_fw_rule)
+        if compare_result.get('changes'):
+            update.append((name, fw_rule))
+        else:
+            unchanged.append(name)
+    return create, update, remove, unchanged
+
+
+def balance_placements(fw_rules):
+    """
+    Rewrite the placement of new firewall rules that share a placement (FIRST, LAST or the same position relative to
+    the same rule) so the group can be created in a logarithmic number of waves instead of one rule at a time.
+    Creating a group one rule at a time in list order gives a contiguous block of rules (in list order for LAST and
+    BEFORE and in reverse list order for FIRST and AFTER). The middle rule of that block keeps the original placement
+    and the middle rules of each half are placed BEFORE or AFTER it, recursively, which gives the same block. Groups
+    with a rule that another new rule is positioned relative to keep their placement
+
+    :arg fw_rules: The list of firewall rule dicts to create
+    :returns: The list of firewall rule dicts with each balanced group in place of its first rule, parents first
+    """
+    referenced = set(x.get('placement', {}).get('relativeToRule') for x in fw_rules)
+    groups = {}
+    for fw_rule in fw_rules:
+        placement = fw_rule.get('placement', {})
+        groups.setdefault((placement.get('position'), placement.get('relativeToRule')), []).append(fw_rule)
+
+    balanced = {}
+    for (position, relative_to), group in groups.items():
+        if len(group) < 3 or [x for x in group if x.get('name') in referenced]:
+            continue
+        block = group if position in ('LAST', 'BEFORE') else group[::-1]
+        ordered = []
+
+        def place(start, end, placement):
+            if start >= end:
+                return
+            middle = (start + end) // 2
+            name = block[middle].get('name')
+            fw_rule = dict(block[middle])
+            fw_rule['placement'] = placement
+            ordered.append(fw_rule)
+            place(start, middle, {'position': 'BEFORE', 'relativeToRule': name})
+            place(middle + 1, end, {'position': 'AFTER', 'relativeToRule': name})
+
+        place(0, len(block), group[0].get('placement'))
+        balanced[group[0].get('name')] = ordered
+        for fw_rule in group[1:]:
+            balanced[fw_rule.get('name')] = []
+    result = []
+    for fw_rule in fw_rules:
+        result.extend(balanced.get(fw_rule.get('name'), [fw_rule]))
+    return result
+
+
+def create_waves(fw_rules):
+    """
+    Group new firewall rules into waves so that creating the waves in order (and the rules within a wave concurrently)
+    gives the same rule order as creating the rules one at a time in list order. A rule is placed in a later wave than:
+    the new rule it is positioned relative to and the previous rule with the same placement (FIRST, LAST or the same
+    position relative to the same rule) as two such rules are placed in the same slot and their order would otherwise
+    depend on which request the API handled first. Groups of rules with the same placement are first balanced with
+    balance_placements
+
+    :arg fw_rules: The list of firewall rule dicts to create
+    :returns: A list of lists of firewall rule dicts
+    """
+    wave_of = {}
+    anchor_wave = {}
+    waves = []
+    for fw_rule in balance_placements(fw_rules):
+        placement = fw_rule.get('placement', {})
+        relative_to = placement.get('relativeToRule')
+        anchor = (placement.get('position'), relative_to)
+        wave = 0
+        if relative_to in wave_of:
+            wave = wave_of[relative_to] + 1
+        if anchor in anchor_wave:
+            wave = max(wave, anchor_wave[anchor] + 1)
+        wave_of[fw_rule.get('name')] = wave
+        anchor_wave[anchor] = wave
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(fw_rule)
+    return waves
+
+
+def create_fw_rules(module, client, fw_rules, concurrency):
+    """
+    Create firewall rules with bounded concurrency
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg fw_rules: The list of firewall rule dicts to create
+    :arg concurrency: The maximum number of concurrent create requests
+    :returns: N/A
+    """
+    def create(fw_rule):
+        try:
+            client.create_fw_rule(fw_rule)
+            return None
+        except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
+            return 'Could not create the firewall rule {0} - {1}'.format(fw_rule.get('name'), e)
+
+    for wave in create_waves(fw_rules):
+        workers = min(concurrency, len(wave))
+        if not HAS_FUTURES or workers <= 1:
+            errors = [create(fw_rule) for fw_rule in wave]
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                errors = list(executor.map(create, wave))
+            finally:
+                executor.shutdown(wait=True)
+        errors = [error for error in errors if error]
+        if errors:
+            module.fail_json(msg='; '.join(errors))
+
+
+def main():
+    """
+    Main function
+
+    :returns: Firewall rule changes
+    """
+    module = AnsibleModule(
+        argument_spec=dict(
+            auth=dict(type='dict'),
+            region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            datacenter=dict(required=True, type='str'),
+            network_domain=dict(required=True, type='str'),
+            rules=dict(required=True, type='list', elements='dict', options=RULE_SPEC),
+            concurrency=dict(required=False, default=4, type='int')
+        ),
+        supports_check_mode=True
+    )
+    try:
+        credentials = get_credentials(module)
+    except ImportError as e:
+        module.fail_json(msg='{0}'.format(e))
+    network_domain_name = module.params.get('network_domain')
+    datacenter = module.params.get('datacenter')
+    rules = module.params.get('rules')
+    concurrency = max(module.params.get('concurrency'), 1)
+
+    # Check Imports
+    if not HAS_IPADDRESS:
+        module.fail_json(msg='Missing Python module: ipaddress')
+
+    # Check the region supplied is valid
+    regions = get_regions()
+    if module.params.get('region') not in regions:
+        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
+
+    if credentials is False:
+        module.fail_json(msg='Error: Could not load the user credentials')
+
+    names = [rule.get('name') for rule in rules]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        module.fail_json(msg='Duplicate firewall rule names: {0}'.format(', '.join(duplicates)))
+
+    try:
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
+    except NTTMCPAPIException as e:
+        module.fail_json(msg=e.msg)
+
+    # Get the CND object based on the supplied name
+    try:
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
+        module.fail_json(msg='Failed to find the Cloud Network Domains - {0}'.format(e), exception=traceback.format_exc())
+
+    # Fetch the existing rules and any referenced IP address and port lists once
+    try:
+        existing_rules = dict((x.get('name'), x) for x in client.list_fw_rules(network_domain_id=network_domain_id))
+        ip_lists = dict()
+        port_lists = dict()
+        if [x for x in rules if x.get('src_ip_list') or x.get('dst_ip_list')]:
+            ip_lists = dict(((x.get('name'), x.get('ipVersion')), x.get('id'))
+                            for x in client.list_ip_list(network_domain_id=network_domain_id))
+        if [x for x in rules if x.get('src_port_list') or x.get('dst_port_list')]:
+            port_lists = dict((x.get('name'), x.get('id')) for x in client.list_port_list(network_domain_id=network_domain_id))
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
+        module.fail_json(msg='Could not retrieve the existing firewall rules, IP address lists or port lists - {0}'.format(e),
+                         exception=traceback.format_exc())
+
+    create, update, remove, unchanged = plan_fw_rules(module, client, network_domain_id, rules, existing_rules,
+                                                      ip_lists, port_lists)
+    result = {
+        'created': [x.get('name') for x in create],
+        'updated': [name for name, fw_rule in update],
+        'removed': [x.get('name') for x in remove],
+        'unchanged': unchanged
+    }
+    changed = bool(create or update or remove)
+
+    # Implement check_mode
+    if module.check_mode:
+        module.exit_json(changed=changed, msg='The firewall rules will be changed' if changed else 'No changes required',
+                         data=result)
+
+    for fw_rule in remove:
+        try:
+            client.remove_fw_rule(fw_rule.get('id'))
+        except NTTMCPAPIException as e:
+            module.fail_json(msg='Could not delete the firewall rule {0} - {1}'.format(fw_rule.get('name'), e),
+                             exception=traceback.format_exc())
+    for name, fw_rule in update:
+        try:
+            client.update_fw_rule(fw_rule)
+        except (KeyError, NTTMCPAPIException) as e:
+            module.fail_json(msg='Could not update the firewall rule {0} - {1}'.format(name, e),
+                             exception=traceback.format_exc())
+    create_fw_rules(module, client, create, concurrency)
+
+    module.exit_json(changed=changed, data=result)
+
+
+if __name__ == '__main__':
+    main()
@@ -54,15 +54,21 @@ options:
                   type: str
     region:
         description:
-            - The geographical region
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
         required: false
-        type: str
-        default: na
+        type: list
+        elements: str
+        default: [na]
     datacenter:
         description:
-            - The datacenter name
+            - The datacenter name or a list of datacenter names
+            - The datacenters are queried concurrently and the results are merged into one list. Each object is tagged
+              with the region it was found in
         required: true
-        type: str
+        type: list
+        elements: str
     name:
         description:
             - The name of the Cloud Network Domain
@@ -79,6 +85,21 @@ options:
         required: false
         default: false
         type: bool
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -133,6 +154,10 @@ data:
             returned: success
             type: complex
             contains:
+                region:
+                    description: The region the object was found in
+                    type: str
+                    sample: na
                 ipVersion:
                     description: IP Version
                     type: str
@@ -271,8 +296,11 @@ data:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
-from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_firewall, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
 
 
 def list_fw_rule(module, client, network_domain_id):
@@ -285,20 +313,14 @@ def list_fw_rule(module, client, network_domain_id):
 
     :returns: List of firewall rules
     """
-    return_data = return_object('acl')
     try:
         if module.params.get('stats'):
-            return_data['acl'] = client.list_fw_rule_stats(network_domain_id, None, 250)
-        else:
-            return_data['acl'] = client.list_fw_rules(network_domain_id, None, 250)
+            return client.list_fw_rule_stats(network_domain_id, None, 250)
+        return client.list_fw_rules(network_domain_id, None, 250)
     except NTTMCPAPIException as e:
-        module.fail_json(msg='Could not retrieve a list of firewall rules - {0}'.format(e))
+        raise NTTMCPAPIException('Could not retrieve a list of firewall rules - {0}'.format(e))
     except KeyError:
-        module.fail_json(msg='Network Domain is invalid')
-
-    return_data['count'] = len(return_data.get('acl'))
-
-    module.exit_json(changed=False, data=return_data)
+        raise NTTMCPAPIException('Network Domain is invalid')
 
 
 def get_fw_rule(module, client, network_domain_id, name):
@@ -310,24 +332,38 @@ def get_fw_rule(module, client, network_domain_id, name):
     :arg network_domain_id: The UUID of the network domain
     :arg name: The name of the firewall rule to search for
 
-    :returns: a firewall rule
+    :returns: A list containing the firewall rule (empty if it was not found)
     """
-    return_data = return_object('acl')
     try:
         if module.params.get('stats'):
-            return_data['acl'] = client.list_fw_rule_stats(network_domain_id, name)
-        else:
-            return_data['acl'].append(client.get_fw_rule_by_name(network_domain_id, name))
-        if return_data['acl'] is None:
-            module.exit_json(changed=False, msg='Could not find the ACL {0}'.format(name))
-    except NTTMCPAPIException as e:
-        module.exit_json(msg='Could not get the firewall rule - {0}'.format(e))
+            return client.list_fw_rule_stats(network_domain_id, name) or []
+        fw_rule = client.get_fw_rule_by_name(network_domain_id, name)
+        return [fw_rule] if fw_rule else []
+    except NTTMCPAPIException:
+        return []
     except KeyError:
-        module.fail_json(msg='Network Domain is invalid')
+        raise NTTMCPAPIException('Network Domain is invalid')
 
-    return_data['count'] = len(return_data.get('acl'))
 
-    module.exit_json(changed=False, data=return_data)
+def get_fw_rules(module, client, datacenter):
+    """
+    Return the firewall rules in the Cloud Network Domain in a datacenter
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID
+    :returns: A list of firewall rules or None if the Cloud Network Domain does not exist in the datacenter
+    """
+    # Get the CND
+    try:
+        network_domain_id = client.resolve_network_domain_id(name=module.params.get('network_domain'),
+                                                             datacenter=datacenter)
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+        return None
+
+    if module.params.get('name') is not None:
+        return get_fw_rule(module, client, network_domain_id, module.params.get('name'))
+    return list_fw_rule(module, client, network_domain_id)
 
 
 def main():
@@ -339,8 +375,10 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             auth=dict(type='dict'),
-            region=dict(default='na', type='str'),
-            datacenter=dict(required=True, type='str'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=True, type='list', elements='str'),
             name=dict(required=False, type='str'),
             stats=dict(required=False, default=False, type='bool'),
             network_domain=dict(required=True, type='str')
@@ -351,31 +389,22 @@ def main():
         credentials = get_credentials(module)
     except ImportError as e:
         module.fail_json(msg='{0}'.format(e))
-    name = module.params.get('name')
-    network_domain_name = module.params.get('network_domain')
-    datacenter = module.params.get('datacenter')
-
-    # Check the region supplied is valid
-    regions = get_regions()
-    if module.params.get('region') not in regions:
-        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
+    return_data = return_object('acl')
 
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    entity = 'firewallRuleStatistics' if module.params.get('stats') else 'firewallRule'
+    project_output(module, 'acl')
+    results = fan_out(module, credentials, lambda client, datacenter: get_fw_rules(module, client, datacenter),
+                      entity=entity)
+    if all(result is None for region, datacenter, result in results):
+        module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(module.params.get('network_domain')))
 
-    # Get the CND
-    try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
-    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
-        module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
+    return_data['acl'] = merge_results(results)
+    return_data['count'] = len(return_data.get('acl'))
 
-    if name is not None:
-        get_fw_rule(module, client, network_domain_id, name)
-    else:
-        list_fw_rule(module, client, network_domain_id)
+    module.exit_json(changed=False, data=return_data)
 
 
 if __name__ == '__main__':
@@ -74,6 +74,20 @@ options:
         required: false
         type: bool
         default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -150,6 +164,8 @@ data:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
 
 
 def get_geo(module, client):
@@ -191,6 +207,8 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
             id=dict(required=False, type='str'),
             name=dict(required=False, type='str'),
             is_home=dict(required=False, default=False, type='bool')
@@ -212,7 +230,8 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     # Create the API client
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
+    project_output(module, 'geo')
 
     get_geo(module=module, client=client)
 
@@ -93,6 +93,13 @@ options:
         required: false
         type: int
         default: 15
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -125,10 +132,12 @@ msg:
     sample: The image was successfully exported with the export ID 71a365c4-f702-4e3c-ac11-34924aa36bf5
 '''
 
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def wait_for_image_export(module, client, datacenter, image_name):
@@ -141,29 +150,18 @@ def wait_for_image_export(module, client, datacenter, image_name):
     :arg image_id: The UUID of the image being polled
     :returns: The exported image object
     """
-    actual_state = False
-    image = None
-    wait_time = module.params.get('wait_time')
-    time = 0
-    while not actual_state and time < wait_time:
-        # Find the image
+    def check():
+        image = None
         try:
             images = client.list_customer_image(datacenter_id=datacenter, image_name=image_name).get('customerImage')
             if images:
                 image = [x for x in images if x.get('name') == image_name][0]
-                if not image:
-                    module.fail_json(msg='Could not find the image {0}'.format(image_name))
         except (KeyError, AttributeError, IndexError, NTTMCPAPIException) as e:
             module.fail_json(msg='The was an error finding the image: {0}'.format(e))
-        try:
-            if not image.get('progress'):
-                actual_state = True
-        except (KeyError, IndexError):
-            pass
-        sleep(module.params.get('wait_poll_interval'))
-        time = time + module.params.get('wait_poll_interval')
-
-    if not image and time >= wait_time:
+        return bool(image) and not image.get('progress'), image
+
+    done, image = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'image_export', client=client)
+    if not image and not done:
         module.fail_json(msg='Timeout waiting for the image to be exported')
     return True
 
@@ -178,6 +176,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
             ovf_name=dict(required=True, type='str'),
@@ -207,7 +206,7 @@ def main():
 
     # Create the API client
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -114,6 +114,13 @@ options:
         required: false
         type: int
         default: 15
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -288,10 +295,12 @@ data:
                     sample: "Someone"
 '''
 
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def import_image(module, client):
@@ -341,10 +350,6 @@ def delete_image(module, client, image):
     :arg image: The image to be deleted
     :returns: A message
     """
-    image_exists = True
-    time = 0
-    wait_time = module.params.get('wait_time')
-    wait_poll_interval = module.params.get('wait_poll_interval')
     datacenter = module.params.get('datacenter')
     image_name = image.get('name')
 
@@ -356,16 +361,14 @@ def delete_image(module, client, image):
         module.fail_json(msg='Error deleting the image - {0}'.format(e))
 
     if module.params['wait']:
-        while image_exists and time < wait_time:
+        def check():
             try:
                 images = client.list_customer_image(datacenter_id=datacenter, image_name=image_name).get('customerImage')
-                image_exists = [image for image in images if image.get('name') == image_name]
+                return not [image for image in images if image.get('name') == image_name], None
             except (KeyError, AttributeError, NTTMCPAPIException):
-                pass
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
+                return False, None
 
-        if image_exists and time >= wait_time:
+        if not poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'image_import', client=client)[0]:
             module.fail_json(msg='Timeout waiting for the image to be deleted')
 
     module.exit_json(changed=True, msg='Image {0} has been successfully removed in {1}'.format(image_name, datacenter))
@@ -381,23 +384,15 @@ def wait_for_image_import(module, client, image_id, state):
     :arg state: The desired state to wait
     :returns: The import image object
     """
-    actual_state = ''
-    image = None
-    wait_time = module.params['wait_time']
-    time = 0
-    while actual_state != state and time < wait_time:
+    def check():
         try:
             image = client.get_customer_image(image_id=image_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Error: Failed to get the image - %s' % e)
-        try:
-            actual_state = image['state']
-        except (KeyError, IndexError):
-            pass
-        sleep(module.params['wait_poll_interval'])
-        time = time + module.params['wait_poll_interval']
+        return image.get('state') == state, image
 
-    if not image and time >= wait_time:
+    done, image = poll(check, module.params['wait_time'], module.params['wait_poll_interval'], 'image_import', client=client)
+    if not image and not done:
         module.fail_json(msg='Timeout waiting for the image to be imported')
     return image
 
@@ -412,6 +407,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
             description=dict(required=False, type='str'),
@@ -444,7 +440,7 @@ def main():
 
     # Create the API client
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
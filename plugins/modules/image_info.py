@@ -54,15 +54,22 @@ options:
                   type: str
     region:
         description:
-            - The geographical region
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
         required: false
-        type: str
-        default: na
+        type: list
+        elements: str
+        default: [na]
     datacenter:
         description:
-            - The datacenter name e.g NA9
+            - The datacenter name e.g NA9 or a list of datacenter names
+            - The datacenters are queried concurrently and the results are merged into one list. Each object is tagged
+              with the region it was found in
+            - All of the datacenters in the region(s) are queried if no datacenter is supplied
         required: false
-        type: str
+        type: list
+        elements: str
     id:
         description:
             - The UUID of the image, supports wildcard matching with "*" e.g. "*ffff*"
@@ -87,6 +94,21 @@ options:
         required: false
         type: bool
         default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -146,6 +168,10 @@ data:
             returned: success
             type: complex
             contains:
+                region:
+                    description: The region the object was found in
+                    type: str
+                    sample: na
                 cpu:
                     description: The default CPU specifications for the image
                     type: complex
@@ -282,23 +308,24 @@ data:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
-from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
 
 
-def get_image(module, client):
+def get_image(module, client, datacenter):
     """
     List images filtered by optional parameters from the Ansible arguments
     :arg module: The Ansible module instance
-    :arg client: The CC API client instance
-    :arg network_domain_id: The UUID of the network domain
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID or None for every datacenter in the region
     :returns: List of image objects
     """
-    return_data = return_object('image')
     image_id = module.params['id']
     image_name = module.params['name']
     os_family = module.params['family']
-    datacenter = module.params['datacenter']
     customer_image = module.params['customer_image']
 
     try:
@@ -307,18 +334,13 @@ def get_image(module, client):
         else:
             result = client.list_image(datacenter_id=datacenter, image_id=image_id, image_name=image_name, os_family=os_family)
     except NTTMCPAPIException as exc:
-        module.fail_json(msg='Could not get a list of images - {0}'.format(exc))
+        raise NTTMCPAPIException('Could not get a list of images - {0}'.format(exc))
     try:
         if customer_image:
-            return_data['count'] = result['totalCount']
-            return_data['image'] = result['customerImage']
-        else:
-            return_data['count'] = result['totalCount']
-            return_data['image'] = result['osImage']
+            return result['customerImage']
+        return result['osImage']
     except KeyError:
-        pass
-
-    module.exit_json(data=return_data)
+        return []
 
 
 def main():
@@ -329,8 +351,10 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             auth=dict(type='dict'),
-            region=dict(default='na', type='str'),
-            datacenter=dict(required=False, type='str'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=False, type='list', elements='str'),
             id=dict(required=False, type='str'),
             name=dict(required=False, type='str'),
             family=dict(required=False, choices=['UNIX', 'WINDOWS']),
@@ -343,22 +367,20 @@ def main():
         credentials = get_credentials(module)
     except ImportError as e:
         module.fail_json(msg='{0}'.format(e))
-
-    # Check the region supplied is valid
-    regions = get_regions()
-    if module.params.get('region') not in regions:
-        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
+    return_data = return_object('image')
 
     if credentials is False:
         module.fail_json(msg='Could not load the user credentials')
 
-    # Create the API client
-    try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
-    except NTTMCPAPIException as e:
-        module.fail_json(msg=e.msg)
+    entity = 'customerImage' if module.params.get('customer_image') else 'osImage'
+    project_output(module, 'image')
+    results = fan_out(module, credentials, lambda client, datacenter: get_image(module, client, datacenter),
+                      entity=entity)
 
-    get_image(module=module, client=client)
+    return_data['image'] = merge_results(results)
+    return_data['count'] = len(return_data['image'])
+
+    module.exit_json(data=return_data)
 
 
 if __name__ == '__main__':
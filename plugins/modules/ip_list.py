@@ -117,6 +117,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -274,10 +281,12 @@ try:
     HAS_IPADDRESS = True
 except ImportError:
     HAS_IPADDRESS = False
-from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_firewall, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -342,6 +351,20 @@ def update_ip_list(module, client, network_domain_id, ip_list):
     module.exit_json(changed=True, data=return_data['ip_list'])
 
 
+def explode_ipv6_range(ip_range):
+    """
+    Return a copy of an IP address range with any IPv6 addresses in the exploded format
+
+    :arg ip_range: The IP address range dict (begin and optionally end)
+    :returns: The IP address range dict
+    """
+    ip_range = dict(ip_range)
+    ip_range['begin'] = str(ipaddress.ip_address(unicode(ip_range.get('begin'))).exploded)
+    if ip_range.get('end'):
+        ip_range['end'] = str(ipaddress.ip_address(unicode(ip_range.get('end'))).exploded)
+    return ip_range
+
+
 def compare_ip_list(module, client, network_domain_id, ip_list, return_all=False):
     """
     Compare two IP address lists
@@ -353,19 +376,17 @@ def compare_ip_list(module, client, network_domain_id, ip_list, return_all=False
     :arg return_all: If True returns the full list of changes otherwise just True/False
     :returns: Any differences between the two IP address lists
     """
-    # Handle schema differences between the returned API object and the one required to be sent
-    child_ip_list_ids = []
-    for i in range(len(ip_list['childIpAddressList'])):
-        child_ip_list_ids.append(ip_list['childIpAddressList'][i].get('id'))
-    ip_list.pop('childIpAddressList')
-    ip_list['childIpAddressListId'] = child_ip_list_ids
-    ip_list.pop('state')
-    ip_list.pop('createTime')
+    # Handle schema differences between the returned API object and the one required to be sent. The existing IP
+    # address list is copied so the caller's object is not modified
+    existing_ip_list = dict(ip_list)
+    existing_ip_list['childIpAddressListId'] = [x.get('id') for x in existing_ip_list.pop('childIpAddressList')]
+    existing_ip_list.pop('state')
+    existing_ip_list.pop('createTime')
 
     new_ip_list = client.ip_list_args_to_dict(False,
                                               network_domain_id,
-                                              ip_list.get('id'),
-                                              ip_list.get('name'),
+                                              existing_ip_list.get('id'),
+                                              existing_ip_list.get('name'),
                                               module.params.get('description'),
                                               module.params.get('ip_addresses'),
                                               module.params.get('ip_addresses_nil'),
@@ -373,26 +394,20 @@ def compare_ip_list(module, client, network_domain_id, ip_list, return_all=False
                                               module.params.get('child_ip_lists_nil'),
                                               module.params.get('version'))
 
-    if module.params.get('child_ip_lists_nil') and not ip_list.get('childIpAddressListId'):
+    if module.params.get('child_ip_lists_nil') and not existing_ip_list.get('childIpAddressListId'):
         new_ip_list['childIpAddressListId'] = []
-    if module.params.get('ip_addresses_nil') and not ip_list.get('ipAddress'):
+    if module.params.get('ip_addresses_nil') and not existing_ip_list.get('ipAddress'):
         new_ip_list['ipAddress'] = []
     # Handle case where no child IP address list is required but the schema still returns an empty list
-    if not ip_list.get('childIpAddressListId') and not module.params.get('child_ip_lists'):
-        ip_list.pop('childIpAddressListId')
+    if not existing_ip_list.get('childIpAddressListId') and not module.params.get('child_ip_lists'):
+        existing_ip_list.pop('childIpAddressListId')
     # Handle differences in IPv6 address formatting between Cloud Control and everything else
-    if ip_list.get('ipVersion') == 'IPV6':
-        if ip_list.get('ipAddress') and new_ip_list.get('ipAddress'):
-            for num, ipv6 in enumerate(ip_list.get('ipAddress'), start=0):
-                ip_list.get('ipAddress')[num]['begin'] = str(ipaddress.ip_address(unicode(ipv6.get('begin'))).exploded)
-                if ipv6.get('end'):
-                    ip_list.get('ipAddress')[num]['end'] = str(ipaddress.ip_address(unicode(ipv6.get('end'))).exploded)
-            for num, ipv6 in enumerate(new_ip_list.get('ipAddress'), start=0):
-                new_ip_list.get('ipAddress')[num]['begin'] = str(ipaddress.ip_address(unicode(ipv6.get('begin'))).exploded)
-                if ipv6.get('end'):
-                    new_ip_list.get('ipAddress')[num]['end'] = str(ipaddress.ip_address(unicode(ipv6.get('end'))).exploded)
-
-    compare_result = compare_json(new_ip_list, ip_list, None)
+    if existing_ip_list.get('ipVersion') == 'IPV6':
+        if existing_ip_list.get('ipAddress') and new_ip_list.get('ipAddress'):
+            existing_ip_list['ipAddress'] = [explode_ipv6_range(x) for x in existing_ip_list.get('ipAddress')]
+            new_ip_list['ipAddress'] = [explode_ipv6_range(x) for x in new_ip_list.get('ipAddress')]
+
+    compare_result = diff_json(new_ip_list, existing_ip_list)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -429,6 +444,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=False, type='str'),
             description=dict(required=False, type='str'),
@@ -466,14 +482,13 @@ def main():
         module.fail_json(msg='Error: Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get a list of existing CNDs and check if the name already exists
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -493,7 +508,7 @@ def main():
                 module.exit_json(msg='This IP address list will be created', data=module.params)
             create_ip_list(module, client, network_domain_id)
         else:
-            if compare_ip_list(module, client, network_domain_id, deepcopy(ip_list)):
+            if compare_ip_list(module, client, network_domain_id, ip_list):
                 update_ip_list(module, client, network_domain_id, ip_list)
             module.exit_json(data=ip_list)
     elif state == 'absent':
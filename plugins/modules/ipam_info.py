@@ -108,6 +108,20 @@ options:
         required: false
         type: bool
         default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -208,6 +222,9 @@ data:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_ipam, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
 
 
 def list_public_ipv4(module, client, network_domain_id):
@@ -298,6 +315,8 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=False, type='str'),
             description=dict(required=False, type='str'),
@@ -331,12 +350,12 @@ def main():
     if not credentials:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
+    project_output(module, 'ipam')
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -76,6 +76,13 @@ options:
         required: false
         type: bool
         default: true
+    count:
+        description:
+            - The number of free public IPv4 addresses to return when next_free_public_ipv4 is true
+            - New /31 public IPv4 blocks are only provisioned if the existing blocks do not have enough free addresses
+        required: false
+        type: int
+        default: 1
     ip_address:
         description:
             - Any of the IPv4 addresses within the /31 public IPv4 block
@@ -97,6 +104,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -120,6 +134,14 @@ EXAMPLES = '''
       network_domain: myCND
       state: present
 
+  - name: Get 50 free public IPv4 addresses
+    ipam_public:
+      region: na
+      datacenter: NA12
+      network_domain: myCND
+      count: 50
+      state: present
+
   - name: Allocate a new /31 block
     ipam_public:
       region: na
@@ -156,6 +178,13 @@ data:
             type: str
             returned: when next_free_public_ipv4 == True (Default)
             sample: 10.0.0.10
+        ips:
+            description: The list of free Public IPv4 addresses (count addresses)
+            type: list
+            returned: when next_free_public_ipv4 == True (Default)
+            sample:
+              - 10.0.0.10
+              - 10.0.0.11
         block:
             description: List of Public IPv4 addresses within the new block
             type: list
@@ -172,24 +201,27 @@ data:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, IP_TO_INT, INT_TO_IP
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_ipam, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def get_next_free_public_ipv4(module, client, network_domain_id):
     """
-    Get the next available public IPv4 address.
-    If no existing IPv4 blocks exist one will allocated as part of this process
+    Get the next available public IPv4 address(es).
+    If not enough free IPv4 addresses exist new blocks will allocated as part of this process
 
     :arg module: The Ansible module instance
     :arg client: The CC API client instance
     :arg network_domain_id: The UUID of the network domain
-    :returns: The allocated public IPv4 address
+    :returns: The allocated public IPv4 address(es)
     """
     return_data = return_object('ipam')
     return_data['ipam'] = {}
     try:
-        result = client.get_next_public_ipv4(network_domain_id)
-        return_data['ipam']['ip'] = result.get('ipAddress')
-    except NTTMCPAPIException as e:
+        result = client.get_free_public_ipv4s(network_domain_id, module.params.get('count'))
+        return_data['ipam']['ip'] = result.get('ipAddresses')[0]
+        return_data['ipam']['ips'] = result.get('ipAddresses')
+    except (IndexError, NTTMCPAPIException) as e:
         module.fail_json(msg='Could get the next free public IPv4 address - {0}'.format(e))
 
     module.exit_json(changed=result.get('changed'), data=return_data.get('ipam'))
@@ -272,9 +304,11 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             next_free_public_ipv4=dict(required=False, default=True, type='bool'),
+            count=dict(required=False, default=1, type='int'),
             ip_address=dict(required=False, default=None, type='str'),
             id=dict(default=None, type='str'),
             state=dict(default='present', choices=['present', 'absent'])
@@ -298,12 +332,14 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    if module.params.get('count') < 1:
+        module.fail_json(msg='count must be 1 or greater')
+
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -92,6 +92,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -176,6 +183,8 @@ except ImportError:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_ipam, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -254,6 +263,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             description=dict(required=False, type='str'),
             network_domain=dict(required=True, type='str'),
@@ -287,7 +297,7 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
 
     # Check the IP address is valid
     try:
@@ -297,8 +307,7 @@ def main():
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
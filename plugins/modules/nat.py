@@ -97,6 +97,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -209,6 +216,8 @@ data:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_ipam, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def create_nat_rule(module, client, network_domain_id, internal_ip, external_ip):
@@ -316,6 +325,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             internal_ip=dict(required=False, default=None, type='str'),
@@ -343,15 +353,14 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
 
     # Get a list of existing CNDs and check if the name already exists
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
         module.fail_json(msg='Failed to get a list of Cloud Network Domains - {0}'.format(e))
-    if not network:
+    if not network_domain_id:
         module.fail_json(msg='Failed to find the Cloud Network Domain Check the network_domain value')
 
     if state == 'present':
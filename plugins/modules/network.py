@@ -110,6 +110,13 @@ options:
         required: false
         type: int
         default: 10
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -251,11 +258,14 @@ data:
             returned: when state == present and wait is True
 '''
 
-from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def create_network_domain(module, client):
@@ -341,7 +351,7 @@ def compare_network_domain(module, network_domain):
     if module.params.get('network_type'):
         new_network_domain['type'] = module.params.get('network_type')
 
-    return compare_json(new_network_domain, network_domain, None)
+    return diff_json(new_network_domain, network_domain)
 
 
 def delete_network_domain(module, client, network_domain):
@@ -353,10 +363,6 @@ def delete_network_domain(module, client, network_domain):
     :arg network_domain: The Cloud Network Domain object
     :returns: A message
     """
-    network_exists = True
-    time = 0
-    wait_time = module.params.get('wait_time')
-    wait_poll_interval = module.params.get('wait_poll_interval')
     name = network_domain.get('name')
     datacenter = module.params.get('datacenter')
 
@@ -366,16 +372,14 @@ def delete_network_domain(module, client, network_domain):
         module.fail_json(msg='Could not delete the Cloud Network Domain - {0}'.format(e))
 
     if module.params['wait']:
-        while network_exists and time < wait_time:
+        def check():
             try:
-                networks = client.list_network_domains(datacenter=datacenter)
-                network_exists = [network for network in networks if network.get('id') == network_domain.get('id')]
-            except (KeyError, AttributeError, NTTMCPAPIException) as e:
-                pass
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
+                networks = client.list_network_domains(network_domain_id=network_domain.get('id'), datacenter=datacenter)
+                return not [network for network in networks if network.get('id') == network_domain.get('id')], None
+            except (KeyError, AttributeError, NTTMCPAPIException):
+                return False, None
 
-        if network_exists and time >= wait_time:
+        if not poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'network_domain', client=client)[0]:
             module.fail_json(msg='Timeout waiting for the Cloud Network Domain to be deleted')
 
     module.exit_json(changed=True, msg='Cloud Network Domain {0} has been successfully removed in {1}'.format(name, datacenter))
@@ -391,27 +395,22 @@ def wait_for_network_domain(module, client, name, datacenter, state):
     :arg state: The desired state to wait
     :returns: The Cloud Network Domain object
     """
-    actual_state = ''
-    wait_time = module.params.get('wait_time')
-    time = 0
-
-    while actual_state != state and time < wait_time:
+    def check():
         try:
-            networks = client.list_network_domains(datacenter=datacenter)
+            networks = client.list_network_domains(datacenter=datacenter, name=name)
             network_domain = [network for network in networks if network.get('name') == name]
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to get a list of Cloud Network Domains - {0}'.format(e))
-        try:
-            actual_state = network_domain[0].get('state')
-        except (KeyError, IndexError, AttributeError) as e:
-            pass
-        sleep(module.params.get('wait_poll_interval'))
-        time = time + module.params.get('wait_poll_interval')
+        if not network_domain:
+            return False, None
+        return network_domain[0].get('state') == state, network_domain[0]
 
-    if not network_domain and time >= wait_time:
+    done, network_domain = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'),
+                                'network_domain', client=client)
+    if not network_domain:
         module.fail_json(msg='Timeout waiting for the Cloud Network Domain to be created')
 
-    return network_domain[0]
+    return network_domain
 
 
 def main():
@@ -424,6 +423,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
             description=dict(required=False, type='str'),
@@ -454,7 +454,7 @@ def main():
         module.fail_json(msg='Error: Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
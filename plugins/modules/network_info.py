@@ -54,20 +54,41 @@ options:
                   type: str
     region:
         description:
-            - The geographical region
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
         required: false
-        type: str
-        default: na
+        type: list
+        elements: str
+        default: [na]
     datacenter:
         description:
-            - The datacenter name
+            - The datacenter name or a list of datacenter names
+            - The datacenters are queried concurrently and the results are merged into one list. Each object is tagged
+              with the region it was found in
         required: true
-        type: str
+        type: list
+        elements: str
     name:
         description:
             - The name of the Cloud Network Domain
         required: false
         type: str
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -111,6 +132,10 @@ data:
             returned: success
             type: complex
             contains:
+                region:
+                    description: The region the object was found in
+                    type: str
+                    sample: na
                 id:
                     description: Network Domain ID
                     type: str
@@ -186,8 +211,30 @@ data:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
-from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
+
+
+def get_network_domains(module, client, datacenter):
+    """
+    Return the Cloud Network Domains in a datacenter
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID
+    :returns: A list of Cloud Network Domains
+    """
+    name = module.params.get('name')
+    try:
+        networks = client.list_network_domains(datacenter=datacenter)
+    except NTTMCPAPIException as e:
+        raise NTTMCPAPIException('Failed to get a list of Cloud Network - {0}'.format(e))
+    if name:
+        return [x for x in networks if x.get('name') == name]
+    return networks
 
 
 def main():
@@ -198,8 +245,10 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             auth=dict(type='dict'),
-            region=dict(default='na', type='str'),
-            datacenter=dict(required=True, type='str'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=True, type='list', elements='str'),
             name=dict(required=False, type='str'),
         ),
         supports_check_mode=True
@@ -209,35 +258,15 @@ def main():
     except ImportError as e:
         module.fail_json(msg='{0}'.format(e))
     return_data = return_object('network_domain')
-    name = module.params.get('name')
-    datacenter = module.params.get('datacenter')
-
-    # Check the region supplied is valid
-    regions = get_regions()
-    if module.params.get('region') not in regions:
-        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
 
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
-    except NTTMCPAPIException as e:
-        module.fail_json(msg=str(e.msg))
-
-    # Get a list of existing CNDs and check if the name already exists
-    try:
-        networks = client.list_network_domains(datacenter=datacenter)
-    except NTTMCPAPIException as e:
-        module.fail_json(msg='Failed to get a list of Cloud Network - {0}'.format(e))
-    try:
-        if name:
-            return_data['network_domain'] = [x for x in networks if x.get('name') == name]
-        else:
-            return_data['network_domain'] = networks
-    except (KeyError, IndexError, AttributeError) as e:
-        module.fail_json(msg='Could not find the Cloud Network Domain - {0} in {1}'.format(name, datacenter))
+    project_output(module, 'network_domain')
+    results = fan_out(module, credentials, lambda client, datacenter: get_network_domains(module, client, datacenter),
+                      entity='networkDomain')
 
+    return_data['network_domain'] = merge_results(results)
     return_data['count'] = len(return_data['network_domain'])
 
     module.exit_json(data=return_data)
@@ -111,6 +111,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -238,10 +245,12 @@ data:
 '''
 
 import traceback
-from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_firewall, provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def create_port_list(module, client, network_domain_id):
@@ -310,28 +319,26 @@ def compare_port_list(module, client, network_domain_id, port_list, return_all=F
     :arg return_all: If True returns the full list of changes otherwise just True/False
     :returns: Any differences between the two port lists
     """
-    # Handle schema differences between the returned API object and the one required to be sent
-    child_port_list_ids = []
-    for i in range(len(port_list['childPortList'])):
-        child_port_list_ids.append(port_list['childPortList'][i].get('id'))
-    port_list.pop('childPortList')
-    port_list['childPortListId'] = child_port_list_ids
-    port_list.pop('state')
-    port_list.pop('createTime')
+    # Handle schema differences between the returned API object and the one required to be sent. The existing port
+    # list is copied so the caller's object is not modified
+    existing_port_list = dict(port_list)
+    existing_port_list['childPortListId'] = [x.get('id') for x in existing_port_list.pop('childPortList')]
+    existing_port_list.pop('state')
+    existing_port_list.pop('createTime')
     new_port_list = client.port_list_args_to_dict(False,
                                                   network_domain_id,
-                                                  port_list.get('id'),
-                                                  port_list.get('name'),
+                                                  existing_port_list.get('id'),
+                                                  existing_port_list.get('name'),
                                                   module.params.get('description'),
                                                   module.params.get('ports'),
                                                   module.params.get('ports_nil'),
                                                   module.params.get('child_port_lists'),
                                                   module.params.get('child_port_lists_nil'))
-    if module.params.get('child_port_lists_nil') or not port_list.get('childPortListId'):
+    if module.params.get('child_port_lists_nil') or not existing_port_list.get('childPortListId'):
         new_port_list['childPortListId'] = []
-    if module.params.get('ports_nil') and not port_list.get('ports'):
+    if module.params.get('ports_nil') and not existing_port_list.get('ports'):
         new_port_list['ports'] = []
-    compare_result = compare_json(new_port_list, port_list, None)
+    compare_result = diff_json(new_port_list, existing_port_list)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -367,6 +374,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
@@ -396,12 +404,11 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
 
     # Get a list of existing CNDs and check if the name already exists
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -418,7 +425,7 @@ def main():
                 module.exit_json(msg='A new port list will be created with the parameters: {0}'.format(module.params))
             create_port_list(module, client, network_domain_id)
         else:
-            if compare_port_list(module, client, network_domain_id, deepcopy(port_list), False):
+            if compare_port_list(module, client, network_domain_id, port_list, False):
                 update_port_list(module, client, network_domain_id, port_list)
             module.exit_json(data=port_list)
     elif state == 'absent':
@@ -100,6 +100,13 @@ options:
             - present
             - absent
         type: str
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -257,8 +264,11 @@ data:
 
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def create_security_group(module, client, network_domain_id=None, vlan_id=None):
@@ -351,7 +361,7 @@ def compare_security_group(module, sec_group):
     if module.params.get('description'):
         new_sec_group['description'] = module.params.get('description')
 
-    compare_result = compare_json(new_sec_group, sec_group, None)
+    compare_result = diff_json(new_sec_group, sec_group)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -367,6 +377,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             id=dict(default=None, required=False, type='str'),
@@ -395,14 +406,13 @@ def main():
         module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(network_domain_name, datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -377,6 +377,13 @@ options:
         required: false
         type: bool
         default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -821,13 +828,16 @@ data:
 '''
 
 import traceback
-from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, generate_password, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, generate_password
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import (SERVER_STATES, VARIABLE_IOPS, IOPS_MULTIPLIER, DISK_CONTROLLER_TYPES,
                                                                         MAX_IOPS_PER_GB, MAX_DISK_SIZE, MAX_DISK_IOPS)
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image, provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_server_state, wait_for_server_removal
 
 
 CORE = {
@@ -947,9 +957,9 @@ def create_server(module, client):
             if 'privateIpv4' in network['primary_nic']:
                 primary_nic['privateIpv4'] = network['primary_nic']['privateIpv4']
             elif 'vlan' in network['primary_nic']:
-                primary_nic['vlanId'] = client.get_vlan_by_name(name=network['primary_nic']['vlan'],
-                                                                datacenter=module.params['datacenter'],
-                                                                network_domain_id=params['networkInfo']['networkDomainId'])['id']
+                primary_nic['vlanId'] = client.resolve_vlan_id(name=network['primary_nic']['vlan'],
+                                                               datacenter=module.params['datacenter'],
+                                                               network_domain_id=params['networkInfo']['networkDomainId'])
             else:
                 module.fail_json(msg='An IPv4 address or VLAN is required.')
             params['networkInfo']['primaryNic'] = primary_nic
@@ -966,9 +976,9 @@ def create_server(module, client):
                 if 'privateIpv4' in nic:
                     new_nic['privateIpv4'] = nic['privateIpv4']
                 elif 'vlan' in nic:
-                    new_nic['vlanId'] = client.get_vlan_by_name(name=nic.get('vlan'),
-                                                                datacenter=module.params['datacenter'],
-                                                                network_domain_id=(params['networkInfo']['networkDomainId']))['id']
+                    new_nic['vlanId'] = client.resolve_vlan_id(name=nic.get('vlan'),
+                                                               datacenter=module.params['datacenter'],
+                                                               network_domain_id=(params['networkInfo']['networkDomainId']))
                 else:
                     module.fail_json(msg='An IPv4 address of VLAN is required for additional NICs')
                 additional_nic.append(new_nic)
@@ -1007,7 +1017,8 @@ def create_server(module, client):
         module.fail_json(msg='Could not create the server - {0}'.format(e), exception=traceback.format_exc())
 
     if wait:
-        wait_result = wait_for_server(module, client, params.get('name'), datacenter, network_domain_id, 'NORMAL', module.params.get('start'), None)
+        wait_result = wait_for_server(module, client, params.get('name'), datacenter, network_domain_id, 'NORMAL', module.params.get('start'), None,
+                                      server_id=new_server_id)
         if not wait_result:
             module.fail_json(msg='Timeout. Could not verify the server creation. Password: {0}'.format(params.get('administratorPassword')))
         wait_result['password'] = params.get('administratorPassword')
@@ -1132,7 +1143,7 @@ def compare_server(module, server):
     if module.params['memory_gb']:
         params['memoryGb'] = module.params.get('memory_gb')
 
-    compare_result = compare_json(params, existing_server, None)
+    compare_result = diff_json(params, existing_server)
     if module.check_mode:
         module.exit_json(data=compare_result)
     return compare_result.get('changes')
@@ -1196,15 +1207,10 @@ def expand_disk(module, client, server):
         server_command(module, client, server, 'start', True)
 
     try:
-        servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
+        server = client.get_server_by_id(server_id=server_id)
     except NTTMCPAPIException as e:
-        module.fail_json(msg='Failed to get a list of servers - {0}'.format(e), exception=traceback.format_exc())
+        module.fail_json(msg='Failed to get the server - {0}'.format(e), exception=traceback.format_exc())
 
-    server_exists = [x for x in servers if x['name'] == name]
-    if server_exists:
-        server = server_exists[0]
-    else:
-        server = []
     module.exit_json(changed=True, msg=msg, data=server)
 
 
@@ -1383,12 +1389,9 @@ def delete_server(module, client, server):
     :arg network_domain: The server dict
     :returns: A message
     """
-    server_exists = True
     name = server['name']
     datacenter = server['datacenterId']
     network_domain_id = server['networkInfo']['networkDomainId']
-    time = 0
-    wait_time = module.params['wait_time']
     wait_poll_interval = module.params['wait_poll_interval']
     wait = module.params['wait']
 
@@ -1407,20 +1410,14 @@ def delete_server(module, client, server):
     except NTTMCPAPIException as e:
         module.fail_json(msg='Could not delete the server - {0}'.format(e), exception=traceback.format_exc())
     if wait:
-        while server_exists and time < wait_time:
-            servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
-            server_exists = [x for x in servers if x.get('id') == server.get('id')]
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-
-        if server_exists and time >= wait_time:
+        if not wait_for_server_removal(module, client, server.get('id'), wait_poll_interval):
             module.fail_json(msg='Timeout waiting for the server to be deleted')
 
     module.exit_json(changed=True, msg='Server {0} has been successfully removed in {1}'.format(name, datacenter))
 
 
 def wait_for_server(module, client, name, datacenter, network_domain_id, state, check_for_start=False, check_for_stop=False,
-                    wait_poll_interval=None):
+                    wait_poll_interval=None, server_id=None):
     """
     Wait for an operation on a server. Polls based on wait_time and wait_poll_interval values.
 
@@ -1433,62 +1430,13 @@ def wait_for_server(module, client, name, datacenter, network_domain_id, state,
     :arg check_for_start: Check if the server is started
     :arg check_for_stop: Check if the server is stopped
     :arg wait_poll_interval: The time between polls
+    :kw server_id: The UUID of the server, polled by UUID instead of name when supplied
     :returns: The server dict
     """
-    set_state = False
-    actual_state = ''
-    start_state = ''
-    time = 0
-    vmtools_status = False
-    wait_for_vmtools = CORE.get('wait_for_vmtools')
-    wait_time = module.params.get('wait_time')
-    wait_required = False
-    if wait_poll_interval is None:
-        wait_poll_interval = module.params.get('wait_poll_interval')
-    server = []
-    while not set_state and time < wait_time:
-        try:
-            servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
-        except NTTMCPAPIException as e:
-            module.fail_json(msg='Failed to get a list of servers - {0}'.format(e), exception=traceback.format_exc())
-        server = [x for x in servers if x['name'] == name]
-        # Check if VMTools has started - if the user as specified to wait for VMWare Tools to be running
-        try:
-            if wait_for_vmtools:
-                if server[0].get('guest').get('vmTools').get('runningStatus') == 'RUNNING':
-                    vmtools_status = True
-        except AttributeError:
-            pass
-        except IndexError:
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-        try:
-            if len(server) > 0:
-                actual_state = server[0].get('state')
-                start_state = server[0].get('started')
-        except (KeyError, IndexError):
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-
-        if actual_state != state:
-            wait_required = True
-        elif check_for_start and not start_state:
-            wait_required = True
-        elif check_for_stop and start_state:
-            wait_required = True
-        elif wait_for_vmtools and not vmtools_status:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
-        return None
-
-    return server[0]
+    return wait_for_server_state(module, client, server_id=server_id, name=name, datacenter=datacenter,
+                                 network_domain_id=network_domain_id, state=state, check_for_start=check_for_start,
+                                 check_for_stop=check_for_stop, wait_for_vmtools=CORE.get('wait_for_vmtools'),
+                                 wait_poll_interval=wait_poll_interval, fail_if_missing=False)
 
 
 def main():
@@ -1501,6 +1449,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(default=None, required=False, type='str'),
             vlan=dict(default=None, required=False, type='str'),
@@ -1561,7 +1510,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -1575,8 +1524,7 @@ def main():
                 module.fail_json(msg='No network_domain or network_info.network_domain was provided')
         if network_domain_name is None:
             module.fail_json(msg='No network_domain or network_info.network_domain was provided')
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Failed to find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -1591,8 +1539,7 @@ def main():
                     module.fail_json(msg='No vlan or network_info.vlan was provided')
             if vlan_name is None:
                 module.fail_json(msg='No vlan or network_info.vlan was provided')
-            vlan = client.get_vlan_by_name(datacenter=datacenter, network_domain_id=network_domain_id, name=vlan_name)
-            vlan_id = vlan.get('id')
+            vlan_id = client.resolve_vlan_id(datacenter=datacenter, network_domain_id=network_domain_id, name=vlan_name)
         except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
             module.fail_json(msg='Failed to find the VLAN - {0}'.format(vlan_name))
 
@@ -75,6 +75,21 @@ options:
         required: false
         type: list
         elements: str
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -199,6 +214,9 @@ data:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_listing, project_output
 
 
 def main():
@@ -210,6 +228,8 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(default=None, type='str'),
             servers=dict(default=list(), type='list', elements='str'),
@@ -235,15 +255,15 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
+    project_output(module, 'antiaffinity_group')
 
     # Get the CND
     if network_domain_name:
         try:
-            network = client.get_network_domain_by_name(network_domain_name, datacenter)
-            network_domain_id = network.get('id')
+            network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
         except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
             module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -260,6 +280,8 @@ def main():
         except (KeyError, IndexError, AttributeError):
             module.warn(warning='Could not find the server - {0} in {1}'.format(server, datacenter))
 
+    if len(server_ids) < 2:
+        project_listing(module, client, 'antiAffinityRule')
     try:
         if len(server_ids) == 0:
             return_data['antiaffinity_group'] = client.list_server_anti_affinity_groups(network_domain_id=network_domain_id)
@@ -0,0 +1,589 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, NTT Ltd.
+#
+# Author: Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'NTT Ltd.'
+}
+
+DOCUMENTATION = '''
+---
+module: server_batch
+short_description: Deploy many servers in a single task
+description:
+    - Deploy a list of servers into a Cloud Network Domain
+    - The Cloud Network Domain, images and VLANs are resolved once for the whole list and servers that already exist
+      (by name) are left unchanged
+    - The deploy requests are sent with bounded concurrency and all new servers are then tracked by a single shared
+      polling loop that lists the servers in the Cloud Network Domain once per poll
+version_added: "2.10.0"
+author:
+    - Ken Sinfield (@kensinfield)
+options:
+    auth:
+        description:
+            - Optional dictionary containing the authentication and API information for Cloud Control
+        required: false
+        type: dict
+        suboptions:
+            username:
+                  description:
+                      - The Cloud Control API username
+                  required: false
+                  type: str
+            password:
+                  description:
+                      - The Cloud Control API user password
+                  required: false
+                  type: str
+            api:
+                  description:
+                      - The Cloud Control API endpoint e.g. api-na.mcp-services.net
+                  required: false
+                  type: str
+            api_version:
+                  description:
+                      - The Cloud Control API version e.g. 2.11
+                  required: false
+                  type: str
+    region:
+        description:
+            - The geographical region
+        required: false
+        type: str
+        default: na
+    datacenter:
+        description:
+            - The datacenter name
+        required: true
+        type: str
+    network_domain:
+        description:
+            - The name of the Cloud Network Domain
+        required: true
+        type: str
+    servers:
+        description:
+            - The list of servers to deploy
+            - Each server supports the same create options as the server module
+        required: true
+        type: list
+        elements: dict
+        suboptions:
+            name:
+                description:
+                    - The name of the server
+                required: true
+                type: str
+            description:
+                description:
+                    - The description of the server
+                required: false
+                type: str
+            image:
+                description:
+                    - The name of the OS or customer image to deploy the server from
+                required: true
+                type: str
+            cluster:
+                description:
+                    - The name of the cluster when the server is being deployed in a multi-cluster environment
+                required: false
+                type: str
+            cpu:
+                description:
+                    - CPU object with the speed, count and coresPerSocket attributes
+                required: false
+                type: dict
+            memory_gb:
+                description:
+                    - Integer value for the server memory size
+                required: false
+                type: int
+            network_info:
+                description:
+                    - Network object with the primary_nic and additional_nic attributes as per the server module
+                    - Each NIC requires a vlan name or a privateIpv4 address
+                required: true
+                type: dict
+            primary_dns:
+                description:
+                    - Primary DNS server to assign to the server
+                required: false
+                type: str
+            secondary_dns:
+                description:
+                    - Secondary DNS server to assign to the server
+                required: false
+                type: str
+            ipv4_gw:
+                description:
+                    - IPv4 default gateway
+                required: false
+                type: str
+            ipv6_gw:
+                description:
+                    - IPv6 default gateway
+                required: false
+                type: str
+            disks:
+                description:
+                    - List of disk objects with the controller_type, controller_number, disk_number, speed and iops
+                      attributes as per the server module
+                required: false
+                type: list
+                elements: dict
+            admin_password:
+                description:
+                    - The administrator/root password to assign to the new server
+                    - If left blank the module will generate and return one
+                required: false
+                type: str
+            ngoc:
+                description:
+                    - Non Guest OS Customization - Used to specify that the image should not be customized during
+                      deployment
+                required: false
+                type: bool
+                default: false
+            start:
+                description:
+                    - Whether to start the server after creation
+                required: false
+                type: bool
+                default: true
+    concurrency:
+        description:
+            - The maximum number of deploy requests sent at the same time
+        required: false
+        type: int
+        default: 4
+    wait:
+        description:
+            - Should Ansible wait for all of the servers to be deployed before continuing
+        required: false
+        type: bool
+        default: true
+    wait_time:
+        description:
+            - The maximum time the Ansible should wait for all of the servers to be deployed in seconds
+        required: false
+        type: int
+        default: 3600
+    wait_poll_interval:
+        description:
+            - The time in between checking the status of the servers in seconds
+        required: false
+        type: int
+        default: 30
+    wait_for_vmtools:
+        description:
+            - Should Ansible wait for VMWare Tools to be running on every server before continuing
+            - This should not be used for NGOC (Non Guest OS Customization) servers/images
+        required: false
+        type: bool
+        default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+notes:
+    - Requires NTT Ltd. MCP account/credentials
+requirements:
+    - requests
+    - configparser
+    - pyOpenSSL
+'''
+
+EXAMPLES = '''
+- hosts: 127.0.0.1
+  connection: local
+  collections:
+    - nttmcp.mcp
+  tasks:
+
+  - name: Deploy the web servers defined in the web_servers variable
+    server_batch:
+      region: na
+      datacenter: NA9
+      network_domain: my_cnd
+      concurrency: 8
+      servers: "{{ web_servers }}"
+
+  - name: Deploy two servers with different specifications
+    server_batch:
+      region: na
+      datacenter: NA9
+      network_domain: my_cnd
+      servers:
+        - name: db01
+          image: "CentOS 7 64-bit 2 CPU"
+          memory_gb: 16
+          network_info:
+            primary_nic:
+              vlan: my_db_vlan
+        - name: app01
+          image: "CentOS 7 64-bit 2 CPU"
+          network_info:
+            primary_nic:
+              vlan: my_app_vlan
+              privateIpv4: 10.0.1.10
+'''
+
+RETURN = '''
+data:
+    description: The servers grouped by the result of the deployment
+    returned: always
+    type: complex
+    contains:
+        created:
+            description: The servers that were deployed. Each server includes the password assigned to it
+            type: list
+            sample: [{"id": "b2fbd7e6-ddbb-4eb6-a2dd-ad048bc5b9ae", "name": "web01", "state": "NORMAL", "password": "mypassword"}]
+        existing:
+            description: The names of the servers that already existed and were not changed
+            type: list
+            sample: ["web02"]
+        failed:
+            description: The servers that failed to deploy, with the error or failed server state
+            type: list
+            sample: [{"name": "web03", "msg": "FAILED_ADD"}]
+        pending:
+            description:
+                - The servers that had not finished deploying when wait_time was reached or the servers could no
+                  longer be polled. Each server includes the password assigned to it
+            type: list
+            sample: [{"id": "b2fbd7e6-ddbb-4eb6-a2dd-ad048bc5b9ae", "name": "web04", "password": "mypassword"}]
+'''
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+    HAS_FUTURES = True
+except ImportError:
+    HAS_FUTURES = False
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, generate_password
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import VARIABLE_IOPS
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image, provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_servers_state
+
+SERVER_SPEC = dict(
+    name=dict(required=True, type='str'),
+    description=dict(required=False, type='str'),
+    image=dict(required=True, type='str'),
+    cluster=dict(required=False, type='str'),
+    cpu=dict(required=False, type='dict'),
+    memory_gb=dict(required=False, type='int'),
+    network_info=dict(required=True, type='dict'),
+    primary_dns=dict(required=False, type='str'),
+    secondary_dns=dict(required=False, type='str'),
+    ipv4_gw=dict(required=False, type='str'),
+    ipv6_gw=dict(required=False, type='str'),
+    disks=dict(required=False, type='list', elements='dict'),
+    admin_password=dict(required=False, type='str', no_log=True),
+    ngoc=dict(required=False, default=False, type='bool'),
+    start=dict(required=False, default=True, type='bool')
+)
+
+CONTROLLER_NAMES = {'scsi': 'scsiController', 'sata': 'sataController', 'ide': 'ideController'}
+
+
+def get_images(module, client, datacenter, servers):
+    """
+    Look up each distinct image used by the servers once
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg datacenter: The MCP ID
+    :arg servers: The list of server arguments
+    :returns: dict of image dicts keyed on the image name
+    """
+    images = {}
+    for image_name in set(x.get('image') for x in servers):
+        try:
+            image_list = client.list_image(datacenter_id=datacenter, image_name=image_name).get('osImage')
+            if not image_list:
+                image_list = client.list_customer_image(datacenter_id=datacenter, image_name=image_name).get('customerImage')
+            images[image_name] = image_list[0]
+        except (KeyError, IndexError, TypeError, NTTMCPAPIException) as e:
+            module.fail_json(msg='Failed to find the Image {0} - {1}'.format(image_name, e))
+    return images
+
+
+def get_vlans(module, client, datacenter, network_domain_id, servers):
+    """
+    Resolve each distinct VLAN name used by the server NICs once
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg datacenter: The MCP ID
+    :arg network_domain_id: The UUID of the Cloud Network Domain
+    :arg servers: The list of server arguments
+    :returns: dict of VLAN UUIDs keyed on the VLAN name
+    """
+    vlan_names = set()
+    for server in servers:
+        network_info = server.get('network_info') or {}
+        for nic in [network_info.get('primary_nic') or {}] + list(network_info.get('additional_nic') or []):
+            if not nic.get('privateIpv4') and nic.get('vlan'):
+                vlan_names.add(nic.get('vlan'))
+    vlans = {}
+    for vlan_name in vlan_names:
+        try:
+            vlans[vlan_name] = client.resolve_vlan_id(name=vlan_name, datacenter=datacenter,
+                                                      network_domain_id=network_domain_id)
+        except NTTMCPAPIException as e:
+            module.fail_json(msg='Failed to find the VLAN {0} - {1}'.format(vlan_name, e))
+    return vlans
+
+
+def get_nic(module, server, nic, vlans, primary=False):
+    """
+    Convert a NIC argument to the API schema
+
+    :arg module: The Ansible module instance
+    :arg server: The server arguments
+    :arg nic: The NIC arguments
+    :arg vlans: dict of VLAN UUIDs keyed on the VLAN name
+    :kw primary: Whether this is the primary NIC
+    :returns: The NIC dict
+    """
+    new_nic = {}
+    if nic.get('networkAdapter'):
+        new_nic['networkAdapter'] = nic.get('networkAdapter')
+    elif not primary:
+        module.fail_json(msg='NIC Adapter type is required for additional NICs on server {0}'.format(server.get('name')))
+    if nic.get('privateIpv4'):
+        new_nic['privateIpv4'] = nic.get('privateIpv4')
+    elif nic.get('vlan'):
+        new_nic['vlanId'] = vlans[nic.get('vlan')]
+    else:
+        module.fail_json(msg='An IPv4 address or VLAN is required for each NIC on server {0}'.format(server.get('name')))
+    return new_nic
+
+
+def get_disks(module, server, image):
+    """
+    Convert the disk arguments to the API schema using the disk UUIDs from the image
+
+    :arg module: The Ansible module instance
+    :arg server: The server arguments
+    :arg image: The image dict
+    :returns: A list of disk dicts
+    """
+    new_disks = []
+    for disk in server.get('disks') or []:
+        try:
+            controller = image.get(CONTROLLER_NAMES[disk.get('controller_type')], [])[disk.get('controller_number') or 0]
+            new_disk = {'id': controller.get('disk', [])[disk.get('disk_number') or 0].get('id')}
+        except (KeyError, IndexError, AttributeError, TypeError) as e:
+            module.fail_json(msg='Failed to find disk {0} on the {1} controller number {2} for server {3}: {4}'.format(
+                disk.get('disk_number'), disk.get('controller_type'), disk.get('controller_number'), server.get('name'), e))
+        if not disk.get('speed'):
+            module.fail_json(msg='Disk speed is required for server {0}'.format(server.get('name')))
+        new_disk['speed'] = disk.get('speed')
+        if disk.get('iops'):
+            if disk.get('speed') not in VARIABLE_IOPS:
+                module.fail_json(msg='Disk IOPS can only be set when the disk speed is one of {0}'.format(VARIABLE_IOPS))
+            new_disk['iops'] = disk.get('iops')
+        new_disks.append(new_disk)
+    return new_disks
+
+
+def server_to_dict(module, server, network_domain_id, images, vlans):
+    """
+    Convert the server arguments to the deployServer API schema
+
+    :arg module: The Ansible module instance
+    :arg server: The server arguments
+    :arg network_domain_id: The UUID of the Cloud Network Domain
+    :arg images: dict of image dicts keyed on the image name
+    :arg vlans: dict of VLAN UUIDs keyed on the VLAN name
+    :returns: The server dict
+    """
+    image = images.get(server.get('image'))
+    network_info = server.get('network_info') or {}
+    if not network_info.get('primary_nic'):
+        module.fail_json(msg='Primary NIC required for server {0}'.format(server.get('name')))
+    params = {
+        'name': server.get('name'),
+        'imageId': image.get('id'),
+        'start': server.get('start'),
+        'networkInfo': {
+            'networkDomainId': network_domain_id,
+            'primaryNic': get_nic(module, server, network_info.get('primary_nic'), vlans, primary=True)
+        }
+    }
+    if network_info.get('additional_nic'):
+        params['networkInfo']['additionalNic'] = [get_nic(module, server, nic, vlans) for nic in network_info.get('additional_nic')]
+    disks = get_disks(module, server, image)
+    if disks:
+        params['disk'] = disks
+    for arg, key in [('description', 'description'), ('cpu', 'cpu'), ('memory_gb', 'memoryGb'),
+                     ('primary_dns', 'primaryDns'), ('secondary_dns', 'secondaryDns'), ('ipv4_gw', 'ipv4Gateway'),
+                     ('ipv6_gw', 'ipv6Gateway'), ('cluster', 'clusterId')]:
+        if server.get(arg) is not None:
+            params[key] = server.get(arg)
+    if not server.get('ngoc'):
+        params['administratorPassword'] = server.get('admin_password') or generate_password()
+    return params
+
+
+def deploy_servers(client, servers, concurrency):
+    """
+    Send the deploy requests for a list of servers with bounded concurrency
+
+    :arg client: The CC API client instance
+    :arg servers: A list of tuples of (ngoc, server dict)
+    :arg concurrency: The maximum number of concurrent deploy requests
+    :returns: A list of tuples of (server dict, new server UUID or None, error message or None) in the same order
+    """
+    def deploy(args):
+        ngoc, params = args
+        try:
+            result = client.create_server(ngoc, params)
+            return params, result['info'][0]['value'], None
+        except (KeyError, IndexError, AttributeError, TypeError, NTTMCPAPIException) as e:
+            return params, None, 'Could not create the server - {0}'.format(e)
+
+    workers = min(concurrency, len(servers))
+    if not HAS_FUTURES or workers <= 1:
+        return [deploy(x) for x in servers]
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        return list(executor.map(deploy, servers))
+    finally:
+        executor.shutdown(wait=True)
+
+
+def main():
+    """
+    Main function
+
+    :returns: The deployed servers
+    """
+    module = AnsibleModule(
+        argument_spec=dict(
+            auth=dict(type='dict'),
+            region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            datacenter=dict(required=True, type='str'),
+            network_domain=dict(required=True, type='str'),
+            servers=dict(required=True, type='list', elements='dict', options=SERVER_SPEC),
+            concurrency=dict(required=False, default=4, type='int'),
+            wait=dict(required=False, default=True, type='bool'),
+            wait_time=dict(required=False, default=3600, type='int'),
+            wait_poll_interval=dict(required=False, default=30, type='int'),
+            wait_for_vmtools=dict(required=False, default=False, type='bool')
+        ),
+        supports_check_mode=True
+    )
+    try:
+        credentials = get_credentials(module)
+    except ImportError as e:
+        module.fail_json(msg='{0}'.format(e))
+    network_domain_name = module.params.get('network_domain')
+    datacenter = module.params.get('datacenter')
+    servers = module.params.get('servers')
+    concurrency = max(module.params.get('concurrency'), 1)
+
+    # Check the region supplied is valid
+    regions = get_regions()
+    if module.params.get('region') not in regions:
+        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
+
+    if credentials is False:
+        module.fail_json(msg='Could not load the user credentials')
+
+    names = [x.get('name') for x in servers]
+    duplicates = sorted(set(name for name in names if names.count(name) > 1))
+    if duplicates:
+        module.fail_json(msg='Duplicate server names: {0}'.format(', '.join(duplicates)))
+
+    try:
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
+    except NTTMCPAPIException as e:
+        module.fail_json(msg=e.msg)
+
+    try:
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+        module.fail_json(msg='Failed to find the Cloud Network Domain: {0}'.format(network_domain_name))
+
+    # Fetch the existing servers once and only deploy the servers that do not exist yet
+    try:
+        existing = set(x.get('name') for x in client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id))
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
+        module.fail_json(msg='Failed attempting to locate any existing servers - {0}'.format(e))
+    new_servers = [x for x in servers if x.get('name') not in existing]
+    result = {
+        'created': [],
+        'existing': [x.get('name') for x in servers if x.get('name') in existing],
+        'failed': [],
+        'pending': []
+    }
+
+    # Implement check_mode
+    if module.check_mode:
+        result['created'] = [{'name': x.get('name')} for x in new_servers]
+        module.exit_json(changed=bool(new_servers), data=result)
+    if not new_servers:
+        module.exit_json(changed=False, data=result)
+
+    images = get_images(module, client, datacenter, new_servers)
+    vlans = get_vlans(module, client, datacenter, network_domain_id, new_servers)
+    requests = [(x.get('ngoc'), server_to_dict(module, x, network_domain_id, images, vlans)) for x in new_servers]
+
+    deployed = {}
+    for params, server_id, error in deploy_servers(client, requests, concurrency):
+        if error:
+            result['failed'].append({'name': params.get('name'), 'msg': error})
+        else:
+            deployed[server_id] = params
+
+    if module.params.get('wait') and deployed:
+        start = all(params.get('start') for params in deployed.values())
+        reached, failed, pending, error = wait_for_servers_state(module, client, list(deployed), datacenter,
+                                                                 network_domain_id, 'NORMAL', start,
+                                                                 module.params.get('wait_for_vmtools'))
+        for server_id, server in reached.items():
+            server['password'] = deployed[server_id].get('administratorPassword')
+            result['created'].append(server)
+        for server_id, server in failed.items():
+            result['failed'].append({'id': server_id, 'name': server.get('name'), 'msg': server.get('state'),
+                                     'password': deployed[server_id].get('administratorPassword')})
+        for server_id in pending:
+            result['pending'].append({'id': server_id, 'name': deployed[server_id].get('name'),
+                                      'password': deployed[server_id].get('administratorPassword')})
+    else:
+        error = None
+        result['created'] = [{'id': server_id, 'name': params.get('name'), 'password': params.get('administratorPassword')}
+                             for server_id, params in deployed.items()]
+
+    if error:
+        module.fail_json(msg='{0}. {1} server(s) failed to deploy and {2} server(s) had not finished deploying'.format(
+                         error, len(result['failed']), len(result['pending'])), changed=True, data=result)
+    if result['failed'] or result['pending']:
+        module.fail_json(msg='{0} server(s) failed to deploy and {1} server(s) did not finish deploying within the '
+                             'wait_time'.format(len(result['failed']), len(result['pending'])),
+                         changed=bool(deployed), data=result)
+    module.exit_json(changed=True, data=result)
+
+
+if __name__ == '__main__':
+    main()
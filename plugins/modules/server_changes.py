@@ -0,0 +1,344 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, NTT Ltd.
+#
+# Author: Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0 (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'NTT Ltd.'
+}
+
+DOCUMENTATION = '''
+---
+module: server_changes
+short_description: List the servers added, removed or modified since the last run
+description:
+    - List the servers added, removed or modified since the previous run of the same feed
+    - A compact snapshot of the listing (the server UUID, a hash of its content and a few key fields) is kept in the
+      local cache directory (NTTMCP_CACHE_DIR, default ~/.ansible/nttmcp) of the host running the module
+    - The first run of a feed (or a run after the snapshot has expired or been reset) reports every server as added
+version_added: "2.10.0"
+author:
+    - Ken Sinfield (@kensinfield)
+options:
+    auth:
+        description:
+            - Optional dictionary containing the authentication and API information for Cloud Control
+        required: false
+        type: dict
+        suboptions:
+            username:
+                  description:
+                      - The Cloud Control API username
+                  required: false
+                  type: str
+            password:
+                  description:
+                      - The Cloud Control API user password
+                  required: false
+                  type: str
+            api:
+                  description:
+                      - The Cloud Control API endpoint e.g. api-na.mcp-services.net
+                  required: false
+                  type: str
+            api_version:
+                  description:
+                      - The Cloud Control API version e.g. 2.11
+                  required: false
+                  type: str
+    region:
+        description:
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
+        required: false
+        type: list
+        elements: str
+        default: [na]
+    datacenter:
+        description:
+            - The datacenter name or a list of datacenter names
+        required: true
+        type: list
+        elements: str
+    network_domain:
+        description:
+            - Only list the servers in this Cloud Network Domain
+        required: false
+        type: str
+    vlan:
+        description:
+            - Only list the servers in this VLAN
+        required: false
+        type: str
+    feed:
+        description:
+            - The name of the change feed
+            - Each combination of feed, credentials, regions, datacenters, network_domain, vlan and fields keeps its
+              own snapshot so several feeds over the same servers do not interfere with each other
+        required: false
+        type: str
+        default: default
+    reset:
+        description:
+            - Discard the previous snapshot and report every server as added
+        required: false
+        type: bool
+        default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only compare and return these fields of each server, as dotted paths e.g.
+              networkInfo.primaryNic.privateIpv4
+            - A server is only reported as modified when one of these fields changes. The id and name are always
+              included
+            - Listed servers are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
+notes:
+    - Requires NTT Ltd. MCP account/credentials
+    - The snapshot is not updated in check mode
+    - The snapshot expires if the feed is not run for 30 days (SERVER_CHANGES_TTL)
+requirements:
+    - requests
+    - configparser
+    - pyOpenSSL
+    - netaddr
+'''
+
+EXAMPLES = '''
+- hosts: 127.0.0.1
+  connection: local
+  collections:
+    - nttmcp.mcp
+  tasks:
+
+  - name: Get the server changes since the last CMDB sync
+    server_changes:
+      region: na
+      datacenter:
+        - NA9
+        - NA12
+      feed: cmdb
+    register: changes
+
+  - name: Compare only the state and primary IPv4 address of the servers in a Cloud Network Domain
+    server_changes:
+      region: na
+      datacenter: NA9
+      network_domain: my_cnd
+      feed: ip_audit
+      fields:
+        - state
+        - networkInfo.primaryNic.privateIpv4
+'''
+
+RETURN = '''
+data:
+    description: dict of the server changes
+    type: complex
+    returned: success
+    contains:
+        count:
+            description: The number of servers added, modified or removed
+            returned: success
+            type: int
+            sample: 3
+        total:
+            description: The number of servers in the current listing
+            returned: success
+            type: int
+            sample: 3000
+        initial:
+            description: There was no previous snapshot so every server is reported as added
+            returned: success
+            type: bool
+        added:
+            description: List of the server objects (see server_info) that were not in the previous snapshot
+            returned: success
+            type: list
+        modified:
+            description: List of the server objects (see server_info) that have changed since the previous snapshot
+            returned: success
+            type: list
+        removed:
+            description: List of the servers in the previous snapshot that no longer exist
+            returned: success
+            type: complex
+            contains:
+                id:
+                    description: The UUID of the server
+                    type: str
+                    sample: b2fbd7e6-ddbb-4eb6-a2dd-ad048bc5b9ae
+                name:
+                    description: The name of the server
+                    type: str
+                    sample: my_server
+                datacenterId:
+                    description: The datacenter the server was in
+                    type: str
+                    sample: NA9
+                region:
+                    description: The region the server was in
+                    type: str
+                    sample: na
+                state:
+                    description: The last known state of the server
+                    type: str
+                    sample: NORMAL
+'''
+
+import json
+import hashlib
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import SERVER_CHANGES_TTL
+from ansible_collections.nttmcp.mcp.plugins.module_utils.cache import NTTMCPFileCache, cache_key
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results, unique
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output, LISTING_FIELDS
+
+# The server fields kept in the snapshot so a removed server can still be identified
+SNAPSHOT_FIELDS = ['name', 'datacenterId', 'region', 'state']
+
+
+def get_servers(module, client, datacenter):
+    """
+    Return the servers in a datacenter, optionally filtered by Cloud Network Domain and VLAN
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID
+    :returns: A list of servers or None if the Cloud Network Domain does not exist in the datacenter
+    """
+    network_domain_name = module.params.get('network_domain')
+    vlan_name = module.params.get('vlan')
+    network_domain_id = vlan_id = None
+
+    if network_domain_name:
+        try:
+            network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
+        except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+            return None
+    if vlan_name:
+        try:
+            vlan_id = client.resolve_vlan_id(name=vlan_name, datacenter=datacenter, network_domain_id=network_domain_id)
+        except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+            raise NTTMCPAPIException('Failed to locate the VLAN - {0}'.format(vlan_name))
+
+    return client.list_servers(datacenter, network_domain_id, vlan_id)
+
+
+def content_hash(server):
+    """
+    Return a hash of the content of a server object that does not depend on the order of its keys
+
+    :arg server: The server object
+    :returns: A hex digest string
+    """
+    return hashlib.sha1(json.dumps(server, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def compare_servers(previous, servers):
+    """
+    Compare a server listing to the snapshot of the previous listing
+
+    :arg previous: The previous snapshot, a dict of server state keyed on the server UUID
+    :arg servers: The list of server objects
+    :returns: A tuple of the new snapshot and the lists of added, modified and removed servers
+    """
+    snapshot = {}
+    added = []
+    modified = []
+    for server in servers:
+        state = dict((field, server.get(field)) for field in SNAPSHOT_FIELDS)
+        state['hash'] = content_hash(server)
+        snapshot[server.get('id')] = state
+        if server.get('id') not in previous:
+            added.append(server)
+        elif previous[server.get('id')].get('hash') != state['hash']:
+            modified.append(server)
+    removed = []
+    for server_id in sorted(set(previous) - set(snapshot)):
+        server = dict((field, previous[server_id].get(field)) for field in SNAPSHOT_FIELDS)
+        server['id'] = server_id
+        removed.append(server)
+    return snapshot, added, modified, removed
+
+
+def main():
+    """
+    Main function
+
+    :returns: The servers added, modified or removed since the last run
+    """
+    module = AnsibleModule(
+        argument_spec=dict(
+            auth=dict(type='dict'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=True, type='list', elements='str'),
+            network_domain=dict(required=False, type='str'),
+            vlan=dict(required=False, type='str'),
+            feed=dict(required=False, default='default', type='str'),
+            reset=dict(required=False, default=False, type='bool')
+        ),
+        supports_check_mode=True
+    )
+
+    try:
+        credentials = get_credentials(module)
+    except ImportError as e:
+        module.fail_json(msg='{0}'.format(e))
+
+    if credentials is False:
+        module.fail_json(msg='Could not load the user credentials')
+
+    project_output(module, ['added', 'modified'], always=LISTING_FIELDS)
+    results = fan_out(module, credentials, lambda client, datacenter: get_servers(module, client, datacenter),
+                      entity='server')
+    if all(result is None for region, datacenter, result in results):
+        module.fail_json(msg='Failed to locate the Cloud Network Domain - {0}'.format(module.params.get('network_domain')))
+    servers = merge_results(results)
+
+    snapshots = NTTMCPFileCache('server_changes')
+    key = cache_key(credentials.get('user_id'), credentials.get('api_endpoint'), credentials.get('api_version'),
+                    sorted(unique(module.params.get('region'))), sorted(unique(module.params.get('datacenter'))),
+                    module.params.get('network_domain'), module.params.get('vlan'),
+                    sorted(module.params.get('fields') or []), module.params.get('feed'))
+    previous = None if module.params.get('reset') else snapshots.get(key)
+    snapshot, added, modified, removed = compare_servers(previous or {}, servers)
+    if not module.check_mode:
+        snapshots.set(key, snapshot, SERVER_CHANGES_TTL)
+
+    return_data = {
+        'added': added,
+        'modified': modified,
+        'removed': removed,
+        'count': len(added) + len(modified) + len(removed),
+        'total': len(servers),
+        'initial': previous is None
+    }
+    module.exit_json(changed=return_data['count'] > 0, data=return_data)
+
+
+if __name__ == '__main__':
+    main()
@@ -115,6 +115,13 @@ options:
         required: false
         type: int
         default: 30
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -149,10 +156,12 @@ msg:
     sample: The server with ID 36071cc0-02a0-46cf-b67c-64245e59e05d was successfully cloned to the new image with ID 71a365c4-f702-4e3c-ac11-34924aa36bf5
 '''
 
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_image, provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def wait_for_server(module, client, server_id):
@@ -164,25 +173,15 @@ def wait_for_server(module, client, server_id):
     :arg server_id: The name of the server
     :returns: True/False
     """
-    actual_state = False
-    time = 0
-    wait_time = module.params.get('wait_time')
-    server = dict()
-    while not actual_state and time < wait_time:
+    def check():
         try:
             server = client.get_server_by_id(server_id=server_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to find the server - {0}'.format(e))
+        return not server.get('progress'), server
 
-        try:
-            if not server.get('progress'):
-                actual_state = True
-        except (KeyError, IndexError):
-            pass
-        sleep(module.params.get('wait_poll_interval'))
-        time = time + module.params.get('wait_poll_interval')
-
-    if not server and time >= wait_time:
+    done, server = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'server_clone', client=client)
+    if not server and not done:
         module.fail_json(msg='Timeout waiting for the server to be cloned')
     return True
 
@@ -197,6 +196,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             server=dict(required=True, type='str'),
@@ -229,14 +229,13 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(network_domain_name, datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -137,6 +137,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -531,12 +538,14 @@ data:
             sample: my_server
 '''
 
-import traceback
 from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import SCSI_ADAPTER_TYPES
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_server_state
 
 CORE = {
     'module': None,
@@ -678,7 +687,8 @@ def server_command(module, client, server, command):
         module.fail_json(msg='Could not {0} the server - {1}'.format(command, e))
 
 
-def wait_for_server(module, client, name, datacenter, network_domain_id, state, check_for_start=False, check_for_stop=False, wait_poll_interval=None):
+def wait_for_server(module, client, name, datacenter, network_domain_id, state, check_for_start=False,
+                    check_for_stop=False, wait_poll_interval=None):
     """
     Wait for an operation on a server. Polls based on wait_time and wait_poll_interval values.
 
@@ -693,57 +703,13 @@ def wait_for_server(module, client, name, datacenter, network_domain_id, state,
     :arg wait_poll_interval: The time between polls
     :returns: The server dict
     """
-    set_state = False
-    actual_state = ''
-    start_state = ''
-    time = 0
-    vmtools_status = False
-    wait_for_vmtools = CORE.get('wait_for_vmtools')
-    wait_time = module.params.get('wait_time')
-    if wait_poll_interval is None:
-        wait_poll_interval = module.params.get('wait_poll_interval')
-    server = []
-    while not set_state and time < wait_time:
-        try:
-            servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
-        except NTTMCPAPIException as e:
-            module.fail_json(msg='Failed to get a list of servers - {0}'.format(e), exception=traceback.format_exc())
-        server = [x for x in servers if x['name'] == name]
-        # Check if VMTools has started - if the user as specified to wait for VMWare Tools to be running
-        try:
-            if wait_for_vmtools:
-                if server[0].get('guest').get('vmTools').get('runningStatus') == 'RUNNING':
-                    vmtools_status = True
-        except AttributeError:
-            pass
-        except IndexError:
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-        try:
-            actual_state = server[0]['state']
-            start_state = server[0]['started']
-        except (KeyError, IndexError) as e:
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-        if actual_state != state:
-            wait_required = True
-        elif check_for_start and not start_state:
-            wait_required = True
-        elif check_for_stop and start_state:
-            wait_required = True
-        elif wait_for_vmtools and not vmtools_status:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
+    server = wait_for_server_state(module, client, name=name, datacenter=datacenter, network_domain_id=network_domain_id,
+                                   state=state, check_for_start=check_for_start, check_for_stop=check_for_stop,
+                                   wait_for_vmtools=CORE.get('wait_for_vmtools'), wait_poll_interval=wait_poll_interval)
+    if server is None:
         module.fail_json(msg='Timeout waiting for the server to be created')
 
-    return server[0]
+    return server
 
 
 def main():
@@ -756,6 +722,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             server=dict(required=True, type='str'),
@@ -795,14 +762,13 @@ def main():
     if credentials is False:
         module.fail_json(msg='Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params.get('region'))
+    client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
 
     # Get the CND object based on the supplied name
     try:
         if network_domain_name is None:
             module.fail_json(msg='No network_domain or network_info.network_domain was provided')
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Failed to find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -174,6 +174,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -613,14 +620,17 @@ data:
             sample: my_server
 '''
 
-import traceback
 from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import (DISK_SPEEDS, IOPS_MULTIPLIER, DISK_CONTROLLER_TYPES,
                                                                         MAX_IOPS_PER_GB, MAX_DISK_SIZE, MAX_DISK_IOPS)
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_server_state
 
 CORE = {
     'module': None,
@@ -864,7 +874,7 @@ def compare_disk(module, existing_disk):
     if disk_iops:
         new_disk['iops'] = disk_iops
 
-    compare_result = compare_json(new_disk, existing_disk, None)
+    compare_result = diff_json(new_disk, existing_disk)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -1034,60 +1044,13 @@ def wait_for_server(module, client, name, datacenter, network_domain_id, state,
     :arg wait_poll_interval: The time between polls
     :returns: The server dict
     """
-    set_state = False
-    actual_state = ''
-    start_state = ''
-    time = 0
-    vmtools_status = False
-    wait_for_vmtools = CORE.get('wait_for_vmtools')
-    wait_time = module.params.get('wait_time')
-    wait_required = False
-    if wait_poll_interval is None:
-        wait_poll_interval = module.params.get('wait_poll_interval')
-    server = []
-    while not set_state and time < wait_time:
-        try:
-            servers = client.list_servers(datacenter=datacenter, network_domain_id=network_domain_id)
-        except NTTMCPAPIException as e:
-            module.fail_json(msg='Failed to get a list of servers - {0}'.format(e), exception=traceback.format_exc())
-        server = [x for x in servers if x['name'] == name]
-        # Check if VMTools has started - if the user as specified to wait for VMWare Tools to be running
-        try:
-            if wait_for_vmtools:
-                if server[0].get('guest').get('vmTools').get('runningStatus') == 'RUNNING':
-                    vmtools_status = True
-        except AttributeError:
-            pass
-        except IndexError:
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-        try:
-            if len(server) > 0:
-                actual_state = server[0]['state']
-                start_state = server[0]['started']
-        except (KeyError, IndexError):
-            module.fail_json(msg='Failed to find the server - {0}'.format(name))
-
-        if actual_state != state:
-            wait_required = True
-        elif check_for_start and not start_state:
-            wait_required = True
-        elif check_for_stop and start_state:
-            wait_required = True
-        elif wait_for_vmtools and not vmtools_status:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
+    server = wait_for_server_state(module, client, name=name, datacenter=datacenter, network_domain_id=network_domain_id,
+                                   state=state, check_for_start=check_for_start, check_for_stop=check_for_stop,
+                                   wait_for_vmtools=CORE.get('wait_for_vmtools'), wait_poll_interval=wait_poll_interval)
+    if server is None:
         module.fail_json(msg='Timeout waiting for the server to be created')
 
-    return server[0]
+    return server
 
 
 def main():
@@ -1100,6 +1063,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             server=dict(required=True, type='str'),
@@ -1147,7 +1111,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -1155,8 +1119,7 @@ def main():
     try:
         if network_domain_name is None:
             module.fail_json(msg='No network_domain or network_info.network_domain was provided')
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Failed to find the Cloud Network Domain: {0}'.format(network_domain_name))
 
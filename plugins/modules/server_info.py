@@ -54,15 +54,21 @@ options:
                   type: str
     region:
         description:
-            - The geographical region
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
         required: false
-        default: na
-        type: str
+        type: list
+        elements: str
+        default: [na]
     datacenter:
         description:
-            - The datacenter name
+            - The datacenter name or a list of datacenter names
+            - The datacenters are queried concurrently and the results are merged into one list. Each object is tagged
+              with the region it was found in
         required: true
-        type: str
+        type: list
+        elements: str
     network_domain:
         description:
             - The name of the Cloud Network Domain
@@ -84,6 +90,21 @@ options:
             - The UUID of the server
         required: false
         type: str
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -130,6 +151,10 @@ data:
             returned: success
             type: complex
             contains:
+                region:
+                    description: The region the object was found in
+                    type: str
+                    sample: na
                 started:
                     description: Is the server running
                     type: bool
@@ -464,93 +489,94 @@ data:
 '''
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
-from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
 
 
-def main():
+def get_servers(module, client, datacenter):
     """
-    Main function
+    Return the servers in a datacenter matching the module arguments
 
-    :returns: Server Information
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID
+    :returns: A list of servers or None if the Cloud Network Domain does not exist in the datacenter
     """
-    module = AnsibleModule(
-        argument_spec=dict(
-            auth=dict(type='dict'),
-            region=dict(default='na', type='str'),
-            datacenter=dict(required=True, type='str'),
-            network_domain=dict(required=False, type='str'),
-            vlan=dict(default=None, required=False, type='str'),
-            name=dict(required=False, type='str'),
-            id=dict(required=False, type='str')
-        ),
-        supports_check_mode=True
-    )
-
-    try:
-        credentials = get_credentials(module)
-    except ImportError as e:
-        module.fail_json(msg='{0}'.format(e))
-    return_data = return_object('server')
     name = module.params.get('name')
     server_id = module.params.get('id')
-    datacenter = module.params.get('datacenter')
     network_domain_name = module.params.get('network_domain')
     vlan_name = module.params.get('vlan')
     network_domain_id = vlan_id = None
 
-    # Check the region supplied is valid
-    regions = get_regions()
-    if module.params.get('region') not in regions:
-        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
-
-    if credentials is False:
-        module.fail_json(msg='Could not load the user credentials')
-
-    try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
-    except NTTMCPAPIException as e:
-        module.fail_json(msg=e.msg)
-
     # Get the CND object based on the supplied name
-    try:
-        if network_domain_name:
+    if network_domain_name:
+        try:
             network_domain = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
             network_domain_id = network_domain.get('id')
-        else:
-            network_domain_id = None
-        if network_domain_name and not network_domain:
-            module.fail_json(msg='Failed to locate the Cloud Network Domain - {0}'.format(network_domain_name))
-    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
-        module.fail_json(msg='Failed to locate the Cloud Network Domain - {0}'.format(network_domain_name))
+        except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+            return None
 
     # Get the VLAN object based on the supplied name
     try:
         if vlan_name:
-            vlan = client.get_vlan_by_name(name=vlan_name, datacenter=datacenter, network_domain_id=network_domain_id)
-            vlan_id = vlan.get('id')
-        else:
-            vlan_id = None
+            vlan_id = client.resolve_vlan_id(name=vlan_name, datacenter=datacenter, network_domain_id=network_domain_id)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
-        module.fail_json(msg='Failed to locate the VLAN - {0}'.format(vlan_name))
+        raise NTTMCPAPIException('Failed to locate the VLAN - {0}'.format(vlan_name))
 
     try:
         if server_id:
             server = client.get_server_by_id(server_id=server_id)
-            if server:
-                return_data['server'].append(server)
+            return [server] if server else []
         elif name:
             server = client.get_server_by_name(datacenter=datacenter,
                                                network_domain_id=network_domain_id,
                                                name=name)
-            if server:
-                return_data['server'].append(server)
-        else:
-            servers = client.list_servers(datacenter, network_domain_id, vlan_id, name)
-            return_data['server'] = servers
+            return [server] if server else []
+        return client.list_servers(datacenter, network_domain_id, vlan_id, name)
     except (KeyError, IndexError, AttributeError):
-        module.fail_json(msg='Could not find the server - {0} in {1}'.format(name, datacenter))
+        raise NTTMCPAPIException('Could not find the server - {0} in {1}'.format(name, datacenter))
+
+
+def main():
+    """
+    Main function
+
+    :returns: Server Information
+    """
+    module = AnsibleModule(
+        argument_spec=dict(
+            auth=dict(type='dict'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=True, type='list', elements='str'),
+            network_domain=dict(required=False, type='str'),
+            vlan=dict(default=None, required=False, type='str'),
+            name=dict(required=False, type='str'),
+            id=dict(required=False, type='str')
+        ),
+        supports_check_mode=True
+    )
+
+    try:
+        credentials = get_credentials(module)
+    except ImportError as e:
+        module.fail_json(msg='{0}'.format(e))
+    return_data = return_object('server')
+
+    if credentials is False:
+        module.fail_json(msg='Could not load the user credentials')
+
+    project_output(module, 'server')
+    results = fan_out(module, credentials, lambda client, datacenter: get_servers(module, client, datacenter),
+                      entity='server')
+    if all(result is None for region, datacenter, result in results):
+        module.fail_json(msg='Failed to locate the Cloud Network Domain - {0}'.format(module.params.get('network_domain')))
 
+    return_data['server'] = merge_results(results)
     return_data['count'] = len(return_data.get('server'))
 
     module.exit_json(data=return_data)
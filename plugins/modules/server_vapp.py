@@ -182,6 +182,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -338,8 +345,12 @@ from time import sleep
 import ast
 from operator import itemgetter
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def validate_vapp_args(module, client):
@@ -448,7 +459,7 @@ def compare_vapp(module, vapp):
         vapp['vAppProperty'] = old_vapp_props
         new_vapp['vAppProperty'] = sorted(new_vapp.get('vAppProperty'), key=itemgetter('key'))
         vapp['vAppProperty'] = sorted(vapp.get('vAppProperty'), key=itemgetter('key'))
-        compare_result = compare_json(new_vapp, vapp, None)
+        compare_result = diff_json(new_vapp, vapp)
         # Implement Check Mode
         if module.check_mode:
             module.exit_json(data=compare_result)
@@ -498,25 +509,15 @@ def wait_for_server(module, client, server_id):
     :arg server_id: The name of the server
     :returns: True/False
     """
-    actual_state = False
-    time = 0
-    wait_time = module.params.get('wait_time')
-    server = dict()
-    while not actual_state and time < wait_time:
+    def check():
         try:
             server = client.get_server_by_id(server_id=server_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to find the server - {0}'.format(e))
+        return server.get('state') == 'NORMAL', server
 
-        try:
-            if server.get('state') == 'NORMAL':
-                actual_state = True
-        except (KeyError, IndexError):
-            pass
-        sleep(module.params.get('wait_poll_interval'))
-        time = time + module.params.get('wait_poll_interval')
-
-    if not server and time >= wait_time:
+    done, server = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'server', client=client)
+    if not server and not done:
         module.fail_json(msg='Timeout waiting for the server to be cloned')
     return True
 
@@ -531,6 +532,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             server=dict(required=True, type='str'),
@@ -565,7 +567,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -573,8 +575,7 @@ def main():
     try:
         if network_domain_name is None:
             module.fail_json(msg='No network_domain or network_info.network_domain was provided')
-        network = client.get_network_domain_by_name(datacenter=datacenter, name=network_domain_name)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(datacenter=datacenter, name=network_domain_name)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Failed to find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -96,6 +96,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -147,6 +154,8 @@ msg:
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server, provider_snapshot  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def main():
@@ -158,6 +167,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=False, type='str'),
             network_domain=dict(required=False, default=None, type='str'),
             server=dict(required=False, default=None, type='str'),
@@ -190,7 +200,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -208,8 +218,7 @@ def main():
             else:
                 # Get the CND
                 try:
-                    network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-                    network_domain_id = network.get('id')
+                    network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
                 except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
                     module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(e))
 
@@ -91,6 +91,13 @@ options:
         required: false
         type: int
         default: 30
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -128,10 +135,12 @@ msg:
     type: str
     sample: "The Snapshot Preview server migration has successfully been deployed"
 '''
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server, provider_snapshot  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 CORE = {
     'region': None,
@@ -150,35 +159,18 @@ def wait_for_migration(module, client, server_id):
 
     :returns: The server dict
     """
-    state = 'NORMAL'
-    set_state = wait_required = False
-    actual_state = ''
-    time = 0
-    wait_time = module.params.get('wait_time')
-    wait_poll_interval = module.params.get('wait_poll_interval')
-    server = None
-    while not set_state and time < wait_time:
+    def check():
         try:
             server = client.get_server_by_id(server_id=server_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to get a list of servers - {0}'.format(e))
         try:
-            actual_state = server.get('state')
-        except (KeyError, IndexError):
+            return server.get('state') == 'NORMAL', server
+        except AttributeError:
             module.fail_json(msg='Failed to get the current state for the server with ID - {0}'.format(server_id))
 
-        if actual_state != state:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
+    done, server = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'snapshot', client=client)
+    if server and not done:
         return None
 
     return server
@@ -193,6 +185,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=False, default=None, type='str'),
             name=dict(required=True, type='str'),
@@ -218,7 +211,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -169,6 +169,13 @@ options:
         required: false
         type: bool
         default: false
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -227,10 +234,12 @@ msg:
     type: str
     sample: "The Snapshot Preview Server has successfully been deployed"
 '''
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server, provider_snapshot  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll, server_state_reached
 
 CORE = {
     'region': None,
@@ -357,49 +366,20 @@ def wait_for_snapshot(module, client, server_id, check_for_start=False):
 
     :returns: The server dict
     """
-    state = 'NORMAL'
-    set_state = vmtools_status = wait_required = False
-    actual_state = start_state = ''
-    time = 0
     wait_for_vmtools = module.params.get('wait_for_vmtools')
-    wait_time = module.params.get('wait_time')
-    wait_poll_interval = module.params.get('wait_poll_interval')
-    server = None
-    while not set_state and time < wait_time:
+
+    def check():
         try:
             server = client.get_server_by_id(server_id=server_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to get a list of servers - {0}'.format(e))
-
-        # Check if VMTools has started - if the user as specified to wait for VMWare Tools to be running
         try:
-            if wait_for_vmtools:
-                if server.get('guest', {}).get('vmTools', {}).get('runningStatus') == 'RUNNING':
-                    vmtools_status = True
+            return server_state_reached(server, 'NORMAL', check_for_start, False, wait_for_vmtools), server
         except AttributeError:
-            pass
-        try:
-            actual_state = server.get('state')
-            start_state = server.get('started')
-        except (KeyError, IndexError):
             module.fail_json(msg='Failed to get the current state for the server with ID - {0}'.format(server_id))
 
-        if actual_state != state:
-            wait_required = True
-        elif check_for_start and not start_state:
-            wait_required = True
-        elif wait_for_vmtools and not vmtools_status:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
-
-    if server and time >= wait_time:
+    done, server = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'snapshot', client=client)
+    if server and not done:
         return None
 
     return server
@@ -414,6 +394,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=False, default=None, type='str'),
             cluster=dict(required=False, default=None, type='str'),
@@ -446,7 +427,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
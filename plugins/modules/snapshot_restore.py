@@ -100,6 +100,13 @@ options:
         required: false
         type: int
         default: 30
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -142,10 +149,12 @@ msg:
     sample: Could not ascertain the status of the snapshot deletion. Check manually
 '''
 
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_server, provider_snapshot  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def wait_for_snapshot(module, client, server_id):
@@ -158,32 +167,15 @@ def wait_for_snapshot(module, client, server_id):
     :arg server_id: The UUID of the server
     :returns: True/False
     """
-    state = 'NORMAL'
-    set_state = False
-    actual_state = None
-    time = 0
-    wait_time = module.params.get('wait_time')
-    wait_required = False
-    wait_poll_interval = module.params.get('wait_poll_interval')
-    server = []
-    while not set_state and time < wait_time:
+    def check():
         try:
             server = client.get_server_by_id(server_id=server_id)
         except NTTMCPAPIException as e:
             module.fail_json(msg='Failed to check the server - {0}'.format(e))
-        actual_state = server.get('state')
-        if actual_state != state:
-            wait_required = True
-        else:
-            wait_required = False
-
-        if wait_required:
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
-        else:
-            set_state = True
+        return server.get('state') == 'NORMAL', server
 
-    if server and time >= wait_time:
+    done, server = poll(check, module.params.get('wait_time'), module.params.get('wait_poll_interval'), 'snapshot', client=client)
+    if server and not done:
         return False
 
     return True
@@ -198,6 +190,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             id=dict(required=True, type='str'),
             src_path=dict(required=True, type='str'),
             dst_path=dict(required=True, type='str'),
@@ -227,7 +220,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
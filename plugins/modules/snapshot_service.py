@@ -117,6 +117,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
     - Introduction to Cloud Server Snapshots - https://docs.mcp-services.net/x/DoBk
@@ -204,11 +211,14 @@ msg:
     type: str
 '''
 
-from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server, provider_snapshot  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 
 def enable_snapshot(module, client, server_id, plan, window_id, replication_mcp, take_snapshot):
@@ -290,33 +300,20 @@ def disable_replication(module, client, server_id):
     :arg server_id: The UUID of the server
     :returns: N/A
     """
-    state = 'NORMAL'
-    actual_state = None
-    set_state = False
-    wait_poll_interval = 5
-    wait_time = 120
-    time = 0
+    def check():
+        server = dict()
+        try:
+            server = client.get_server_by_id(server_id=server_id)
+        except NTTMCPAPIException as e:
+            module.warn(warning='Failed to check the server - {0}'.format(e))
+        return server.get('snapshotService', {}).get('state') == 'NORMAL', server
+
     try:
         result = client.disable_snapshot_replication(server_id)
         if result.get('responseCode') != 'IN_PROGRESS':
             raise NTTMCPAPIException(result.get('message', 'Generic Failure'))
         # Wait for the service replication state to become Normal before proceeding
-        while not set_state and time < wait_time:
-            try:
-                server = client.get_server_by_id(server_id=server_id)
-            except NTTMCPAPIException as e:
-                module.warn(warning='Failed to check the server - {0}'.format(e))
-            actual_state = server.get('snapshotService', {}).get('state')
-            if actual_state != state:
-                wait_required = True
-            else:
-                wait_required = False
-
-            if wait_required:
-                sleep(wait_poll_interval)
-                time = time + wait_poll_interval
-            else:
-                set_state = True
+        poll(check, 120, 5, client=client)
     except NTTMCPAPIException as e:
         module.fail_json(msg='Failed to disable snapshot replication - {0}'.format(e))
 
@@ -360,10 +357,9 @@ def compare_snapshot(module, snapshot_config):
         if module.params.get('plan') in ['ONE_MONTH', 'THREE_MONTH', 'TWELVE_MONTH']:
             new_config['window']['dayOfWeek'] = 'DAILY'
 
-    compare_result = compare_json(new_config, snapshot_config, None)
+    compare_result = diff_json(new_config, snapshot_config)
     # determine if the change is a service or replication or both change
-    consolidate_changes = compare_result.get('added')
-    consolidate_changes.update(compare_result.get('updated'))
+    consolidate_changes = set(compare_result.get('added')) | set(compare_result.get('updated'))
     if 'servicePlan' in consolidate_changes or 'window' in consolidate_changes:
         service_change = True
     if 'replicationTargetDatacenterId' in consolidate_changes:
@@ -403,6 +399,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=False, type='str'),
             network_domain_id=dict(required=False, type='str'),
@@ -440,15 +437,14 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     if server_id is None and network_domain_id is None:
         try:
-            network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-            network_domain_id = network.get('id')
+            network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
         except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
             module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(e))
 
@@ -100,6 +100,13 @@ options:
             - present
             - absent
             - restore
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -219,8 +226,11 @@ try:
 except ImportError:
     HAS_IPADDRESS = False
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -291,7 +301,7 @@ def compare_snat_exclusion(module, new_network_cidr, snat):
         new_snat['destinationIpv4NetworkAddress'] = str(new_network_cidr.network_address)
         new_snat['destinationIpv4PrefixSize'] = new_network_cidr.prefixlen
 
-    compare_result = compare_json(new_snat, snat, None)
+    compare_result = diff_json(new_snat, snat)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -308,6 +318,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             id=dict(default=None, required=False, type='str'),
@@ -340,7 +351,7 @@ def main():
     if credentials is False:
         module.fail_json(msg='Error: Could not load the user credentials')
 
-    client = NTTMCPClient(credentials, module.params['region'])
+    client = NTTMCPClient(credentials, module.params['region'], hooks=debug_timing(module))
 
     # Check to see the CIDR provided is valid
     if module.params.get('cidr'):
@@ -360,8 +371,7 @@ def main():
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (AttributeError, NTTMCPAPIException) as e:
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
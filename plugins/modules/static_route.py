@@ -99,6 +99,13 @@ options:
             - present
             - absent
             - restore
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -208,8 +215,11 @@ try:
 except ImportError:
     HAS_IPADDRESS = False
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -289,7 +299,7 @@ def compare_static_route(module, network_cidr, route):
     if module.params.get('next_hop'):
         new_route['nextHopAddress'] = module.params.get('next_hop')
 
-    compare_result = compare_json(new_route, route, None)
+    compare_result = diff_json(new_route, route)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -306,6 +316,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             name=dict(default=None, required=False, type='str'),
@@ -340,7 +351,7 @@ def main():
         module.fail_json(msg='Error: Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
@@ -353,8 +364,7 @@ def main():
 
     # Get a list of existing CNDs and check if the name already exists
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as e:
         module.fail_json(msg='Failed to get a list of Cloud Network Domains - {0}'.format(e))
 
@@ -146,6 +146,13 @@ options:
         choices:
             - present
             - absent
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -272,8 +279,11 @@ data:
 from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_user  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 
 
 def create_user(module, client):
@@ -454,7 +464,7 @@ def compare_user(module, user, full_compare):
     if module.params.get('custom_2'):
         new_user['customDefined2'] = module.params.get('custom_2')
 
-    compare_result = compare_json(new_user, user, None)
+    compare_result = diff_json(new_user, user)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -470,7 +480,7 @@ def compare_user_roles(module, roles):
 
     :returns: Compare result
     """
-    return compare_json({'role': module.params.get('roles')}, {'role': roles}, None)
+    return diff_json({'role': module.params.get('roles')}, {'role': roles})
 
 
 def main():
@@ -482,6 +492,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             username=dict(required=True, type='str'),
             my_user=dict(default=False, type='bool'),
             password=dict(required=False, type='str'),
@@ -518,7 +529,7 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
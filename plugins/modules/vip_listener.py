@@ -194,6 +194,13 @@ options:
             - present
             - absent
 
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Introduction to Virtual Listeners https://docs.mcp-services.net/x/CwIu
     - How to Create a Virtual Listener https://docs.mcp-services.net/x/7gM
@@ -283,8 +290,11 @@ msg:
 
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_vip  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import (VIP_LISTENER_TYPES, VIP_LISTENER_PRESERVATION, VIP_LISTENER_OPTOMIZATION)
 
 
@@ -583,7 +593,7 @@ def compare_vip_listener(module, client, network_domain_id, vip_listener):
             existing_vip_listener.get('irule').append(existing_irule.get('id'))
     new_vip_listener['irule'] = irule_id_list
 
-    compare_result = compare_json(new_vip_listener, existing_vip_listener, None)
+    compare_result = diff_json(new_vip_listener, existing_vip_listener)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -599,6 +609,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             id=dict(default=None, required=False, type='str'),
@@ -651,14 +662,13 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
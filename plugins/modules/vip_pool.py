@@ -149,6 +149,20 @@ options:
                     - Specified as an integer
                 required: true
                 type: int
+    concurrency:
+        description:
+            - The maximum number of member add/remove requests in flight at the same time
+        required: false
+        default: 4
+        type: int
+    rate_limit:
+        description:
+            - The maximum number of member add/remove requests started per second
+            - Use 0 for no limit
+            - A request rejected because the VIP Pool is busy is retried with a backoff
+        required: false
+        default: 5
+        type: int
     state:
         description:
             - The action to be performed
@@ -158,6 +172,13 @@ options:
             - present
             - absent
 
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
     - https://docs.mcp-services.net/x/5wMk
@@ -255,10 +276,13 @@ msg:
 '''
 
 from copy import deepcopy
-from time import sleep
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_vip  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.batch import run_batch
 from ansible_collections.nttmcp.mcp.plugins.module_utils.config import VIP_NODE_STATES, LOAD_BALANCING_METHODS, VIP_POOL_SERVICE_DOWN_ACTIONS
 
 
@@ -284,19 +308,13 @@ def create_vip_pool(module, client, network_domain_id):
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
         module.fail_json(msg='Could not create the VIP Pool - {0}'.format(exc))
 
-    try:
-        if members:
-            for member in members:
-                client.add_vip_pool_member(pool_result, member.get('id'), member.get('port'), member.get('status'))
-                # Introduce a pause in case the previous operation is still being processed
-                # also stops the API getting smashed
-                sleep(1)
-    except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
+    errors = update_vip_pool_members(module, client, pool_result, members, [])
+    if errors:
         module.fail_json(msg='The VIP Pool was created but there was a issue adding the members to the Pool. '
-                             'Check the list of member objects - {0}'.format(exc))
+                             'Check the list of member objects - {0}'.format(errors))
 
     try:
-        pool_result = client.get_vip_pool(pool_result.get('id'))
+        pool_result = client.get_vip_pool(pool_result)
     except (AttributeError, KeyError, NTTMCPAPIException):
         pass
 
@@ -320,54 +338,11 @@ def update_vip_pool(module, client, pool):
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
         module.fail_json(msg='Could not update the VIP Pool - {0}'.format(exc))
 
-    # The next code block is not exactly stellar but is required to handle schema differences between objects/dicts
-    # in order to be able to accurately compare two VIP pools and determine any differences
     if module.params.get('members'):
-        try:
-            updated_members = []
-            removed_members = []
-            added_members = []
-            for existing_member in pool.get('members'):
-                existing_member_found = False
-                for new_member in module.params.get('members'):
-                    if existing_member.get('node').get('id') == new_member.get('id'):
-                        existing_member_tmp = {}
-                        existing_member_tmp['id'] = existing_member.get('node').get('id')
-                        existing_member_tmp['port'] = existing_member.get('port')
-                        existing_member_tmp['status'] = existing_member.get('status')
-                        compare_result = compare_json(new_member, existing_member_tmp, None)
-                        if compare_result:
-                            if compare_result['changes']:
-                                # Save the actual pool member ID as it will be needed for the update
-                                new_member['member_id'] = existing_member.get('id')
-                                updated_members.append(new_member)
-                        existing_member_found = True
-                if not existing_member_found:
-                    removed_members.append(existing_member)
-            for new_member in module.params.get('members'):
-                new_member_found = False
-                for existing_member in pool.get('members'):
-                    if new_member.get('id') == existing_member.get('node').get('id'):
-                        new_member_found = True
-                if not new_member_found:
-                    added_members.append(new_member)
-
-            # Make the member changes. Induce a 0.5sec pause to stop the API from being spammed on large member lists
-            for member in removed_members:
-                client.remove_vip_pool_member(member.get('id'))
-                sleep(0.5)
-            for member in added_members:
-                client.add_vip_pool_member(pool_id, member.get('id'), member.get('port'), member.get('status'))
-                sleep(0.5)
-            for member in updated_members:
-                client.remove_vip_pool_member(member.get('member_id'))
-                sleep(0.5)
-                client.add_vip_pool_member(pool_id, member.get('id'), member.get('port'), member.get('status'))
-                sleep(0.5)
-
-        except (KeyError, IndexError, AttributeError, NTTMCPAPIException) as exc:
+        errors = update_vip_pool_members(module, client, pool_id, module.params.get('members'), pool.get('members'))
+        if errors:
             module.fail_json(msg='The VIP Pool was updated but there was a issue updating the members of the Pool. '
-                             'Check the list of member objects - {0}'.format(exc))
+                                 'Check the list of member objects - {0}'.format(errors))
 
     try:
         pool_result = client.get_vip_pool(pool_id).get('id')
@@ -376,6 +351,44 @@ def update_vip_pool(module, client, pool):
     module.exit_json(changed=True, data=pool_result)
 
 
+def update_vip_pool_members(module, client, pool_id, members, existing_members):
+    """
+    Make the VIP pool members match the list of members. Members are matched on the node UUID and port so only the
+    members that are missing, no longer required or have a different status are changed. A changed member is removed
+    and added again. The removes are made before the adds and each set of requests is run concurrently within the
+    concurrency and rate_limit arguments
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance
+    :arg pool_id: The UUID of the VIP pool
+    :arg members: The list of required members (dicts with id, port and status)
+    :arg existing_members: The list of existing pool members from the API
+    :returns: A list of error strings (empty on success)
+    """
+    concurrency = module.params.get('concurrency')
+    rate = module.params.get('rate_limit')
+    new = dict(((member.get('id'), member.get('port')), member) for member in members or [])
+    existing = dict(((member.get('node', {}).get('id'), member.get('port')), member) for member in existing_members or [])
+
+    remove = [existing[key].get('id') for key in sorted(set(existing) - set(new), key=str)]
+    add = [new[key] for key in sorted(set(new) - set(existing), key=str)]
+    for key in sorted(set(new) & set(existing), key=str):
+        if new[key].get('status') != existing[key].get('status'):
+            remove.append(existing[key].get('id'))
+            add.append(new[key])
+
+    errors = ['remove member {0}: {1}'.format(member_id, exc)
+              for member_id, result, exc in run_batch(client.remove_vip_pool_member, remove, concurrency, rate) if exc]
+    if errors:
+        return errors
+
+    def add_member(member):
+        return client.add_vip_pool_member(pool_id, member.get('id'), member.get('port'), member.get('status'))
+
+    return ['add member {0}:{1}: {2}'.format(member.get('id'), member.get('port'), exc)
+            for member, result, exc in run_batch(add_member, add, concurrency, rate) if exc]
+
+
 def delete_vip_pool(module, client, pool_id):
     """
     Delete a VIP pool
@@ -441,7 +454,8 @@ def verify_member_schema(module, client, network_domain_id):
     elif len(member_names) > 100:
         del member_names[100:]
     try:
-        nodes = client.list_vip_node(network_domain_id=network_domain_id)
+        node_ids = client.resolve_vip_node_ids(network_domain_id,
+                                               [x.get('name') for x in member_names if isinstance(x, dict) and x.get('name')])
         for member in member_names:
             if not isinstance(member, dict):
                 module.fail_json(msg='The members must be a YAML object/dictionary. Got {0}'.format(member))
@@ -454,7 +468,7 @@ def verify_member_schema(module, client, network_domain_id):
                     status = member.get('status')
                 else:
                     status = 'ENABLED'
-                member_id = [x for x in nodes if x['name'] == member.get('name')][0].get('id')
+                member_id = node_ids[member.get('name')]
                 if member_id:
                     members.append({'id': member_id, 'port': member.get('port'), 'status': status})
             else:
@@ -508,7 +522,7 @@ def compare_vip_pool(module, pool):
         existing_pool['members'] = existing_members
         new_pool['members'] = module.params.get('members')
 
-    compare_result = compare_json(new_pool, existing_pool, None)
+    compare_result = diff_json(new_pool, existing_pool)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -524,6 +538,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             id=dict(default=None, required=False, type='str'),
@@ -536,6 +551,8 @@ def main():
             service_down_action=dict(required=False, default='NONE', type='str'),
             slow_ramp_time=dict(required=False, default=10, type='int'),
             members=dict(default=None, required=False, type='list', elements='dict'),
+            concurrency=dict(required=False, default=4, type='int'),
+            rate_limit=dict(required=False, default=5, type='int'),
             state=dict(default='present', required=False, choices=['present', 'absent'])
         ),
         supports_check_mode=True
@@ -564,14 +581,13 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
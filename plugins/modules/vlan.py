@@ -146,6 +146,13 @@ options:
         required: false
         default: 10
         type: int
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -311,11 +318,14 @@ try:
     HAS_IPADDRESS = True
 except ImportError:
     HAS_IPADDRESS = False
-from time import sleep
 from copy import deepcopy
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object, compare_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
 from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.instrumentation import debug_timing
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import poll
 
 # Python3 workaround for unicode function so the same code can be used with ipaddress later
 try:
@@ -451,7 +461,7 @@ def compare_vlan(module, vlan):
     if module.params.get('detached_vlan_gw_ipv6'):
         new_vlan['ipv6GatewayAddress'] = module.params.get('detached_vlan_gw_ipv6')
 
-    compare_result = compare_json(new_vlan, vlan, None)
+    compare_result = diff_json(new_vlan, vlan)
     # Implement Check Mode
     if module.check_mode:
         module.exit_json(data=compare_result)
@@ -468,26 +478,19 @@ def delete_vlan(module, client, datacenter, network_domain_id, vlan_id):
     :arg network_domain_id: The UUID of the network domain
     :arg vlan_id: The UUID of the VLAN to delete
     """
-    vlan_exists = True
-    time = 0
-    wait_time = module.params['wait_time']
-    wait_poll_interval = module.params['wait_poll_interval']
-
     try:
         client.delete_vlan(vlan_id)
     except NTTMCPAPIException as exc:
         module.fail_json(msg='Could not delete the VLAN - {0}'.format(exc), exception=traceback.format_exc())
     if module.params['wait']:
-        while vlan_exists and time < wait_time:
+        def check():
             try:
                 vlans = client.list_vlans(datacenter=datacenter, network_domain_id=network_domain_id)
-                vlan_exists = [x for x in vlans if x['id'] == vlan_id]
+                return not [x for x in vlans if x['id'] == vlan_id], None
             except (KeyError, IndexError, NTTMCPAPIException):
-                pass
-            sleep(wait_poll_interval)
-            time = time + wait_poll_interval
+                return False, None
 
-        if vlan_exists and time >= wait_time:
+        if not poll(check, module.params['wait_time'], module.params['wait_poll_interval'], 'vlan', client=client)[0]:
             module.fail_json(msg='Timeout waiting for the VLAN to be deleted')
 
     module.exit_json(changed=True, msg='The VLAN has been successfully removed')
@@ -505,25 +508,17 @@ def wait_for_vlan(module, client, name, datacenter, network_domain_id, state):
     :arg state: The state to wait for e.g. NORMAL
     :returns: VIP Node object
     """
-    actual_state = ''
-    vlan = None
-    time = 0
-    wait_time = module.params['wait_time']
-    wait_poll_interval = module.params['wait_poll_interval']
-
-    while actual_state != state and time < wait_time:
+    def check():
         try:
             vlan = client.get_vlan_by_name(name=name, datacenter=datacenter, network_domain_id=network_domain_id)
         except NTTMCPAPIException as exc:
             module.fail_json(msg='Failed to get a list of VLANS - {0}'.format(exc), exception=traceback.format_exc())
-        try:
-            actual_state = vlan.get('state')
-        except (KeyError, IndexError):
+        if not vlan:
             module.fail_json(msg='Failed to find the VLAN - {0}'.format(name))
-        sleep(module.params['wait_poll_interval'])
-        time = time + wait_poll_interval
+        return vlan.get('state') == state, vlan
 
-    if vlan and time >= wait_time:
+    done, vlan = poll(check, module.params['wait_time'], module.params['wait_poll_interval'], 'vlan', client=client)
+    if not done:
         module.fail_json(msg='Timeout waiting for the VLAN to be created')
 
     return vlan
@@ -539,6 +534,7 @@ def main():
         argument_spec=dict(
             auth=dict(type='dict'),
             region=dict(default='na', type='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
             datacenter=dict(required=True, type='str'),
             network_domain=dict(required=True, type='str'),
             name=dict(required=True, type='str'),
@@ -579,14 +575,13 @@ def main():
         module.fail_json(msg='Could not load the user credentials')
 
     try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
+        client = NTTMCPClient(credentials, module.params.get('region'), hooks=debug_timing(module))
     except NTTMCPAPIException as e:
         module.fail_json(msg=e.msg)
 
     # Get the CND
     try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
+        network_domain_id = client.resolve_network_domain_id(name=network_domain_name, datacenter=datacenter)
     except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
         module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
 
@@ -54,15 +54,21 @@ options:
                   type: str
     region:
         description:
-            - The geographical region
+            - The geographical region or a list of regions
+            - With more than one region the API end-point of each region is used and each datacenter is
+              queried in the region it belongs to
         required: false
-        default: na
-        type: str
+        type: list
+        elements: str
+        default: [na]
     datacenter:
         description:
-            - The datacenter name e.g NA9
+            - The datacenter name e.g NA9 or a list of datacenter names
+            - The datacenters are queried concurrently and the results are merged into one list. Each object is tagged
+              with the region it was found in
         required: true
-        type: str
+        type: list
+        elements: str
     network_domain:
         description:
             - The name of the Cloud Network Domain
@@ -73,6 +79,21 @@ options:
             - The name of the VLAN. If a name is not provided the module will return a list of all VLANs in the network_domain
         required: false
         type: str
+    debug_timing:
+        description:
+            - Return a summary of the Cloud Control API calls made by the module as api_timing
+            - The summary contains the call count, p50/p95 latency, total bytes and a per end-point breakdown
+        required: false
+        type: bool
+        default: false
+    fields:
+        description:
+            - Only return these fields of each object, as dotted paths e.g. name or networkInfo.primaryNic.privateIpv4
+            - A path through a list applies to every element of the list
+            - Listed objects are reduced to the fields as each page of results arrives
+        required: false
+        type: list
+        elements: str
 notes:
     - Requires NTT Ltd. MCP account/credentials
 requirements:
@@ -120,6 +141,10 @@ data:
             returned: success
             type: complex
             contains:
+                region:
+                    description: The region the object was found in
+                    type: str
+                    sample: na
                 id:
                     description: VLAN ID
                     type: str
@@ -200,8 +225,39 @@ data:
                     type: bool
 '''
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, get_regions, return_object
-from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils.utils import get_credentials, return_object
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.module_utils.fanout import fan_out, merge_results
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import project_output
+
+
+def get_vlans(module, client, datacenter):
+    """
+    Return the VLANs in the Cloud Network Domain in a datacenter
+
+    :arg module: The Ansible module instance
+    :arg client: The CC API client instance for the region of the datacenter
+    :arg datacenter: The MCP ID
+    :returns: A list of VLANs or None if the Cloud Network Domain does not exist in the datacenter
+    """
+    name = module.params.get('name')
+
+    # Get the CND
+    try:
+        network_domain_id = client.resolve_network_domain_id(name=module.params.get('network_domain'),
+                                                             datacenter=datacenter)
+    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
+        return None
+
+    # Get a list of existing VLANs and check if the new name already exists
+    try:
+        vlans = client.list_vlans(datacenter=datacenter, network_domain_id=network_domain_id)
+    except NTTMCPAPIException as exc:
+        raise NTTMCPAPIException('Failed to get a list of VLANs - {0}'.format(exc))
+    if name:
+        return [x for x in vlans if x.get('name') == name]
+    return vlans
 
 
 def main():
@@ -212,8 +268,10 @@ def main():
     module = AnsibleModule(
         argument_spec=dict(
             auth=dict(type='dict'),
-            region=dict(default='na', type='str'),
-            datacenter=dict(required=True, type='str'),
+            region=dict(default=['na'], type='list', elements='str'),
+            debug_timing=dict(required=False, default=False, type='bool'),
+            fields=dict(required=False, type='list', elements='str'),
+            datacenter=dict(required=True, type='list', elements='str'),
             network_domain=dict(required=True, type='str'),
             name=dict(required=False, type='str')
         ),
@@ -225,43 +283,17 @@ def main():
     except ImportError as e:
         module.fail_json(msg='{0}'.format(e))
     return_data = return_object('vlan')
-    name = module.params.get('name')
-    datacenter = module.params.get('datacenter')
-    network_domain_name = module.params.get('network_domain')
-
-    # Check the region supplied is valid
-    regions = get_regions()
-    if module.params.get('region') not in regions:
-        module.fail_json(msg='Invalid region. Regions must be one of {0}'.format(regions))
 
     if credentials is False:
         module.fail_json(msg='Could not load the user credentials')
 
-    try:
-        client = NTTMCPClient(credentials, module.params.get('region'))
-    except NTTMCPAPIException as e:
-        module.fail_json(msg=e.msg)
-
-    # Get the CND
-    try:
-        network = client.get_network_domain_by_name(name=network_domain_name, datacenter=datacenter)
-        network_domain_id = network.get('id')
-    except (KeyError, IndexError, AttributeError, NTTMCPAPIException):
-        module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(network_domain_name))
-
-    # Get a list of existing VLANs and check if the new name already exists
-    try:
-        vlans = client.list_vlans(datacenter=datacenter, network_domain_id=network_domain_id)
-    except NTTMCPAPIException as exc:
-        module.fail_json(msg='Failed to get a list of VLANs - {0}'.format(exc))
-    try:
-        if name:
-            return_data['vlan'] = [x for x in vlans if x.get('name') == name]
-        else:
-            return_data['vlan'] = vlans
-    except (KeyError, IndexError, NTTMCPAPIException):
-        module.fail_json(msg='Could not find the VLAN - {0} in {1}'.format(name, datacenter))
+    project_output(module, 'vlan')
+    results = fan_out(module, credentials, lambda client, datacenter: get_vlans(module, client, datacenter),
+                      entity='vlan')
+    if all(result is None for region, datacenter, result in results):
+        module.fail_json(msg='Could not find the Cloud Network Domain: {0}'.format(module.params.get('network_domain')))
 
+    return_data['vlan'] = merge_results(results)
     return_data['count'] = len(return_data.get('vlan'))
 
     module.exit_json(data=return_data)
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Fixtures to run the provider and modules against the fake Cloud Control API
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+from contextlib import contextmanager
+
+import pytest
+
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible_collections.nttmcp.mcp.plugins.module_utils import wait
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_ENDPOINTS
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import (CaaSFake, CaaSAdapter, CaaSServer, FAKE_USER,
+                                                                  FAKE_PASSWORD, FAKE_API_VERSION, FAKE_EU_DATACENTERS)
+try:
+    from ansible.module_utils.testing import patch_module_args
+except ImportError:
+    @contextmanager
+    def patch_module_args(args=None):
+        saved = basic._ANSIBLE_ARGS
+        basic._ANSIBLE_ARGS = to_bytes(json.dumps({'ANSIBLE_MODULE_ARGS': args or {}}))
+        try:
+            yield
+        finally:
+            basic._ANSIBLE_ARGS = saved
+
+
+class AnsibleExitJson(Exception):
+    pass
+
+
+class AnsibleFailJson(Exception):
+    pass
+
+
+def exit_json(*args, **kwargs):
+    kwargs.setdefault('changed', False)
+    raise AnsibleExitJson(kwargs)
+
+
+def fail_json(*args, **kwargs):
+    kwargs['failed'] = True
+    raise AnsibleFailJson(kwargs)
+
+
+@pytest.fixture
+def caas_install(monkeypatch, tmp_path):
+    """
+    Return a function that points the provider at a CaaSFake. Every session the client creates has the fake mounted
+    for https://, the credentials come from the environment, the local cache is in a temporary directory and the
+    wait helpers poll quickly. Other fakes can be installed for specific hosts by passing a dict of fakes keyed on
+    host
+    """
+    def install(fake, hosts=None):
+        create_session = NTTMCPClient.create_session
+
+        def fake_session(self, *args, **kwargs):
+            session = create_session(self, *args, **kwargs)
+            session.mount('https://', CaaSAdapter(fake, hosts))
+            return session
+
+        monkeypatch.setattr(NTTMCPClient, 'create_session', fake_session)
+        monkeypatch.setenv('NTTMCP_USER', FAKE_USER)
+        monkeypatch.setenv('NTTMCP_PASSWORD', FAKE_PASSWORD)
+        monkeypatch.setenv('NTTMCP_API', fake.host)
+        monkeypatch.setenv('NTTMCP_API_VERSION', FAKE_API_VERSION)
+        monkeypatch.setenv('NTTMCP_CACHE_DIR', str(tmp_path / 'cache'))
+        monkeypatch.setattr(wait, 'POLL_MIN_INTERVAL', 0.01)
+        monkeypatch.setattr(wait, 'POLL_EXPECTED_DURATION', {})
+        return fake
+    return install
+
+
+@pytest.fixture
+def caas(caas_install):
+    """
+    A CaaSFake with the default datasets installed for the provider
+    """
+    return caas_install(CaaSFake())
+
+
+@pytest.fixture
+def caas_regions(caas_install):
+    """
+    Two CaaSFakes served on the na and eu API_ENDPOINTS hosts. The na fake has the FAKE_DATACENTERS and the eu fake
+    has the FAKE_EU_DATACENTERS. Returns a tuple of the (na, eu) fakes
+    """
+    na = CaaSFake(sizes={'server': 100}, host=API_ENDPOINTS['na']['host'])
+    eu = CaaSFake(sizes={'server': 50}, seed=1, host=API_ENDPOINTS['eu']['host'], datacenters=FAKE_EU_DATACENTERS)
+    caas_install(na, hosts={na.host: na, eu.host: eu})
+    return na, eu
+
+
+@pytest.fixture
+def client(caas):
+    """
+    An NTTMCPClient connected to the caas fixture
+    """
+    client = NTTMCPClient({'user_id': FAKE_USER, 'password': FAKE_PASSWORD, 'api_endpoint': caas.host,
+                           'api_version': FAKE_API_VERSION}, 'na')
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def run_module(monkeypatch):
+    """
+    Return a function that runs a module main() with the supplied arguments and returns the result dict passed to
+    exit_json or fail_json (with failed=True)
+    """
+    monkeypatch.setattr(basic.AnsibleModule, 'exit_json', exit_json)
+    monkeypatch.setattr(basic.AnsibleModule, 'fail_json', fail_json)
+
+    def run(module, args):
+        with patch_module_args(args):
+            try:
+                module.main()
+            except (AnsibleExitJson, AnsibleFailJson) as result:
+                return result.args[0]
+        raise AssertionError('{0} did not call exit_json or fail_json'.format(module.__name__))
+    return run
+
+
+@pytest.fixture(scope='session')
+def tls_cert(tmp_path_factory):
+    """
+    A self-signed certificate for localhost. Returns a tuple of (certificate file, key file)
+    """
+    x509 = pytest.importorskip('cryptography.x509')
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    import datetime
+    import ipaddress
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u'localhost')])
+    now = datetime.datetime.utcnow()
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+            .serial_number(x509.random_serial_number()).not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([x509.DNSName(u'localhost'),
+                                                        x509.IPAddress(ipaddress.ip_address(u'127.0.0.1'))]),
+                           critical=False)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .sign(key, hashes.SHA256()))
+    path = tmp_path_factory.mktemp('tls')
+    cert_file = path / 'cert.pem'
+    key_file = path / 'key.pem'
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                           serialization.NoEncryption()))
+    return str(cert_file), str(key_file)
+
+
+@pytest.fixture
+def caas_server(monkeypatch, tmp_path, tls_cert):
+    """
+    A CaaSFake with small datasets served over HTTPS on a local port. The provider connects to it over the network so
+    connections and TLS handshakes are real and counted
+    """
+    fake = CaaSFake(sizes={'server': 600, 'firewallRule': 300})
+    with CaaSServer(fake, *tls_cert) as server:
+        monkeypatch.setenv('REQUESTS_CA_BUNDLE', tls_cert[0])
+        monkeypatch.setenv('NTTMCP_USER', FAKE_USER)
+        monkeypatch.setenv('NTTMCP_PASSWORD', FAKE_PASSWORD)
+        monkeypatch.setenv('NTTMCP_API', server.host)
+        monkeypatch.setenv('NTTMCP_API_VERSION', FAKE_API_VERSION)
+        monkeypatch.setenv('NTTMCP_CACHE_DIR', str(tmp_path / 'cache'))
+        yield server
@@ -0,0 +1,721 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# In-process fake of the Cloud Control (CaaS) REST API used by the unit tests and benchmarks
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+import copy
+import json
+import random
+import ssl
+import threading
+import uuid
+from fnmatch import fnmatch
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from ansible.module_utils.six.moves import BaseHTTPServer, socketserver
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, parse_qs
+
+FAKE_HOST = 'api-fake.mcp-services.net'
+FAKE_API_VERSION = '2.11'
+FAKE_USER = 'fake_user'
+FAKE_PASSWORD = 'fake_password'
+FAKE_ORG_ID = '11111111-2222-3333-4444-555555555555'
+FAKE_DATACENTERS = ['NA9', 'NA12']
+# The name of the OS image in each datacenter
+FAKE_IMAGE = 'Ubuntu 18.04 64-bit'
+# The datacenters of a second (eu) region fake
+FAKE_EU_DATACENTERS = ['EU6']
+
+# The number of seeded objects of each type
+DEFAULT_SIZES = {
+    'networkDomain': 20,
+    'vlan': 200,
+    'server': 3000,
+    'firewallRule': 2000,
+    'ipAddressList': 200,
+    'portList': 200,
+    'natRule': 500,
+    'publicIpBlock': 40,
+    'node': 400,
+    'pool': 60,
+    'poolMember': 600,
+    'virtualListener': 60,
+}
+
+# The collection URL (relative to the org base URL) of each object type
+COLLECTIONS = {
+    'infrastructure/datacenter': 'datacenter',
+    'image/osImage': 'osImage',
+    'network/networkDomain': 'networkDomain',
+    'network/vlan': 'vlan',
+    'server/server': 'server',
+    'network/firewallRule': 'firewallRule',
+    'network/ipAddressList': 'ipAddressList',
+    'network/portList': 'portList',
+    'network/natRule': 'natRule',
+    'network/publicIpBlock': 'publicIpBlock',
+    'networkDomainVip/node': 'node',
+    'networkDomainVip/pool': 'pool',
+    'networkDomainVip/poolMember': 'poolMember',
+    'networkDomainVip/virtualListener': 'virtualListener',
+    'networkDomainVip/defaultHealthMonitor': 'defaultHealthMonitor',
+    'networkDomainVip/defaultPersistenceProfile': 'defaultPersistenceProfile',
+    'networkDomainVip/defaultIrule': 'defaultIrule',
+}
+
+# Query parameters that filter on a nested field. Any other parameter filters on the top level field of the same name
+FILTER_PATHS = {
+    'vlan': {'networkDomainId': 'networkDomain.id'},
+    'server': {'networkDomainId': 'networkInfo.networkDomainId', 'vlanId': 'networkInfo.primaryNic.vlanId'},
+    'poolMember': {'poolId': 'pool.id', 'nodeId': 'node.id'},
+    'ipAddressList': {'ipVersion': 'ipVersion'},
+}
+PAGING_PARAMS = ['pageSize', 'pageNumber', 'orderBy']
+# Query parameters that filter on the UUID of a parent object. A listing filtered on a parent that does not exist
+# returns RESOURCE_NOT_FOUND
+PARENT_FILTERS = ['networkDomainId', 'vlanId']
+
+# Object types where changes are asynchronous. Objects are left in a PENDING_* state until transition_time passes
+ASYNC_TYPES = ['networkDomain', 'vlan', 'server']
+
+# POST actions: action name -> (operation, object type)
+ACTIONS = {
+    'deployNetworkDomain': ('create', 'networkDomain'),
+    'editNetworkDomain': ('edit', 'networkDomain'),
+    'deleteNetworkDomain': ('delete', 'networkDomain'),
+    'deployVlan': ('create', 'vlan'),
+    'editVlan': ('edit', 'vlan'),
+    'deleteVlan': ('delete', 'vlan'),
+    'deployServer': ('create', 'server'),
+    'deleteServer': ('delete', 'server'),
+    'startServer': ('start', 'server'),
+    'shutdownServer': ('stop', 'server'),
+    'powerOffServer': ('stop', 'server'),
+    'disableReplication': ('disable_replication', 'server'),
+    'createFirewallRule': ('create', 'firewallRule'),
+    'editFirewallRule': ('edit', 'firewallRule'),
+    'deleteFirewallRule': ('delete', 'firewallRule'),
+    'createIpAddressList': ('create', 'ipAddressList'),
+    'editIpAddressList': ('edit', 'ipAddressList'),
+    'deleteIpAddressList': ('delete', 'ipAddressList'),
+    'createPortList': ('create', 'portList'),
+    'editPortList': ('edit', 'portList'),
+    'deletePortList': ('delete', 'portList'),
+    'createNatRule': ('create', 'natRule'),
+    'deleteNatRule': ('delete', 'natRule'),
+    'addPublicIpBlock': ('create', 'publicIpBlock'),
+    'removePublicIpBlock': ('delete', 'publicIpBlock'),
+    'createNode': ('create', 'node'),
+    'editNode': ('edit', 'node'),
+    'deleteNode': ('delete', 'node'),
+    'createPool': ('create', 'pool'),
+    'editPool': ('edit', 'pool'),
+    'deletePool': ('delete', 'pool'),
+    'addPoolMember': ('create', 'poolMember'),
+    'removePoolMember': ('delete', 'poolMember'),
+    'createVirtualListener': ('create', 'virtualListener'),
+    'editVirtualListener': ('edit', 'virtualListener'),
+    'deleteVirtualListener': ('delete', 'virtualListener'),
+}
+
+
+def get_path(obj, path):
+    """
+    Return the value of a dotted path in a nested dict
+
+    :arg obj: The dict
+    :arg path: The dotted path e.g. networkInfo.primaryNic.vlanId
+    :returns: The value or None
+    """
+    for key in path.split('.'):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def filter_value(value):
+    """
+    Return the string form of a field value as it would appear in a query string
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return '{0}'.format(value)
+
+
+class CaaSFake():
+    """
+    A fake of the Cloud Control API holding seeded datasets of every object type the provider uses. Listings are
+    paged (pageSize, pageNumber and totalCount) and filtered on the query parameters, POST actions create, edit and
+    delete objects and changes to asynchronous object types move from PENDING_ADD, PENDING_CHANGE or PENDING_DELETE to
+    NORMAL (or are removed) once transition_time seconds have passed. Every request is delayed by latency seconds.
+    The fake is thread safe so it can serve concurrent page requests
+    """
+    def __init__(self, sizes=None, seed=0, latency=0, transition_time=0.05, host=FAKE_HOST, datacenters=None):
+        """
+        :kw sizes: dict of the number of objects to seed for each type (merged with DEFAULT_SIZES)
+        :kw datacenters: The list of datacenter IDs (defaults to FAKE_DATACENTERS)
+        :kw seed: The random seed for the datasets
+        :kw latency: The number of seconds each request takes
+        :kw transition_time: The number of seconds an asynchronous object stays in a PENDING_* state
+        :kw host: The API host name returned as the home geo of the user
+        """
+        self.sizes = dict(DEFAULT_SIZES)
+        self.sizes.update(sizes or {})
+        self.random = random.Random(seed)
+        self.latency = latency
+        self.transition_time = transition_time
+        self.host = host
+        self.datacenters = list(datacenters or FAKE_DATACENTERS)
+        self.lock = threading.Lock()
+        self.data = dict((object_type, []) for object_type in COLLECTIONS.values())
+        self.index = {}
+        self.pending = {}
+        self.calls = []
+        self.seed()
+
+    """
+    Datasets
+    """
+
+    def new_id(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def add(self, object_type, obj):
+        """
+        Add an object to the dataset
+
+        :arg object_type: The object type e.g. vlan
+        :arg obj: The object dict. An id is generated if the object does not have one
+        :returns: The object
+        """
+        obj.setdefault('id', self.new_id())
+        self.data[object_type].append(obj)
+        self.index[obj['id']] = (object_type, obj)
+        return obj
+
+    def remove(self, obj_id):
+        """
+        Remove an object from the dataset
+
+        :arg obj_id: The UUID of the object
+        """
+        object_type, obj = self.index.pop(obj_id, (None, None))
+        if obj is not None:
+            self.data[object_type].remove(obj)
+        self.pending.pop(obj_id, None)
+
+    def find(self, object_type, **fields):
+        """
+        Return the objects of a type with matching top level fields
+        """
+        return [obj for obj in self.data[object_type] if all(obj.get(k) == v for k, v in fields.items())]
+
+    def seed(self):
+        """
+        Build the seeded datasets. Objects are spread evenly over the Cloud Network Domains and the Cloud Network
+        Domains over the datacenters
+        """
+        rnd = self.random
+        for dc in self.datacenters:
+            self.add('datacenter', {'id': dc, 'displayName': 'Fake {0}'.format(dc), 'city': 'Fake', 'country': 'US',
+                                    'type': 'MCP 2.0'})
+            # Fixed IDs so adding the images does not change the random datasets
+            self.add('osImage', {'id': str(uuid.uuid5(uuid.NAMESPACE_URL, dc)), 'name': FAKE_IMAGE, 'datacenterId': dc,
+                                 'guest': {'operatingSystem': {'id': 'UBUNTU1864', 'family': 'UNIX'}},
+                                 'scsiController': [{'id': str(uuid.uuid5(uuid.NAMESPACE_URL, dc + '/scsi')),
+                                                     'adapterType': 'LSI_LOGIC_PARALLEL', 'busNumber': 0,
+                                                     'disk': [{'id': str(uuid.uuid5(uuid.NAMESPACE_URL, dc + '/disk')),
+                                                               'scsiId': 0, 'sizeGb': 10, 'speed': 'STANDARD'}]}]})
+        for i, name in enumerate(['CCPA_HTTP', 'CCPA_HTTPS', 'CCPA_ICMP', 'CCPA_TCP']):
+            self.add('defaultHealthMonitor', {'name': name, 'nodeCompatible': i > 1, 'poolCompatible': True})
+        for name in ['CCPA_DESTINATION_ADDRESS', 'CCPA_SOURCE_ADDRESS', 'CCPA_COOKIE']:
+            self.add('defaultPersistenceProfile', {'name': name, 'fallbackCompatible': True})
+        for name in ['CCPA_HTTP_REDIRECT', 'CCPA_X_FORWARDED_FOR']:
+            self.add('defaultIrule', {'name': name})
+
+        domains = [self.network_domain('cnd_{0:03d}'.format(i), self.datacenters[i % len(self.datacenters)])
+                   for i in range(self.sizes['networkDomain'])]
+        if not domains:
+            return
+        vlans = [self.vlan('vlan_{0:04d}'.format(i), domains[i % len(domains)], '10.{0}.{1}.0'.format(i // 256, i % 256))
+                 for i in range(self.sizes['vlan'])]
+        for i in range(self.sizes['server']):
+            vlan = vlans[i % len(vlans)] if vlans else None
+            self.server('server_{0:05d}'.format(i), domains[i % len(domains)] if not vlan else
+                        self.index[vlan['networkDomain']['id']][1], vlan, started=rnd.random() > 0.1)
+        for i in range(self.sizes['firewallRule']):
+            domain = domains[i % len(domains)]
+            self.add('firewallRule', {
+                'name': 'rule_{0:05d}'.format(i), 'action': rnd.choice(['ACCEPT_DECISIVELY', 'DROP']),
+                'ipVersion': 'IPV4', 'protocol': rnd.choice(['TCP', 'UDP', 'IP']), 'enabled': True,
+                'source': {'ip': {'address': 'ANY'}}, 'ruleType': 'CLIENT_RULE', 'state': 'NORMAL',
+                'destination': {'ip': {'address': '10.0.{0}.{1}'.format(i // 256 % 256, i % 256)},
+                                'port': {'begin': rnd.randint(1, 65535)}},
+                'networkDomainId': domain['id'],
+                'datacenterId': domain['datacenterId']})
+        for i in range(self.sizes['ipAddressList']):
+            domain = domains[i % len(domains)]
+            self.add('ipAddressList', {
+                'name': 'ip_list_{0:04d}'.format(i), 'description': 'Fake IP address list', 'ipVersion': 'IPV4',
+                'ipAddress': [{'begin': '10.1.{0}.{1}'.format(i % 256, x)} for x in range(1, 5)],
+                'childIpAddressList': [], 'state': 'NORMAL', 'networkDomainId': domain['id'],
+                'createTime': '2019-01-01T00:00:00.000Z'})
+        for i in range(self.sizes['portList']):
+            domain = domains[i % len(domains)]
+            self.add('portList', {
+                'name': 'port_list_{0:04d}'.format(i), 'description': 'Fake port list',
+                'port': [{'begin': 8000 + x, 'end': 8010 + x} for x in range(3)], 'childPortList': [],
+                'state': 'NORMAL', 'networkDomainId': domain['id'], 'createTime': '2019-01-01T00:00:00.000Z'})
+        for i in range(self.sizes['publicIpBlock']):
+            domain = domains[i % len(domains)]
+            self.add('publicIpBlock', {
+                'baseIp': '203.0.{0}.{1}'.format(i // 128 % 256, i * 2 % 256), 'size': 2, 'state': 'NORMAL',
+                'networkDomainId': domain['id'], 'datacenterId': domain['datacenterId']})
+        for i in range(self.sizes['natRule']):
+            domain = domains[i % len(domains)]
+            self.add('natRule', {
+                'internalIp': '10.2.{0}.{1}'.format(i // 256 % 256, i % 256),
+                'externalIp': '198.51.{0}.{1}'.format(i // 256 % 256, i % 256), 'state': 'NORMAL',
+                'networkDomainId': domain['id'], 'datacenterId': domain['datacenterId']})
+        nodes = []
+        for i in range(self.sizes['node']):
+            domain = domains[i % len(domains)]
+            nodes.append(self.add('node', {
+                'name': 'node_{0:04d}'.format(i), 'description': 'Fake VIP node',
+                'ipv4Address': '10.3.{0}.{1}'.format(i // 256 % 256, i % 256), 'status': 'ENABLED',
+                'connectionLimit': 100000, 'connectionRateLimit': 4000, 'healthMonitor': {}, 'state': 'NORMAL',
+                'networkDomainId': domain['id'], 'datacenterId': domain['datacenterId']}))
+        pools = []
+        for i in range(self.sizes['pool']):
+            domain = domains[i % len(domains)]
+            pools.append(self.add('pool', {
+                'name': 'pool_{0:03d}'.format(i), 'description': 'Fake VIP pool', 'loadBalanceMethod': 'ROUND_ROBIN',
+                'serviceDownAction': 'NONE', 'slowRampTime': 10, 'healthMonitor': [], 'state': 'NORMAL',
+                'networkDomainId': domain['id'], 'datacenterId': domain['datacenterId']}))
+        for i in range(self.sizes['poolMember'] if pools else 0):
+            pool = pools[i % len(pools)]
+            candidates = [node for node in nodes if node['networkDomainId'] == pool['networkDomainId']]
+            if candidates:
+                self.pool_member(pool, candidates[(i // len(pools)) % len(candidates)], 80 + i // len(pools), 'ENABLED')
+        for i in range(self.sizes['virtualListener'] if pools else 0):
+            pool = pools[i % len(pools)]
+            self.add('virtualListener', {
+                'name': 'listener_{0:03d}'.format(i), 'description': 'Fake virtual listener', 'type': 'STANDARD',
+                'protocol': 'TCP', 'listenerIpAddress': '203.0.113.{0}'.format(i % 256), 'port': 443,
+                'enabled': True, 'state': 'NORMAL', 'pool': {'id': pool['id'], 'name': pool['name']},
+                'networkDomainId': pool['networkDomainId'], 'datacenterId': pool['datacenterId']})
+
+    def network_domain(self, name, datacenter, state='NORMAL', description=None, network_type='ADVANCED'):
+        return self.add('networkDomain', {
+            'name': name, 'description': description or 'Fake Cloud Network Domain', 'type': network_type,
+            'snatIpv4Address': '198.51.100.{0}'.format(len(self.data['networkDomain']) % 256),
+            'outsideTransitVlanIpv4Subnet': {'ipAddress': '100.64.0.0', 'prefixSize': 24}, 'state': state,
+            'datacenterId': datacenter, 'createTime': '2019-01-01T00:00:00.000Z'})
+
+    def vlan(self, name, domain, address, prefix=24, state='NORMAL', description=None, gateway='LOW'):
+        return self.add('vlan', {
+            'name': name, 'description': description or 'Fake VLAN',
+            'networkDomain': {'id': domain['id'], 'name': domain['name']},
+            'privateIpv4Range': {'address': address, 'prefixSize': int(prefix)},
+            'ipv4GatewayAddress': address.rsplit('.', 1)[0] + '.1',
+            'ipv6Range': {'address': '2001:db8:{0:x}::'.format(len(self.data['vlan'])), 'prefixSize': 64},
+            'ipv6GatewayAddress': '2001:db8:{0:x}::1'.format(len(self.data['vlan'])), 'gatewayAddressing': gateway,
+            'attachedVlan': {'gatewayAddressing': gateway}, 'state': state, 'datacenterId': domain['datacenterId'],
+            'createTime': '2019-01-01T00:00:00.000Z'})
+
+    def server(self, name, domain, vlan, state='NORMAL', started=True, description=None):
+        rnd = self.random
+        count = len(self.data['server'])
+        return self.add('server', {
+            'name': name, 'description': description or 'Fake server', 'datacenterId': domain['datacenterId'],
+            'state': state, 'started': started, 'deployed': True, 'createTime': '2019-01-01T00:00:00.000Z',
+            'cpu': {'count': rnd.choice([1, 2, 4, 8]), 'speed': 'STANDARD', 'coresPerSocket': 1},
+            'memoryGb': rnd.choice([2, 4, 8, 16]),
+            'source': {'type': 'IMAGE_ID', 'value': self.new_id()},
+            'guest': {'operatingSystem': {'id': 'UBUNTU1864', 'displayName': 'UBUNTU18/64', 'family': 'UNIX'},
+                      'osCustomization': True, 'vmTools': {'type': 'VMWARE_TOOLS', 'runningStatus': 'RUNNING'}},
+            'scsiController': [{'id': self.new_id(), 'adapterType': 'LSI_LOGIC_PARALLEL', 'key': 1000, 'busNumber': 0,
+                                'state': 'NORMAL',
+                                'disk': [{'id': self.new_id(), 'scsiId': x, 'sizeGb': 10 * (x + 1),
+                                          'speed': 'STANDARD', 'state': 'NORMAL'} for x in range(2)]}],
+            'networkInfo': {
+                'networkDomainId': domain['id'],
+                'primaryNic': {'id': self.new_id(), 'privateIpv4': '10.{0}.{1}.{2}'.format(
+                    count // 65536 % 256, count // 256 % 256, count % 256 or 1),
+                    'ipv6': '2001:db8::{0:x}'.format(count), 'networkAdapter': 'VMXNET3', 'state': 'NORMAL',
+                    'vlanId': vlan['id'] if vlan else None, 'vlanName': vlan['name'] if vlan else None,
+                    'macAddress': '00:50:56:{0:02x}:{1:02x}:{2:02x}'.format(count >> 16 & 255, count >> 8 & 255,
+                                                                            count & 255)},
+                'additionalNic': []},
+            'snapshotService': None,
+            'tag': [{'tagKeyName': 'env', 'value': rnd.choice(['prod', 'dev', 'test'])}]})
+
+    def pool_member(self, pool, node, port, status):
+        return self.add('poolMember', {
+            'pool': {'id': pool['id'], 'name': pool['name']},
+            'node': {'id': node['id'], 'name': node['name'], 'ipAddress': node['ipv4Address'],
+                     'status': node['status']},
+            'port': port, 'status': status, 'state': 'NORMAL', 'networkDomainId': pool['networkDomainId'],
+            'datacenterId': pool['datacenterId']})
+
+    """
+    Request handling
+    """
+
+    def handle(self, method, path, query=None, body=None, auth=None):
+        """
+        Handle an API request
+
+        :arg method: GET or POST
+        :arg path: The URL path e.g. /caas/2.11/<org_id>/network/vlan
+        :kw query: dict of query parameters (values may be lists as returned by parse_qs)
+        :kw body: The request body (bytes or text) for a POST
+        :kw auth: The value of the Authorization header
+        :returns: A tuple of (HTTP status code, JSON response body as bytes)
+        """
+        if self.latency:
+            sleep(self.latency)
+        query = dict((k, v[-1] if isinstance(v, list) else v) for k, v in (query or {}).items())
+        with self.lock:
+            self.calls.append((method, path, query))
+            status, payload = self.dispatch(method, path, query, body, auth)
+            # Serialized while holding the lock so the response is a snapshot of the objects
+            return status, json.dumps(payload).encode('utf-8')
+
+    def dispatch(self, method, path, query, body, auth):
+        if auth != self.auth_header():
+            return 401, {'responseCode': 'UNAUTHORIZED', 'message': 'Authentication failed'}
+        self.settle()
+        parts = path.strip('/').split('/')
+        if parts[:1] != ['caas'] or len(parts) < 4:
+            return self.error(404, 'UNSUPPORTED_ENDPOINT', path)
+        if parts[2:] == ['user', 'myUser']:
+            return 200, self.my_user()
+        if parts[2] != FAKE_ORG_ID:
+            return self.error(400, 'UNAUTHORIZED', 'Unknown org {0}'.format(parts[2]))
+        resource = '/'.join(parts[3:])
+        if method == 'GET':
+            return self.get(resource, query)
+        try:
+            params = json.loads(body or '{}')
+        except ValueError:
+            return self.error(400, 'INVALID_INPUT_DATA', 'The request body is not valid JSON')
+        return self.post(resource, params)
+
+    def auth_header(self):
+        token = base64.b64encode('{0}:{1}'.format(FAKE_USER, FAKE_PASSWORD).encode('utf-8')).decode('ascii')
+        return 'Basic {0}'.format(token)
+
+    def error(self, status, code, message):
+        return status, {'operation': None, 'responseCode': code, 'message': message, 'requestId': self.new_id()}
+
+    def my_user(self):
+        return {'userName': FAKE_USER, 'firstName': 'Fake', 'lastName': 'User', 'emailAddress': 'fake@example.com',
+                'organization': {'id': FAKE_ORG_ID, 'name': 'Fake Org', 'homeGeoApiHost': self.host},
+                'role': [{'name': 'primary administrator'}]}
+
+    def settle(self):
+        """
+        Move asynchronous objects whose transition time has passed out of their PENDING_* state
+        """
+        now = monotonic()
+        for obj_id, ready in list(self.pending.items()):
+            if ready > now:
+                continue
+            del self.pending[obj_id]
+            object_type, obj = self.index.get(obj_id, (None, None))
+            if obj is None:
+                continue
+            if obj.get('state') == 'PENDING_DELETE':
+                self.remove(obj_id)
+            else:
+                obj['state'] = 'NORMAL'
+                if (obj.get('snapshotService') or {}).get('state') == 'PENDING_CHANGE':
+                    obj['snapshotService']['state'] = 'NORMAL'
+
+    def matches(self, object_type, obj, query):
+        paths = FILTER_PATHS.get(object_type, {})
+        for key, value in query.items():
+            if key in PAGING_PARAMS:
+                continue
+            if key.endswith('.LIKE'):
+                key = key[:-5]
+                pattern = value
+            else:
+                pattern = None
+            field = get_path(obj, paths.get(key, key))
+            if field is None:
+                return False
+            if pattern is not None:
+                if not fnmatch(filter_value(field).lower(), pattern.lower()):
+                    return False
+            elif filter_value(field) != value:
+                return False
+        return True
+
+    def get(self, resource, query):
+        object_type = COLLECTIONS.get(resource)
+        if object_type is not None:
+            for key in PARENT_FILTERS:
+                if key in query and query[key] not in self.index:
+                    return self.error(400, 'RESOURCE_NOT_FOUND', '{0} {1} not found'.format(key[:-2], query[key]))
+            items = [obj for obj in self.data[object_type] if self.matches(object_type, obj, query)]
+            page_size = int(query.get('pageSize', 250))
+            page_number = int(query.get('pageNumber', 1))
+            page = items[(page_number - 1) * page_size:page_number * page_size]
+            return 200, {object_type: page, 'pageNumber': page_number, 'pageCount': len(page),
+                         'totalCount': len(items), 'pageSize': page_size}
+        collection, dummy, obj_id = resource.rpartition('/')
+        object_type = COLLECTIONS.get(collection)
+        if object_type is None:
+            return self.error(404, 'UNSUPPORTED_ENDPOINT', resource)
+        found_type, obj = self.index.get(obj_id, (None, None))
+        if obj is None or found_type != object_type:
+            return self.error(400, 'RESOURCE_NOT_FOUND', '{0} {1} not found'.format(object_type, obj_id))
+        return 200, obj
+
+    def post(self, resource, params):
+        action = resource.rsplit('/', 1)[-1]
+        if action not in ACTIONS:
+            return self.error(400, 'UNSUPPORTED_OPERATION', 'The fake does not support {0}'.format(resource))
+        operation, object_type = ACTIONS[action]
+        asynchronous = object_type in ASYNC_TYPES
+        if operation == 'create':
+            obj = self.create(object_type, params)
+            if isinstance(obj, tuple):
+                return obj
+            if asynchronous:
+                obj['state'] = 'PENDING_ADD'
+                self.pending[obj['id']] = monotonic() + self.transition_time
+        else:
+            obj_id = params.get('id') or params.get('serverId')
+            found_type, obj = self.index.get(obj_id, (None, None))
+            if obj is None or found_type != object_type:
+                return self.error(400, 'RESOURCE_NOT_FOUND', '{0} {1} not found'.format(object_type, obj_id))
+            if asynchronous and obj.get('state') != 'NORMAL':
+                return self.error(400, 'RESOURCE_BUSY', '{0} {1} is busy'.format(object_type, obj['id']))
+            if operation == 'delete':
+                if not asynchronous:
+                    self.remove(obj['id'])
+                    return 200, self.accepted(action, object_type, obj['id'], 'OK')
+                obj['state'] = 'PENDING_DELETE'
+            elif operation == 'edit' and object_type == 'firewallRule':
+                obj.update(self.fw_rule_fields(params))
+            elif operation == 'edit':
+                obj.update(dict((k, v) for k, v in params.items() if k != 'id' and not isinstance(v, dict)))
+                if asynchronous:
+                    obj['state'] = 'PENDING_CHANGE'
+            elif operation == 'disable_replication':
+                if not obj.get('snapshotService'):
+                    return self.error(400, 'SNAPSHOT_SERVICE_NOT_ENABLED', 'server {0}'.format(obj['id']))
+                obj['snapshotService'].pop('replicationTargetDatacenterId', None)
+                obj['snapshotService']['state'] = 'PENDING_CHANGE'
+            else:
+                obj['started'] = operation == 'start'
+                obj['state'] = 'PENDING_CHANGE'
+            if asynchronous:
+                self.pending[obj['id']] = monotonic() + self.transition_time
+        return 200, self.accepted(action, object_type, obj['id'], 'IN_PROGRESS' if asynchronous else 'OK')
+
+    def accepted(self, action, object_type, obj_id, code):
+        return {'operation': action.upper(), 'responseCode': code, 'message': 'Request to {0} accepted'.format(action),
+                'info': [{'name': '{0}Id'.format(object_type), 'value': obj_id}], 'requestId': self.new_id()}
+
+    def create(self, object_type, params):
+        """
+        Build a new object from the parameters of a create action
+
+        :arg object_type: The object type
+        :arg params: The request body
+        :returns: The new object or an error tuple
+        """
+        if object_type == 'networkDomain':
+            return self.network_domain(params.get('name'), params.get('datacenterId'),
+                                       description=params.get('description'), network_type=params.get('type') or 'ADVANCED')
+        domain = self.index.get(params.get('networkDomainId'), (None, None))[1]
+        if object_type == 'vlan':
+            if domain is None:
+                return self.error(400, 'RESOURCE_NOT_FOUND', 'Network Domain not found')
+            return self.vlan(params.get('name'), domain, params.get('privateIpv4NetworkAddress'),
+                             params.get('privateIpv4PrefixSize'), description=params.get('description'),
+                             gateway=(params.get('attachedVlan') or {}).get('gatewayAddressing', 'LOW'))
+        if object_type == 'server':
+            nic = (params.get('networkInfo') or {}).get('primaryNic') or {}
+            vlan = self.index.get(nic.get('vlanId'), (None, None))[1]
+            domain = self.index.get((params.get('networkInfo') or {}).get('networkDomainId'), (None, None))[1]
+            if domain is None:
+                return self.error(400, 'RESOURCE_NOT_FOUND', 'Network Domain not found')
+            return self.server(params.get('name'), domain, vlan, started=bool(params.get('start')),
+                               description=params.get('description'))
+        if object_type == 'poolMember':
+            pool = self.index.get(params.get('poolId'), (None, None))[1]
+            node = self.index.get(params.get('nodeId'), (None, None))[1]
+            if pool is None or node is None:
+                return self.error(400, 'RESOURCE_NOT_FOUND', 'Pool or node not found')
+            return self.pool_member(pool, node, params.get('port'), params.get('status') or 'ENABLED')
+        obj = copy.deepcopy(params)
+        obj['state'] = 'NORMAL'
+        if domain is not None:
+            obj['datacenterId'] = domain['datacenterId']
+        if object_type == 'firewallRule':
+            obj.update(self.fw_rule_fields(obj))
+            obj['ruleType'] = 'CLIENT_RULE'
+            return self.place_fw_rule(obj, obj.pop('placement', None))
+        return self.add(object_type, obj)
+
+    def fw_rule_fields(self, params):
+        """
+        Convert the fields of a create or edit firewall rule request to the schema of the firewall rule listing. IP
+        address and port list UUIDs become ipAddressList and portList objects and prefix sizes and ports become
+        integers
+
+        :arg params: The request body
+        :returns: dict of the changed firewall rule fields
+        """
+        fields = dict((k, v) for k, v in params.items() if k not in ('id', 'placement'))
+        for side in ('source', 'destination'):
+            if side not in params:
+                continue
+            endpoint = copy.deepcopy(params[side])
+            for key, list_type in (('ipAddressListId', 'ipAddressList'), ('portListId', 'portList')):
+                if key in endpoint:
+                    found = self.index.get(endpoint.pop(key), (None, {}))[1]
+                    endpoint[list_type] = {'id': found.get('id'), 'name': found.get('name')}
+            if 'prefixSize' in endpoint.get('ip', {}):
+                endpoint['ip']['prefixSize'] = int(endpoint['ip']['prefixSize'])
+            for key in ('begin', 'end'):
+                if key in endpoint.get('port', {}):
+                    endpoint['port'][key] = int(endpoint['port'][key])
+            fields[side] = endpoint
+        return fields
+
+    def place_fw_rule(self, obj, placement):
+        """
+        Add a firewall rule at the position in its Cloud Network Domain given by the placement of the create request
+
+        :arg obj: The firewall rule dict
+        :arg placement: The placement dict of the create request
+        :returns: The firewall rule or an error tuple
+        """
+        rules = self.data['firewallRule']
+        domain_rules = [i for i, x in enumerate(rules) if x.get('networkDomainId') == obj.get('networkDomainId')]
+        placement = placement or {}
+        position = placement.get('position', 'LAST')
+        if position == 'FIRST':
+            index = domain_rules[0] if domain_rules else len(rules)
+        elif position in ('BEFORE', 'AFTER'):
+            index = next((i for i in domain_rules if rules[i].get('name') == placement.get('relativeToRule')), None)
+            if index is None:
+                return self.error(400, 'RESOURCE_NOT_FOUND', 'firewallRule {0} not found'.format(
+                    placement.get('relativeToRule')))
+            index += position == 'AFTER'
+        else:
+            index = domain_rules[-1] + 1 if domain_rules else len(rules)
+        obj.setdefault('id', self.new_id())
+        rules.insert(index, obj)
+        self.index[obj['id']] = ('firewallRule', obj)
+        return obj
+
+
+class CaaSAdapter(BaseAdapter):
+    """
+    A requests transport adapter that sends requests to a CaaSFake instead of the network. Mount it on a session
+    (session.mount('https://', CaaSAdapter(fake))) to run the real provider against the fake without any sockets.
+    Requests to a host in hosts go to the fake for that host (e.g. to fake several regions)
+    """
+    def __init__(self, fake, hosts=None):
+        super(CaaSAdapter, self).__init__()
+        self.fake = fake
+        self.hosts = hosts or {}
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlsplit(request.url)
+        status, data = self.hosts.get(url.netloc, self.fake).handle(request.method, url.path, parse_qs(url.query), request.body,
+                                        request.headers.get('Authorization'))
+        response = Response()
+        response.status_code = status
+        response.reason = 'OK' if status == 200 else 'Error'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response._content = data
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class CaaSRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Without TCP_NODELAY the separate header and body writes stall on delayed ACKs over a kept alive connection
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        with self.server.lock:
+            self.server.connections += 1
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+
+    def respond(self, method):
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        status, data = self.server.fake.handle(method, url.path, parse_qs(url.query), body,
+                                               self.headers.get('Authorization'))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def do_POST(self):
+        self.respond('POST')
+
+
+class CaaSServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    Serve a CaaSFake over HTTPS on a local port from a background thread. The number of accepted connections (and
+    so TLS handshakes) is counted in connections. The home geo of the fake is set to the server address
+    """
+    daemon_threads = True
+
+    def __init__(self, fake, certfile, keyfile, address='localhost'):
+        BaseHTTPServer.HTTPServer.__init__(self, (address, 0), CaaSRequestHandler)
+        self.fake = fake
+        self.lock = threading.Lock()
+        self.connections = 0
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile, keyfile)
+        self.socket = context.wrap_socket(self.socket, server_side=True)
+        self.host = '{0}:{1}'.format(address, self.server_address[1])
+        fake.host = self.host
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+from io import BytesIO
+
+import pytest
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlsplit, parse_qs
+from ansible_collections.nttmcp.mcp.plugins.httpapi.mcp import HttpApi
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient, NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import FAKE_USER, FAKE_PASSWORD, FAKE_API_VERSION, FAKE_ORG_ID
+
+
+class Response():
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+
+    def getcode(self):
+        return self.status
+
+    def read(self):
+        return self.body
+
+
+class FakeConnection():
+    """
+    The parts of the ansible.netcommon httpapi connection used by the plugin. Requests are sent to a CaaSFake and HTTP
+    errors are passed to the plugin handle_httperror in the same way as the real connection
+    """
+    def __init__(self, fake):
+        self.fake = fake
+        self.httpapi = None
+        self._auth = None
+        self.sent = []
+
+    def get_option(self, option):
+        return {'host': self.fake.host}.get(option)
+
+    def send(self, path, data, method='GET', headers=None):
+        self.sent.append((method, path, data))
+        url = urlsplit(path)
+        status, body = self.fake.handle(method, url.path, parse_qs(url.query), data, (self._auth or {}).get('Authorization'))
+        response = Response(status, body)
+        if status >= 400:
+            handled = self.httpapi.handle_httperror(HTTPError(path, status, 'error', {}, BytesIO(body)))
+            if handled is False:
+                raise AnsibleConnectionFailure('HTTP {0}'.format(status))
+            response = handled
+        return response, BytesIO(response.read())
+
+
+class PluginConnection():
+    """
+    Stands in for the module side ansible.module_utils.connection.Connection by calling the plugin methods directly
+    """
+    def __init__(self, httpapi):
+        self.httpapi = httpapi
+
+    def send_request(self, *args):
+        return self.httpapi.send_request(*args)
+
+    def get_org_context(self, *args):
+        return self.httpapi.get_org_context(*args)
+
+
+@pytest.fixture
+def httpapi(caas):
+    connection = FakeConnection(caas)
+    plugin = HttpApi(connection)
+    connection.httpapi = plugin
+    plugin.login(FAKE_USER, FAKE_PASSWORD)
+    return plugin
+
+
+@pytest.fixture
+def connection_client(monkeypatch, httpapi):
+    monkeypatch.setattr(NTTMCPClient, 'get_connection', lambda self, socket_path: PluginConnection(httpapi))
+    client = NTTMCPClient({'socket_path': '/fake/socket', 'api_version': FAKE_API_VERSION}, 'na')
+    yield client
+    client.close()
+
+
+def test_get_query_encoding(httpapi):
+    url = 'https://{0}/caas/{1}/{2}/server/server'.format(httpapi.connection.fake.host, FAKE_API_VERSION, FAKE_ORG_ID)
+    status, body = httpapi.send_request('GET', url, {'name': 'web 01', 'state': ['NORMAL', 'STOPPED']})
+    assert status == 200
+    method, path, data = httpapi.connection.sent[-1]
+    assert (method, data) == ('GET', None)
+    assert path == '/caas/{0}/{1}/server/server?name=web+01&state=NORMAL&state=STOPPED'.format(
+        FAKE_API_VERSION, FAKE_ORG_ID)
+
+
+def test_post_body(httpapi):
+    url = 'https://{0}/caas/{1}/{2}/network/deployNetworkDomain'.format(
+        httpapi.connection.fake.host, FAKE_API_VERSION, FAKE_ORG_ID)
+    params = {'datacenterId': 'NA9', 'name': 'new_cnd', 'type': 'ESSENTIALS'}
+    status, body = httpapi.send_request('POST', url, params)
+    assert status == 200
+    assert json.loads(httpapi.connection.sent[-1][2]) == params
+    assert httpapi.connection.fake.find('networkDomain', name='new_cnd')
+
+
+def test_other_host_is_refused(httpapi):
+    with pytest.raises(AnsibleConnectionFailure):
+        httpapi.send_request('GET', 'https://api-other.mcp-services.net/caas/2.11/{0}/server/server'.format(FAKE_ORG_ID))
+    assert not httpapi.connection.sent
+
+
+def test_not_found_is_returned(httpapi):
+    url = '/caas/{0}/{1}/server/server/00000000-0000-0000-0000-000000000000'.format(FAKE_API_VERSION, FAKE_ORG_ID)
+    status, body = httpapi.send_request('GET', url)
+    assert status == 400
+    assert json.loads(body)['responseCode'] == 'RESOURCE_NOT_FOUND'
+
+
+def test_unauthorized_is_raised(httpapi):
+    httpapi.login(FAKE_USER, 'wrong')
+    with pytest.raises(AnsibleConnectionFailure):
+        httpapi.send_request('GET', '/caas/{0}/{1}/server/server'.format(FAKE_API_VERSION, FAKE_ORG_ID))
+
+
+def test_org_context_is_cached(httpapi):
+    context = httpapi.get_org_context(FAKE_API_VERSION)
+    assert context == {'org_id': FAKE_ORG_ID, 'home_geo': httpapi.connection.fake.host, 'host': httpapi.connection.fake.host}
+    assert httpapi.get_org_context(FAKE_API_VERSION) == context
+    assert len([x for x in httpapi.connection.sent if x[1].endswith('/user/myUser')]) == 1
+
+
+def test_client_over_connection(httpapi, connection_client):
+    """
+    The client sends its calls over the connection, gets RESOURCE_NOT_FOUND responses back and cannot reach another
+    API host
+    """
+    caas = httpapi.connection.fake
+    assert connection_client.org_id == FAKE_ORG_ID
+    server = caas.data['server'][0]
+    assert connection_client.get_server_by_id(server_id=server['id'])['id'] == server['id']
+    assert connection_client.get_server_by_id(server_id='00000000-0000-0000-0000-000000000000').get('responseCode') == \
+        'RESOURCE_NOT_FOUND'
+    connection_client.home_geo = 'api-other.mcp-services.net'
+    with pytest.raises(NTTMCPAPIException):
+        connection_client.get_geo()
+    assert all(not x[1].startswith('http') for x in httpapi.connection.sent)
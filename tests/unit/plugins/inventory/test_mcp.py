@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleError
+from ansible_collections.nttmcp.mcp.plugins.inventory.mcp import InventoryModule
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import FAKE_DATACENTERS, FAKE_EU_DATACENTERS
+
+
+def inventory_plugin(monkeypatch, **options):
+    plugin = InventoryModule()
+    settings = {'auth': None, 'regions': ['na'], 'datacenters': [], 'max_workers': 4}
+    settings.update(options)
+    monkeypatch.setattr(plugin, 'get_option', settings.get)
+    return plugin
+
+
+def test_several_regions(monkeypatch, caas_regions):
+    na, eu = caas_regions
+    plugin = inventory_plugin(monkeypatch, regions=['na', 'eu'],
+                              datacenters=[FAKE_DATACENTERS[0], FAKE_EU_DATACENTERS[0]])
+    servers = plugin.fetch_servers()['servers']
+    expected = na.find('server', datacenterId=FAKE_DATACENTERS[0]) + eu.data['server']
+    assert sorted(server['id'] for server in servers) == sorted(server['id'] for server in expected)
+    assert all(server['region'] == ('eu' if server['datacenterId'] in FAKE_EU_DATACENTERS else 'na')
+               for server in servers)
+    # Each datacenter is only listed on the API end-point of its own region
+    assert not [call for call in na.calls if call[2].get('datacenterId') in FAKE_EU_DATACENTERS]
+    assert not [call for call in eu.calls if call[2].get('datacenterId') in FAKE_DATACENTERS]
+
+
+def test_every_datacenter(monkeypatch, caas_regions):
+    na, eu = caas_regions
+    servers = inventory_plugin(monkeypatch, regions=['na', 'eu']).fetch_servers()['servers']
+    assert len(servers) == len(na.data['server']) + len(eu.data['server'])
+
+
+def test_unknown_datacenter(monkeypatch, caas_regions):
+    plugin = inventory_plugin(monkeypatch, regions=['na', 'eu'], datacenters=['AP3'])
+    with pytest.raises(AnsibleError, match='AP3'):
+        plugin.fetch_servers()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from threading import Lock
+from time import sleep
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+import pytest
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils import batch
+from ansible_collections.nttmcp.mcp.plugins.module_utils.batch import run_batch, RateLimiter
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_server  # noqa: F401
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(batch, 'POLL_MIN_INTERVAL', 0.01)
+    monkeypatch.setattr(batch, 'API_BUSY_MAX_DELAY', 0.02)
+
+
+class Flaky():
+    """
+    A callable that raises the supplied exceptions in turn for each item and then returns the item
+    """
+    def __init__(self, *errors):
+        self.errors = errors
+        self.calls = {}
+        self.lock = Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            attempt = self.calls.get(item, 0)
+            self.calls[item] = attempt + 1
+        if attempt < len(self.errors):
+            raise self.errors[attempt]
+        return item
+
+
+def test_parse_errors_are_returned():
+    """
+    A KeyError, IndexError or AttributeError raised while parsing a response is returned as the error for the item
+    rather than raised out of the worker thread
+    """
+    def func(item):
+        return {'info': []}['info'][0] if item == 'index' else {}[item]
+
+    results = run_batch(func, ['index', 'key'], concurrency=2)
+    assert [item for item, result, exc in results] == ['index', 'key']
+    assert isinstance(results[0][2], IndexError)
+    assert isinstance(results[1][2], KeyError)
+
+
+def test_results_in_item_order():
+    results = run_batch(lambda item: sleep(0.01 * (5 - item)) or item * 2, list(range(5)), concurrency=5)
+    assert results == [(item, item * 2, None) for item in range(5)]
+
+
+def test_busy_errors_are_retried(fast_retries):
+    func = Flaky(NTTMCPAPIException('RESOURCE_BUSY: pool busy'), NTTMCPAPIException('RESOURCE_BUSY: pool busy'))
+    assert run_batch(func, ['a', 'b'], concurrency=2) == [('a', 'a', None), ('b', 'b', None)]
+    assert func.calls == {'a': 3, 'b': 3}
+
+
+def test_other_errors_are_not_retried(fast_retries):
+    error = NTTMCPAPIException('RESOURCE_NOT_FOUND: no such member')
+    func = Flaky(error)
+    assert run_batch(func, ['a']) == [('a', None, error)]
+    assert func.calls == {'a': 1}
+
+
+def test_busy_retries_are_limited(fast_retries):
+    error = NTTMCPAPIException('RESOURCE_BUSY: pool busy')
+    func = Flaky(*([error] * 10))
+    assert run_batch(func, ['a'], retries=2) == [('a', None, error)]
+    assert func.calls == {'a': 3}
+
+
+def test_busy_server_is_retried_against_the_api(fast_retries, caas, client):
+    """
+    A request for a server that is still changing gets RESOURCE_BUSY from the API and succeeds once it settles
+    """
+    server = caas.data['server'][0]
+    server['state'] = 'PENDING_CHANGE'
+    caas.pending[server['id']] = monotonic() + 0.03
+    results = run_batch(lambda server_id: client.start_server(server_id=server_id), [server['id']])
+    assert results[0][2] is None
+    posts = [call for call in caas.calls if call[1].endswith('/startServer')]
+    assert len(posts) > 1
+
+
+def test_rate_limit_spaces_calls():
+    """
+    With a rate of 20 calls per second the calls start at least 50 ms apart regardless of the concurrency
+    """
+    starts = []
+    lock = Lock()
+
+    def func(item):
+        with lock:
+            starts.append(monotonic())
+
+    run_batch(func, list(range(6)), concurrency=6, rate=20)
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.045
+    assert starts[-1] - starts[0] >= 0.045 * 5
+
+
+def test_rate_limiter_without_rate_does_not_wait():
+    limiter = RateLimiter()
+    start = monotonic()
+    for dummy in range(100):
+        limiter.wait()
+    assert monotonic() - start < 0.05
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# Benchmarks of the provider building blocks against the fake Cloud Control API. Run with
+#   pytest tests/unit --benchmark-only
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tarfile
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils import response as response_utils
+from ansible_collections.nttmcp.mcp.plugins.module_utils.config import API_PAGE_WORKERS
+from ansible_collections.nttmcp.mcp.plugins.module_utils.diff import diff_json
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPClient
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.plugins.modules import server_info
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import (CaaSFake, FAKE_USER, FAKE_PASSWORD, FAKE_API_VERSION,
+                                                                  FAKE_DATACENTERS)
+
+DATACENTER = FAKE_DATACENTERS[0]
+
+
+def new_client(host, **kwargs):
+    return NTTMCPClient({'user_id': FAKE_USER, 'password': FAKE_PASSWORD, 'api_endpoint': host,
+                         'api_version': FAKE_API_VERSION}, 'na', **kwargs)
+
+
+@pytest.mark.parametrize('max_workers', [1, API_PAGE_WORKERS], ids=['serial', 'concurrent'])
+def test_list_servers_paging(benchmark, caas_install, max_workers):
+    """
+    List 3000 servers (12 pages) from an API end-point with 20ms latency
+    """
+    fake = caas_install(CaaSFake(sizes={'server': 6000}, latency=0.02))
+    client = new_client(fake.host, cache_ttl=0)
+    benchmark.group = 'paging'
+    servers = benchmark(client.list_servers, datacenter=DATACENTER, max_workers=max_workers)
+    assert len(servers) == len(fake.find('server', datacenterId=DATACENTER))
+
+
+@pytest.mark.parametrize('keep_alive', [True, False], ids=['pooled', 'connection-per-request'])
+def test_session_reuse(benchmark, monkeypatch, caas_server, run_module, keep_alive):
+    """
+    Run server_info over real HTTPS and count the TLS handshakes. The pooled session should open no more connections
+    than there are concurrent page workers
+    """
+    if not keep_alive:
+        original = NTTMCPClient.create_session
+
+        def create_session(self, *args, **kwargs):
+            session = original(self, *args, **kwargs)
+            session.headers['Connection'] = 'close'
+            return session
+        monkeypatch.setattr(NTTMCPClient, 'create_session', create_session)
+    benchmark.group = 'session'
+    start = caas_server.connections
+    result = benchmark.pedantic(run_module, args=(server_info, {'datacenter': DATACENTER}), rounds=5)
+    assert not result.get('failed'), result.get('msg')
+    handshakes = (caas_server.connections - start) // 5
+    benchmark.extra_info['handshakes_per_run'] = handshakes
+    if keep_alive:
+        assert handshakes <= API_PAGE_WORKERS + 1
+
+
+@pytest.mark.parametrize('warm', [False, True], ids=['cold', 'warm'])
+def test_resolver(benchmark, caas_install, warm):
+    """
+    Resolve 20 Cloud Network Domain and VLAN names to UUIDs with 10ms API latency, with and without the resolver
+    cache populated by an earlier run
+    """
+    fake = caas_install(CaaSFake(latency=0.01))
+    domains = fake.find('networkDomain', datacenterId=DATACENTER)
+    vlans = [(vlan['name'], vlan['networkDomain']['id']) for vlan in fake.data['vlan']
+             if vlan['datacenterId'] == DATACENTER][:10]
+
+    def resolve():
+        client = new_client(fake.host, resolver_ttl=600 if warm else 0)
+        for domain in domains:
+            client.resolve_network_domain_id(name=domain['name'], datacenter=DATACENTER)
+        for name, domain_id in vlans:
+            client.resolve_vlan_id(name=name, datacenter=DATACENTER, network_domain_id=domain_id)
+        client.close()
+
+    if warm:
+        resolve()
+    benchmark.group = 'resolver'
+    benchmark(resolve)
+
+
+def test_diff_json_large_lists(benchmark):
+    """
+    Compare two objects holding 10,000 element lists in a different order with a few changes
+    """
+    rnd = random.Random(0)
+    existing = {'name': 'pool', 'members': [{'id': 'node_{0}'.format(i), 'port': 80 + i % 10, 'status': 'ENABLED'}
+                                            for i in range(10000)]}
+    members = [dict(member) for member in existing['members']]
+    rnd.shuffle(members)
+    for member in members[:10]:
+        member['status'] = 'DISABLED'
+    new = {'name': 'pool', 'members': members}
+    benchmark.group = 'diff'
+    result = benchmark(diff_json, new, existing)
+    assert result['changes']
+
+
+@pytest.mark.parametrize('use_orjson', [False, True], ids=['json', 'orjson'])
+def test_response_parse(benchmark, monkeypatch, use_orjson):
+    """
+    Parse a page of 250 servers three times through one NTTMCPResponse
+    """
+    if use_orjson and not response_utils.HAS_ORJSON:
+        pytest.skip('orjson is not installed')
+    monkeypatch.setattr(response_utils, 'HAS_ORJSON', use_orjson)
+    fake = CaaSFake(sizes={'server': 250})
+
+    class Page():
+        status_code = 200
+        content = json.dumps({'server': fake.data['server'], 'totalCount': 250}).encode('utf-8')
+        text = content.decode('utf-8')
+
+    def parse():
+        wrapped = response_utils.NTTMCPResponse(Page())
+        for dummy in range(3):
+            wrapped.json()
+
+    benchmark.group = 'parse'
+    benchmark(parse)
+
+
+# Run in a new interpreter: build the AnsiballZ module_utils payload of a module with the ansible-core recursive
+# finder for the collection at COLLECTIONS_PATH and print the number of files and source bytes
+PAYLOAD_SCRIPT = """
+import io, json, sys, zipfile, datetime
+from ansible.executor import module_common
+from ansible.utils.collection_loader._collection_finder import _AnsibleCollectionFinder
+_AnsibleCollectionFinder(paths=[sys.argv[1]], scan_sys_paths=False)._install()
+name = sys.argv[2]
+fqn = 'ansible_collections.nttmcp.mcp.plugins.modules.' + name
+with open(sys.argv[3], 'rb') as module_file:
+    data = module_file.read()
+zf = zipfile.ZipFile(io.BytesIO(), 'w')
+try:
+    from ansible._internal._ansiballz import _builder
+    module_common.recursive_finder(name, fqn, data, zf, datetime.datetime(2020, 1, 1), _builder.ExtensionManager())
+except ImportError:
+    module_common.recursive_finder(name, fqn, data, zf)
+files = [x for x in zf.infolist() if x.filename.startswith('ansible_collections/nttmcp/mcp/plugins/module_utils/')]
+print(json.dumps({'files': len(files), 'bytes': sum(x.file_size for x in files)}))
+"""
+STARTUP_SCRIPT = (
+    'import sys; from ansible_collections.nttmcp.mcp.plugins.modules import {0}; '
+    'print(len([m for m in sys.modules if m.startswith("ansible_collections.nttmcp.mcp.plugins.module_utils.")]))'
+)
+
+
+def collection_root():
+    """
+    Return the collections path (the directory holding ansible_collections) of this collection
+    """
+    return os.path.abspath(server_info.__file__).split('{0}ansible_collections{0}'.format(os.sep))[0]
+
+
+@pytest.fixture(scope='module')
+def split_trees(tmp_path_factory):
+    """
+    The plugins of this collection before and after the provider was split into per-domain modules. The "before"
+    tree is extracted from the parent of the commit that added provider_server.py. Returns a dict of collections
+    paths keyed on before/after
+    """
+    repo = os.path.join(collection_root(), 'ansible_collections', 'nttmcp', 'mcp')
+    try:
+        added = subprocess.check_output(['git', 'log', '--diff-filter=A', '--format=%H', '--',
+                                         'plugins/module_utils/provider_server.py'], cwd=repo).split()
+        if not added:
+            pytest.skip('The provider split is not in the git history')
+        archive = subprocess.check_output(['git', 'archive', '{0}^'.format(added[-1].decode('ascii')), 'plugins'],
+                                          cwd=repo)
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip('git history is not available')
+    before = tmp_path_factory.mktemp('before')
+    target = before / 'ansible_collections' / 'nttmcp' / 'mcp'
+    target.mkdir(parents=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(str(target))
+    return {'before': str(before), 'after': collection_root()}
+
+
+@pytest.mark.parametrize('tree', ['before', 'after'])
+@pytest.mark.parametrize('module', ['geo_info', 'server_info', 'firewall'])
+def test_module_startup(benchmark, split_trees, module, tree):
+    """
+    Measure the AnsiballZ module_utils payload of a module (files and source bytes found by the ansible-core recursive
+    finder) and the time to import the module in a new interpreter, before and after the provider split
+    """
+    path = split_trees[tree]
+    module_path = os.path.join(path, 'ansible_collections', 'nttmcp', 'mcp', 'plugins', 'modules', module + '.py')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([path] + [x for x in sys.path if x != collection_root()]))
+    payload = json.loads(subprocess.check_output([sys.executable, '-c', PAYLOAD_SCRIPT, path, module, module_path],
+                                                 env=env))
+
+    def start():
+        return subprocess.check_output([sys.executable, '-c', STARTUP_SCRIPT.format(module)], env=env)
+
+    benchmark.group = 'startup-{0}'.format(module)
+    output = benchmark.pedantic(start, rounds=5)
+    benchmark.extra_info['payload_files'] = payload['files']
+    benchmark.extra_info['payload_bytes'] = payload['bytes']
+    benchmark.extra_info['module_utils_imported'] = int(output)
+    assert payload['bytes']
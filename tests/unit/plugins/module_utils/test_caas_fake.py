@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from time import sleep
+
+import pytest
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network, provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import FAKE_ORG_ID, FAKE_DATACENTERS
+
+
+def test_org_context(client):
+    assert client.org_id == FAKE_ORG_ID
+
+
+def test_paging_returns_every_object(caas, client):
+    servers = client.list_servers(datacenter=FAKE_DATACENTERS[0])
+    assert len(servers) == len(caas.find('server', datacenterId=FAKE_DATACENTERS[0]))
+    assert len(set(server['id'] for server in servers)) == len(servers)
+    assert len([call for call in caas.calls if call[1].endswith('server/server')]) > 1
+
+
+def test_filters(caas, client):
+    domain = caas.data['networkDomain'][0]
+    vlans = client.list_vlans(datacenter=domain['datacenterId'], network_domain_id=domain['id'])
+    assert vlans
+    assert all(vlan['networkDomain']['id'] == domain['id'] for vlan in vlans)
+    assert client.get_vlan_by_name(datacenter=domain['datacenterId'], network_domain_id=domain['id'],
+                                   name=vlans[0]['name'])['id'] == vlans[0]['id']
+
+
+def test_not_found(client):
+    assert client.get_server_by_id(server_id='00000000-0000-0000-0000-000000000000').get('responseCode') == \
+        'RESOURCE_NOT_FOUND'
+
+
+def test_bad_credentials(caas, client):
+    client.session.auth = ('fake_user', 'wrong')
+    with client.uncached():
+        with pytest.raises(NTTMCPAPIException):
+            client.list_network_domains(datacenter=FAKE_DATACENTERS[0])
+
+
+def test_pending_transition(caas, client):
+    result = client.create_network_domain(datacenter=FAKE_DATACENTERS[0], name='new_cnd', network_type='ESSENTIALS')
+    domain_id = result['info'][0]['value']
+
+    def state():
+        with client.uncached():
+            domains = client.list_network_domains(network_domain_id=domain_id)
+        return domains[0]['state'] if domains else None
+
+    assert state() == 'PENDING_ADD'
+    sleep(caas.transition_time)
+    assert state() == 'NORMAL'
+    client.delete_network_domain(domain_id)
+    assert state() == 'PENDING_DELETE'
+    sleep(caas.transition_time)
+    assert state() is None
+
+
+def test_fw_rule_listing_schema(caas, client):
+    """
+    Created firewall rules are listed in the listing schema rather than as the create request
+    """
+    domain = caas.data['networkDomain'][0]
+    ip_list = caas.find('ipAddressList', networkDomainId=domain['id'])[0]
+    client.create_fw_rule({'networkDomainId': domain['id'], 'name': 'new_rule', 'ipVersion': 'IPV4', 'enabled': True,
+                           'action': 'DROP', 'protocol': 'TCP', 'placement': {'position': 'FIRST'},
+                           'source': {'ipAddressListId': ip_list['id']},
+                           'destination': {'ip': {'address': '10.2.0.0', 'prefixSize': '24'},
+                                           'port': {'begin': '80', 'end': '81'}}})
+    fw_rule = client.get_fw_rule_by_name(network_domain_id=domain['id'], name='new_rule')
+    assert 'placement' not in fw_rule
+    assert fw_rule['ruleType'] == 'CLIENT_RULE'
+    assert fw_rule['source'] == {'ipAddressList': {'id': ip_list['id'], 'name': ip_list['name']}}
+    assert fw_rule['destination'] == {'ip': {'address': '10.2.0.0', 'prefixSize': 24}, 'port': {'begin': 80, 'end': 81}}
+    assert not [x for x in caas.data['firewallRule'] if 'placement' in x]
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.projection import parse_fields, project
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_server  # noqa: F401
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import FAKE_DATACENTERS
+
+SERVER = {
+    'id': 'a', 'name': 'web01', 'state': 'NORMAL',
+    'networkInfo': {'primaryNic': {'privateIpv4': '10.0.0.1', 'ipv6': '2001:db8::1'}, 'networkDomainId': 'b'},
+    'scsiController': [{'key': 1000, 'disk': [{'sizeGb': 10, 'speed': 'STANDARD'}, {'sizeGb': 20}]}]
+}
+
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields(['name', 'networkInfo.primaryNic.ipv6']) == {'name': None,
+                                                                      'networkInfo': {'primaryNic': {'ipv6': None}}}
+    assert parse_fields(['networkInfo.primaryNic', 'networkInfo']) == {'networkInfo': None}
+    assert parse_fields(['networkInfo', 'networkInfo.primaryNic']) == {'networkInfo': None}
+
+
+def test_project():
+    result = project(SERVER, parse_fields(['name', 'networkInfo.primaryNic.privateIpv4', 'missing', 'state.x']))
+    assert result == {'name': 'web01', 'networkInfo': {'primaryNic': {'privateIpv4': '10.0.0.1'}}}
+    assert project([SERVER], parse_fields(['scsiController.disk.sizeGb'])) == \
+        [{'scsiController': [{'disk': [{'sizeGb': 10}, {'sizeGb': 20}]}]}]
+    assert 'ipv6' in SERVER['networkInfo']['primaryNic']
+
+
+def test_listing_projection(caas, client):
+    client.project('server', ['networkInfo.primaryNic.privateIpv4'])
+    cached = len(client.request_cache)
+    servers = client.list_servers(datacenter=FAKE_DATACENTERS[0])
+    assert len(servers) == len(caas.find('server', datacenterId=FAKE_DATACENTERS[0]))
+    assert all(list(server) == ['networkInfo'] for server in servers)
+    assert len(client.request_cache) == cached
+    client.project('server', None)
+    assert 'cpu' in client.list_servers(datacenter=FAKE_DATACENTERS[0])[0]
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.provider import NTTMCPAPIException
+from ansible_collections.nttmcp.mcp.plugins.module_utils import provider_network  # noqa: F401
+
+
+def test_listing_not_found_forgets_filter_uuid(caas, client):
+    """
+    A RESOURCE_NOT_FOUND response to a listing filtered on a cached Cloud Network Domain UUID removes the cached UUID
+    """
+    domain = caas.data['networkDomain'][0]
+    network_domain_id = client.resolve_network_domain_id(name=domain['name'], datacenter=domain['datacenterId'])
+    assert client.resolver.get('networkDomain', domain['datacenterId'], domain['name']) == network_domain_id
+    caas.remove(domain['id'])
+    with client.uncached():
+        try:
+            client.list_vlans(datacenter=domain['datacenterId'], network_domain_id=network_domain_id)
+        except NTTMCPAPIException:
+            pass
+    assert client.resolver.get('networkDomain', domain['datacenterId'], domain['name']) is None
+    with client.uncached(), pytest.raises(NTTMCPAPIException):
+        client.resolve_network_domain_id(name=domain['name'], datacenter=domain['datacenterId'])
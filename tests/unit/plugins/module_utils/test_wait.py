@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.nttmcp.mcp.plugins.module_utils.wait import wait_for_server_state
+
+
+class ModuleFailed(Exception):
+    pass
+
+
+class FakeModule():
+    """
+    The parts of an AnsibleModule used by the wait helpers
+    """
+    def __init__(self, **params):
+        self.params = params
+
+    def fail_json(self, **kwargs):
+        raise ModuleFailed(kwargs)
+
+
+def test_missing_server_fails_at_once(caas, client):
+    """
+    A server that does not exist fails the module on the first poll instead of polling for the whole wait_time
+    """
+    domain = caas.data['networkDomain'][0]
+    module = FakeModule(wait_time=3600, wait_poll_interval=30)
+    with pytest.raises(ModuleFailed) as result:
+        wait_for_server_state(module, client, name='no_such_server', datacenter=domain['datacenterId'],
+                              network_domain_id=domain['id'])
+    assert result.value.args[0]['msg'] == 'Failed to find the server - no_such_server'
+    assert len([call for call in caas.calls if call[1].endswith('server/server')]) == 1
+
+
+def test_missing_server_is_polled(caas, client):
+    """
+    With fail_if_missing disabled a server that does not exist yet is polled until the wait_time is reached
+    """
+    domain = caas.data['networkDomain'][0]
+    module = FakeModule(wait_time=0.1, wait_poll_interval=0.01)
+    assert wait_for_server_state(module, client, name='no_such_server', datacenter=domain['datacenterId'],
+                                 network_domain_id=domain['id'], fail_if_missing=False) is None
+    assert len([call for call in caas.calls if call[1].endswith('server/server')]) > 1
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+#
+# End to end benchmarks of the modules against the fake Cloud Control API. Run with
+#   pytest tests/unit --benchmark-only
+# and compare runs with --benchmark-autosave / --benchmark-compare
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from ansible_collections.nttmcp.mcp.plugins.modules import (server_info, vlan_info, network_info, firewall_info,
+                                                             ip_list_info, port_list_info, nat_info, vip_pool_info,
+                                                             network, vlan, vip_pool)
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import CaaSFake, FAKE_DATACENTERS
+
+DATACENTER = FAKE_DATACENTERS[0]
+# Per request latency of a remote API end-point
+REMOTE_LATENCY = 0.02
+
+
+def network_domain_args(fake):
+    domain = fake.find('networkDomain', datacenterId=DATACENTER)[0]
+    return {'datacenter': DATACENTER, 'network_domain': domain['name']}
+
+
+INFO_MODULES = [
+    ('server_info', server_info, lambda fake: {'datacenter': DATACENTER}),
+    ('server_info_network_domain', server_info, network_domain_args),
+    ('server_info_name', server_info, lambda fake: {'datacenter': DATACENTER, 'name': 'server_00100'}),
+    ('server_info_fields', server_info, lambda fake: {'datacenter': DATACENTER,
+                                                      'fields': ['id', 'name', 'state',
+                                                                 'networkInfo.primaryNic.privateIpv4']}),
+    ('network_info', network_info, lambda fake: {'datacenter': DATACENTER}),
+    ('vlan_info', vlan_info, network_domain_args),
+    ('firewall_info', firewall_info, network_domain_args),
+    ('ip_list_info', ip_list_info, network_domain_args),
+    ('port_list_info', port_list_info, network_domain_args),
+    ('nat_info', nat_info, network_domain_args),
+    ('vip_pool_info', vip_pool_info, network_domain_args),
+]
+
+
+@pytest.mark.parametrize('latency', [0, REMOTE_LATENCY], ids=['local', 'remote'])
+@pytest.mark.parametrize('name,module,args', INFO_MODULES, ids=[x[0] for x in INFO_MODULES])
+def test_info_module(benchmark, caas_install, run_module, name, module, args, latency):
+    fake = caas_install(CaaSFake(latency=latency))
+    benchmark.group = 'info-{0}'.format(name)
+    result = benchmark(run_module, module, args(fake))
+    assert not result.get('failed'), result.get('msg')
+    assert result['data']['count']
+
+
+def test_network_create(benchmark, caas, run_module):
+    """
+    Create a Cloud Network Domain and wait for it to move from PENDING_ADD to NORMAL
+    """
+    def setup():
+        for domain in caas.find('networkDomain', name='bench_cnd'):
+            caas.remove(domain['id'])
+
+    result = benchmark.pedantic(run_module, args=(network, {'datacenter': DATACENTER, 'name': 'bench_cnd',
+                                                            'wait_poll_interval': 1}),
+                                setup=setup, rounds=5)
+    assert result.get('changed'), result.get('msg')
+    assert result['data']['state'] == 'NORMAL'
+
+
+def test_vlan_create(benchmark, caas, run_module):
+    """
+    Create a VLAN and wait for it to move from PENDING_ADD to NORMAL
+    """
+    args = network_domain_args(caas)
+    args.update({'name': 'bench_vlan', 'ipv4_cidr': '192.168.0.0/24', 'wait_poll_interval': 1})
+
+    def setup():
+        for obj in caas.find('vlan', name='bench_vlan'):
+            caas.remove(obj['id'])
+
+    result = benchmark.pedantic(run_module, args=(vlan, args), setup=setup, rounds=5)
+    assert result.get('changed'), result.get('msg')
+    assert result['data']['state'] == 'NORMAL'
+
+
+def test_vip_pool_members(benchmark, caas, run_module):
+    """
+    Reconcile the members of an existing VIP pool: the seeded members are removed, ten are kept and ten are added
+    """
+    pool = caas.data['pool'][0]
+    domain = caas.index[pool['networkDomainId']][1]
+    nodes = caas.find('node', networkDomainId=domain['id'])
+    original = [member['id'] for member in caas.data['poolMember'] if member['pool']['id'] == pool['id']]
+    original_members = [dict(member) for member in caas.data['poolMember'] if member['id'] in original]
+    members = [{'name': node['name'], 'port': 8080} for node in nodes[:20]]
+    args = {'datacenter': domain['datacenterId'], 'network_domain': domain['name'], 'name': pool['name'],
+            'members': members}
+
+    def setup():
+        for member in [member for member in caas.data['poolMember'] if member['pool']['id'] == pool['id']]:
+            caas.remove(member['id'])
+        for member in original_members:
+            caas.add('poolMember', dict(member))
+        for node in nodes[:10]:
+            caas.pool_member(pool, node, 8080, 'ENABLED')
+
+    result = benchmark.pedantic(run_module, args=(vip_pool, args), setup=setup, rounds=5)
+    assert result.get('changed'), result.get('msg')
+    assert len([member for member in caas.data['poolMember'] if member['pool']['id'] == pool['id']]) == 20
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import server_info
+
+
+def test_records_org_context_lookup(caas, run_module):
+    """
+    The myUser lookup made while the client is created (with a cold org cache) is part of api_timing
+    """
+    result = run_module(server_info, {'datacenter': ['NA9'], 'debug_timing': True})
+    assert not result.get('failed'), result.get('msg')
+    endpoints = result['api_timing']['endpoints']
+    assert [x for x in endpoints if x.startswith('GET ') and x.endswith('/user/myUser')]
+    assert result['api_timing']['count'] == sum(x['count'] for x in endpoints.values())
+    user_calls = [call for call in caas.calls if call[1].endswith('/user/myUser')]
+    assert len(user_calls) == 1
+
+
+def test_records_org_context_lookup_fan_out(caas_regions, run_module):
+    """
+    The myUser lookup of every region client is recorded when the info modules fan out over several regions
+    """
+    result = run_module(server_info, {'region': ['na', 'eu'], 'datacenter': ['NA9', 'EU6'], 'debug_timing': True})
+    assert not result.get('failed'), result.get('msg')
+    endpoints = result['api_timing']['endpoints']
+    user_calls = sum(v['count'] for k, v in endpoints.items() if k.endswith('/user/myUser'))
+    assert user_calls == 2
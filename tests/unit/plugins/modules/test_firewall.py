@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import firewall
+
+
+def test_rerun_is_unchanged(caas, run_module):
+    """
+    Running the same firewall rule task twice only changes the rule the first time
+    """
+    domain = caas.data['networkDomain'][0]
+    args = {'datacenter': domain['datacenterId'], 'network_domain': domain['name'], 'name': 'web_https',
+            'src_cidr': '10.1.0.0/24', 'dst_cidr': '10.2.0.10/32', 'dst_port_start': '443', 'position': 'FIRST'}
+    result = run_module(firewall, args)
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    result = run_module(firewall, args)
+    assert not result.get('failed'), result.get('msg')
+    assert not result['changed']
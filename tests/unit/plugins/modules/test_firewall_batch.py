@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+from time import sleep
+
+from ansible_collections.nttmcp.mcp.plugins.modules import firewall_batch
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import CaaSFake
+
+
+def batch_args(domain, rules):
+    for i, rule in enumerate(rules):
+        rule.setdefault('src_cidr', '10.1.0.{0}/32'.format(i))
+        rule.setdefault('dst_cidr', '10.2.0.0/24')
+        rule.setdefault('dst_port_start', '443')
+    return {'datacenter': domain['datacenterId'], 'network_domain': domain['name'], 'rules': rules, 'concurrency': 8}
+
+
+class SlowFirstCaaSFake(CaaSFake):
+    """
+    A CaaSFake where each create firewall rule request takes longer the earlier the rule is in the list (the names
+    end with a letter in list order), so rules created at the same time are handled in reverse list order
+    """
+    def handle(self, method, path, query=None, body=None, auth=None):
+        if path.endswith('/createFirewallRule'):
+            sleep(0.01 * (ord('z') - ord(json.loads(body).get('name')[-1])))
+        return super(SlowFirstCaaSFake, self).handle(method, path, query, body, auth)
+
+
+def test_create_order_matches_list_order(caas_install, run_module):
+    """
+    New rules sharing a placement (FIRST, LAST or the same rule) are created concurrently with other rules but end up
+    in the same order as if every rule was created one at a time in list order
+    """
+    caas = caas_install(SlowFirstCaaSFake(sizes={'server': 0, 'firewallRule': 60}))
+    domain = caas.data['networkDomain'][0]
+    existing = [x.get('name') for x in caas.find('firewallRule', networkDomainId=domain['id'])]
+    anchor = existing[0]
+    rules = [
+        {'name': 'new_a', 'position': 'FIRST'},
+        {'name': 'new_b', 'position': 'FIRST'},
+        {'name': 'new_c', 'position': 'AFTER', 'position_to': anchor},
+        {'name': 'new_d', 'position': 'AFTER', 'position_to': anchor},
+        {'name': 'new_e', 'position': 'AFTER', 'position_to': 'new_c'},
+        {'name': 'new_f', 'position': 'LAST'},
+        {'name': 'new_g', 'position': 'LAST'},
+        {'name': 'new_h', 'position': 'BEFORE', 'position_to': anchor},
+        {'name': 'new_i', 'position': 'FIRST'},
+        {'name': 'new_j', 'position': 'LAST'},
+        {'name': 'new_k', 'position': 'LAST'},
+        {'name': 'new_l', 'position': 'LAST'},
+    ]
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result.get('failed'), result.get('msg')
+    assert result['data']['created'] == [x['name'] for x in rules]
+    names = [x.get('name') for x in caas.find('firewallRule', networkDomainId=domain['id'])]
+    assert names == (['new_i', 'new_b', 'new_a', 'new_h', anchor, 'new_d', 'new_c', 'new_e'] + existing[1:] +
+                     ['new_f', 'new_g', 'new_j', 'new_k', 'new_l'])
+
+
+def test_create_waves():
+    """
+    Rules positioned relative to a new rule are in later waves. Groups of rules with the same placement are balanced
+    unless another new rule is positioned relative to one of them, in which case they are created one at a time
+    """
+    fw_rules = [
+        {'name': 'a', 'placement': {'position': 'FIRST'}},
+        {'name': 'b', 'placement': {'position': 'FIRST'}},
+        {'name': 'c', 'placement': {'position': 'AFTER', 'relativeToRule': 'x'}},
+        {'name': 'd', 'placement': {'position': 'BEFORE', 'relativeToRule': 'x'}},
+        {'name': 'e', 'placement': {'position': 'AFTER', 'relativeToRule': 'c'}},
+        {'name': 'f', 'placement': {'position': 'AFTER', 'relativeToRule': 'x'}},
+        {'name': 'g', 'placement': {'position': 'LAST'}},
+        {'name': 'h', 'placement': {'position': 'FIRST'}},
+    ]
+    waves = firewall_batch.create_waves(fw_rules)
+    assert [[x['name'] for x in wave] for wave in waves] == [['b', 'c', 'd', 'g'], ['h', 'a', 'e', 'f']]
+    assert [x['placement'] for x in waves[1][:2]] == [{'position': 'BEFORE', 'relativeToRule': 'b'},
+                                                      {'position': 'AFTER', 'relativeToRule': 'b'}]
+
+
+def test_create_waves_balanced():
+    """
+    A group of rules with the same placement is created in log2(n) + 1 waves
+    """
+    fw_rules = [{'name': 'r{0:02d}'.format(i), 'placement': {'position': 'LAST'}} for i in range(15)]
+    waves = firewall_batch.create_waves(fw_rules)
+    assert [len(wave) for wave in waves] == [1, 2, 4, 8]
+    assert waves[0] == [{'name': 'r07', 'placement': {'position': 'LAST'}}]
+    assert fw_rules[0] == {'name': 'r00', 'placement': {'position': 'LAST'}}
+
+
+def test_rerun_is_unchanged(caas, run_module):
+    """
+    Running the same rules twice only creates them the first time
+    """
+    domain = caas.data['networkDomain'][0]
+    rules = [{'name': 'web_{0}'.format(i)} for i in range(3)]
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    calls = len(caas.calls)
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result.get('failed'), result.get('msg')
+    assert not result['changed']
+    assert result['data'] == {'created': [], 'updated': [], 'removed': [], 'unchanged': ['web_0', 'web_1', 'web_2']}
+    assert not [call for call in caas.calls[calls:] if call[0] == 'POST']
+
+
+def test_update(caas, run_module):
+    """
+    Only the rules that differ from the existing rules are updated
+    """
+    domain = caas.data['networkDomain'][0]
+    rules = [{'name': 'web_{0}'.format(i)} for i in range(3)]
+    run_module(firewall_batch, batch_args(domain, rules))
+    rules[0]['action'] = 'DROP'
+    rules[1]['dst_port_start'] = '8443'
+    calls = len(caas.calls)
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    assert result['data'] == {'created': [], 'updated': ['web_0', 'web_1'], 'removed': [], 'unchanged': ['web_2']}
+    assert len([call for call in caas.calls[calls:] if call[1].endswith('/editFirewallRule')]) == 2
+    assert caas.find('firewallRule', name='web_0')[0]['action'] == 'DROP'
+    assert caas.find('firewallRule', name='web_1')[0]['destination']['port'] == {'begin': 8443}
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result['changed']
+
+
+def test_remove(caas, run_module):
+    """
+    Existing rules with state absent are removed and absent rules that do not exist are unchanged
+    """
+    domain = caas.data['networkDomain'][0]
+    existing = caas.find('firewallRule', networkDomainId=domain['id'])[0]
+    rules = [{'name': existing['name'], 'state': 'absent'}, {'name': 'no_such_rule', 'state': 'absent'}]
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result.get('failed'), result.get('msg')
+    assert result['changed']
+    assert result['data'] == {'created': [], 'updated': [], 'removed': [existing['name']], 'unchanged': ['no_such_rule']}
+    assert not caas.find('firewallRule', id=existing['id'])
+    result = run_module(firewall_batch, batch_args(domain, rules))
+    assert not result['changed']
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import server_info, network_info
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import FAKE_DATACENTERS, FAKE_EU_DATACENTERS
+
+EU_DATACENTER = FAKE_EU_DATACENTERS[0]
+
+
+def test_several_datacenters(caas, run_module):
+    result = run_module(server_info, {'datacenter': FAKE_DATACENTERS})
+    assert not result.get('failed'), result.get('msg')
+    servers = result['data']['server']
+    assert result['data']['count'] == len(caas.data['server'])
+    assert set(server['datacenterId'] for server in servers) == set(FAKE_DATACENTERS)
+    assert all(server['region'] == 'na' for server in servers)
+
+
+def test_several_regions(caas_regions, run_module):
+    na, eu = caas_regions
+    result = run_module(network_info, {'region': ['na', 'eu'], 'datacenter': [FAKE_DATACENTERS[0], EU_DATACENTER]})
+    assert not result.get('failed'), result.get('msg')
+    domains = result['data']['network_domain']
+    expected = na.find('networkDomain', datacenterId=FAKE_DATACENTERS[0]) + eu.data['networkDomain']
+    assert sorted(domain['id'] for domain in domains) == sorted(domain['id'] for domain in expected)
+    assert set((domain['region'], domain['datacenterId']) for domain in domains) == \
+        set([('na', FAKE_DATACENTERS[0]), ('eu', EU_DATACENTER)])
+
+
+def test_unknown_datacenter(caas_regions, run_module):
+    result = run_module(network_info, {'region': ['na', 'eu'], 'datacenter': ['AP3']})
+    assert result.get('failed')
+    assert 'AP3' in result['msg']
+
+
+def test_fields(caas, run_module):
+    result = run_module(server_info, {'datacenter': FAKE_DATACENTERS,
+                                      'fields': ['name', 'networkInfo.primaryNic.privateIpv4']})
+    assert not result.get('failed'), result.get('msg')
+    assert result['data']['count'] == len(caas.data['server'])
+    assert all(sorted(server) == ['name', 'networkInfo'] for server in result['data']['server'])
+    assert all(list(server['networkInfo']) == ['primaryNic'] for server in result['data']['server'])
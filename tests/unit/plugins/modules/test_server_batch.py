@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import server_batch
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import CaaSFake, FAKE_IMAGE
+
+
+class FailingPollCaaSFake(CaaSFake):
+    """
+    A CaaSFake where the first poll_failures server listings after a server is deployed fail
+    """
+    def __init__(self, poll_failures, **kwargs):
+        super(FailingPollCaaSFake, self).__init__(**kwargs)
+        self.poll_failures = poll_failures
+        self.deployed = False
+
+    def get(self, resource, query):
+        if resource == 'server/server' and self.deployed and self.poll_failures:
+            self.poll_failures -= 1
+            return self.error(500, 'SYSTEM_ERROR', 'The server listing failed')
+        return super(FailingPollCaaSFake, self).get(resource, query)
+
+    def post(self, resource, params):
+        self.deployed = self.deployed or resource.endswith('/deployServer')
+        return super(FailingPollCaaSFake, self).post(resource, params)
+
+
+def deploy(caas_install, run_module, poll_failures, count):
+    caas = caas_install(FailingPollCaaSFake(poll_failures, sizes={'server': 20}))
+    domain = caas.data['networkDomain'][0]
+    vlan = caas.find('vlan', networkDomain={'id': domain['id'], 'name': domain['name']})[0]
+    return run_module(server_batch, {
+        'datacenter': domain['datacenterId'], 'network_domain': domain['name'], 'wait_time': 10,
+        'servers': [{'name': 'batch_{0:02d}'.format(i), 'image': FAKE_IMAGE,
+                     'network_info': {'primary_nic': {'vlan': vlan['name']}}} for i in range(count)]})
+
+
+def test_poll_error_reports_pending_servers(caas_install, run_module):
+    """
+    When the shared poll keeps failing the deployed servers are returned as pending with their passwords
+    """
+    result = deploy(caas_install, run_module, 100, 3)
+    assert result.get('failed')
+    assert result['changed']
+    assert 'The server listing failed' in result['msg']
+    pending = result['data']['pending']
+    assert sorted(x['name'] for x in pending) == ['batch_00', 'batch_01', 'batch_02']
+    assert all(x['id'] and x['password'] for x in pending)
+
+
+def test_poll_error_is_retried(caas_install, run_module):
+    """
+    A single failed poll is retried and the deployment completes
+    """
+    result = deploy(caas_install, run_module, 1, 2)
+    assert not result.get('failed'), result.get('msg')
+    assert sorted(x['name'] for x in result['data']['created']) == ['batch_00', 'batch_01']
+    assert all(x['password'] for x in result['data']['created'])
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.nttmcp.mcp.plugins.modules import server_changes
+from ansible_collections.nttmcp.mcp.tests.unit.mock.caas import CaaSFake, FAKE_DATACENTERS
+
+DATACENTER = FAKE_DATACENTERS[0]
+
+
+@pytest.fixture
+def fake(caas_install):
+    return caas_install(CaaSFake(sizes={'server': 200}))
+
+
+def run_changes(run_module, **kwargs):
+    args = {'datacenter': DATACENTER}
+    args.update(kwargs)
+    result = run_module(server_changes, args)
+    assert not result.get('failed'), result.get('msg')
+    return result
+
+
+def test_changes(fake, run_module):
+    servers = fake.find('server', datacenterId=DATACENTER)
+    result = run_changes(run_module)
+    assert result['changed'] and result['data']['initial']
+    assert len(result['data']['added']) == result['data']['total'] == len(servers)
+
+    result = run_changes(run_module)
+    assert not result['changed'] and not result['data']['initial']
+    assert result['data']['count'] == 0
+
+    removed = servers[0]
+    fake.remove(removed['id'])
+    servers[1]['state'] = 'PENDING_CHANGE'
+    domain = fake.index[servers[2]['networkInfo']['networkDomainId']][1]
+    added = fake.server('new_server', domain, None)
+    result = run_changes(run_module)
+    assert result['data']['count'] == 3
+    assert [x['id'] for x in result['data']['added']] == [added['id']]
+    assert [x['id'] for x in result['data']['modified']] == [servers[1]['id']]
+    assert result['data']['removed'] == [{'id': removed['id'], 'name': removed['name'], 'datacenterId': DATACENTER,
+                                          'region': 'na', 'state': 'NORMAL'}]
+
+
+def test_fields_and_check_mode(fake, run_module):
+    server = fake.find('server', datacenterId=DATACENTER)[0]
+    result = run_changes(run_module, fields=['state'])
+    assert set(tuple(sorted(x)) for x in result['data']['added']) == set([('id', 'name', 'state')])
+    server['cpu']['count'] += 1
+    assert run_changes(run_module, fields=['state'])['data']['count'] == 0
+    assert run_changes(run_module)['data']['initial']
+
+    server['state'] = 'PENDING_CHANGE'
+    result = run_changes(run_module, fields=['state'], _ansible_check_mode=True)
+    assert result['data']['modified'] == [{'id': server['id'], 'name': server['name'], 'state': 'PENDING_CHANGE'}]
+    assert run_changes(run_module, fields=['state'])['data']['count'] == 1
+    assert run_changes(run_module, fields=['state'], reset=True)['data']['initial']
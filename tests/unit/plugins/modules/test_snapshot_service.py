@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import snapshot_service
+
+
+def test_disable_replication_waits(caas, run_module):
+    """
+    The server is read (and cached) before the disableReplication POST, so the poll must see the PENDING_CHANGE state
+    from the API and wait for it to settle rather than the cached NORMAL state
+    """
+    server = caas.data['server'][0]
+    server['snapshotService'] = {'state': 'NORMAL', 'servicePlan': 'ONE_MONTH', 'replicationTargetDatacenterId': 'NA12'}
+    result = run_module(snapshot_service, {'datacenter': server['datacenterId'], 'server_id': server['id'],
+                                           'replication': 'NA12', 'state': 'absent'})
+    assert not result.get('failed'), result.get('msg')
+    assert server['snapshotService']['state'] == 'NORMAL'
+    assert 'replicationTargetDatacenterId' not in server['snapshotService']
+    polls = [call for call in caas.calls if call[0] == 'GET' and call[1].endswith(server['id'])]
+    assert len(polls) > 2
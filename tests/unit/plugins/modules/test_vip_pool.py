@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2019, Ken Sinfield <ken.sinfield@cis.ntt.com>
+#
+# GNU General Public License v2.0+ (see COPYING or https://www.gnu.org/licenses/gpl-2.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.nttmcp.mcp.plugins.modules import vip_pool
+
+
+class FakeModule():
+    """
+    The parts of an AnsibleModule used by update_vip_pool_members
+    """
+    def __init__(self, **params):
+        self.params = params
+
+
+def pool_members(caas, pool):
+    return dict(((x['node']['id'], x['port']), x) for x in caas.data['poolMember'] if x['pool']['id'] == pool['id'])
+
+
+def test_update_members_changes_only_the_differences(caas, client):
+    """
+    Unchanged members are left alone, members no longer required are removed, new members are added and a member with
+    a new status is removed and added again. Every remove is made before the first add
+    """
+    pool = caas.data['pool'][0]
+    nodes = caas.find('node', networkDomainId=pool['networkDomainId'])
+    for member in list(pool_members(caas, pool).values()):
+        caas.remove(member['id'])
+    kept = caas.pool_member(pool, nodes[0], 80, 'ENABLED')
+    changed = caas.pool_member(pool, nodes[1], 80, 'ENABLED')
+    removed = caas.pool_member(pool, nodes[2], 80, 'ENABLED')
+    members = [{'id': nodes[0]['id'], 'port': 80, 'status': 'ENABLED'},
+               {'id': nodes[1]['id'], 'port': 80, 'status': 'DISABLED'},
+               {'id': nodes[3]['id'], 'port': 8080, 'status': 'ENABLED'}]
+    existing = client.list_vip_pool_members(vip_pool_id=pool['id'])
+    calls = len(caas.calls)
+
+    errors = vip_pool.update_vip_pool_members(FakeModule(concurrency=4, rate_limit=None), client, pool['id'], members,
+                                              existing)
+    assert errors == []
+    actions = [call[1].rsplit('/', 1)[-1] for call in caas.calls[calls:] if call[0] == 'POST']
+    assert actions == ['removePoolMember'] * 2 + ['addPoolMember'] * 2
+    result = pool_members(caas, pool)
+    assert sorted(result) == sorted((x['id'], x['port']) for x in members)
+    assert result[(nodes[0]['id'], 80)]['id'] == kept['id']
+    assert result[(nodes[1]['id'], 80)]['id'] != changed['id']
+    assert result[(nodes[1]['id'], 80)]['status'] == 'DISABLED'
+    assert removed['id'] not in caas.index
+
+
+def test_update_members_unchanged(caas, client):
+    """
+    Members that already match make no API calls
+    """
+    pool = caas.data['pool'][0]
+    existing = client.list_vip_pool_members(vip_pool_id=pool['id'])
+    members = [{'id': x['node']['id'], 'port': x['port'], 'status': x['status']} for x in existing]
+    calls = len(caas.calls)
+    assert vip_pool.update_vip_pool_members(FakeModule(concurrency=4, rate_limit=None), client, pool['id'], members,
+                                            existing) == []
+    assert not [call for call in caas.calls[calls:] if call[0] == 'POST']